@@ -16,4 +16,34 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from .version import __version__, __author__, __email__, __repository__, __license__
+import importlib
+
+# The tool related information and the Python API are resolved on first access,
+# which keeps the startup of the command line tool fast.
+_VERSION_INFO_NAMES = ["__version__", "__author__", "__email__", "__repository__", "__license__"]
+_API_NAMES = ["iter_lobster_items", "convert", "iter_lobster_implementations", "create_lobster_report"]
+
+
+def __getattr__(name: str) -> object:
+    # lobster-trace: SwRequirements.sw_req_startup
+    # lobster-trace: SwRequirements.sw_req_api
+    """Get the tool related information from the version module and the Python
+    API functions from the converter module on first access.
+
+    Args:
+        name (str): The name of the package attribute.
+
+    Returns:
+        object: The tool related information or the Python API function.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    if name in _VERSION_INFO_NAMES:
+        module = importlib.import_module(".version", __name__)
+    elif name in _API_NAMES:
+        module = importlib.import_module(".doxygen_to_lobster_converter", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(module, name)
@@ -23,22 +23,33 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 
 # Imports **********************************************************************
 
+# Only the modules for the command line arguments are imported here. The
+# conversion modules are imported when the conversion starts, which keeps e.g.
+# --help and --version fast.
 import argparse
+import os
 import sys
+from typing import TYPE_CHECKING
 
-try:
-    from lobster_doxygen.version import __version__, __author__, __email__, __repository__, __license__
-except ModuleNotFoundError:
-    # provide dummy information when not installed as package but called directly
-    # also necessary to get sphinx running without error
-    __version__ = "dev"
-    __author__ = "Andreas Merkle"
-    __email__ = "andreas.merkle@newtec.de"
-    __repository__ = "https://github.com/NewTec-GmbH/lobster-doxygen.git"
-    __license__ = "GPLv3"
+from lobster_doxygen.version import get_version
 from lobster_doxygen.ret import Ret
 from lobster_doxygen.printer import Printer
-from lobster_doxygen.doxygen_to_lobster_converter import convert_doxygen_xml_to_lobster_common_interchange_format
+from lobster_doxygen.xml_parser import XmlParser
+from lobster_doxygen.constants import (
+    ARCHIVE_SUFFIXES,
+    DEFAULT_CACHE_MAX_SIZE,
+    FINGERPRINT_FILE_SUFFIX,
+    MANIFEST_FILE_SUFFIX,
+)
+from lobster_doxygen.trace_source import TraceSource
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from lobster_doxygen.compound_cache import CompoundCache
+    from lobster_doxygen.conversion_options import ConversionOptions
+    from lobster_doxygen.conversion_report import ConversionReport
+    from lobster_doxygen.conversion_stats import ConversionStats
 
 # Variables ********************************************************************
 
@@ -93,9 +104,149 @@ class RawDescriptionHelpFormatterWithNL(argparse.RawDescriptionHelpFormatter):
         return "".join([indent + line + "\n" for line in text.splitlines()])
 
 
+class _VersionAction(argparse.Action):
+    # lobster-trace: SwRequirements.sw_req_cli_version
+    # lobster-trace: SwRequirements.sw_req_startup
+    """Print the version and exit. Unlike the argparse version action, the
+    version is only resolved if the option is given.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):  # pylint: disable=redefined-builtin
+        """Initialize the action.
+
+        Args:
+            option_strings (list[str]): The option strings, e.g. --version.
+            dest (str): Not used, the action stores no value.
+            default (str): Not used, the action stores no value.
+            help (str): The help text of the option.
+        """
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """Print the version to the standard output stream and exit.
+
+        Args:
+            parser (argparse.ArgumentParser): The parser, which provides the program name.
+            namespace (argparse.Namespace): Not used.
+            values (list): Not used.
+            option_string (str): Not used.
+        """
+        sys.stdout.write(f"{parser.prog} {get_version()}\n")
+        parser.exit()
+
+
 # Functions ********************************************************************
 
 
+def _positive_int(value: str) -> int:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """Convert a command line argument to a positive integer.
+
+    Args:
+        value (str): The command line argument value.
+
+    Returns:
+        int: The positive integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid positive int value: '{value}'") from e
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive int value: '{value}'")
+
+    return number
+
+
+def _read_folder_list(file_name: str) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Read the doxygen XML folders from a folder list file with one folder per
+    line. Empty lines and lines starting with # are ignored. Relative paths are
+    relative to the folder list file.
+
+    Args:
+        file_name (str): Path and file name of the folder list file.
+
+    Returns:
+        list[str]: The doxygen XML folders.
+
+    Raises:
+        OSError: If the folder list file can't be read.
+    """
+    base_folder = os.path.dirname(file_name)
+    doxygen_xml_folders = []
+
+    with open(file_name, "r", encoding="utf-8") as folder_list_file:
+        for line in folder_list_file:
+            line = line.strip()
+
+            if 0 < len(line) and not line.startswith("#"):
+                doxygen_xml_folders.append(os.path.join(base_folder, line))
+
+    return doxygen_xml_folders
+
+
+def _get_doxygen_xml_folders(parser: argparse.ArgumentParser, args: argparse.Namespace) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_folder
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Get the doxygen XML folders of the positional arguments and of the folder list file.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser, which reports a usage error.
+        args (argparse.Namespace): Program arguments from user.
+
+    Returns:
+        list[str]: The doxygen XML folders, at least one.
+    """
+    doxygen_xml_folders = list(args.doxygen_xml_folder)
+
+    if args.folder_list is not None:
+        try:
+            doxygen_xml_folders.extend(_read_folder_list(args.folder_list))
+        except OSError as e:
+            parser.error(f"folder list {args.folder_list} can't be read: {e}")
+
+    if 0 == len(doxygen_xml_folders):
+        parser.error("the following arguments are required: doxygen_xml_folder")
+
+    return doxygen_xml_folders
+
+
+def _get_output_file_names(doxygen_xml_folders: list[str], output_dir: str) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Get one output file in the output directory per doxygen XML folder. Its
+    name is the path of the doxygen XML folder without the path, which all
+    doxygen XML folders have in common, e.g. component_a/doxygen/xml and
+    component_b/doxygen/xml result in component_a_doxygen_xml.json and
+    component_b_doxygen_xml.json.
+
+    Args:
+        doxygen_xml_folders (list[str]): The doxygen XML folders.
+        output_dir (str): The output directory.
+
+    Returns:
+        list[str]: The output file names in the order of the doxygen XML folders.
+    """
+    folder_paths = [os.path.abspath(doxygen_xml_folder) for doxygen_xml_folder in doxygen_xml_folders]
+    common_path = os.path.commonpath(folder_paths)
+    output_file_names = []
+
+    for folder_path in folder_paths:
+        name = os.path.relpath(folder_path, common_path)
+
+        if name == os.curdir:
+            name = os.path.basename(folder_path)
+
+        output_file_names.append(os.path.join(output_dir, name.replace(os.sep, "_") + ".json"))
+
+    return output_file_names
+
+
 def _add_parser() -> argparse.ArgumentParser:
     """Add parser for command line arguments and set the execute function of
     each cmd module as callback for the subparser command.
@@ -111,23 +262,160 @@ def _add_parser() -> argparse.ArgumentParser:
     # lobster-trace: SwRequirements.sw_req_cli_help
     # lobster-trace: SwRequirements.sw_req_cli_version
     # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_folder
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
     # lobster-trace: SwRequirements.sw_req_cli_output
     # lobster-trace: SwRequirements.sw_req_cli_verbose
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    # lobster-trace: SwRequirements.sw_req_cli_gzip
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    # lobster-trace: SwRequirements.sw_req_cli_max_errors
+    # lobster-trace: SwRequirements.sw_req_cli_report_json
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    # The program name is fixed, because the arguments are also parsed by the server.
     parser = argparse.ArgumentParser(
-        description=_HELP_DESCRIPTION, formatter_class=RawDescriptionHelpFormatterWithNL)
-    parser.add_argument("--version", action="version",
-                        version="%(prog)s " + __version__)
-    parser.add_argument("doxygen_xml_folder", type=str,
-                        help="Path to the doxygen XML output folder.")
+        prog="lobster-doxygen", description=_HELP_DESCRIPTION, formatter_class=RawDescriptionHelpFormatterWithNL)
+    parser.add_argument("--version", action=_VersionAction)
+    parser.add_argument("doxygen_xml_folder", type=str, nargs="*",
+                        help="Path to the doxygen XML output folder or to an archive with it "
+                        f"({', '.join(ARCHIVE_SUFFIXES)}), optionally followed by the folder in the archive, "
+                        "e.g. doxygen.zip/xml, or to a combined doxygen XML file, e.g. all.xml of combine.xslt, "
+                        "or to the doxygen SQLite3 database, e.g. doxygen_sqlite3.db. Several ones are converted "
+                        "in one process and their tags have to be unique.")
     parser.add_argument(
+        "--folder-list", type=str, help="File with one doxygen_xml_folder per line, which are converted in "
+        "addition. Relative paths are relative to the file, empty lines and lines starting with # are ignored. "
+        "Default: no file", default=None
+    )
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
         "-o", "--output", type=str, help="Output file name. Default: lobster.json", default="lobster.json"
     )
+    output_group.add_argument(
+        "--output-dir", type=str, help="Write one output file per doxygen_xml_folder into this directory instead "
+        "of one output file, named after the path of the doxygen_xml_folder. Default: one output file",
+        default=None
+    )
+    output_group.add_argument(
+        "--lobster-config", type=str, help="Create the lobster report with this lobster configuration file in the "
+        "same process instead of the output file. The lobster items are added to the implementation level "
+        "without source file. Default: output file", default=None
+    )
+    parser.add_argument(
+        "--lobster-level", type=str, help="Implementation level of the lobster configuration, which gets the "
+        "lobster items. Default: the only implementation level without source file", default=None
+    )
+    parser.add_argument(
+        "--lobster-report", type=str, help="Lobster report file, which is written with --lobster-config. "
+        "Default: report.lobster", default="report.lobster"
+    )
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Enable verbose output.")
+    parser.add_argument(
+        "-j", "--jobs", type=_positive_int, help="Number of parallel jobs to parse the doxygen XML files. "
+        "Default: number of CPUs", default=None
+    )
+    parser.add_argument(
+        "--parser", type=str, choices=[xml_parser.value for xml_parser in XmlParser],
+        help=f"XML parser for the doxygen compound files. {XmlParser.ITERPARSE.value} parses incrementally "
+        f"with low memory usage. Default: {XmlParser.DOXMLPARSER.value}", default=XmlParser.DOXMLPARSER.value
+    )
+    parser.add_argument(
+        "--cache-dir", type=str, help="Directory of a persistent cache for the results of the doxygen XML files. "
+        "Only changed files are parsed again. Default: no cache", default=None
+    )
+    parser.add_argument(
+        "--cache-fast", action="store_true",
+        help="Detect changed doxygen XML files by size and modification time instead of the content hash."
+    )
+    parser.add_argument(
+        "--cache-max-size", type=_positive_int, help="Maximum size of the cache in MiB. "
+        f"Default: {DEFAULT_CACHE_MAX_SIZE}", default=DEFAULT_CACHE_MAX_SIZE
+    )
+    parser.add_argument(
+        "--trace-source", type=str, choices=[trace_source.value for trace_source in TraceSource],
+        help="Source of the requirements and justifications. "
+        f"{TraceSource.DESCRIPTION.value} reads the detailed description of each compound and member, "
+        f"{TraceSource.XREFITEM.value} reads the xrefitem pages of the aliases and "
+        f"{TraceSource.VERIFY.value} checks that both are identical. Default: {TraceSource.DESCRIPTION.value}",
+        default=TraceSource.DESCRIPTION.value
+    )
+    parser.add_argument(
+        "--compact", action="store_true",
+        help="Write the output file as compact JSON without indentation and line breaks."
+    )
+    parser.add_argument(
+        "--gzip", action="store_true", help="Write the output file gzip compressed, e.g. for archiving."
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="Print the time and throughput of each conversion phase and the slowest compound files."
+    )
+    parser.add_argument(
+        "--stats-json", type=str, help="Write the time and throughput of each conversion phase as JSON file. "
+        "Default: no file", default=None
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Update the output file of a previous run only for the changed doxygen XML files. "
+        f"The byte range of each compound is recorded in <output>{MANIFEST_FILE_SUFFIX}."
+    )
+    parser.add_argument(
+        "--depfile", type=str, help="Write the index.xml and all read doxygen XML files as Makefile style "
+        "dependencies of the output file, e.g. for make or ninja. Default: no file", default=None
+    )
+    parser.add_argument(
+        "--skip-if-unchanged", action="store_true",
+        help="Skip the conversion if the output file and all read doxygen XML files are unchanged since the last "
+        f"run. Their sizes and modification times are recorded in <output>{FINGERPRINT_FILE_SUFFIX}."
+    )
+    parser.add_argument(
+        "--keep-going", action="store_true",
+        help="Skip the doxygen XML files, which can't be converted, and write the output file with the other ones. "
+        f"The skipped files are reported and the exit code is {int(Ret.RET_ERROR_PARTIAL_OUTPUT)}."
+    )
+    parser.add_argument(
+        "--max-errors", type=_positive_int, help="Abort the conversion after this number of errors, i.e. rule "
+        "violations and with --keep-going skipped doxygen XML files. Default: all errors are reported", default=None
+    )
+    parser.add_argument(
+        "--report-json", type=str, help="Write the rule violations and with --keep-going the skipped doxygen XML "
+        "files as JSON file, also if the conversion fails. Default: no file", default=None
+    )
 
     return parser
 
 
+def _check_lobster_report_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Check that no option of the output file is given together with the lobster report.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser, which reports the usage error.
+        args (argparse.Namespace): Program arguments from user.
+    """
+    if args.lobster_config is not None:
+        output_file_options = {
+            "--incremental": args.incremental,
+            "--depfile": args.depfile is not None,
+            "--skip-if-unchanged": args.skip_if_unchanged,
+        }
+
+        for option, is_given in output_file_options.items():
+            if is_given is True:
+                parser.error(f"argument --lobster-config: not allowed with argument {option}")
+
+
 def _print_program_arguments(args: argparse.Namespace) -> None:
     # lobster-trace: SwRequirements.sw_req_cli_verbose
     """Print program argument information.
@@ -137,17 +425,124 @@ def _print_program_arguments(args: argparse.Namespace) -> None:
     """
     LOG.print_info("Program arguments: ")
     for arg in vars(args):
-        LOG.print_info(f"* {arg} = {vars(args)[arg]}")
+        LOG.print_info("* %s = %s", arg, vars(args)[arg])
     LOG.print_info("\n")
 
-def main() -> Ret:
+
+def _report_stats(args: argparse.Namespace, stats: "ConversionStats") -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Print the conversion statistics and write them to the JSON file, as requested.
+
+    Args:
+        args (argparse.Namespace): Program arguments from user.
+        stats (ConversionStats): The statistics of the conversion.
+
+    Returns:
+        Ret: Ret.RET_OK if reported, Ret.RET_ERROR if the JSON file can't be written.
+    """
+    ret_status = Ret.RET_OK
+
+    if args.stats is True:
+        for line in stats.get_report():
+            LOG.print_report(line)
+
+    if args.stats_json is not None:
+        try:
+            stats.write_json(args.stats_json)
+        except OSError as e:
+            LOG.print_error(f"Statistics file {args.stats_json} can't be written: {e}")
+            ret_status = Ret.RET_ERROR
+
+    return ret_status
+
+
+def _write_report(args: argparse.Namespace, report: "ConversionReport") -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_report_json
+    """Write the errors of the conversion to the JSON file, as requested.
+
+    Args:
+        args (argparse.Namespace): Program arguments from user.
+        report (ConversionReport): The errors of the conversion.
+
+    Returns:
+        Ret: Ret.RET_OK if written or not requested, Ret.RET_ERROR if the JSON file can't be written.
+    """
+    ret_status = Ret.RET_OK
+
+    if args.report_json is not None:
+        try:
+            report.write_json(args.report_json)
+        except OSError as e:
+            LOG.print_error(f"Report file {args.report_json} can't be written: {e}")
+            ret_status = Ret.RET_ERROR
+
+    return ret_status
+
+
+def _convert(args: argparse.Namespace, output_file_name: str | list[str], options: "ConversionOptions") -> Ret:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Convert into the output file or with --lobster-config into the lobster report.
+
+    Args:
+        args (argparse.Namespace): Program arguments from user.
+        output_file_name (str | list[str]): The output file or one output file per doxygen XML folder.
+        options (ConversionOptions): The conversion options.
+
+    Returns:
+        Ret: The result of the conversion.
+    """
+    # pylint: disable=import-outside-toplevel
+    from lobster_doxygen.doxygen_to_lobster_converter import (
+        convert_doxygen_xml_to_lobster_common_interchange_format,
+        convert_doxygen_xml_to_lobster_report,
+    )
+
+    if args.lobster_config is not None:
+        ret_status = convert_doxygen_xml_to_lobster_report(
+            args.doxygen_xml_folder, args.lobster_config, args.lobster_report, args.lobster_level, options)
+    else:
+        ret_status = convert_doxygen_xml_to_lobster_common_interchange_format(
+            args.doxygen_xml_folder, output_file_name, options)
+
+    return ret_status
+
+
+def main(
+    argv: list[str] | None = None,
+    cache: "CompoundCache | None" = None,
+    worker_pool: "ProcessPoolExecutor | None" = None,
+) -> Ret:
     """Main function to convert doxygen XML output to lobster common interchange format.
 
+    Args:
+        argv (list[str] | None): The command line arguments without the program
+            name. If None, the arguments of the process are used.
+        cache (CompoundCache | None): The compound cache, which is used if no
+            cache directory is given, e.g. the in-memory cache of the server.
+        worker_pool (ProcessPoolExecutor | None): The worker processes, which are
+            used for parallel jobs, e.g. the ones of the server. If None, the
+            worker processes are started for the conversion.
+
     Returns:
         int: System exit status
     """
     # lobster-trace: SwRequirements.sw_req_cli
     # lobster-trace: SwRequirements.sw_req_stdout_output
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    # lobster-trace: SwRequirements.sw_req_cli_gzip
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    # lobster-trace: SwRequirements.sw_req_cli_max_errors
+    # lobster-trace: SwRequirements.sw_req_cli_report_json
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    # lobster-trace: SwRequirements.sw_req_server
+    # lobster-trace: SwRequirements.sw_req_startup
     ret_status = Ret.RET_OK
     args = None
 
@@ -156,20 +551,71 @@ def main() -> Ret:
 
     # Parse command line arguments.
     # If error occurs, exits the program from this point with code 2.
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args is None:
         ret_status = Ret.RET_ERROR_ARGPARSE
     else:
+        args.doxygen_xml_folder = _get_doxygen_xml_folders(parser, args)
+        _check_lobster_report_args(parser, args)
+
+        # pylint: disable=import-outside-toplevel
+        from lobster_doxygen.compound_cache import CompoundCache
+        from lobster_doxygen.conversion_options import ConversionOptions
+        from lobster_doxygen.conversion_report import ConversionReport
+        from lobster_doxygen.conversion_stats import ConversionStats
+
         # In verbose mode print all program arguments
         if args.verbose:
             LOG.set_verbose()
             _print_program_arguments(args)
 
+        options = ConversionOptions(
+            jobs=args.jobs,
+            xml_parser=XmlParser(args.parser),
+            trace_source=TraceSource(args.trace_source),
+            compact=args.compact,
+            gzip=args.gzip,
+            incremental=args.incremental,
+            depfile=args.depfile,
+            skip_if_unchanged=args.skip_if_unchanged,
+            keep_going=args.keep_going,
+            max_errors=args.max_errors,
+            report=ConversionReport(),
+            worker_pool=worker_pool,
+        )
+
+        if args.cache_dir is not None:
+            options.cache = CompoundCache(args.cache_dir, args.cache_fast, args.cache_max_size * 1024 * 1024)
+        else:
+            options.cache = cache
+
+        if args.stats is True or args.stats_json is not None:
+            options.stats = ConversionStats()
+
+        output_file_name = args.output
+
+        if args.output_dir is not None:
+            output_file_name = _get_output_file_names(args.doxygen_xml_folder, args.output_dir)
+
+            try:
+                os.makedirs(args.output_dir, exist_ok=True)
+            except OSError as e:
+                LOG.print_error(f"Output directory {args.output_dir} can't be created: {e}")
+                ret_status = Ret.RET_ERROR
+
         # Check if the doxygen folder exists in the arguments.
-        if args.doxygen_xml_folder:
-            ret_status = convert_doxygen_xml_to_lobster_common_interchange_format(
-                args.doxygen_xml_folder, args.output)
+        if args.doxygen_xml_folder and ret_status == Ret.RET_OK:
+            ret_status = _convert(args, output_file_name, options)
+
+            if ret_status == Ret.RET_OK and options.stats is not None:
+                ret_status = _report_stats(args, options.stats)
+
+            # The report is written also for a failed conversion, it contains the cause.
+            report_ret_status = _write_report(args, options.report)
+
+            if ret_status == Ret.RET_OK:
+                ret_status = report_ret_status
 
     return ret_status
 
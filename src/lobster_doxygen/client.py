@@ -0,0 +1,180 @@
+"""Thin client, which lets the lobster-doxygen server convert with warm
+imports and caches. If no server is running, the conversion is done in
+this process.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+# Only the standard library is imported, the conversion modules are only
+# imported if no server is running.
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+
+from lobster_doxygen.ret import Ret
+
+# Variables ********************************************************************
+
+# Environment variable with the path of the server socket.
+SOCKET_ENV_VARIABLE = "LOBSTER_DOXYGEN_SOCKET"
+
+# Environment variable with the runtime directory of the user, which only the user may access.
+RUNTIME_DIR_ENV_VARIABLE = "XDG_RUNTIME_DIR"
+
+# File name of the server socket in the runtime directory.
+SOCKET_FILE_NAME = "lobster-doxygen.sock"
+
+# Classes **********************************************************************
+
+
+class RequestError(Exception):
+    # lobster-trace: SwRequirements.sw_req_server
+    """Raised if the request was sent to the server, but no response was received.
+    The server may still convert, therefore the conversion isn't done again."""
+
+
+# Functions ********************************************************************
+
+
+def get_socket_path() -> str:
+    # lobster-trace: SwRequirements.sw_req_server
+    """Get the path of the server socket.
+
+    Returns:
+        str: The path from the environment variable, else the socket in the
+        runtime directory of the user or in a folder per user in the temporary
+        directory, which the server creates for the current user only.
+    """
+    socket_path = os.environ.get(SOCKET_ENV_VARIABLE)
+
+    if socket_path is None:
+        socket_folder = os.environ.get(RUNTIME_DIR_ENV_VARIABLE)
+
+        if socket_folder is None or 0 == len(socket_folder):
+            socket_folder = os.path.join(tempfile.gettempdir(), f"lobster-doxygen-{getpass.getuser()}")
+
+        socket_path = os.path.join(socket_folder, SOCKET_FILE_NAME)
+
+    return socket_path
+
+
+def _check_socket_owner(socket_path: str) -> None:
+    # lobster-trace: SwRequirements.sw_req_server
+    """Check that the socket belongs to a server of the current user, because
+    the request contains the command line arguments and the working directory.
+
+    Args:
+        socket_path (str): The path of the server socket.
+
+    Raises:
+        OSError: If the socket doesn't exist or belongs to another user.
+    """
+    if os.stat(socket_path).st_uid != os.getuid():
+        raise OSError(f"The socket {socket_path} belongs to another user.")
+
+
+def send_request(socket_path: str, argv: list[str], cwd: str) -> dict:
+    # lobster-trace: SwRequirements.sw_req_server
+    """Let the server run a conversion.
+
+    Args:
+        socket_path (str): The path of the server socket.
+        argv (list[str]): The command line arguments of lobster-doxygen without the program name.
+        cwd (str): The working directory, relative paths in the arguments refer to.
+
+    Returns:
+        dict: The exit code and the output to the standard output and error streams.
+
+    Raises:
+        OSError: If no server of the current user is running or the connection fails.
+        RequestError: If the connection fails after it was established or the
+        response is invalid.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this platform.")
+
+    _check_socket_owner(socket_path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.connect(socket_path)
+
+        # The server may have received the request, even if sending it fails.
+        try:
+            client_socket.sendall(json.dumps({"argv": argv, "cwd": cwd}).encode("utf-8") + b"\n")
+
+            with client_socket.makefile("rb") as response_file:
+                response_line = response_file.readline()
+        except OSError as e:
+            raise RequestError(f"The connection to the server failed: {e}") from e
+
+    if 0 == len(response_line):
+        raise RequestError("The server closed the connection without response.")
+
+    try:
+        response = json.loads(response_line)
+    except ValueError as e:
+        raise RequestError(f"The response of the server is invalid: {e}") from e
+
+    return response
+
+
+def main() -> int:
+    """Main function of the client. The arguments are the ones of lobster-doxygen.
+
+    Returns:
+        int: System exit status
+    """
+    # lobster-trace: SwRequirements.sw_req_server
+    argv = sys.argv[1:]
+
+    response = None
+    is_server_used = True
+
+    try:
+        response = send_request(get_socket_path(), argv, os.getcwd())
+    except RequestError as e:
+        # The server may still write the output, therefore it isn't converted again.
+        sys.stderr.write(f"{e}\n")
+    except OSError:
+        is_server_used = False
+
+    if is_server_used is False:
+        # Without server, the conversion is done in this process.
+        from lobster_doxygen.__main__ import main as convert_main  # pylint: disable=import-outside-toplevel
+
+        exit_code = int(convert_main(argv))
+    elif response is None:
+        exit_code = Ret.RET_ERROR
+    else:
+        sys.stdout.write(response["stdout"])
+        sys.stderr.write(response["stderr"])
+        exit_code = response["exit_code"]
+
+    return exit_code
+
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+"""Persistent cache for the results of the compound files.
+
+The cache maps the content hash of a compound file (or its path, size and
+modification time in fast mode) to the LobsterItems extracted from it and the
+log output created while parsing it. It is stored in a SQLite database file.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import os
+import pickle
+import sqlite3
+
+from lobster_doxygen.version import get_version
+from lobster_doxygen.constants import DEFAULT_CACHE_MAX_SIZE
+from lobster_doxygen.lobster_item import LobsterItem
+from lobster_doxygen.xml_archive import get_xml_file_hash, get_xml_file_stamp
+
+# Variables ********************************************************************
+
+# File name of the cache database in the cache directory.
+CACHE_FILE_NAME = "lobster-doxygen-cache.sqlite"
+
+# Version of the cache content format. Increase it if the cached data changes
+# without a new tool version.
+_CACHE_FORMAT_VERSION = 3
+
+# Classes **********************************************************************
+
+
+class CompoundCache:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    """Persistent cache for the results of the compound files.
+
+    The cache is only valid for the tool version, which created it. If the
+    version stamp doesn't match, all cached results are dropped. If the cached
+    results exceed the maximum size, the least recently used results are
+    evicted on close.
+    """
+
+    def __init__(
+        self, cache_dir: str, fast: bool = False, max_size: int = DEFAULT_CACHE_MAX_SIZE * 1024 * 1024
+    ) -> None:
+        """Initialize the compound cache.
+
+        Args:
+            cache_dir (str): Directory where the cache database is located.
+            fast (bool): If True, a compound file is identified by its path, size
+                and modification time instead of its content hash.
+            max_size (int): Maximum size of the cached results in bytes.
+        """
+        self._cache_file_name = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self._fast = fast
+        self._max_size = max_size
+        self._connection = None
+        self._run = 0  # Number of the current run, used to find the least recently used results.
+        self.hits = 0  # Number of compound files found in the cache, see contains().
+        self.misses = 0  # Number of compound files not found in the cache, see contains().
+
+    def __enter__(self) -> "CompoundCache":
+        """Open the cache on entering the context.
+
+        Returns:
+            CompoundCache: The opened cache.
+        """
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the cache on leaving the context."""
+        self.close()
+
+    @staticmethod
+    def _get_version_stamp() -> str:
+        """Get the version stamp, which the cached results are valid for.
+
+        Returns:
+            str: The version stamp.
+        """
+        return f"{get_version()}/{_CACHE_FORMAT_VERSION}"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the cache database and create the tables if necessary.
+        The cached results are dropped if the version stamp doesn't match.
+
+        Returns:
+            sqlite3.Connection: The connection to the cache database.
+        """
+        connection = sqlite3.connect(self._cache_file_name)
+
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS compounds "
+                "(key TEXT PRIMARY KEY, result BLOB NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+            )
+
+            row = connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+
+            if row is None or row[0] != self._get_version_stamp():
+                connection.execute("DELETE FROM compounds")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)", (self._get_version_stamp(),)
+                )
+
+            row = connection.execute("SELECT value FROM meta WHERE name = 'run'").fetchone()
+            self._run = 1 if row is None else int(row[0]) + 1
+            connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('run', ?)", (str(self._run),))
+
+            connection.commit()
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        return connection
+
+    def open(self) -> None:
+        """Open the cache database. It is created if it doesn't exist yet or
+        recreated if it is not a valid cache database.
+
+        Raises:
+            OSError: If the cache directory can't be created.
+            sqlite3.Error: If the cache database can't be opened.
+        """
+        os.makedirs(os.path.dirname(self._cache_file_name), exist_ok=True)
+
+        try:
+            self._connection = self._connect()
+        except sqlite3.DatabaseError:
+            # The file is no valid cache database, start with an empty one.
+            os.remove(self._cache_file_name)
+            self._connection = self._connect()
+
+    def close(self) -> None:
+        """Evict the least recently used results if the cache exceeds its
+        maximum size and close the cache database.
+        """
+        if self._connection is not None:
+            self._evict()
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    def _evict(self) -> None:
+        """Remove the least recently used results until the cached results fit
+        into the maximum size.
+        """
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM compounds").fetchone()[0]
+
+        if self._max_size < total_size:
+            evicted_keys = []
+            rows = self._connection.execute("SELECT key, size FROM compounds ORDER BY last_used ASC").fetchall()
+
+            for key, size in rows:
+                if total_size <= self._max_size:
+                    break
+
+                evicted_keys.append((key,))
+                total_size -= size
+
+            self._connection.executemany("DELETE FROM compounds WHERE key = ?", evicted_keys)
+            self._connection.commit()
+
+            # Give the space of the evicted results back to the file system.
+            self._connection.execute("VACUUM")
+
+    def get_key(self, compound_path: str, variant: str = "") -> str:
+        """Get the cache key of a compound file.
+
+        Args:
+            compound_path (str): The path of the compound file.
+            variant (str): Distinguishes results of the same compound file, which
+                are created with different settings.
+
+        Returns:
+            str: The cache key.
+        """
+        if self._fast is True:
+            key = f"{os.path.abspath(compound_path)}:{get_xml_file_stamp(compound_path)}"
+        else:
+            key = get_xml_file_hash(compound_path)
+
+        if 0 < len(variant):
+            key += f"/{variant}"
+
+        return key
+
+    def contains(self, key: str) -> bool:
+        """Check whether a result of a compound file is cached and count it as
+        hit or miss.
+
+        Args:
+            key (str): The cache key of the compound file, see get_key().
+
+        Returns:
+            bool: True if a result is cached, False otherwise.
+        """
+        row = self._connection.execute("SELECT 1 FROM compounds WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return row is not None
+
+    def get(self, key: str) -> tuple[list[LobsterItem], list[tuple[str, str]]] | None:
+        """Get the cached result of a compound file.
+
+        Args:
+            key (str): The cache key of the compound file, see get_key().
+
+        Returns:
+            tuple[list[LobsterItem], list[tuple[str, str]]] | None: The list of
+            LobsterItems and the log output of the compound file or None if it
+            is not cached.
+        """
+        result = None
+        row = self._connection.execute("SELECT result FROM compounds WHERE key = ?", (key,)).fetchone()
+
+        if row is not None:
+            try:
+                result = pickle.loads(row[0])
+            except (pickle.UnpicklingError, AttributeError, ImportError, EOFError, TypeError):
+                self._connection.execute("DELETE FROM compounds WHERE key = ?", (key,))
+
+                # The result was counted as hit, but has to be created again.
+                self.hits -= 1
+                self.misses += 1
+            else:
+                self._connection.execute(
+                    "UPDATE compounds SET last_used = ? WHERE key = ?", (self._run, key)
+                )
+
+        return result
+
+    def put(self, key: str, result: tuple[list[LobsterItem], list[tuple[str, str]]]) -> None:
+        """Store the result of a compound file in the cache.
+
+        Args:
+            key (str): The cache key of the compound file, see get_key().
+            result (tuple[list[LobsterItem], list[tuple[str, str]]]): The list
+                of LobsterItems and the log output of the compound file.
+        """
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO compounds (key, result, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, data, len(data), self._run),
+        )
+
+
+class MemoryCompoundCache(CompoundCache):
+    # lobster-trace: SwRequirements.sw_req_server
+    """Compound cache in memory, which the server keeps between conversions.
+
+    A compound file is identified by its content hash. If the content of a
+    compound file changes, its previous result is dropped. If the cached
+    results exceed the maximum size, the least recently used results are
+    evicted on close.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE * 1024 * 1024) -> None:
+        """Initialize the in-memory compound cache.
+
+        Args:
+            max_size (int): Maximum size of the cached results in bytes.
+        """
+        super().__init__("", False, max_size)
+        self._results = {}  # Pickled result per cache key, the least recently used first.
+        self._keys = {}  # Latest cache key per absolute compound path and variant.
+        self._size = 0  # Size of all pickled results in bytes.
+
+    def open(self) -> None:
+        """Start a conversion with the cached results of the previous ones."""
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Evict the least recently used results if the cache exceeds its maximum size."""
+        while self._max_size < self._size:
+            key = next(iter(self._results))
+            self._size -= len(self._results.pop(key))
+
+    def get_key(self, compound_path: str, variant: str = "") -> str:
+        """Get the cache key of a compound file and drop the result of its
+        previous content.
+
+        Args:
+            compound_path (str): The path of the compound file.
+            variant (str): Distinguishes results of the same compound file, which
+                are created with different settings.
+
+        Returns:
+            str: The cache key.
+        """
+        key = super().get_key(compound_path, variant)
+        previous_key = self._keys.get((os.path.abspath(compound_path), variant))
+
+        if previous_key is not None and previous_key != key and previous_key in self._results:
+            self._size -= len(self._results.pop(previous_key))
+
+        self._keys[(os.path.abspath(compound_path), variant)] = key
+
+        return key
+
+    def contains(self, key: str) -> bool:
+        """Check whether a result of a compound file is cached and count it as
+        hit or miss.
+
+        Args:
+            key (str): The cache key of the compound file, see get_key().
+
+        Returns:
+            bool: True if a result is cached, False otherwise.
+        """
+        is_cached = key in self._results
+
+        if is_cached is True:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        return is_cached
+
+    def get(self, key: str) -> tuple[list[LobsterItem], list[tuple[str, str]]] | None:
+        """Get the cached result of a compound file. Each call returns new
+        LobsterItems, which may be modified by the conversion.
+
+        Args:
+            key (str): The cache key of the compound file, see get_key().
+
+        Returns:
+            tuple[list[LobsterItem], list[tuple[str, str]]] | None: The list of
+            LobsterItems and the log output of the compound file or None if it
+            is not cached.
+        """
+        result = None
+        data = self._results.pop(key, None)
+
+        if data is not None:
+            # Insert it again as the most recently used result.
+            self._results[key] = data
+            result = pickle.loads(data)
+
+        return result
+
+    def put(self, key: str, result: tuple[list[LobsterItem], list[tuple[str, str]]]) -> None:
+        """Store the result of a compound file in the cache.
+
+        Args:
+            key (str): The cache key of the compound file, see get_key().
+            result (tuple[list[LobsterItem], list[tuple[str, str]]]): The list
+                of LobsterItems and the log output of the compound file.
+        """
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        previous_data = self._results.pop(key, None)
+
+        if previous_data is not None:
+            self._size -= len(previous_data)
+
+        self._results[key] = data
+        self._size += len(data)
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
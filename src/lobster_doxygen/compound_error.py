@@ -0,0 +1,106 @@
+"""Module for the errors of single compounds, which are isolated from the
+other compounds.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+from dataclasses import dataclass
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+@dataclass(frozen=True)
+class CompoundError:
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Error of a compound, which can't be converted. It is passed from the
+    worker processes to the main process, therefore it only keeps text.
+    """
+
+    path: str  # The path of the compound file.
+    exception: str  # The name of the exception type, e.g. ParseError.
+    message: str  # The message of the exception.
+    element_path: str  # The path of the element, which can't be converted, or the position of a syntax error.
+
+    def get_report_line(self) -> str:
+        """Get the error as line of the report.
+
+        Returns:
+            str: The path of the compound file, the element path, the exception type and its message.
+        """
+        location = self.path
+
+        if 0 < len(self.element_path):
+            location += f" ({self.element_path})"
+
+        return f"{location}: {self.exception}: {self.message}"
+
+
+class CompoundElementError(Exception):
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Raised if an element of a compound definition can't be converted. It
+    keeps the path of the element and the original exception.
+    """
+
+    def __init__(self, element_path: str, exception: Exception) -> None:
+        """Initialize the error.
+
+        Args:
+            element_path (str): The path of the element, e.g. compounddef[@id='class_a'].
+            exception (Exception): The exception raised while the element was converted.
+        """
+        super().__init__(f"{exception}")
+        self.element_path = element_path
+        self.exception = exception
+
+
+# Functions ********************************************************************
+
+
+def get_compound_error(path: str, exception: Exception) -> CompoundError:
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Get the error of a compound from the exception, which aborted its conversion.
+
+    Args:
+        path (str): The path of the compound file.
+        exception (Exception): The exception.
+
+    Returns:
+        CompoundError: The error with the path of the element, which can't be converted.
+        For a XML syntax error the line and column are given instead.
+    """
+    element_path = ""
+
+    if isinstance(exception, CompoundElementError):
+        element_path = exception.element_path
+        exception = exception.exception
+    else:
+        # The syntax errors of ElementTree and lxml provide the line and column.
+        position = getattr(exception, "position", None)
+
+        if isinstance(position, tuple) and 2 == len(position):
+            element_path = f"line {position[0]}, column {position[1]}"
+
+    return CompoundError(path, type(exception).__name__, f"{exception}", element_path)
+
+
+# Main *************************************************************************
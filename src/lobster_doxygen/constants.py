@@ -0,0 +1,44 @@
+"""Module with the constants, which the command line arguments and the conversion
+modules share. It imports nothing, so the command line arguments are created
+without the conversion modules and their dependencies.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+# Variables ********************************************************************
+
+# Default maximum size of the cached results in MiB.
+DEFAULT_CACHE_MAX_SIZE = 256
+
+# Suffix of the fingerprint file, which is stored next to the output file.
+FINGERPRINT_FILE_SUFFIX = ".fingerprint.json"
+
+# Suffix of the manifest file, which is stored next to the output file.
+MANIFEST_FILE_SUFFIX = ".manifest.json"
+
+# Suffixes of the supported archives.
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.zst")
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,36 @@
+"""Module with the exception to abort a conversion, whose cause is already reported.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class ConversionError(Exception):
+    # lobster-trace: SwRequirements.sw_req_streaming
+    """Raised to abort the conversion after the cause was reported with an error message."""
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,90 @@
+"""Module to represent the options of the conversion, which are set by command line arguments.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from lobster_doxygen.compound_cache import CompoundCache
+from lobster_doxygen.conversion_report import ConversionReport
+from lobster_doxygen.conversion_stats import ConversionStats
+from lobster_doxygen.tag_index import TagIndex
+from lobster_doxygen.trace_source import TraceSource
+from lobster_doxygen.xml_parser import XmlParser
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+@dataclass
+class ConversionOptions:  # pylint: disable=too-many-instance-attributes
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    # lobster-trace: SwRequirements.sw_req_cli_gzip
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    # lobster-trace: SwRequirements.sw_req_cli_max_errors
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Options of the conversion, the defaults match the command line defaults."""
+
+    jobs: int | None = None  # Number of worker processes, None for the number of CPUs.
+    xml_parser: XmlParser = XmlParser.DOXMLPARSER  # XML parser for the compound files.
+    cache: CompoundCache | None = None  # Compound cache, which is not opened yet.
+    trace_source: TraceSource = TraceSource.DESCRIPTION  # Source of the requirements and justifications.
+    compact: bool = False  # Write the output file without indentation and line breaks.
+    gzip: bool = False  # Write the output file gzip compressed.
+    stats: ConversionStats | None = None  # Statistics of the conversion phases, None to not collect them.
+    incremental: bool = False  # Update the output file only for the changed compound files.
+    depfile: str | None = None  # Makefile style dependency file of the output file, None to not write it.
+    skip_if_unchanged: bool = False  # Skip the conversion if the inputs are unchanged since the last run.
+    input_files: list[str] | None = None  # Collects the paths of the read input files, None to not collect them.
+    keep_going: bool = False  # Skip the compounds, which can't be converted, instead of aborting the conversion.
+    max_errors: int | None = None  # Abort the conversion after this number of errors, None to report all errors.
+    report: ConversionReport | None = None  # Collects the skipped compounds and the rule violations.
+    tag_index: TagIndex | None = None  # Detects the tags used in several doxygen XML folders, None to not check them.
+    worker_pool: ProcessPoolExecutor | None = None  # Worker processes shared by several conversions, None for own ones.
+
+    def get_jobs(self) -> int:
+        """Get the number of worker processes.
+
+        Returns:
+            int: The number of worker processes, the number of CPUs if not set.
+        """
+        jobs = self.jobs
+
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+
+        return jobs
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,110 @@
+"""Module for the report of the conversion errors, i.e. the compounds, which
+can't be converted, and the rule violations.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import json
+from dataclasses import asdict
+
+from lobster_doxygen.compound_error import CompoundError
+from lobster_doxygen.rule_check import RuleViolation
+from lobster_doxygen.utils import indent
+from lobster_doxygen.version import get_version
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class ConversionReport:
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    # lobster-trace: SwRequirements.sw_req_rule_report
+    # lobster-trace: SwRequirements.sw_req_cli_report_json
+    """Collects the compounds, which can't be converted, and the rule violations
+    of all compounds in the order of the compounds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty report."""
+        self.compound_errors: list[CompoundError] = []
+        self.rule_violations: list[RuleViolation] = []
+
+    def get_error_count(self) -> int:
+        """Get the number of all errors.
+
+        Returns:
+            int: The number of the compounds, which can't be converted, and of the rule violations.
+        """
+        return len(self.compound_errors) + len(self.rule_violations)
+
+    def get_compound_error_report(self) -> list[str]:
+        """Get the report of the compounds, which can't be converted.
+
+        Returns:
+            list[str]: The report lines.
+        """
+        report = [f"{len(self.compound_errors)} compound files can't be converted:"]
+        report.extend(indent(1, compound_error.get_report_line()) for compound_error in self.compound_errors)
+
+        return report
+
+    def get_rule_violation_report(self) -> list[str]:
+        """Get the report of the rule violations.
+
+        Returns:
+            list[str]: The report lines.
+        """
+        report = [f"{len(self.rule_violations)} rule violations:"]
+        report.extend(indent(1, rule_violation.get_report_line()) for rule_violation in self.rule_violations)
+
+        return report
+
+    def to_dict(self) -> dict:
+        """Get the errors as dictionary, e.g. to write them as JSON.
+
+        Returns:
+            dict: The compounds, which can't be converted, and the rule violations.
+        """
+        return {
+            "generator": "lobster-doxygen",
+            "version": get_version(),
+            "compound_errors": [asdict(compound_error) for compound_error in self.compound_errors],
+            "rule_violations": [asdict(rule_violation) for rule_violation in self.rule_violations],
+        }
+
+    def write_json(self, file_name: str) -> None:
+        """Write the errors to a JSON file.
+
+        Args:
+            file_name (str): Path and file name of the JSON file.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        with open(file_name, "w", encoding="utf-8") as report_file:
+            json.dump(self.to_dict(), report_file, indent=4)
+            report_file.write("\n")
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
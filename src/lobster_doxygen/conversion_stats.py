@@ -0,0 +1,295 @@
+"""Module to measure the time and throughput of the conversion phases.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import heapq
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Iterator
+
+from lobster_doxygen.version import get_version
+
+# Variables ********************************************************************
+
+# Phase of reading the index.xml file and the xrefitem pages.
+PHASE_INDEX = "index"
+
+# Phase of parsing the compound files or getting their results from the cache.
+PHASE_COMPOUNDS = "compounds"
+
+# Phase of checking the LobsterItems for rules.
+PHASE_RULE_CHECK = "rule_check"
+
+# Phase of writing the LOBSTER common interchange format file.
+PHASE_WRITE = "write"
+
+# All phases in the order of the conversion.
+PHASES = [PHASE_INDEX, PHASE_COMPOUNDS, PHASE_RULE_CHECK, PHASE_WRITE]
+
+# Default number of the slowest compound files, which are reported.
+DEFAULT_SLOWEST_COMPOUND_COUNT = 10
+
+# Format of a line of the phase table in the report.
+_REPORT_LINE_FORMAT = "{:<10} {:>12} {:>12} {:>10} {:>10} {:>10} {:>12} {:>13} {:>12}"
+
+# Classes **********************************************************************
+
+
+@dataclass
+class PhaseStats:  # pylint: disable=too-many-instance-attributes
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Measured values of a conversion phase."""
+
+    wall_time: float = 0.0  # Elapsed time in seconds.
+    cpu_time: float = 0.0  # CPU time in seconds of the main process and the worker processes.
+    compounds: int = 0  # Number of processed compound files.
+    members: int = 0  # Number of members of the parsed compound files, as listed in the index.
+    items: int = 0  # Number of emitted LobsterItems, including the children.
+    bytes_read: int = 0  # Number of read bytes.
+    bytes_written: int = 0  # Number of written bytes.
+
+    def get_items_per_second(self) -> float:
+        """Get the throughput of the phase.
+
+        Returns:
+            float: Number of emitted LobsterItems per second or 0 if no time was measured.
+        """
+        items_per_second = 0.0
+
+        if 0.0 < self.wall_time:
+            items_per_second = self.items / self.wall_time
+
+        return items_per_second
+
+    def to_dict(self) -> dict:
+        """Get the measured values as dictionary, e.g. to write them as JSON.
+
+        Returns:
+            dict: The measured values and the throughput.
+        """
+        values = asdict(self)
+        values["items_per_second"] = self.get_items_per_second()
+
+        return values
+
+
+@dataclass
+class CompoundStats:
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Measured times of a single compound file."""
+
+    path: str  # The path of the compound file.
+    wall_time: float  # Elapsed time in seconds to get the result of the compound file.
+    cpu_time: float  # CPU time in seconds to get the result of the compound file.
+
+
+class Stopwatch:  # pylint: disable=too-few-public-methods
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Measures the elapsed time and the CPU time of the current process since its creation."""
+
+    def __init__(self) -> None:
+        """Start the measurement."""
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def get_times(self) -> tuple[float, float]:
+        """Get the times since the start of the measurement.
+
+        Returns:
+            tuple[float, float]: The elapsed time and the CPU time in seconds.
+        """
+        return time.perf_counter() - self._wall_start, time.process_time() - self._cpu_start
+
+
+class ConversionStats:
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Collects the measured values of all conversion phases.
+
+    The phases are processed interleaved, one compound after the other. A phase
+    measured while another one is measured, e.g. the compound parsing while the
+    output file is written, is only accounted to the inner phase.
+    """
+
+    def __init__(self, slowest_compound_count: int = DEFAULT_SLOWEST_COMPOUND_COUNT) -> None:
+        """Initialize the conversion statistics.
+
+        Args:
+            slowest_compound_count (int): Number of the slowest compound files, which are kept.
+        """
+        self.phases = {phase: PhaseStats() for phase in PHASES}
+        self._slowest_compound_count = slowest_compound_count
+        self._slowest_compounds = []  # Min-heap of (wall time, sequence number, CompoundStats).
+        self._active_phases = []  # Phases, which are measured at the moment, innermost last.
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[PhaseStats]:
+        """Measure the elapsed time and the CPU time of the main process in a phase.
+        The time is not accounted to the enclosing phase measurement.
+
+        Args:
+            phase (str): The phase, see PHASES.
+
+        Yields:
+            PhaseStats: The measured values of the phase.
+        """
+        stopwatch = Stopwatch()
+        self._active_phases.append(phase)
+
+        try:
+            yield self.phases[phase]
+        finally:
+            wall_time, cpu_time = stopwatch.get_times()
+            self._active_phases.pop()
+
+            self.phases[phase].wall_time += wall_time
+            self.phases[phase].cpu_time += cpu_time
+
+            if 0 < len(self._active_phases):
+                self.phases[self._active_phases[-1]].wall_time -= wall_time
+                self.phases[self._active_phases[-1]].cpu_time -= cpu_time
+
+    def add_compound(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        compound_stats: CompoundStats,
+        members: int,
+        bytes_read: int,
+        is_parsed_in_worker: bool = False,
+    ) -> None:
+        """Add the measured values of a compound file to the compounds phase.
+
+        Args:
+            compound_stats (CompoundStats): The measured times of the compound file.
+            members (int): Number of members of the compound file, 0 if it wasn't parsed.
+            bytes_read (int): Size of the compound file, 0 if it wasn't parsed.
+            is_parsed_in_worker (bool): True if the compound file was parsed in a worker
+                process, whose CPU time is not part of the main process measurement.
+        """
+        phase_stats = self.phases[PHASE_COMPOUNDS]
+        phase_stats.compounds += 1
+        phase_stats.members += members
+        phase_stats.bytes_read += bytes_read
+
+        if is_parsed_in_worker is True:
+            phase_stats.cpu_time += compound_stats.cpu_time
+
+        # The sequence number keeps the order of compound files with the same time.
+        entry = (compound_stats.wall_time, -phase_stats.compounds, compound_stats)
+
+        if len(self._slowest_compounds) < self._slowest_compound_count:
+            heapq.heappush(self._slowest_compounds, entry)
+        elif 0 < self._slowest_compound_count:
+            heapq.heappushpop(self._slowest_compounds, entry)
+
+    def get_slowest_compounds(self) -> list[CompoundStats]:
+        """Get the slowest compound files.
+
+        Returns:
+            list[CompoundStats]: The slowest compound files, the slowest first.
+        """
+        return [entry[2] for entry in sorted(self._slowest_compounds, reverse=True)]
+
+    def get_total(self) -> PhaseStats:
+        """Get the measured values of the whole conversion.
+
+        Returns:
+            PhaseStats: The sum of the times and sizes of all phases, the compounds
+            and members of the compounds phase and the items of the write phase.
+        """
+        return PhaseStats(
+            wall_time=sum(phase_stats.wall_time for phase_stats in self.phases.values()),
+            cpu_time=sum(phase_stats.cpu_time for phase_stats in self.phases.values()),
+            compounds=self.phases[PHASE_COMPOUNDS].compounds,
+            members=self.phases[PHASE_COMPOUNDS].members,
+            items=self.phases[PHASE_WRITE].items,
+            bytes_read=sum(phase_stats.bytes_read for phase_stats in self.phases.values()),
+            bytes_written=sum(phase_stats.bytes_written for phase_stats in self.phases.values()),
+        )
+
+    def to_dict(self) -> dict:
+        """Get the measured values as dictionary, e.g. to write them as JSON.
+
+        Returns:
+            dict: The measured values of all phases, the total and the slowest compound files.
+        """
+        return {
+            "generator": "lobster-doxygen",
+            "version": get_version(),
+            "phases": {phase: phase_stats.to_dict() for phase, phase_stats in self.phases.items()},
+            "total": self.get_total().to_dict(),
+            "slowest_compounds": [asdict(compound_stats) for compound_stats in self.get_slowest_compounds()],
+        }
+
+    def write_json(self, file_name: str) -> None:
+        """Write the measured values to a JSON file.
+
+        Args:
+            file_name (str): Path and file name of the JSON file.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        with open(file_name, "w", encoding="utf-8") as stats_file:
+            json.dump(self.to_dict(), stats_file, indent=4)
+            stats_file.write("\n")
+
+    def get_report(self) -> list[str]:
+        """Get the measured values as human readable report.
+
+        Returns:
+            list[str]: The lines of the report.
+        """
+        lines = [
+            "Statistics:",
+            _REPORT_LINE_FORMAT.format(
+                "Phase", "Wall time/s", "CPU time/s", "Compounds", "Members", "Items", "Bytes read",
+                "Bytes written", "Items/s"
+            ),
+        ]
+
+        for phase, phase_stats in [*self.phases.items(), ("total", self.get_total())]:
+            lines.append(
+                _REPORT_LINE_FORMAT.format(
+                    phase,
+                    f"{phase_stats.wall_time:.3f}",
+                    f"{phase_stats.cpu_time:.3f}",
+                    phase_stats.compounds,
+                    phase_stats.members,
+                    phase_stats.items,
+                    phase_stats.bytes_read,
+                    phase_stats.bytes_written,
+                    f"{phase_stats.get_items_per_second():.0f}",
+                )
+            )
+
+        lines.append("Slowest compound files:")
+
+        for compound_stats in self.get_slowest_compounds():
+            lines.append(f"{compound_stats.wall_time:12.3f} s  {compound_stats.path}")
+
+        return lines
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,68 @@
+"""Module to write the dependencies of the output file as Makefile rule,
+which build systems like make and ninja read to detect changed inputs.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+# Variables ********************************************************************
+
+# Characters, which have a special meaning in a Makefile rule, and their escaped form.
+_ESCAPED_CHARACTERS = str.maketrans({" ": "\\ ", "#": "\\#", "$": "$$"})
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def _escape_path(path: str) -> str:
+    # lobster-exclude: Helper function that improves readability.
+    """Escape a path for a Makefile rule.
+
+    Args:
+        path (str): The path.
+
+    Returns:
+        str: The escaped path.
+    """
+    return path.translate(_ESCAPED_CHARACTERS)
+
+
+def write_depfile(depfile_name: str, targets: list[str], dependencies: list[str]) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    """Write a Makefile rule without recipe, which lists the dependencies of
+    the targets, one per line.
+
+    Args:
+        depfile_name (str): Path and file name of the dependency file.
+        targets (list[str]): The targets, e.g. the output files, which one run writes.
+        dependencies (list[str]): The files, which the targets depend on.
+
+    Raises:
+        OSError: If the dependency file can't be written.
+    """
+    lines = [" ".join(_escape_path(target) for target in targets) + ":"]
+    lines.extend(f" {_escape_path(dependency)}" for dependency in dependencies)
+
+    with open(depfile_name, "w", encoding="utf-8") as depfile:
+        depfile.write(" \\\n".join(lines) + "\n")
+
+
+# Main *************************************************************************
@@ -22,13 +22,49 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import itertools
 import os
+from collections import Counter
+from contextlib import closing, nullcontext
+import sqlite3
+from dataclasses import replace
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator
 
 from lobster_doxygen.ret import Ret
 from lobster_doxygen.printer import Printer
-from lobster_doxygen.get_lobster_items_from_doxygen_xml_folder import get_lobster_items_from_doxygen_xml_folder
-from lobster_doxygen.write_lobster_common_interchange_format_file import write_lobster_common_interchange_format_file
-from lobster_doxygen.rule_check import rule_check
+from lobster_doxygen.compound_cache import CompoundCache
+from lobster_doxygen.conversion_error import ConversionError
+from lobster_doxygen.conversion_options import ConversionOptions
+from lobster_doxygen.conversion_report import ConversionReport
+from lobster_doxygen.conversion_stats import PHASE_WRITE, ConversionStats
+from lobster_doxygen.get_lobster_items_from_doxygen_sqlite3_db import (
+    is_doxygen_sqlite3_db,
+    iter_compound_lobster_items_from_doxygen_sqlite3_db,
+)
+from lobster_doxygen.get_lobster_items_from_doxygen_xml_folder import (
+    create_worker_pool,
+    is_combined_xml_file,
+    iter_compound_lobster_items,
+)
+from lobster_doxygen.depfile import write_depfile
+from lobster_doxygen.input_fingerprint import get_unchanged_input_files, write_fingerprint
+from lobster_doxygen.output_manifest import OutputManifest
+from lobster_doxygen.write_lobster_common_interchange_format_file import (
+    get_lobster_items_segment,
+    iter_written_lobster_items,
+    write_lobster_common_interchange_format_file,
+    write_lobster_common_interchange_format_segments,
+    write_lobster_common_interchange_format_stream,
+)
+from lobster_doxygen.tag_index import TagIndex
+from lobster_doxygen.xml_archive import close_archives, is_xml_file
+from lobster_doxygen.lobster_item import LobsterItem
+
+from lobster_doxygen.version import get_version
+
+if TYPE_CHECKING:
+    from lobster.common.items import Implementation
+    from lobster.common.report import Report
 
 # Variables ********************************************************************
 LOG = Printer()
@@ -36,47 +72,908 @@ LOG = Printer()
 # Classes **********************************************************************
 
 
+class _CountedLobsterItems:  # pylint: disable=too-few-public-methods
+    # lobster-trace: SwRequirements.sw_req_streaming
+    """The lobster items of the compounds, which are counted one compound after
+    the other while they are iterated.
+    """
+
+    def __init__(self, compounds: Iterable[list[LobsterItem]]) -> None:
+        """Initialize the counted lobster items.
+
+        Args:
+            compounds (Iterable[list[LobsterItem]]): The lobster items per compound.
+        """
+        self._compounds = compounds
+        self.count = 0  # Number of lobster items on compound level, which are iterated.
+
+    def __iter__(self) -> Iterator[LobsterItem]:
+        """Iterate over the lobster items of all compounds.
+
+        Yields:
+            LobsterItem: The lobster item.
+
+        Raises:
+            ConversionError: If the lobster items of a compound violate a rule.
+        """
+        for compound_lobster_items in self._compounds:
+            self.count += len(compound_lobster_items)
+            yield from compound_lobster_items
+
+
 # Functions ********************************************************************
 
 
-def convert_doxygen_xml_to_lobster_common_interchange_format(doxygen_xml_folder: str, output_file_name: str) -> Ret:
+def _open_cache(cache: CompoundCache) -> CompoundCache | None:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    """Open the compound cache. If the cache is not available, a warning is
+    printed and all compound files are parsed.
+
+    Args:
+        cache (CompoundCache): The compound cache, which is not opened yet.
+
+    Returns:
+        CompoundCache | None: The opened compound cache or None if it is not available.
+    """
+    try:
+        cache.open()
+    except (OSError, sqlite3.Error) as e:
+        LOG.print_warning(f"Cache not available, all compound files are parsed: {e}")
+        cache = None
+
+    return cache
+
+
+def _iter_compound_lobster_items(
+    doxygen_xml_folders: list[str],
+    options: ConversionOptions,
+    is_compound_unchanged: Callable[[str, str], bool] | None = None,
+) -> Iterator[tuple[str, list[LobsterItem] | None]]:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Get the LobsterItems of one compound after the other from the doxygen
+    SQLite3 database or from the doxygen XML files, depending on the input.
+    Several inputs are read one after the other.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories,
+            combined doxygen XML files or doxygen SQLite3 databases.
+        options (ConversionOptions): The conversion options with the opened compound cache or None.
+        is_compound_unchanged (Callable[[str, str], bool] | None): Only used for
+            doxygen XML folders, see iter_compound_lobster_items().
+
+    Yields:
+        tuple[str, list[LobsterItem] | None]: The path of each compound and its
+        LobsterItems or None if it is unchanged.
+    """
+    for doxygen_xml_folder in doxygen_xml_folders:
+        if is_doxygen_sqlite3_db(doxygen_xml_folder) is True:
+            yield from iter_compound_lobster_items_from_doxygen_sqlite3_db(doxygen_xml_folder, options)
+        else:
+            yield from iter_compound_lobster_items(doxygen_xml_folder, options, is_compound_unchanged)
+
+
+def _convert(doxygen_xml_folders: list[str], output_file_name: str, options: ConversionOptions) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_no_trace
+    # lobster-trace: SwRequirements.sw_req_streaming
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Stream the lobster items of one compound after the other from the parser,
+    which checks them for rules, into the output file.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        options (ConversionOptions): The conversion options with the opened compound cache or None.
+
+    Return:
+        Ret.RET_OK: LOBSTER common interchange format file successful created.
+        Ret.RET_ERROR: Conversion not successful, no output file is left behind.
+    """
+    ret_status = Ret.RET_ERROR
+
+    # Without statistics the phases are measured, but not reported.
+    if options.stats is None:
+        options = replace(options, stats=ConversionStats())
+
+    lobster_items = _CountedLobsterItems(
+        compound_lobster_items
+        for _, compound_lobster_items in _iter_compound_lobster_items(doxygen_xml_folders, options)
+    )
+
+    try:
+        with options.stats.measure(PHASE_WRITE) as phase_stats:
+            phase_stats.items += write_lobster_common_interchange_format_file(
+                lobster_items, output_file_name, options.compact, options.gzip
+            )
+            phase_stats.bytes_written += os.path.getsize(output_file_name)
+
+        # Check if lobster items are found.
+        if 0 == lobster_items.count:
+            LOG.print_warning("No lobster items found in the doxygen XML output.")
+
+        ret_status = Ret.RET_OK
+
+    except ConversionError:
+        # The cause is already reported.
+        pass
+
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        LOG.print_error(f"{e}")
+
+    return ret_status
+
+
+def _iter_segments(
+    compounds: Iterable[tuple[str, list[LobsterItem] | None]],
+    manifest: OutputManifest,
+    options: ConversionOptions,
+) -> Iterator[bytes]:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Get the text of the lobster items of one compound file after the other.
+    The lobster items of changed compound files are already checked for rules,
+    the ones of unchanged compound files are taken from the previous output file.
+
+    Args:
+        compounds (Iterable[tuple[str, list[LobsterItem] | None]]): The path of
+            each compound file and its lobster items or None if it is unchanged.
+        manifest (OutputManifest): The loaded manifest of the previous output file.
+        options (ConversionOptions): The conversion options with statistics.
+
+    Yields:
+        bytes: The UTF-8 encoded text of the lobster items of a compound file.
+
+    Raises:
+        ConversionError: If the lobster items of a compound violate a rule.
+    """
+    for compound_path, compound_lobster_items in compounds:
+        if compound_lobster_items is None:
+            segment, item_count = manifest.read_segment(compound_path)
+        else:
+            segment, item_count = get_lobster_items_segment(compound_lobster_items, options.compact)
+
+        manifest.add(compound_path, len(segment), item_count)
+        yield segment
+
+    # The previous output file is replaced after the last segment.
+    manifest.close()
+
+
+def _get_output_settings(doxygen_xml_folders: list[str], options: ConversionOptions) -> dict:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    """Get the settings, which influence the content of the output file.
+    The doxygen XML folders are part of them, because another folder gives
+    another output file, even if its compound files are unchanged.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        options (ConversionOptions): The conversion options.
+
+    Returns:
+        dict: The settings, which are recorded in the output manifest and the input fingerprint.
+    """
+    return {
+        "version": get_version(),
+        "compact": options.compact,
+        "gzip": options.gzip,
+        "trace_source": options.trace_source.value,
+        "xml_parser": options.xml_parser.value,
+        "inputs": [os.path.abspath(doxygen_xml_folder) for doxygen_xml_folder in doxygen_xml_folders],
+    }
+
+
+def _write_incremental(
+    compounds: Iterator[tuple[str, list[LobsterItem] | None]],
+    output_file_name: str,
+    manifest: OutputManifest,
+    options: ConversionOptions,
+) -> int:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Write the output file with the lobster items of the changed compound
+    files and the unchanged parts of the previous output file. If all compound
+    files are unchanged, the output file is not written at all.
+
+    Args:
+        compounds (Iterator[tuple[str, list[LobsterItem] | None]]): The path of
+            each compound file and its lobster items or None if it is unchanged.
+        output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        manifest (OutputManifest): The loaded manifest of the previous output file.
+        options (ConversionOptions): The conversion options with statistics.
+
+    Returns:
+        int: The number of lobster items in the output file.
+    """
+    # The index is read and all compound files are checked with the first compound.
+    first_compound = next(compounds, None)
+    compounds = itertools.chain([] if first_compound is None else [first_compound], compounds)
+
+    if manifest.is_unchanged() is True:
+        # Process the remaining compounds for the log output and the xrefitem verification.
+        for _ in compounds:
+            pass
+
+        LOG.print_info("Output file is up to date.")
+        item_count = manifest.get_item_count()
+
+    else:
+        offsets = write_lobster_common_interchange_format_segments(
+            _iter_segments(compounds, manifest, options), output_file_name, options.compact, options.gzip
+        )
+        manifest.save(offsets)
+        item_count = sum(entry["items"] for entry in manifest.get_entries())
+
+    return item_count
+
+
+def _convert_incremental(doxygen_xml_folders: list[str], output_file_name: str, options: ConversionOptions) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Update the output file of a previous run only for the changed compound files.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        options (ConversionOptions): The conversion options with the opened compound cache or None.
+
+    Return:
+        Ret.RET_OK: LOBSTER common interchange format file successful created or up to date.
+        Ret.RET_ERROR: Conversion not successful, no output file is left behind.
+    """
+    ret_status = Ret.RET_ERROR
+
+    # Without statistics the phases are measured, but not reported.
+    if options.stats is None:
+        options = replace(options, stats=ConversionStats())
+
+    manifest = OutputManifest(output_file_name, _get_output_settings(doxygen_xml_folders, options))
+    manifest.load()
+
+    compounds = _iter_compound_lobster_items(doxygen_xml_folders, options, manifest.is_compound_unchanged)
+
+    try:
+        with options.stats.measure(PHASE_WRITE) as phase_stats:
+            phase_stats.items += _write_incremental(compounds, output_file_name, manifest, options)
+            phase_stats.bytes_written += os.path.getsize(output_file_name)
+
+        # Check if lobster items are found.
+        if 0 == phase_stats.items:
+            LOG.print_warning("No lobster items found in the doxygen XML output.")
+
+        ret_status = Ret.RET_OK
+
+    except ConversionError:
+        # The cause is already reported.
+        pass
+
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        LOG.print_error(f"{e}")
+
+    finally:
+        manifest.close()
+
+    # Don't leave an output file behind, which doesn't match the Doxygen XML output.
+    if ret_status != Ret.RET_OK:
+        manifest.remove()
+
+        if os.path.isfile(output_file_name):
+            os.remove(output_file_name)
+
+    return ret_status
+
+
+def _convert_with_cache(doxygen_xml_folders: list[str], output_file_name: str, options: ConversionOptions) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Convert with the opened compound cache, if one is set, completely or
+    incrementally as set in the options.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        options (ConversionOptions): The conversion options with the compound cache, which is not opened yet.
+
+    Return:
+        Ret.RET_OK: LOBSTER common interchange format file successful created.
+        Ret.RET_ERROR: Conversion not successful.
+    """
+    convert_function = _convert_incremental if options.incremental is True else _convert
+
+    if options.cache is None:
+        ret_status = convert_function(doxygen_xml_folders, output_file_name, options)
+    else:
+        cache = _open_cache(options.cache)
+
+        try:
+            ret_status = convert_function(doxygen_xml_folders, output_file_name, replace(options, cache=cache))
+        finally:
+            if cache is not None:
+                cache.close()
+
+    return ret_status
+
+
+def _convert_outputs(
+    doxygen_xml_folders: list[str],
+    output_file_names: list[str],
+    input_files: list[list[str]],
+    options: ConversionOptions,
+) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Convert all doxygen XML folders into one output file or each one into
+    its own output file. The conversion stops with the first failed output file.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        output_file_names (list[str]): One output file for all doxygen XML folders or one per doxygen XML folder.
+        input_files (list[list[str]]): Collects the paths of the read input files per output file.
+        options (ConversionOptions): The conversion options.
+
+    Return:
+        Ret.RET_OK: LOBSTER common interchange format files successful created.
+        Ret.RET_ERROR: Conversion not successful.
+    """
+    if 1 == len(output_file_names):
+        ret_status = _convert_with_cache(
+            doxygen_xml_folders, output_file_names[0], replace(options, input_files=input_files[0])
+        )
+    else:
+        ret_status = Ret.RET_OK
+
+        for doxygen_xml_folder, output_file_name, output_input_files in zip(
+            doxygen_xml_folders, output_file_names, input_files
+        ):
+            if ret_status == Ret.RET_OK:
+                LOG.print_info("Convert %s to %s.", doxygen_xml_folder, output_file_name)
+                ret_status = _convert_with_cache(
+                    [doxygen_xml_folder], output_file_name, replace(options, input_files=output_input_files)
+                )
+
+    return ret_status
+
+
+def _convert_if_changed(
+    doxygen_xml_folders: list[str], output_file_names: list[str], options: ConversionOptions
+) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Convert, unless the inputs are unchanged since the last run and the
+    conversion may be skipped, and write the dependency file, as set in the options.
+    The compounds, which are skipped with keep_going, are reported.
+
+    With several output files the conversion is only skipped, if the inputs of
+    all of them are unchanged, because the tags are checked across all of them.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        output_file_names (list[str]): One output file for all doxygen XML folders or one per doxygen XML folder.
+        options (ConversionOptions): The conversion options.
+
+    Return:
+        Ret.RET_OK: LOBSTER common interchange format file successful created or up to date.
+        Ret.RET_ERROR_PARTIAL_OUTPUT: LOBSTER common interchange format file created without
+            the compounds, which can't be converted.
+        Ret.RET_ERROR: Conversion not successful or the dependency file can't be written.
+    """
+    settings = _get_output_settings(doxygen_xml_folders, options)
+    input_files = None
+    report = options.report if options.report is not None else ConversionReport()
+
+    if options.skip_if_unchanged is True:
+        input_files = [get_unchanged_input_files(output_file_name, settings) for output_file_name in output_file_names]
+
+        if None in input_files:
+            input_files = None
+
+    if input_files is not None:
+        LOG.print_info("Inputs are unchanged, conversion skipped.")
+        ret_status = Ret.RET_OK
+    else:
+        input_files = [[] for _ in output_file_names]
+        ret_status = _convert_outputs(
+            doxygen_xml_folders, output_file_names, input_files, replace(options, report=report)
+        )
+
+        if 0 < len(report.compound_errors):
+            for line in report.get_compound_error_report():
+                LOG.print_report(line)
+
+            # The output file lacks the compounds, which can't be converted.
+            if ret_status == Ret.RET_OK:
+                ret_status = Ret.RET_ERROR_PARTIAL_OUTPUT
+
+        if ret_status == Ret.RET_OK and options.skip_if_unchanged is True:
+            try:
+                for output_file_name, output_input_files in zip(output_file_names, input_files):
+                    write_fingerprint(output_file_name, output_input_files, settings)
+            except OSError as e:
+                LOG.print_warning(f"Input fingerprint can't be written, the next run converts again: {e}")
+
+    if ret_status == Ret.RET_OK and options.depfile is not None:
+        try:
+            write_depfile(
+                options.depfile, output_file_names,
+                [input_file for output_input_files in input_files for input_file in output_input_files]
+            )
+        except OSError as e:
+            LOG.print_error(f"Dependency file {options.depfile} can't be written: {e}")
+            ret_status = Ret.RET_ERROR
+
+    return ret_status
+
+
+def _get_single_file_options(options: ConversionOptions) -> ConversionOptions:
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Get the conversion options for a combined doxygen XML file or the doxygen
+    SQLite3 database, which are read in one pass. Their compounds are neither
+    cached nor updated incrementally.
+
+    Args:
+        options (ConversionOptions): The conversion options.
+
+    Returns:
+        ConversionOptions: The conversion options without cache and incremental update.
+    """
+    if options.incremental is True:
+        LOG.print_warning("A single input file is converted completely, --incremental is ignored.")
+
+    LOG.print_info("Single input file is read in one pass, without cache and parallel jobs.")
+
+    return replace(options, cache=None, incremental=False)
+
+
+def _convert_folders(doxygen_xml_folders: list[str], output_file_names: list[str], options: ConversionOptions) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Convert several doxygen XML folders in one process. They share one pool
+    of worker processes and their tags are checked to be unique across all of them.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, where the file index.xml is located.
+        output_file_names (list[str]): One output file for all doxygen XML folders or one per doxygen XML folder.
+        options (ConversionOptions): The conversion options.
+
+    Return:
+        Ret: The result of the conversion, see convert_doxygen_xml_to_lobster_common_interchange_format().
+    """
+    ret_status = Ret.RET_ERROR
+    duplicate_folders = [folder for folder, count in Counter(doxygen_xml_folders).items() if 1 < count]
+
+    if 0 < len(duplicate_folders):
+        LOG.print_error(f"The doxygen XML folders are given more than once: {', '.join(duplicate_folders)}")
+    else:
+        if options.incremental is True:
+            LOG.print_warning("Several doxygen XML folders are converted completely, --incremental is ignored.")
+
+        options = replace(options, incremental=False, tag_index=TagIndex())
+        jobs = options.get_jobs()
+
+        if 1 < jobs and options.worker_pool is None:
+            with create_worker_pool(jobs) as worker_pool:
+                ret_status = _convert_if_changed(
+                    doxygen_xml_folders, output_file_names, replace(options, worker_pool=worker_pool)
+                )
+        else:
+            ret_status = _convert_if_changed(doxygen_xml_folders, output_file_names, options)
+
+    return ret_status
+
+
+def convert_doxygen_xml_to_lobster_common_interchange_format(
+    doxygen_xml_folder: str | list[str],
+    output_file_name: str | list[str],
+    options: ConversionOptions | None = None,
+) -> Ret:
     # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_folder
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
     # lobster-trace: SwRequirements.sw_req_output_file_format
     # lobster-trace: SwRequirements.sw_req_cli_output
-    # lobster-trace: SwRequirements.sw_req_no_trace
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    # lobster-trace: SwRequirements.sw_req_cli_gzip
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
     """Convert xml files in doxygen_xml_folder to LOBSTER common interchange format file with name
     output.
 
     Args:
-        doxygen_xml_folder (str): The Doxygen XML output directory, where the file index.xml is located.
-        output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        doxygen_xml_folder (str | list[str]): The Doxygen XML output directory, where the file index.xml
+            is located, or its path in an archive, e.g. doxygen.zip or doxygen.tar.gz/xml, a combined
+            doxygen XML file, e.g. all.xml, or the doxygen SQLite3 database, e.g. doxygen_sqlite3.db.
+            A list of them is converted in one process and their tags have to be unique.
+        output_file_name (str | list[str]): Path and file name for LOBSTER common interchange format file.
+            A list with one output file per doxygen XML folder to not merge them.
+        options (ConversionOptions | None): The conversion options. If None, the defaults are used.
 
     Return:
         Ret.RET_OK: LOBSTER common interchange format file successful created.
+        Ret.RET_ERROR_PARTIAL_OUTPUT: LOBSTER common interchange format file created without
+            the compounds, which can't be converted, see ConversionOptions.keep_going.
         Ret.RET_ERROR_FILEPATH_INVALID: No index.xml file in doxygen_folder
         Ret.RET_ERROR: Conversion not successful.
+
+    Raises:
+        ValueError: If the number of output files doesn't match the number of doxygen XML folders.
     """
     ret_status = Ret.RET_ERROR
     is_index_file_found = False
+    is_single_file = False
+    doxygen_xml_folders = [doxygen_xml_folder] if isinstance(doxygen_xml_folder, str) else doxygen_xml_folder
+    output_file_names = [output_file_name] if isinstance(output_file_name, str) else output_file_name
 
-    if not os.path.isfile(doxygen_xml_folder + "/index.xml"):
-        LOG.print_error(
-            f"No doxygen index.xml file in doxygen_xml_folder {doxygen_xml_folder}.")
-        ret_status = Ret.RET_ERROR_FILEPATH_INVALID
-        is_index_file_found = False
-    else:
-        is_index_file_found = True
+    if len(output_file_names) not in (1, len(doxygen_xml_folders)):
+        raise ValueError("One output file or one output file per doxygen XML folder is required.")
+
+    if options is None:
+        options = ConversionOptions()
+
+    try:
+        try:
+            for folder in doxygen_xml_folders:
+                is_single_file = is_doxygen_sqlite3_db(folder) or is_combined_xml_file(folder)
+                is_index_file_found = is_single_file or is_xml_file(folder + "/index.xml")
+
+                if not is_index_file_found:
+                    LOG.print_error(
+                        f"No doxygen index.xml file in doxygen_xml_folder {folder}.")
+                    ret_status = Ret.RET_ERROR_FILEPATH_INVALID
+                    break
+
+        except OSError as e:
+            # The archive, which contains the doxygen XML files, can't be read.
+            LOG.print_error(f"{e}")
+            ret_status = Ret.RET_ERROR_FILEPATH_INVALID
+            is_index_file_found = False
 
-    if is_index_file_found:
-        lobster_items = get_lobster_items_from_doxygen_xml_folder(doxygen_xml_folder)
-        # Continue only if no error during parsing.
-        if lobster_items is not None:
-            # Check if lobster items are found.
-            if 0 == len(lobster_items):
-                LOG.print_warning("No lobster items found in the doxygen XML output.")
+        if is_index_file_found:
+            if 1 < len(doxygen_xml_folders):
+                ret_status = _convert_folders(doxygen_xml_folders, output_file_names, options)
+            else:
+                if is_single_file:
+                    options = _get_single_file_options(options)
 
-            if rule_check(lobster_items) is True:
-                write_lobster_common_interchange_format_file(lobster_items, output_file_name)
-                ret_status = Ret.RET_OK
+                ret_status = _convert_if_changed(doxygen_xml_folders, output_file_names, options)
+
+    finally:
+        # The archives are opened again by the next conversion, e.g. of the server.
+        close_archives()
 
     return ret_status
+
+
+def _check_api_inputs(doxygen_xml_folders: list[str]) -> bool:
+    # lobster-trace: SwRequirements.sw_req_api
+    """Check the inputs of the Python API like the command line tool does,
+    but raise an exception instead of reporting an error.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, combined
+            doxygen XML files or doxygen SQLite3 databases.
+
+    Returns:
+        bool: True if the only input is a combined doxygen XML file or a doxygen SQLite3 database.
+
+    Raises:
+        ValueError: If a doxygen XML folder is given more than once.
+        FileNotFoundError: If a doxygen XML folder has no index.xml file.
+        OSError: If the archive, which contains the doxygen XML files, can't be read.
+    """
+    is_single_file = False
+    duplicate_folders = [folder for folder, count in Counter(doxygen_xml_folders).items() if 1 < count]
+
+    if 0 < len(duplicate_folders):
+        raise ValueError(f"The doxygen XML folders are given more than once: {', '.join(duplicate_folders)}")
+
+    for folder in doxygen_xml_folders:
+        is_single_file = is_doxygen_sqlite3_db(folder) or is_combined_xml_file(folder)
+
+        if not is_single_file and not is_xml_file(folder + "/index.xml"):
+            raise FileNotFoundError(f"No doxygen index.xml file in doxygen_xml_folder {folder}.")
+
+    return is_single_file and 1 == len(doxygen_xml_folders)
+
+
+def _iter_api_compound_lobster_items(
+    doxygen_xml_folders: list[str], options: ConversionOptions
+) -> Iterator[list[LobsterItem]]:
+    # lobster-trace: SwRequirements.sw_req_api
+    """Get the LobsterItems of one compound after the other for the Python API.
+    The compound cache and the shared worker processes are opened on the first
+    and closed after the last compound or if the iteration is stopped early.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, combined
+            doxygen XML files or doxygen SQLite3 databases.
+        options (ConversionOptions): The conversion options.
+
+    Yields:
+        list[LobsterItem]: The LobsterItems of a compound.
+
+    Raises:
+        ValueError: If a doxygen XML folder is given more than once.
+        FileNotFoundError: If a doxygen XML folder has no index.xml file.
+        ConversionError: If a compound can't be converted or violates a rule, the cause is already reported.
+    """
+    if options.report is None:
+        options = replace(options, report=ConversionReport())
+
+    if 1 < len(doxygen_xml_folders):
+        options = replace(options, tag_index=TagIndex())
+
+    try:
+        # A single input file is read in one pass without cache.
+        if _check_api_inputs(doxygen_xml_folders) is True:
+            options = replace(options, cache=None)
+
+        cache = None if options.cache is None else _open_cache(options.cache)
+        jobs = options.get_jobs()
+
+        try:
+            with create_worker_pool(jobs) if 1 < jobs and options.worker_pool is None else nullcontext() as pool:
+                options = replace(options, cache=cache, incremental=False, worker_pool=options.worker_pool or pool)
+
+                for _, compound_lobster_items in _iter_compound_lobster_items(doxygen_xml_folders, options):
+                    yield compound_lobster_items
+        finally:
+            if cache is not None:
+                cache.close()
+
+    finally:
+        # The archives are opened again by the next conversion.
+        close_archives()
+
+    if 0 < len(options.report.compound_errors):
+        for line in options.report.get_compound_error_report():
+            LOG.print_report(line)
+
+
+def iter_lobster_items(doxygen_xml_folder: str | list[str], **options) -> Iterator[LobsterItem]:
+    # lobster-trace: SwRequirements.sw_req_api
+    """Get the LobsterItems lazily, which are written to the LOBSTER common
+    interchange format file, without writing a file. The compounds are
+    converted one after the other while the LobsterItems are iterated.
+
+    Example:
+        for lobster_item in iter_lobster_items("doxygen/xml", jobs=4):
+            print(lobster_item.get_tag())
+
+    Args:
+        doxygen_xml_folder (str | list[str]): The Doxygen XML output directory, its path in an archive,
+            a combined doxygen XML file or the doxygen SQLite3 database, see
+            convert_doxygen_xml_to_lobster_common_interchange_format(). A list of them is converted
+            one after the other and their tags have to be unique.
+        **options: The fields of ConversionOptions, e.g. jobs=4 or trace_source=TraceSource.XREFITEM.
+            The compounds, which are skipped with keep_going=True, and the rule violations are
+            collected in report=ConversionReport().
+
+    Yields:
+        LobsterItem: The LobsterItems in the order of the output file.
+
+    Raises:
+        TypeError: If an option is not a field of ConversionOptions.
+        ValueError: If a doxygen XML folder is given more than once.
+        FileNotFoundError: If a doxygen XML folder has no index.xml file.
+        ConversionError: If a compound can't be converted or violates a rule, the cause is already reported.
+    """
+    doxygen_xml_folders = [doxygen_xml_folder] if isinstance(doxygen_xml_folder, str) else doxygen_xml_folder
+
+    for compound_lobster_items in _iter_api_compound_lobster_items(doxygen_xml_folders, ConversionOptions(**options)):
+        yield from iter_written_lobster_items(compound_lobster_items)
+
+
+def convert(doxygen_xml_folder: str | list[str], sink: BinaryIO | Callable[[bytes], object], **options) -> int:
+    # lobster-trace: SwRequirements.sw_req_api
+    """Convert to the LOBSTER common interchange format and write it to a
+    binary stream or a callback instead of a file. The compounds are converted
+    one after the other while the UTF-8 encoded text is written in chunks.
+
+    Example:
+        with socket.create_connection(("localhost", 8000)) as connection:
+            convert("doxygen/xml", connection.sendall, compact=True)
+
+    Args:
+        doxygen_xml_folder (str | list[str]): The Doxygen XML output directory, see iter_lobster_items().
+        sink (BinaryIO | Callable[[bytes], object]): The binary stream, e.g. io.BytesIO() or
+            sys.stdout.buffer, or a callback, which is called with each chunk of the text.
+            A stream isn't closed.
+        **options: The fields of ConversionOptions, see iter_lobster_items(). Only compact is
+            used from the output settings, gzip isn't applied.
+
+    Returns:
+        int: The number of written LobsterItems.
+
+    Raises:
+        TypeError: If an option is not a field of ConversionOptions.
+        ValueError: If a doxygen XML folder is given more than once.
+        FileNotFoundError: If a doxygen XML folder has no index.xml file.
+        ConversionError: If a compound can't be converted or violates a rule, the cause is already reported.
+            The sink has received an incomplete text then.
+    """
+    doxygen_xml_folders = [doxygen_xml_folder] if isinstance(doxygen_xml_folder, str) else doxygen_xml_folder
+    conversion_options = ConversionOptions(**options)
+    write = sink if callable(sink) else sink.write
+
+    # The compounds are closed immediately if the conversion fails, which releases the worker processes.
+    with closing(_iter_api_compound_lobster_items(doxygen_xml_folders, conversion_options)) as compounds:
+        item_count = write_lobster_common_interchange_format_stream(
+            itertools.chain.from_iterable(compounds), write, conversion_options.compact
+        )
+
+    return item_count
+
+
+def _get_lobster_report(
+    doxygen_xml_folders: list[str], lobster_config_file: str, level: str | None, options: ConversionOptions
+) -> tuple["Report", int]:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Create the lobster report with the LobsterItems of the doxygen XML folders,
+    which are converted while the report is created.
+
+    Args:
+        doxygen_xml_folders (list[str]): The Doxygen XML output directories, see iter_lobster_items().
+        lobster_config_file (str): The lobster configuration file, e.g. lobster.conf.
+        level (str | None): The implementation level of the LobsterItems, see get_lobster_report().
+        options (ConversionOptions): The conversion options.
+
+    Returns:
+        tuple[Report, int]: The lobster report and the number of LobsterItems in it.
+    """
+    # bmw-lobster is only imported for the report, which keeps the conversion to a file fast.
+    from lobster_doxygen.lobster_report import get_lobster_report  # pylint: disable=import-outside-toplevel
+
+    with closing(_iter_api_compound_lobster_items(doxygen_xml_folders, options)) as compounds:
+        lobster_items = _CountedLobsterItems(list(iter_written_lobster_items(compound)) for compound in compounds)
+        report = get_lobster_report(lobster_items, lobster_config_file, level)
+
+    return report, lobster_items.count
+
+
+def iter_lobster_implementations(
+    doxygen_xml_folder: str | list[str], level: str, **options
+) -> Iterator["Implementation"]:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Get the lobster Implementation items of the LobsterItems lazily, which
+    bmw-lobster would read from the LOBSTER common interchange format file.
+
+    Args:
+        doxygen_xml_folder (str | list[str]): The Doxygen XML output directory, see iter_lobster_items().
+        level (str): The name of the implementation level of the lobster configuration.
+        **options: The fields of ConversionOptions, see iter_lobster_items().
+
+    Yields:
+        Implementation: The lobster Implementation item with unresolved references.
+
+    Raises:
+        See iter_lobster_items().
+    """
+    from lobster_doxygen.lobster_report import get_lobster_implementation  # pylint: disable=import-outside-toplevel
+
+    for lobster_item in iter_lobster_items(doxygen_xml_folder, **options):
+        yield get_lobster_implementation(lobster_item, level)
+
+
+def create_lobster_report(
+    doxygen_xml_folder: str | list[str],
+    lobster_config_file: str,
+    level: str | None = None,
+    report_file_name: str | None = None,
+    **options,
+) -> "Report":
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Create the lobster report like lobster-report in the same process. The
+    LobsterItems are added to the implementation level directly, so no LOBSTER
+    common interchange format file is written and parsed again.
+
+    Example:
+        report = create_lobster_report("doxygen/xml", "lobster.conf", report_file_name="report.lobster")
+        print(report.coverage["Code"].coverage)
+
+    Args:
+        doxygen_xml_folder (str | list[str]): The Doxygen XML output directory, see iter_lobster_items().
+        lobster_config_file (str): The lobster configuration file, e.g. lobster.conf.
+        level (str | None): The name of the implementation level, which gets the LobsterItems.
+            If None, the only implementation level without source file of the configuration.
+        report_file_name (str | None): The report file, e.g. report.lobster, None to not write it.
+        **options: The fields of ConversionOptions, see iter_lobster_items().
+
+    Returns:
+        Report: The lobster report with the resolved references and the coverage.
+
+    Raises:
+        TypeError: If an option is not a field of ConversionOptions.
+        ValueError: If a doxygen XML folder is given more than once or the level can't be determined.
+        FileNotFoundError: If a doxygen XML folder has no index.xml file or the lobster configuration is missing.
+        ConversionError: If a compound can't be converted, violates a rule or bmw-lobster reports an error.
+            The cause is already reported.
+    """
+    doxygen_xml_folders = [doxygen_xml_folder] if isinstance(doxygen_xml_folder, str) else doxygen_xml_folder
+    report, _ = _get_lobster_report(doxygen_xml_folders, lobster_config_file, level, ConversionOptions(**options))
+
+    if report_file_name is not None:
+        report.write_report(report_file_name)
+
+    return report
+
+
+def convert_doxygen_xml_to_lobster_report(
+    doxygen_xml_folder: str | list[str],
+    lobster_config_file: str,
+    report_file_name: str,
+    level: str | None = None,
+    options: ConversionOptions | None = None,
+) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Convert the doxygen XML output and write the lobster report in the same
+    process, without the LOBSTER common interchange format file in between.
+
+    Args:
+        doxygen_xml_folder (str | list[str]): The Doxygen XML output directory, see
+            convert_doxygen_xml_to_lobster_common_interchange_format().
+        lobster_config_file (str): The lobster configuration file, e.g. lobster.conf.
+        report_file_name (str): The report file, e.g. report.lobster.
+        level (str | None): The name of the implementation level, which gets the LobsterItems.
+            If None, the only implementation level without source file of the configuration.
+        options (ConversionOptions | None): The conversion options. If None, the defaults are used.
+            The options of the output file don't apply.
+
+    Return:
+        Ret.RET_OK: Lobster report successful created.
+        Ret.RET_ERROR_PARTIAL_OUTPUT: Lobster report created without the compounds,
+            which can't be converted, see ConversionOptions.keep_going.
+        Ret.RET_ERROR_FILEPATH_INVALID: No index.xml file in doxygen_folder or no lobster configuration file.
+        Ret.RET_ERROR: Conversion not successful.
+    """
+    ret_status = Ret.RET_ERROR
+    doxygen_xml_folders = [doxygen_xml_folder] if isinstance(doxygen_xml_folder, str) else doxygen_xml_folder
+
+    if options is None:
+        options = ConversionOptions()
+
+    # Without statistics the phases are measured, but not reported.
+    options = replace(
+        options,
+        report=options.report if options.report is not None else ConversionReport(),
+        stats=options.stats if options.stats is not None else ConversionStats(),
+    )
+
+    try:
+        with options.stats.measure(PHASE_WRITE) as phase_stats:
+            report, item_count = _get_lobster_report(doxygen_xml_folders, lobster_config_file, level, options)
+            report.write_report(report_file_name)
+            phase_stats.items += item_count
+            phase_stats.bytes_written += os.path.getsize(report_file_name)
+
+        # Check if lobster items are found.
+        if 0 == item_count:
+            LOG.print_warning("No lobster items found in the doxygen XML output.")
+
+        ret_status = Ret.RET_OK if 0 == len(options.report.compound_errors) else Ret.RET_ERROR_PARTIAL_OUTPUT
+
+    except ConversionError:
+        # The cause is already reported.
+        pass
+
+    except FileNotFoundError as e:
+        LOG.print_error(f"{e}")
+        ret_status = Ret.RET_ERROR_FILEPATH_INVALID
+
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        LOG.print_error(f"{e}")
+
+    return ret_status
+
+
+# Main *************************************************************************
@@ -0,0 +1,388 @@
+"""Module to read the doxygen SQLite3 database.
+
+Module that reads the compounds and members from the doxygen SQLite3 output
+(GENERATE_SQLITE3) with a few SQL queries instead of parsing the doxygen XML
+files and returns their LobsterItems.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import os
+import re
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Iterator
+from xml.etree.ElementTree import Element, ParseError, fromstring
+
+from lobster_doxygen.conversion_options import ConversionOptions
+from lobster_doxygen.conversion_stats import PHASE_INDEX, ConversionStats
+from lobster_doxygen.get_lobster_items_from_doxygen_xml_folder import iter_compounddef_lobster_items
+from lobster_doxygen.iterparse_compound import (
+    IterparseCompounddef,
+    IterparseLocation,
+    IterparseMemberdef,
+    IterparseSectiondef,
+    get_description,
+)
+from lobster_doxygen.lobster_item import LobsterItem
+from lobster_doxygen.trace_source import TraceSource
+from lobster_doxygen.xrefitem_pages import XREFITEM_PAGES, add_paired_member_values, get_xrefitem_values_from_pages
+
+# Variables ********************************************************************
+
+# Suffix of the doxygen SQLite3 database file.
+SQLITE3_DB_SUFFIX = ".db"
+
+# Compound kinds, whose members are read. The members of other compounds are not converted.
+_MEMBER_COMPOUND_KINDS = ("class", "struct", "union", "interface", "file", "namespace", "group")
+
+# Order of the compounds in the doxygen index: classes, namespaces, files, groups,
+# pages and dirs, each sorted by name.
+_COMPOUND_ORDER = """
+    CASE compounddef.kind
+        WHEN 'namespace' THEN 1
+        WHEN 'file' THEN 2
+        WHEN 'group' THEN 3
+        WHEN 'page' THEN 4
+        WHEN 'dir' THEN 5
+        ELSE 0
+    END,
+    compounddef.name COLLATE NOCASE,
+    compounddef.rowid
+"""
+
+# Query of all compounds in index order. The description column is set on execution.
+_COMPOUNDS_QUERY = f"""
+    SELECT compounddef.rowid, refid.refid, compounddef.kind, compounddef.name, path.name, compounddef.line,
+        compounddef.column, {{description}}
+    FROM compounddef
+    JOIN refid ON refid.rowid = compounddef.rowid
+    LEFT JOIN path ON path.rowid = compounddef.file_id
+    ORDER BY {_COMPOUND_ORDER}
+"""
+
+# Query of the members of all compounds in the order of the compounds query.
+_MEMBERS_QUERY = f"""
+    SELECT member.scope_rowid, refid.refid, memberdef.kind, memberdef.name, path.name, memberdef.line,
+        memberdef.column, {{description}}
+    FROM compounddef
+    JOIN member ON member.scope_rowid = compounddef.rowid
+    JOIN memberdef ON memberdef.rowid = member.memberdef_rowid
+    JOIN refid ON refid.rowid = memberdef.rowid
+    LEFT JOIN path ON path.rowid = memberdef.file_id
+    WHERE compounddef.kind IN ({", ".join(f"'{kind}'" for kind in _MEMBER_COMPOUND_KINDS)})
+    ORDER BY {_COMPOUND_ORDER}, member.rowid
+"""
+
+# Query of the detaileddescriptions of the xrefitem pages.
+_XREFITEM_PAGES_QUERY = f"""
+    SELECT refid.refid, compounddef.detaileddescription
+    FROM compounddef
+    JOIN refid ON refid.rowid = compounddef.rowid
+    WHERE compounddef.kind = 'page' AND refid.refid IN ({", ".join("?" for _ in XREFITEM_PAGES)})
+"""
+
+# Query of the kind, name and body location of the members with a body, which
+# pair the ids of a member declared and defined in different files.
+_MEMBER_BODIES_QUERY = """
+    SELECT refid.refid, memberdef.kind, memberdef.name, memberdef.bodyfile_id, memberdef.bodystart
+    FROM memberdef
+    JOIN refid ON refid.rowid = memberdef.rowid
+    WHERE memberdef.bodyfile_id IS NOT NULL
+"""
+
+# Languages of doxygen's default extension mapping. The database doesn't contain
+# the language, files with other extensions are parsed as C++ by doxygen.
+_LANGUAGES = {
+    ".idl": "IDL", ".ddl": "IDL", ".odl": "IDL",
+    ".java": "Java",
+    ".as": "JavaScript", ".js": "JavaScript",
+    ".cs": "C#",
+    ".d": "D",
+    ".php": "PHP", ".php4": "PHP", ".php5": "PHP", ".inc": "PHP", ".phtml": "PHP",
+    ".m": "Objective-C", ".mm": "Objective-C",
+    ".py": "Python", ".pyw": "Python",
+    ".f": "Fortran", ".for": "Fortran", ".f90": "Fortran", ".f95": "Fortran", ".f03": "Fortran", ".f08": "Fortran",
+    ".f18": "Fortran",
+    ".vhd": "VHDL", ".vhdl": "VHDL",
+    ".md": "Markdown", ".markdown": "Markdown",
+    ".ice": "Slice",
+    ".l": "Lex",
+}
+
+# Default language of doxygen.
+_DEFAULT_LANGUAGE = "C++"
+
+# Regex pattern to match a "<" or "&", which doesn't start a tag or an entity.
+# The descriptions contain them unescaped, if doxygen converted their entities.
+_UNESCAPED_MARKUP_PATTERN = re.compile(
+    r'<(?!/?[a-zA-Z_][\w.-]*(\s+[\w:.-]+="[^"]*")*\s*/?>)|&(?!\w+;|#\d+;|#x[0-9a-fA-F]+;)'
+)
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def is_doxygen_sqlite3_db(path: str) -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Check whether the path refers to a doxygen SQLite3 database instead of a
+    doxygen XML folder.
+
+    Args:
+        path (str): The path of the doxygen XML folder or file.
+
+    Returns:
+        bool: True if it is a database file.
+    """
+    return path.lower().endswith(SQLITE3_DB_SUFFIX) and os.path.isfile(path)
+
+
+def _parse_description(description: str | None) -> Element | None:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Parse a description of the database, which is stored as XML fragment
+    like the content of the description element in the doxygen XML files.
+
+    Args:
+        description (str | None): The description.
+
+    Returns:
+        Element | None: The description element or None if there is no description.
+    """
+    element = None
+
+    if description is not None and 0 < len(description):
+        try:
+            element = fromstring(f"<description>{description}</description>")
+        except ParseError:
+            escaped_description = _UNESCAPED_MARKUP_PATTERN.sub(
+                lambda match: "&lt;" if match.group(0) == "<" else "&amp;", description
+            )
+            element = fromstring(f"<description>{escaped_description}</description>")
+
+    return element
+
+
+def _get_language(file_name: str | None) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Get the programming language of a source file.
+
+    Args:
+        file_name (str | None): The file name.
+
+    Returns:
+        str: The language, e.g. C++.
+    """
+    return _LANGUAGES.get(os.path.splitext(file_name or "")[1].lower(), _DEFAULT_LANGUAGE)
+
+
+def _get_location(file_name: str | None, line: int | None, column: int | None) -> IterparseLocation:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Get the location of a compound or member.
+
+    Args:
+        file_name (str | None): The file name.
+        line (int | None): The line number or None, e.g. for files.
+        column (int | None): The column number or None, e.g. for files.
+
+    Returns:
+        IterparseLocation: The location.
+    """
+    attributes = {"file": file_name or ""}
+
+    if line is not None:
+        attributes["line"] = str(line)
+        attributes["column"] = str(column)
+
+    return IterparseLocation(Element("location", attributes))
+
+
+def _get_compounddef(row: tuple) -> IterparseCompounddef:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Get the compound definition of a row of the compounds query.
+
+    Args:
+        row (tuple): The row of the compounds query.
+
+    Returns:
+        IterparseCompounddef: The compound definition without members.
+    """
+    _, refid, kind, name, file_name, line, column, description = row
+    attributes = {"id": refid, "kind": kind}
+
+    # A group has no language and location on compounddef level and a file no line.
+    if kind != "group":
+        attributes["language"] = _get_language(file_name)
+
+    compounddef = IterparseCompounddef(Element("compounddef", attributes))
+    compounddef.compoundname = name
+
+    if kind == "file":
+        compounddef.location = _get_location(file_name, None, None)
+    elif kind != "group":
+        compounddef.location = _get_location(file_name, line, column)
+
+    description_element = _parse_description(description)
+    if description_element is not None:
+        compounddef.detaileddescription = get_description(description_element)
+
+    return compounddef
+
+
+def _get_memberdef(row: tuple) -> IterparseMemberdef:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Get the member definition of a row of the members query.
+
+    Args:
+        row (tuple): The row of the members query.
+
+    Returns:
+        IterparseMemberdef: The member definition.
+    """
+    _, refid, kind, name, file_name, line, column, description = row
+
+    memberdef = IterparseMemberdef(Element("memberdef", {"id": refid, "kind": kind}))
+    memberdef.name = name
+    memberdef.location = _get_location(file_name, line, column)
+
+    description_element = _parse_description(description)
+    if description_element is not None:
+        memberdef.detaileddescription = get_description(description_element)
+
+    return memberdef
+
+
+def _iter_compounddefs(connection: sqlite3.Connection, read_descriptions: bool) -> Iterator[IterparseCompounddef]:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Query the compounds and their members and yield one compound definition
+    after the other in index order. The members are queried for all compounds at
+    once and are read in the same order as the compounds.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+        read_descriptions (bool): If False, the detaileddescriptions are not read.
+
+    Yields:
+        IterparseCompounddef: The compound definitions with their members.
+    """
+    compound_rows = connection.execute(_COMPOUNDS_QUERY.format(
+        description="compounddef.detaileddescription" if read_descriptions is True else "NULL"
+    ))
+    member_rows = connection.execute(_MEMBERS_QUERY.format(
+        description="memberdef.detaileddescription" if read_descriptions is True else "NULL"
+    ))
+    member_row = next(member_rows, None)
+
+    for compound_row in compound_rows:
+        compounddef = _get_compounddef(compound_row)
+        sectiondef = IterparseSectiondef()
+
+        while member_row is not None and member_row[0] == compound_row[0]:
+            sectiondef.append_memberdef(_get_memberdef(member_row))
+            member_row = next(member_rows, None)
+
+        compounddef.sectiondefs.append(sectiondef)
+
+        yield compounddef
+
+
+def _get_xrefitem_values(connection: sqlite3.Connection) -> dict[str, list[str]]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Read the requirement and justification xrefitem pages of the database.
+    The ids of a member declared and defined in different files are paired by
+    the body location of their memberdefs.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+
+    Returns:
+        dict[str, list[str]]: The texts of the aliases per id of the compound
+        or member, see get_xrefitem_values_from_pages().
+    """
+    pages = {}
+
+    for refid, description in connection.execute(_XREFITEM_PAGES_QUERY, XREFITEM_PAGES):
+        description_element = _parse_description(description)
+
+        if description_element is not None:
+            pages[refid] = description_element
+
+    xrefitem_values = get_xrefitem_values_from_pages(pages)
+    add_paired_member_values(
+        xrefitem_values,
+        ((refid, (kind, name, bodyfile_id, bodystart))
+         for refid, kind, name, bodyfile_id, bodystart in connection.execute(_MEMBER_BODIES_QUERY)),
+    )
+
+    return xrefitem_values
+
+
+def iter_compound_lobster_items_from_doxygen_sqlite3_db(
+    db_path: str, options: ConversionOptions | None = None
+) -> Iterator[tuple[str, list[LobsterItem]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    """Read the compounds and members of the doxygen SQLite3 database and yield
+    the LobsterItems of one compound after the other, like the ones of the
+    doxygen XML files.
+
+    Args:
+        db_path (str): The path of the doxygen SQLite3 database.
+        options (ConversionOptions | None): The conversion options. The cache and
+        the number of jobs are not used. If None, the defaults are used.
+
+    Yields:
+        tuple[str, list[LobsterItem]]: The path of the database with the id of
+        the compound, e.g. doxygen_sqlite3.db#class_a, and its LobsterItems.
+
+    Raises:
+        ConversionError: If the requirements or justifications differ from the
+        xrefitem pages in verify mode or a rule is violated. It is raised after all
+        compounds are processed, unless options.max_errors is reached before.
+        sqlite3.Error: If the database can't be read.
+    """
+    if options is None:
+        options = ConversionOptions()
+
+    stats = options.stats if options.stats is not None else ConversionStats()
+    xrefitem_values = None
+
+    # The database is only read, it may be write protected.
+    with closing(sqlite3.connect(Path(db_path).absolute().as_uri() + "?mode=ro", uri=True)) as connection:
+        with stats.measure(PHASE_INDEX):
+            if options.trace_source != TraceSource.DESCRIPTION:
+                xrefitem_values = _get_xrefitem_values(connection)
+
+            if options.input_files is not None:
+                options.input_files.append(db_path)
+
+        yield from iter_compounddef_lobster_items(
+            _iter_compounddefs(connection, options.trace_source != TraceSource.XREFITEM),
+            db_path,
+            xrefitem_values,
+            options,
+        )
+
+
+# Main *************************************************************************
@@ -4,6 +4,7 @@ Module that parse doxygen index.xml file and returns list with LobsterItems.
 
 Author: Andreas Merkle (andreas.merkle@newtec.de)
 """
+# pylint: disable=too-many-lines
 
 # lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
 # Copyright (c) NewTec GmbH 2025   -   www.newtec.de
@@ -23,14 +24,52 @@ Author: Andreas Merkle (andreas.merkle@newtec.de)
 
 # Imports **********************************************************************
 
+import hashlib
 import re
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
 import doxmlparser
-from doxmlparser.compound import DoxCompoundKind, DoxMemberKind, compounddefType, descriptionType
-
+from doxmlparser.compound import DoxCompoundKind, DoxMemberKind, compounddefType, descriptionType, memberdefType
+
+from lobster_doxygen.compound_cache import CompoundCache
+from lobster_doxygen.compound_error import CompoundElementError, CompoundError, get_compound_error
+from lobster_doxygen.conversion_error import ConversionError
+from lobster_doxygen.conversion_options import ConversionOptions
+from lobster_doxygen.conversion_report import ConversionReport
+from lobster_doxygen.conversion_stats import (
+    PHASE_COMPOUNDS,
+    PHASE_INDEX,
+    PHASE_RULE_CHECK,
+    CompoundStats,
+    ConversionStats,
+    Stopwatch,
+)
+from lobster_doxygen.iterparse_compound import (
+    IterparseCompounddef,
+    IterparseDescription,
+    IterparseMemberdef,
+    iterparse_compounddefs,
+)
 from lobster_doxygen.lobster_item import LobsterItem
 from lobster_doxygen.lobster_kind import LobsterKind
 from lobster_doxygen.printer import Printer
+from lobster_doxygen.rule_check import check_rules
+from lobster_doxygen.trace_source import TraceSource
 from lobster_doxygen.utils import indent
+from lobster_doxygen.write_lobster_common_interchange_format_file import is_replaced_by_children
+from lobster_doxygen.xml_archive import get_source_file, get_xml_file_size, is_xml_file, open_xml_file
+from lobster_doxygen.xml_parser import XmlParser
+from lobster_doxygen.xrefitem_pages import (
+    add_paired_member_values,
+    get_combined_xrefitem_values,
+    get_member_bodies,
+    get_xrefitem_page_paths,
+    get_xrefitem_values,
+)
 
 
 # Variables ********************************************************************
@@ -57,21 +96,164 @@ _LOBSTER_ITEM_KINDS = [
 # Regex pattern to match TRLC identifier and optional TRLC package prefix.
 _IDENTIFIER_PATTERN = re.compile(r"([a-zA-Z][a-zA-Z0-9_]*\.)?[a-zA-Z][a-zA-Z0-9_]*")
 
+# Number of compound files each worker process gets per task in parallel mode.
+# Multiple tasks per worker balance the load if compound files differ in size.
+_TASKS_PER_WORKER = 4
+
+# Maximum number of compound files per task in parallel mode.
+_MAX_COMPOUNDS_PER_TASK = 16
+
+# Number of tasks per worker process, which are submitted to the pool in advance.
+# Limits the number of parsed compounds, which wait to be processed.
+_PENDING_TASKS_PER_WORKER = 2
+
 # Classes **********************************************************************
 
+
+@dataclass(frozen=True)
+class _CompoundFile:
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    """A compound file to be parsed."""
+
+    path: str  # The path of the compound file.
+    duplicate_member_ids: frozenset[str]  # Ids of the members, which are already part of a previous compound.
+    member_count: int = 0  # Number of members of the compound, as listed in the index.
+
+
+@dataclass(frozen=True)
+class _ParseSettings:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """Settings to parse the compound files, which are passed to the worker processes."""
+
+    xml_parser: XmlParser  # The XML parser to use.
+    read_descriptions: bool  # If False, the detaileddescriptions are not read.
+    capture_all: bool = False  # Capture the complete log output, independent of verbose mode.
+
+
+class _SharedMembers:
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    # lobster-trace: SwRequirements.sw_req_rule_class
+    """The LobsterItems of the members, which several compounds list. A member
+    is only converted with the first compound, which lists it. If that compound
+    is written without its children, e.g. a namespace with requirements, the
+    member is written with the next compound, which lists it and whose children
+    are written, e.g. its file. The rules are checked for each compound, which
+    lists the member, e.g. for a group with requirements and its function.
+    """
+
+    def __init__(self, member_ids: frozenset[str] | None = None) -> None:
+        """Initialize the shared members.
+
+        Args:
+            member_ids (frozenset[str] | None): Ids of the members, which later
+                compounds list again. If None, all members are kept.
+        """
+        self._member_ids = member_ids
+        self._lobster_items = {}  # LobsterItem with requirements or justifications per member id.
+        self._unwritten_lobster_items = {}  # LobsterItem, which isn't written yet, per member id.
+
+    def _is_shared(self, lobster_item: LobsterItem) -> bool:
+        """Check whether later compounds may list the member again.
+
+        Args:
+            lobster_item (LobsterItem): The LobsterItem of the member.
+
+        Returns:
+            bool: True if the member is kept, False otherwise.
+        """
+        return self._member_ids is None or lobster_item.item_id in self._member_ids
+
+    def add(self, lobster_items: list[LobsterItem], duplicate_member_ids: frozenset[str]) -> list[LobsterItem]:
+        """Add the LobsterItems of a compound. The members, which are converted
+        with a previous compound, but not written yet, become children of the
+        compound, if its children are written.
+
+        Args:
+            lobster_items (list[LobsterItem]): The LobsterItems of the compound.
+            duplicate_member_ids (frozenset[str]): Ids of the members, which are
+                converted with a previous compound.
+
+        Returns:
+            list[LobsterItem]: The LobsterItems of the compound to be written.
+        """
+        unwritten_children = [
+            self._unwritten_lobster_items[member_id] for member_id in sorted(duplicate_member_ids)
+            if member_id in self._unwritten_lobster_items
+        ]
+        lobster_items = list(lobster_items)
+
+        for index, lobster_item in enumerate(lobster_items):
+            if 0 < len(unwritten_children):
+                lobster_item_with_children = lobster_item.copy_with_children(
+                    lobster_item.get_children() + unwritten_children
+                )
+
+                if is_replaced_by_children(lobster_item_with_children) is True:
+                    lobster_items[index] = lobster_item_with_children
+
+                    for lobster_item_child in unwritten_children:
+                        del self._unwritten_lobster_items[lobster_item_child.item_id]
+
+                    unwritten_children = []
+
+            are_children_written = is_replaced_by_children(lobster_items[index])
+
+            for lobster_item_child in lobster_items[index].get_children():
+                if self._is_shared(lobster_item_child) is True:
+                    if lobster_item_child.has_refs() or lobster_item_child.has_just_up():
+                        self._lobster_items[lobster_item_child.item_id] = lobster_item_child
+
+                    if are_children_written is False:
+                        self._unwritten_lobster_items[lobster_item_child.item_id] = lobster_item_child
+
+        return lobster_items
+
+    def get_rule_check_items(
+        self, lobster_items: list[LobsterItem], duplicate_member_ids: frozenset[str]
+    ) -> list[LobsterItem]:
+        """Get the LobsterItems of a compound with the kept members, which are
+        converted with a previous compound, as children again.
+
+        Args:
+            lobster_items (list[LobsterItem]): The LobsterItems of the compound, see add().
+            duplicate_member_ids (frozenset[str]): Ids of the members, which are
+                converted with a previous compound.
+
+        Returns:
+            list[LobsterItem]: The LobsterItems to check the rules.
+        """
+        rule_check_items = []
+
+        for lobster_item in lobster_items:
+            child_ids = {lobster_item_child.item_id for lobster_item_child in lobster_item.get_children()}
+            shared_children = [
+                self._lobster_items[member_id] for member_id in sorted(duplicate_member_ids)
+                if member_id in self._lobster_items and member_id not in child_ids
+            ]
+
+            if 0 < len(shared_children):
+                lobster_item = lobster_item.copy_with_children(lobster_item.get_children() + shared_children)
+
+            rule_check_items.append(lobster_item)
+
+        return rule_check_items
+
+
 # Functions ********************************************************************
 
 
-def _get_xrefdescriptions_from_detaileddescription(detaileddescription: descriptionType) -> list[descriptionType]:
+def _get_xrefdescriptions_from_detaileddescription(
+    detaileddescription: descriptionType | IterparseDescription,
+) -> list[descriptionType | IterparseDescription]:
     # lobster-trace: SwRequirements.sw_req_output_file_format
     """Get a list with xrefdescriptions from detaileddescription.
 
     Args:
-        detaileddescription (descriptionType): The detaileddescription to be parsed
-        for xrefdescriptions.
+        detaileddescription (descriptionType | IterparseDescription): The detaileddescription
+        to be parsed for xrefdescriptions.
 
     Return:
-        list[descriptionType]: List with xrefdescriptions.
+        list[descriptionType | IterparseDescription]: List with xrefdescriptions.
     """
     xrefdescriptions = []
 
@@ -83,116 +265,232 @@ def _get_xrefdescriptions_from_detaileddescription(detaileddescription: descript
     return xrefdescriptions
 
 
-def _get_refs_and_just_up_from_detaileddescription(detaileddescription: descriptionType) -> tuple[list[str], list[str]]:
+def _get_xref_values_from_detaileddescription(
+    detaileddescription: descriptionType | IterparseDescription,
+) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    """Get the texts of all xrefdescription paras in the detaileddescription.
+
+    Args:
+        detaileddescription (descriptionType | IterparseDescription): The detaileddescription
+        to be parsed for xrefdescriptions.
+
+    Returns:
+        list[str]: The stripped texts of the xrefdescription paras.
+    """
+    values = []
+
+    for xrefdescription in _get_xrefdescriptions_from_detaileddescription(detaileddescription):
+        for para in xrefdescription.get_para():
+            values.append(para.get_valueOf_().strip())
+
+    return values
+
+
+def _get_refs_and_just_up_from_values(values: list[str], print_log: bool = True) -> tuple[list[str], list[str]]:
     # lobster-trace: SwRequirements.sw_req_output_file_format
     # lobster-trace: SwRequirements.sw_req_valid_id
     # lobster-trace: SwRequirements.sw_req_invalid_input
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Retrieve requirements with _REQ_SPECIFIER and justifications with
+    _JUSTIFICATION_SPECIFIER from the xref texts and return them with two
+    separate lists.
+
+    Args:
+        values (list[str]): The stripped xref texts, e.g. "Requirement: REQ".
+        print_log (bool): Print the found requirements, justifications and
+        invalid identifiers.
+
+    Returns:
+        list[str], list[str]:
+        List with requirements strings found in the xref texts,
+        List with justification strings found in the xref texts
+    """
+    refs = []
+    just_up = []
+
+    for value in values:
+        # Look for requirement reference.
+        if value.startswith(f"{_REQ_SPECIFIER}: "):
+            doxygen_parsed_req = value.removeprefix(f"{_REQ_SPECIFIER}: ")
+
+            # Check for a valid identifier.
+            req_match = _IDENTIFIER_PATTERN.search(doxygen_parsed_req)
+
+            # Keep parsing if a valid identifier was found at the expected position.
+            if req_match is not None and 0 == req_match.span()[0]:
+                req_id = req_match.group(0)
+                refs.append(req_id)
+                if print_log is True:
+                    LOG.print_info("%s: %s", _REQ_SPECIFIER, req_id, level=3)
+            elif print_log is True:
+                LOG.print_warning(indent(3, f"Invalid identifier in doxygen xml: {doxygen_parsed_req}."))
+
+        # Look for justification.
+        elif value.startswith(f"{_JUSTIFICATION_SPECIFIER}: "):
+            just_up_id = value.removeprefix(f"{_JUSTIFICATION_SPECIFIER}: ")
+            just_up.append(just_up_id)
+            if print_log is True:
+                LOG.print_info("%s: %s", _JUSTIFICATION_SPECIFIER, just_up_id, level=3)
+
+    return refs, just_up
+
+
+def _get_refs_and_just_up_from_detaileddescription(
+    detaileddescription: descriptionType | IterparseDescription,
+) -> tuple[list[str], list[str]]:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
     """Parse the detaileddescription for xrefdescription to retrieve requirement
     with _REQ_SPECIFIER and justification with _JUSTIFICATION_SPECIFIER
     references and return them with two separate lists.
 
     Args:
-        detaileddescription (descriptionType): The detaileddescription to be parsed
-        for requirements and justifications.
+        detaileddescription (descriptionType | IterparseDescription): The detaileddescription
+        to be parsed for requirements and justifications.
 
     Returns:
         list[str], list[str]:
         List with requirements strings found in detaileddescription,
         List with justification strings found in detaileddescripiton
     """
-    refs = []
-    just_up = []
+    return _get_refs_and_just_up_from_values(_get_xref_values_from_detaileddescription(detaileddescription))
 
-    xrefdescriptions = _get_xrefdescriptions_from_detaileddescription(detaileddescription)
-    for xrefdescription in xrefdescriptions:
-        for para in xrefdescription.get_para():
-            value = para.get_valueOf_().strip()
 
-            # Look for requirement reference.
-            if value.startswith(f"{_REQ_SPECIFIER}: "):
-                doxygen_parsed_req = value.removeprefix(f"{_REQ_SPECIFIER}: ")
+def _get_language(compounddef: compounddefType | IterparseCompounddef) -> str:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    """Get the programming language of the compound and its members.
 
-                # Check for a valid identifier.
-                req_match = _IDENTIFIER_PATTERN.search(doxygen_parsed_req)
+    Args:
+        compounddef (compounddefType | IterparseCompounddef): The compound definition.
 
-                # Keep parsing if a valid identifier was found at the expected position.
-                if req_match is not None and 0 == req_match.span()[0]:
-                    req_id = req_match.group(0)
-                    refs.append(req_id)
-                    LOG.print_info(indent(3, f"{_REQ_SPECIFIER}: {req_id}"))
-                else:
-                    LOG.print_warning(indent(3, f"Invalid identifier in doxygen xml: {doxygen_parsed_req}."))
+    Returns:
+        str: The language or "unspecified", because a group has no language on compounddef level.
+    """
+    language = compounddef.get_language()
 
-            # Look for justification.
-            elif value.startswith(f"{_JUSTIFICATION_SPECIFIER}: "):
-                just_up_id = value.removeprefix(f"{_JUSTIFICATION_SPECIFIER}: ")
-                just_up.append(just_up_id)
-                LOG.print_info(indent(3, f"{_JUSTIFICATION_SPECIFIER}: {just_up_id}"))
+    if language is None:
+        language = "unspecified"
 
-    return refs, just_up
+    return language
 
 
-def _get_lobster_item_children_from_compounddef(compounddef: compounddefType) -> list[LobsterItem]:
+def _get_lobster_item_children_from_compounddef(
+    compounddef: compounddefType | IterparseCompounddef,
+    read_descriptions: bool = True,
+    duplicate_member_ids: frozenset[str] = frozenset(),
+) -> list[LobsterItem]:
     # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
     """Parse the members of the compound definition and returns list of
     children LobsterItems.
 
     Args:
-        compounddef (compounddefType): The compound definition to be parsed for children.
+        compounddef (compounddefType | IterparseCompounddef): The compound definition to be
+        parsed for children.
+        read_descriptions (bool): Read the requirements and justifications from the
+        detaileddescriptions of the members.
+        duplicate_member_ids (frozenset[str]): Ids of the members, which are skipped
+        because they are already part of a previous compound.
 
     Returns:
         list[LobsterItem]: List with LobsterItem children.
 
+    Raises:
+        CompoundElementError: If a member can't be converted.
     """
     lobster_item_children = []
-    function_like_kind = [DoxMemberKind.FUNCTION, DoxMemberKind.PROTOTYPE]
 
     for sectiondef in compounddef.get_sectiondef():
         for memberdef in sectiondef.get_memberdef():
-            LOG.print_info(indent(2, f"member: {memberdef.get_name()}"))
-            lobster_item_child = None
-
-            if compounddef.get_kind() in [DoxCompoundKind.CLASS, DoxCompoundKind.STRUCT, DoxCompoundKind.INTERFACE]:
-                if memberdef.get_kind() in function_like_kind:
-                    # Process function-like members
-                    lobster_item_child = LobsterItem(memberdef.get_id())
-                    lobster_item_child.kind = LobsterKind.METHOD
-                    lobster_item_child.name = f"{compounddef.get_compoundname()}."
-
-            elif compounddef.get_kind() in [DoxCompoundKind.FILE, DoxCompoundKind.NAMESPACE, DoxCompoundKind.GROUP]:
-                if memberdef.get_kind() in function_like_kind:
-                    # Process function-like members
-                    lobster_item_child = LobsterItem(memberdef.get_id())
-                    lobster_item_child.kind = LobsterKind.FUNCTION
-
-            # Update only if LobsterItem was created
-            if lobster_item_child is not None:
-                LOG.print_info(indent(3, f"kind: {memberdef.get_kind()}"))
+            LOG.print_info("member: %s", memberdef.get_name(), level=2)
 
-                lobster_item_child.language = compounddef.get_language()
-                lobster_item_child.name += memberdef.get_name()
-                lobster_item_child.file_name = memberdef.get_location().get_file()
-                lobster_item_child.line = memberdef.get_location().get_line()
-                lobster_item_child.column = memberdef.get_location().get_column()
+            if memberdef.get_id() in duplicate_member_ids:
+                LOG.print_info("kind: %s (duplicate)", memberdef.get_kind(), level=3)
+                continue
 
-                lobster_item_child.refs, lobster_item_child.just_up = _get_refs_and_just_up_from_detaileddescription(
-                    memberdef.get_detaileddescription()
-                )
+            try:
+                lobster_item_child = _get_lobster_item_child_from_memberdef(compounddef, memberdef, read_descriptions)
+
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                raise CompoundElementError(
+                    f"compounddef[@id='{compounddef.get_id()}']/sectiondef/memberdef[@id='{memberdef.get_id()}']", e
+                ) from e
 
+            if lobster_item_child is not None:
                 lobster_item_children.append(lobster_item_child)
-            else:
-                LOG.print_info(indent(3, f"kind: {memberdef.get_kind()} (skipped)"))
 
     return lobster_item_children
 
 
-def _lobster_item_from_compounddef(compounddef: compounddefType) -> LobsterItem:
+def _get_lobster_item_child_from_memberdef(
+    compounddef: compounddefType | IterparseCompounddef,
+    memberdef: memberdefType | IterparseMemberdef,
+    read_descriptions: bool,
+) -> LobsterItem | None:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    """Get the children LobsterItem of a member, if its kind results in one.
+
+    Args:
+        compounddef (compounddefType | IterparseCompounddef): The compound definition of the member.
+        memberdef (memberdefType | IterparseMemberdef): The member definition.
+        read_descriptions (bool): Read the requirements and justifications from the
+        detaileddescription of the member.
+
+    Returns:
+        LobsterItem | None: The children LobsterItem or None if the kind of the member is skipped.
+    """
+    lobster_item_child = None
+    function_like_kind = [DoxMemberKind.FUNCTION, DoxMemberKind.PROTOTYPE]
+
+    if compounddef.get_kind() in [DoxCompoundKind.CLASS, DoxCompoundKind.STRUCT, DoxCompoundKind.INTERFACE]:
+        if memberdef.get_kind() in function_like_kind:
+            # Process function-like members
+            lobster_item_child = LobsterItem(memberdef.get_id())
+            lobster_item_child.kind = LobsterKind.METHOD
+            lobster_item_child.name = f"{compounddef.get_compoundname()}."
+
+    elif compounddef.get_kind() in [DoxCompoundKind.FILE, DoxCompoundKind.NAMESPACE, DoxCompoundKind.GROUP]:
+        if memberdef.get_kind() in function_like_kind:
+            # Process function-like members
+            lobster_item_child = LobsterItem(memberdef.get_id())
+            lobster_item_child.kind = LobsterKind.FUNCTION
+
+    # Update only if LobsterItem was created
+    if lobster_item_child is not None:
+        LOG.print_info("kind: %s", memberdef.get_kind(), level=3)
+
+        lobster_item_child.language = _get_language(compounddef)
+        lobster_item_child.name += memberdef.get_name()
+        lobster_item_child.file_name = memberdef.get_location().get_file()
+        lobster_item_child.line = memberdef.get_location().get_line()
+        lobster_item_child.column = memberdef.get_location().get_column()
+
+        if read_descriptions is True:
+            lobster_item_child.refs, lobster_item_child.just_up = (
+                _get_refs_and_just_up_from_detaileddescription(memberdef.get_detaileddescription())
+            )
+    else:
+        LOG.print_info("kind: %s (skipped)", memberdef.get_kind(), level=3)
+
+    return lobster_item_child
+
+
+def _lobster_item_from_compounddef(
+    compounddef: compounddefType | IterparseCompounddef,
+    read_descriptions: bool = True,
+    duplicate_member_ids: frozenset[str] = frozenset(),
+) -> LobsterItem:
     # lobster-trace: SwRequirements.sw_req_output_file_format
     """Creates a LobsterItem from comppunddef.
 
     Args:
-        compounddef (compounddefType): The compound definition to be parsed
-        for LobsterItem.
+        compounddef (compounddefType | IterparseCompounddef): The compound definition
+        to be parsed for LobsterItem.
+        read_descriptions (bool): Read the requirements and justifications from the
+        detaileddescriptions of the compound and its members.
+        duplicate_member_ids (frozenset[str]): Ids of the members, which are skipped.
 
     Returns:
         LobsterItem: LobsterItem created from compounddef.
@@ -202,11 +500,7 @@ def _lobster_item_from_compounddef(compounddef: compounddefType) -> LobsterItem:
     # DoxCompoundKind to LobsterKind
     lobster_item.kind = LobsterKind[compounddef.get_kind().upper()]
 
-    # A group has no language on compounddef level.
-    if compounddef.get_language() is None:
-        lobster_item.language = "unspecified"
-    else:
-        lobster_item.language = compounddef.get_language()
+    lobster_item.language = _get_language(compounddef)
 
     lobster_item.name = compounddef.get_compoundname()
 
@@ -221,22 +515,58 @@ def _lobster_item_from_compounddef(compounddef: compounddefType) -> LobsterItem:
         lobster_item.column = compounddef.get_location().get_column()
 
     # Adds refs and just_up attributes
-    lobster_item.refs, lobster_item.just_up = _get_refs_and_just_up_from_detaileddescription(
-        compounddef.get_detaileddescription()
-    )
+    if read_descriptions is True:
+        lobster_item.refs, lobster_item.just_up = _get_refs_and_just_up_from_detaileddescription(
+            compounddef.get_detaileddescription()
+        )
 
-    lobster_item_children = _get_lobster_item_children_from_compounddef(compounddef)
+    lobster_item_children = _get_lobster_item_children_from_compounddef(
+        compounddef, read_descriptions, duplicate_member_ids
+    )
     for lobster_item_child in lobster_item_children:
         lobster_item.append_lobster_child(lobster_item_child)
 
     return lobster_item
 
 
-def _get_lobster_items_from_compound(compound_path: str) -> list[LobsterItem]:
+def _get_compounddefs(
+    compound_file: str | BinaryIO, xml_parser: XmlParser
+) -> list[compounddefType] | Iterator[IterparseCompounddef]:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Parse the compound file with the selected XML parser.
+
+    Args:
+        compound_file (str | BinaryIO): The Path of the compound file to be parsed
+        or the opened compound file, see open_xml_file().
+        xml_parser (XmlParser): The XML parser to use.
+
+    Returns:
+        list[compounddefType] | Iterator[IterparseCompounddef]: The compound definitions.
+    """
+    if xml_parser == XmlParser.ITERPARSE:
+        compounddefs = iterparse_compounddefs(compound_file)
+    else:
+        compounddefs = doxmlparser.compound.parse(compound_file, True).get_compounddef()
+
+    return compounddefs
+
+
+def _get_lobster_items_from_compound(
+    compound_path: str,
+    xml_parser: XmlParser = XmlParser.DOXMLPARSER,
+    read_descriptions: bool = True,
+    duplicate_member_ids: frozenset[str] = frozenset(),
+) -> list[LobsterItem]:
     """Parse the compound file and extract a list with LobsterItems inside file.
 
     Args:
-        compound_path (str): The Path of the compound file to be parsed.
+        compound_path (str): The Path of the compound file to be parsed, which
+        may be a file in an archive.
+        xml_parser (XmlParser): The XML parser to use.
+        read_descriptions (bool): Read the requirements and justifications from
+        the detaileddescriptions.
+        duplicate_member_ids (frozenset[str]): Ids of the members, which are skipped
+        because they are already part of a previous compound.
 
     Returns:
         list[LobsterItem]: The list of LobsterItems from compound.
@@ -251,31 +581,1156 @@ def _get_lobster_items_from_compound(compound_path: str) -> list[LobsterItem]:
     # lobster-trace: SwRequirements.sw_req_no_group
     # lobster-trace: SwRequirements.sw_req_group
     # lobster-trace: SwRequirements.sw_req_unspecified
+    # lobster-trace: SwRequirements.sw_req_cli_parser
     lobster_items = []
-    root_obj = doxmlparser.compound.parse(compound_path, True)
 
-    for compounddef in root_obj.get_compounddef():
-        LOG.print_info(f"compound: {compounddef.get_compoundname()}")
+    # The compound file in an archive is kept open until iterparse has parsed it completely.
+    with open_xml_file(compound_path) as compound_file:
+        for compounddef in _get_compounddefs(compound_file, xml_parser):
+            lobster_item = _get_lobster_item_from_compounddef(compounddef, read_descriptions, duplicate_member_ids)
 
-        kind = compounddef.get_kind()
+            if lobster_item is not None:
+                lobster_items.append(lobster_item)
+
+    return lobster_items
+
+
+def _get_lobster_item_from_compounddef(
+    compounddef: compounddefType | IterparseCompounddef,
+    read_descriptions: bool,
+    duplicate_member_ids: frozenset[str],
+) -> LobsterItem | None:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Get the LobsterItem of a compound definition, if its kind results in one.
+
+    Args:
+        compounddef (compounddefType | IterparseCompounddef): The compound definition.
+        read_descriptions (bool): Read the requirements and justifications from
+        the detaileddescriptions.
+        duplicate_member_ids (frozenset[str]): Ids of the members, which are skipped
+        because they are already part of a previous compound.
+
+    Returns:
+        LobsterItem | None: The LobsterItem or None if the kind of the compound is skipped.
+
+    Raises:
+        CompoundElementError: If the compound definition or one of its members can't be converted.
+    """
+    lobster_item = None
+
+    LOG.print_info("compound: %s", compounddef.get_compoundname())
+
+    kind = compounddef.get_kind()
+
+    if kind in _LOBSTER_ITEM_KINDS:
+        LOG.print_info("kind: %s", kind, level=1)
+
+        try:
+            lobster_item = _lobster_item_from_compounddef(compounddef, read_descriptions, duplicate_member_ids)
+
+        except CompoundElementError:
+            # The element path of the member is already known.
+            raise
+
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            raise CompoundElementError(f"compounddef[@id='{compounddef.get_id()}']", e) from e
+    else:
+        LOG.print_info("kind: %s (skipped)", kind, level=1)
+
+    return lobster_item
+
+
+def _init_worker(verbose: bool) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """Initialize a worker process of the compound parser pool.
+
+    Args:
+        verbose (bool): True if the main process runs in verbose mode.
+    """
+    if verbose is True:
+        Printer.set_verbose()
 
-        if kind in _LOBSTER_ITEM_KINDS:
-            LOG.print_info(indent(1, f"kind: {kind}"))
-            lobster_item = _lobster_item_from_compounddef(compounddef)
-            lobster_items.append(lobster_item)
-        else:
-            LOG.print_info(indent(1, f"kind: {kind} (skipped)"))
+
+def create_worker_pool(jobs: int) -> ProcessPoolExecutor:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Create a pool of worker processes to parse the compound files, which
+    several conversions can share, see ConversionOptions.worker_pool. The
+    worker processes are started on demand and the verbose mode is taken over.
+
+    Args:
+        jobs (int): The number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The pool of worker processes, which has to be shut down by the caller.
+    """
+    return ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(LOG.is_verbose(),))
+
+
+def _get_lobster_items_or_error_from_compound(
+    settings: _ParseSettings, compound_file: _CompoundFile
+) -> list[LobsterItem] | CompoundError:
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Parse the compound file. A failure is isolated from the other compound
+    files and returned as error, which the main process reports.
+
+    Args:
+        settings (_ParseSettings): The settings to parse the compound file.
+        compound_file (_CompoundFile): The compound file to be parsed.
+
+    Returns:
+        list[LobsterItem] | CompoundError: The list of LobsterItems from compound
+        or the error, if it can't be parsed or converted.
+    """
+    try:
+        lobster_items = _get_lobster_items_from_compound(
+            compound_file.path, settings.xml_parser, settings.read_descriptions, compound_file.duplicate_member_ids
+        )
+
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        lobster_items = get_compound_error(compound_file.path, e)
 
     return lobster_items
 
 
-def get_lobster_items_from_doxygen_xml_folder(doxygen_xml_folder: str) -> list[LobsterItem] | None:
+def _get_lobster_items_and_log_from_compound(
+    settings: _ParseSettings, compound_file: _CompoundFile
+) -> tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    """Parse the compound file with captured log output. The log output is
+    returned, to be printed by the main process in index order or to be cached.
+
+    Args:
+        settings (_ParseSettings): The settings to parse the compound file.
+        compound_file (_CompoundFile): The compound file to be parsed.
+
+    Returns:
+        tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]: The list
+        of LobsterItems from compound or its error and the captured log output.
+    """
+    Printer.start_capture(settings.capture_all)
+
+    try:
+        lobster_items = _get_lobster_items_or_error_from_compound(settings, compound_file)
+    finally:
+        log_records = Printer.stop_capture()
+
+    return lobster_items, log_records
+
+
+def _get_lobster_items_and_log_from_compounds(
+    settings: _ParseSettings, compound_files: list[_CompoundFile]
+) -> list[tuple[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]], CompoundStats]]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Parse several compound files with captured log output in a worker process.
+
+    Args:
+        settings (_ParseSettings): The settings to parse the compound files.
+        compound_files (list[_CompoundFile]): The compound files to be parsed.
+
+    Returns:
+        list[tuple[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]], CompoundStats]]:
+        The list of LobsterItems or the error and the captured log output of each compound
+        and the times measured in the worker process to parse it.
+    """
+    results = []
+
+    for compound_file in compound_files:
+        stopwatch = Stopwatch()
+        result = _get_lobster_items_and_log_from_compound(settings, compound_file)
+        results.append((result, CompoundStats(compound_file.path, *stopwatch.get_times())))
+
+    return results
+
+
+def _add_parsed_compound_stats(
+    stats: ConversionStats | None, compound_file: _CompoundFile, compound_stats: CompoundStats, is_in_worker: bool
+) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Add the measured values of a parsed compound file to the statistics.
+
+    Args:
+        stats (ConversionStats | None): The statistics or None if they are not collected.
+        compound_file (_CompoundFile): The parsed compound file.
+        compound_stats (CompoundStats): The times measured to parse the compound file.
+        is_in_worker (bool): True if the compound file was parsed in a worker process.
+    """
+    if stats is not None:
+        stats.add_compound(
+            compound_stats, compound_file.member_count, get_xml_file_size(compound_file.path), is_in_worker
+        )
+
+
+def _get_lobster_items_from_compounds_in_parallel(
+    compound_files: list[_CompoundFile],
+    jobs: int,
+    settings: _ParseSettings,
+    stats: ConversionStats | None,
+    worker_pool: ProcessPoolExecutor | None,
+) -> Iterator[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_streaming
+    """Parse the compound files with a pool of worker processes. The results
+    are yielded in the order of the compound files, so the result is identical
+    to a serial run. Only a limited number of tasks is submitted in advance,
+    so the memory usage doesn't depend on the number of compound files.
+
+    Args:
+        compound_files (list[_CompoundFile]): The compound files to be parsed.
+        jobs (int): The number of worker processes.
+        settings (_ParseSettings): The settings to parse the compound files.
+        stats (ConversionStats | None): The statistics or None if they are not collected.
+        worker_pool (ProcessPoolExecutor | None): The worker processes, which are shared
+        with other conversions, or None to start own ones for the compound files.
+
+    Yields:
+        tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]: The list
+        of LobsterItems or the error of each compound and its captured log output.
+    """
+    chunksize = max(1, min(len(compound_files) // (jobs * _TASKS_PER_WORKER), _MAX_COMPOUNDS_PER_TASK))
+    task = partial(_get_lobster_items_and_log_from_compounds, settings)
+    futures = deque()
+
+    def get_results(
+        chunk_index: int, future: Future
+    ) -> Iterator[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]]:
+        for compound_file, (result, compound_stats) in zip(
+            compound_files[chunk_index : chunk_index + chunksize], future.result()
+        ):
+            _add_parsed_compound_stats(stats, compound_file, compound_stats, True)
+            yield result
+
+    with nullcontext(worker_pool) if worker_pool is not None else create_worker_pool(jobs) as executor:
+        try:
+            for index in range(0, len(compound_files), chunksize):
+                futures.append((index, executor.submit(task, compound_files[index : index + chunksize])))
+
+                if jobs * _PENDING_TASKS_PER_WORKER <= len(futures):
+                    yield from get_results(*futures.popleft())
+
+            while 0 < len(futures):
+                yield from get_results(*futures.popleft())
+
+        finally:
+            # Don't parse the remaining compound files if the conversion is aborted.
+            for _, future in futures:
+                future.cancel()
+
+
+def _get_lobster_items_from_compounds(
+    compound_files: list[_CompoundFile],
+    jobs: int,
+    settings: _ParseSettings,
+    stats: ConversionStats | None = None,
+    worker_pool: ProcessPoolExecutor | None = None,
+) -> Iterator[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Parse the compound files, either in the current process or with a pool
+    of worker processes.
+
+    Args:
+        compound_files (list[_CompoundFile]): The compound files to be parsed.
+        jobs (int): The number of worker processes. With 1 the compound files
+        are parsed in the current process.
+        settings (_ParseSettings): The settings to parse the compound files.
+        With capture_all the complete log output is captured, independent of
+        verbose mode and of the number of worker processes.
+        stats (ConversionStats | None): The statistics or None if they are not collected.
+        worker_pool (ProcessPoolExecutor | None): The shared worker processes or
+        None to start own ones, if more than one job is used.
+
+    Yields:
+        tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]: The list
+        of LobsterItems or the error of each compound and its log output, which is not printed yet. In the
+        current process the log output is printed directly, if it is not
+        captured.
+    """
+    jobs = min(jobs, len(compound_files))
+
+    if 1 < jobs:
+        yield from _get_lobster_items_from_compounds_in_parallel(compound_files, jobs, settings, stats, worker_pool)
+    else:
+        for compound_file in compound_files:
+            stopwatch = Stopwatch()
+
+            if settings.capture_all is True:
+                result = _get_lobster_items_and_log_from_compound(settings, compound_file)
+            else:
+                result = _get_lobster_items_or_error_from_compound(settings, compound_file), []
+
+            _add_parsed_compound_stats(stats, compound_file, CompoundStats(compound_file.path, *stopwatch.get_times()),
+                                       False)
+            yield result
+
+
+def _get_cache_variant(compound_file: _CompoundFile, read_descriptions: bool) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    """Get the cache key variant of a compound file, which distinguishes the
+    results of the same compound file created with different settings.
+
+    Args:
+        compound_file (_CompoundFile): The compound file.
+        read_descriptions (bool): Read the requirements and justifications from
+        the detaileddescriptions.
+
+    Returns:
+        str: The cache key variant.
+    """
+    # Results without requirements and justifications are cached separately.
+    variant = "" if read_descriptions is True else "no-descriptions"
+
+    # Results without the duplicate members depend on the other compounds.
+    if 0 < len(compound_file.duplicate_member_ids):
+        duplicates_hash = hashlib.sha256("\n".join(sorted(compound_file.duplicate_member_ids)).encode("utf-8"))
+        variant += f"/duplicates-{duplicates_hash.hexdigest()}"
+
+    return variant
+
+
+def _get_cache_key(cache: CompoundCache, compound_file: _CompoundFile, read_descriptions: bool) -> str | None:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Get the cache key of a compound file.
+
+    Args:
+        cache (CompoundCache): The opened compound cache.
+        compound_file (_CompoundFile): The compound file.
+        read_descriptions (bool): Read the requirements and justifications from
+        the detaileddescriptions.
+
+    Returns:
+        str | None: The cache key or None if the compound file can't be read.
+        Then it is parsed, which reports the error of the compound file.
+    """
+    try:
+        cache_key = cache.get_key(compound_file.path, _get_cache_variant(compound_file, read_descriptions))
+    except OSError:
+        cache_key = None
+
+    return cache_key
+
+
+def _put_into_cache(
+    cache: CompoundCache,
+    cache_key: str | None,
+    result: tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]],
+) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Store the result of a parsed compound file in the cache. The result of a
+    compound file, which can't be converted, is not stored, so it is parsed
+    again in the next run.
+
+    Args:
+        cache (CompoundCache): The opened compound cache.
+        cache_key (str | None): The cache key of the compound file or None if it can't be read.
+        result (tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]):
+        The list of LobsterItems or the error and the log output of the compound.
+    """
+    if cache_key is not None and not isinstance(result[0], CompoundError):
+        cache.put(cache_key, result)
+
+
+def _get_lobster_items_from_compounds_with_cache(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    compound_files: list[_CompoundFile],
+    jobs: int,
+    settings: _ParseSettings,
+    cache: CompoundCache,
+    stats: ConversionStats | None,
+    worker_pool: ProcessPoolExecutor | None = None,
+) -> Iterator[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Get the results of the compound files from the cache and parse only the
+    compound files, which are not cached. The results of the parsed compound
+    files are stored in the cache.
+
+    Args:
+        compound_files (list[_CompoundFile]): The compound files.
+        jobs (int): The number of worker processes to parse the compound files.
+        settings (_ParseSettings): The settings to parse the compound files.
+        cache (CompoundCache): The opened compound cache.
+        stats (ConversionStats | None): The statistics or None if they are not collected.
+        worker_pool (ProcessPoolExecutor | None): The shared worker processes or None to start own ones.
+
+    Yields:
+        tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]: The list
+        of LobsterItems or the error of each compound and its complete log output.
+    """
+    # The cached log output has to be complete, independent of verbose mode.
+    settings = replace(settings, capture_all=True)
+
+    cache_keys = [_get_cache_key(cache, compound_file, settings.read_descriptions) for compound_file in compound_files]
+    is_cached = [cache_key is not None and cache.contains(cache_key) for cache_key in cache_keys]
+
+    missed_compound_files = [
+        compound_file for compound_file, is_compound_cached in zip(compound_files, is_cached)
+        if is_compound_cached is False
+    ]
+    parsed_results = _get_lobster_items_from_compounds(missed_compound_files, jobs, settings, stats, worker_pool)
+
+    # The cached results are loaded one after the other, to keep the memory usage low.
+    for compound_file, cache_key, is_compound_cached in zip(compound_files, cache_keys, is_cached):
+        if is_compound_cached is True:
+            stopwatch = Stopwatch()
+            result = cache.get(cache_key)
+
+            # Parse the compound file again if its cached result is not readable anymore.
+            if result is None:
+                result = _get_lobster_items_and_log_from_compound(settings, compound_file)
+                _put_into_cache(cache, cache_key, result)
+                _add_parsed_compound_stats(stats, compound_file, CompoundStats(compound_file.path,
+                                                                               *stopwatch.get_times()), False)
+            elif stats is not None:
+                stats.add_compound(CompoundStats(compound_file.path, *stopwatch.get_times()), 0, 0)
+        else:
+            # There is one parsed result for each compound file, which is not cached.
+            result = next(parsed_results)  # pylint: disable=stop-iteration-return
+            _put_into_cache(cache, cache_key, result)
+
+        yield result
+
+
+def _apply_xrefitem_values(
+    lobster_items: list[LobsterItem], xrefitem_values: dict[str, list[str]], trace_source: TraceSource
+) -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Set the requirements and justifications of the LobsterItems and their
+    children from the xrefitem pages or verify them against the xrefitem pages.
+
+    Args:
+        lobster_items (list[LobsterItem]): The LobsterItems of a compound.
+        xrefitem_values (dict[str, list[str]]): The xref texts per id of the compound
+        or member.
+        trace_source (TraceSource): TraceSource.XREFITEM to set or TraceSource.VERIFY
+        to verify the requirements and justifications.
+
+    Returns:
+        bool: True if the requirements and justifications are set or verified
+        successfully, False if they differ from the detaileddescriptions.
+    """
+    success = True
+
+    for lobster_item in lobster_items:
+        values = xrefitem_values.get(lobster_item.item_id, [])
+
+        if trace_source == TraceSource.XREFITEM:
+            if 0 < len(values):
+                LOG.print_info("xrefitem: %s", lobster_item.name, level=1)
+
+            lobster_item.refs, lobster_item.just_up = _get_refs_and_just_up_from_values(values)
+
+        elif _get_refs_and_just_up_from_values(values, print_log=False) != (lobster_item.refs, lobster_item.just_up):
+            LOG.print_error(
+                f"The {lobster_item.kind.value} '{lobster_item.name}' "
+                f"has different requirements or justifications in the detaileddescription and the xrefitem pages."
+            )
+            success = False
+
+        if _apply_xrefitem_values(lobster_item.get_children(), xrefitem_values, trace_source) is False:
+            success = False
+
+    return success
+
+
+def _get_compound_files(doxygen_xml_folder: str, compounds: list) -> list[_CompoundFile]:
+    # lobster-trace: SwRequirements.sw_req_skip_compounds
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    """Get the compound files, whose kind can result in a LobsterItem.
+
+    Doxygen lists e.g. a function of a namespace or group in the file compound
+    as well, each time with the same member id. The member is only kept in the
+    first compound of the index, which lists it.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory.
+        compounds (list): All compounds defined in the index.
+
+    Returns:
+        list[_CompoundFile]: The compound files to be parsed.
+    """
+    compound_files = []
+    member_registry = {}  # The id of the compound, which lists the member first, per member id.
+
+    for compound in compounds:
+        if compound.get_kind() in _LOBSTER_ITEM_KINDS:
+            duplicate_member_ids = set()
+
+            for member in compound.get_member():
+                member_id = member.get_refid()
+
+                if member_registry.setdefault(member_id, compound.get_refid()) != compound.get_refid():
+                    duplicate_member_ids.add(member_id)
+
+            compound_files.append(
+                _CompoundFile(
+                    doxygen_xml_folder + "/" + compound.get_refid() + ".xml",
+                    frozenset(duplicate_member_ids),
+                    len(compound.get_member()),
+                )
+            )
+
+    return compound_files
+
+
+def _get_compound_results(
+    compound_files: list[_CompoundFile], options: ConversionOptions
+) -> Iterator[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Get the results of the compound files, from the cache if available.
+
+    Args:
+        compound_files (list[_CompoundFile]): The compound files.
+        options (ConversionOptions): The conversion options with the opened
+        compound cache or None.
+
+    Returns:
+        Iterator[tuple[list[LobsterItem] | CompoundError, list[tuple[str, str]]]]: The list of
+        LobsterItems or the error of each compound and its log output.
+    """
+    settings = _ParseSettings(options.xml_parser, options.trace_source != TraceSource.XREFITEM)
+    jobs = options.get_jobs()
+
+    if options.cache is None:
+        compound_results = _get_lobster_items_from_compounds(
+            compound_files, jobs, settings, options.stats, options.worker_pool
+        )
+    else:
+        compound_results = _get_lobster_items_from_compounds_with_cache(
+            compound_files, jobs, settings, options.cache, options.stats, options.worker_pool
+        )
+
+    return compound_results
+
+
+def _get_page_refids(compounds: list) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Get the ids of the pages, which are listed in the index.
+
+    Args:
+        compounds (list): All compounds defined in the index.
+
+    Returns:
+        list[str]: The ids of the pages.
+    """
+    return [compound.get_refid() for compound in compounds if compound.get_kind() == DoxCompoundKind.PAGE]
+
+
+def _pair_xrefitem_members(doxygen_xml_folder: str, compounds: list, xrefitem_values: dict[str, list[str]]) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Add the xref texts of a traced member to the ids of the same member in
+    other compounds, see add_paired_member_values(). Only the compound files,
+    which list a member of the same kind and name with another id, are parsed.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory.
+        compounds (list): All compounds defined in the index.
+        xrefitem_values (dict[str, list[str]]): The xref texts per id of the compound
+        or member.
+    """
+    traced_names = {
+        (member.get_kind(), member.get_name())
+        for compound in compounds
+        for member in compound.get_member()
+        if member.get_refid() in xrefitem_values
+    }
+    member_ids_per_name = {}
+
+    for compound in compounds:
+        for member in compound.get_member():
+            if (member.get_kind(), member.get_name()) in traced_names:
+                member_ids_per_name.setdefault((member.get_kind(), member.get_name()), {}).setdefault(
+                    member.get_refid(), compound.get_refid()
+                )
+
+    member_ids_per_compound = {}
+
+    for member_ids in member_ids_per_name.values():
+        if 1 < len(member_ids):
+            for member_id, compound_id in member_ids.items():
+                member_ids_per_compound.setdefault(compound_id, set()).add(member_id)
+
+    add_paired_member_values(
+        xrefitem_values,
+        [
+            member_body
+            for compound_id, member_ids in member_ids_per_compound.items()
+            for member_body in get_member_bodies(doxygen_xml_folder + "/" + compound_id + ".xml", member_ids)
+        ],
+    )
+
+
+def _get_item_count(lobster_items: list[LobsterItem]) -> int:
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Get the number of LobsterItems including their children.
+
+    Args:
+        lobster_items (list[LobsterItem]): The LobsterItems.
+
+    Returns:
+        int: The number of LobsterItems and all their children.
+    """
+    return sum(1 + _get_item_count(lobster_item.get_children()) for lobster_item in lobster_items)
+
+
+def _get_index(doxygen_xml_folder: str, options: ConversionOptions) -> tuple[list, dict | None, list[_CompoundFile]]:
+    # lobster-trace: SwRequirements.sw_req_skip_compounds
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    """Read the index and the xrefitem pages and get the compound files to be parsed.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory.
+        options (ConversionOptions): The conversion options. If input_files is
+        set, the paths of the index, the used xrefitem pages and the compound
+        files or the path of their archive are appended.
+
+    Returns:
+        tuple[list, dict | None, list[_CompoundFile]]: All compounds defined in
+        the index, the xref texts of the xrefitem pages or None if they are not
+        used and the compound files to be parsed.
+    """
+    # All compounds defined in the index.
+    with open_xml_file(doxygen_xml_folder + "/index.xml") as index_file:
+        compounds = doxmlparser.index.parse(index_file, True).get_compound()
+
+    compound_files = _get_compound_files(doxygen_xml_folder, compounds)
+    page_refids = _get_page_refids(compounds)
+
+    xrefitem_values = None
+    if options.trace_source != TraceSource.DESCRIPTION:
+        xrefitem_values = get_xrefitem_values(doxygen_xml_folder, page_refids)
+        _pair_xrefitem_members(doxygen_xml_folder, compounds, xrefitem_values)
+
+    # The compound files are inputs, even if their results are taken from the cache.
+    if options.input_files is not None:
+        input_files = [doxygen_xml_folder + "/index.xml"]
+
+        if xrefitem_values is not None:
+            input_files.extend(get_xrefitem_page_paths(doxygen_xml_folder, page_refids))
+
+        input_files.extend(compound_file.path for compound_file in compound_files)
+
+        # The files in an archive are represented by the archive itself.
+        options.input_files.extend(dict.fromkeys(get_source_file(input_file) for input_file in input_files))
+
+    return compounds, xrefitem_values, compound_files
+
+
+def _get_unchanged_paths(
+    compound_files: list[_CompoundFile],
+    xrefitem_values: dict[str, list[str]] | None,
+    options: ConversionOptions,
+    is_compound_unchanged: Callable[[str, str], bool],
+) -> set[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Get the paths of the compound files, whose LobsterItems are unchanged
+    since the last run and don't have to be parsed.
+
+    Args:
+        compound_files (list[_CompoundFile]): The compound files.
+        xrefitem_values (dict[str, list[str]] | None): The xref texts of the
+        xrefitem pages or None if they are not used.
+        options (ConversionOptions): The conversion options.
+        is_compound_unchanged (Callable[[str, str], bool]): Called with the path
+        of each compound file and the variant of its settings.
+
+    Returns:
+        set[str]: The paths of the unchanged compound files.
+    """
+    read_descriptions = options.trace_source != TraceSource.XREFITEM
+    xrefitem_variant = ""
+
+    # The LobsterItems of each compound depend on the xrefitem pages, if they are used.
+    if xrefitem_values is not None:
+        xrefitem_hash = hashlib.sha256(repr(sorted(xrefitem_values.items())).encode("utf-8"))
+        xrefitem_variant = f"/xrefitems-{xrefitem_hash.hexdigest()}"
+
+    unchanged_paths = set()
+
+    for compound_file in compound_files:
+        try:
+            if is_compound_unchanged(
+                compound_file.path, _get_cache_variant(compound_file, read_descriptions) + xrefitem_variant
+            ) is True:
+                unchanged_paths.add(compound_file.path)
+
+        except OSError:
+            # The compound file is parsed, which reports its error.
+            pass
+
+    return unchanged_paths
+
+
+def _skip_compound_error(compound_error: CompoundError, options: ConversionOptions) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Skip the compound, which can't be converted, if the conversion keeps
+    going, otherwise abort the conversion.
+
+    Args:
+        compound_error (CompoundError): The error of the compound.
+        options (ConversionOptions): The conversion options with the report,
+        where the error is appended.
+
+    Raises:
+        ConversionError: If the conversion doesn't keep going or the maximum
+        number of errors is reached. The error is reported.
+    """
+    if options.keep_going is False:
+        LOG.print_error(compound_error.get_report_line())
+        raise ConversionError()
+
+    LOG.print_info("Failed: %s", compound_error.get_report_line(), level=1)
+    options.report.compound_errors.append(compound_error)
+    _abort_on_max_errors(options)
+
+
+def _report_rule_violations(report: ConversionReport) -> None:
+    # lobster-trace: SwRequirements.sw_req_rule_report
+    """Report all rule violations, which are found so far.
+
+    Args:
+        report (ConversionReport): The report with the rule violations.
+    """
+    if 0 < len(report.rule_violations):
+        LOG.print_error("\n".join(report.get_rule_violation_report()))
+
+
+def _abort_on_max_errors(options: ConversionOptions) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_max_errors
+    """Abort the conversion, if the maximum number of errors is reached.
+
+    Args:
+        options (ConversionOptions): The conversion options with the report.
+
+    Raises:
+        ConversionError: If the maximum number of errors is reached. The rule violations are reported.
+    """
+    if options.max_errors is not None and options.max_errors <= options.report.get_error_count():
+        _report_rule_violations(options.report)
+        raise ConversionError()
+
+
+def _check_rules(
+    lobster_items: list[LobsterItem],
+    doxygen_xml_folder: str,
+    options: ConversionOptions,
+    stats: ConversionStats,
+    rule_check_items: list[LobsterItem] | None = None,
+) -> None:
+    # lobster-trace: SwRequirements.sw_req_rule_file
+    # lobster-trace: SwRequirements.sw_req_rule_class
+    # lobster-trace: SwRequirements.sw_req_rule_report
+    # lobster-trace: SwRequirements.sw_req_streaming
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Check the LobsterItems of a compound for all rules, right after they are
+    extracted, and collect the violations in the report. With a tag index their
+    tags are checked to be unique across the doxygen XML folders too.
+
+    Args:
+        lobster_items (list[LobsterItem]): The LobsterItems of the compound.
+        doxygen_xml_folder (str): The doxygen XML folder or the single input file of the compound.
+        options (ConversionOptions): The conversion options with the report.
+        stats (ConversionStats): The statistics, where the rule check is measured.
+        rule_check_items (list[LobsterItem] | None): The LobsterItems with the members of
+            the compound, which are converted with a previous compound, see _SharedMembers.
+            If None, the rules are checked for the LobsterItems.
+
+    Raises:
+        ConversionError: If the maximum number of errors is reached.
+    """
+    if rule_check_items is None:
+        rule_check_items = lobster_items
+
+    with stats.measure(PHASE_RULE_CHECK) as phase_stats:
+        for lobster_item in rule_check_items:
+            options.report.rule_violations.extend(check_rules(lobster_item))
+
+        if options.tag_index is not None:
+            options.report.rule_violations.extend(options.tag_index.check(lobster_items, doxygen_xml_folder))
+
+        phase_stats.compounds += 1
+        phase_stats.items += len(lobster_items)
+
+    _abort_on_max_errors(options)
+
+
+def is_combined_xml_file(path: str) -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    """Check whether the path refers to a combined doxygen XML file, e.g. the
+    all.xml created by combine.xslt, instead of a doxygen XML folder.
+
+    Args:
+        path (str): The path of the doxygen XML folder or file, which may be in an archive.
+
+    Returns:
+        bool: True if it is a XML file.
+
+    Raises:
+        OSError: If the archive can't be read.
+    """
+    return path.lower().endswith(".xml") and is_xml_file(path)
+
+
+def _get_member_ids(compounddef: IterparseCompounddef) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    """Get the ids of the members, which are defined in the compound.
+
+    Args:
+        compounddef (IterparseCompounddef): The compound definition.
+
+    Returns:
+        list[str]: The member ids.
+    """
+    return [
+        memberdef.get_id() for sectiondef in compounddef.get_sectiondef() for memberdef in sectiondef.get_memberdef()
+    ]
+
+
+# pylint: disable-next=too-many-locals
+def iter_compounddef_lobster_items(
+    compounddefs: Iterator[IterparseCompounddef],
+    source_path: str,
+    xrefitem_values: dict[str, list[str]] | None,
+    options: ConversionOptions,
+) -> Iterator[tuple[str, list[LobsterItem]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    """Get the LobsterItems of one compound definition after the other, which
+    are read from a single input file without index, e.g. a combined doxygen
+    XML file or the doxygen SQLite3 database.
+
+    The compound definitions have to be in index order, therefore a member is
+    kept in the first compound, which defines it, as with the index. A compound
+    definition, which can't be converted, is skipped with options.keep_going.
+
+    Args:
+        compounddefs (Iterator[IterparseCompounddef]): The compound definitions,
+        which are read while they are iterated.
+        source_path (str): The path of the input file.
+        xrefitem_values (dict[str, list[str]] | None): The xref texts of the
+        xrefitem pages or None if they are not used.
+        options (ConversionOptions): The conversion options. The cache and the
+        number of jobs are not used.
+
+    Yields:
+        tuple[str, list[LobsterItem]]: The path of the input file with the id of
+        the compound, e.g. all.xml#class_a, and its LobsterItems.
+
+    Raises:
+        ConversionError: If the requirements or justifications differ from the
+        xrefitem pages in verify mode or a rule is violated. It is raised after all
+        compounds are processed, unless options.max_errors is reached before.
+        It is raised immediately, if a compound can't be converted and options.keep_going
+        is not set.
+    """
+    if options.report is None:
+        options = replace(options, report=ConversionReport())
+
+    stats = options.stats if options.stats is not None else ConversionStats()
+    read_descriptions = options.trace_source != TraceSource.XREFITEM
+    is_xrefitem_valid = True
+    registered_member_ids = set()  # Ids of the members of the previous compounds.
+    shared_members = _SharedMembers()
+    compound_count = 0
+    skipped_compound_count = 0
+    duplicate_member_count = 0
+
+    while True:
+        with stats.measure(PHASE_COMPOUNDS) as phase_stats:
+            stopwatch = Stopwatch()
+            compounddef = next(compounddefs, None)
+
+            if compounddef is None:
+                phase_stats.bytes_read += get_xml_file_size(source_path)
+                break
+
+            compound_count += 1
+            compound_path = source_path + "#" + compounddef.get_id()
+            compound_lobster_items = None
+
+            if compounddef.get_kind() in _LOBSTER_ITEM_KINDS:
+                member_ids = _get_member_ids(compounddef)
+                duplicate_member_ids = frozenset(registered_member_ids.intersection(member_ids))
+                registered_member_ids.update(member_ids)
+                duplicate_member_count += len(duplicate_member_ids)
+
+                try:
+                    compound_lobster_items = [
+                        _get_lobster_item_from_compounddef(compounddef, read_descriptions, duplicate_member_ids)
+                    ]
+
+                # pylint: disable=broad-exception-caught
+                except Exception as e:
+                    _skip_compound_error(get_compound_error(compound_path, e), options)
+                    continue
+
+                if xrefitem_values is not None:
+                    if _apply_xrefitem_values(compound_lobster_items, xrefitem_values, options.trace_source) is False:
+                        is_xrefitem_valid = False
+
+                compound_lobster_items = shared_members.add(compound_lobster_items, duplicate_member_ids)
+                _check_rules(
+                    compound_lobster_items, source_path, options, stats,
+                    shared_members.get_rule_check_items(compound_lobster_items, duplicate_member_ids)
+                )
+                phase_stats.items += _get_item_count(compound_lobster_items)
+                stats.add_compound(CompoundStats(compound_path, *stopwatch.get_times()), len(member_ids), 0)
+            else:
+                _get_lobster_item_from_compounddef(compounddef, read_descriptions, frozenset())
+                skipped_compound_count += 1
+
+        if compound_lobster_items is not None:
+            yield compound_path, compound_lobster_items
+
+    LOG.print_info("Skipped %d of %d compounds.", skipped_compound_count, compound_count)
+    LOG.print_info("Skipped %d duplicate members.", duplicate_member_count)
+
+    _report_rule_violations(options.report)
+
+    if is_xrefitem_valid is False or 0 < len(options.report.rule_violations):
+        raise ConversionError()
+
+
+def _iter_combined_compound_lobster_items(
+    combined_xml_file: str, options: ConversionOptions
+) -> Iterator[tuple[str, list[LobsterItem]]]:
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Parse a combined doxygen XML file incrementally and yield the LobsterItems
+    of one compound after the other. Only one compound is kept in memory at a time.
+
+    The compounds are in index order in the combined XML file. The xrefitem
+    pages are read in a first pass over the file, if they are used.
+
+    Args:
+        combined_xml_file (str): The path of the combined XML file, which may be
+        a file in an archive.
+        options (ConversionOptions): The conversion options. The cache and the
+        number of jobs are not used.
+
+    Yields:
+        tuple[str, list[LobsterItem]]: The path of the combined XML file with the
+        id of the compound, e.g. all.xml#class_a, and its LobsterItems.
+
+    Raises:
+        ConversionError: If the requirements or justifications differ from the
+        xrefitem pages in verify mode or a rule is violated. It is raised after all
+        compounds are processed, unless options.max_errors is reached before.
+        Exception: If the combined XML file can't be parsed.
+    """
+    stats = options.stats if options.stats is not None else ConversionStats()
+    xrefitem_values = None
+
+    with stats.measure(PHASE_INDEX):
+        if options.trace_source != TraceSource.DESCRIPTION:
+            xrefitem_values = get_combined_xrefitem_values(combined_xml_file)
+
+        if options.input_files is not None:
+            options.input_files.append(get_source_file(combined_xml_file))
+
+    # The file is closed when the generator is closed, e.g. if the caller stops the iteration early.
+    with open_xml_file(combined_xml_file) as xml_file:  # pylint: disable=contextmanager-generator-missing-cleanup
+        yield from iter_compounddef_lobster_items(
+            iterparse_compounddefs(xml_file), combined_xml_file, xrefitem_values, options
+        )
+
+
+# pylint: disable-next=too-many-locals,too-many-branches
+def iter_compound_lobster_items(  # pylint: disable=too-many-statements
+    doxygen_xml_folder: str,
+    options: ConversionOptions | None = None,
+    is_compound_unchanged: Callable[[str, str], bool] | None = None,
+) -> Iterator[tuple[str, list[LobsterItem] | None]]:
+    """Parse the doxygen XML index file, process each compound defined in it
+    and yield the LobsterItems of one compound file after the other.
+
+    Compound files, whose kind in the index can't result in a LobsterItem, are
+    skipped without opening them. A combined doxygen XML file is parsed in one
+    pass instead, without cache, worker processes and is_compound_unchanged.
+
+    Each compound file is parsed on its own. One, which can't be parsed or
+    converted, aborts the conversion or is skipped with options.keep_going.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory, where the
+        file index.xml is located, or its path in an archive, see xml_archive,
+        or a combined doxygen XML file, see is_combined_xml_file().
+        options (ConversionOptions | None): The conversion options. Its cache has
+        to be opened already, only the compound files, which are not cached, are
+        parsed. If stats is set, the index and compounds phases are measured.
+        If None, the defaults are used.
+        is_compound_unchanged (Callable[[str, str], bool] | None): Called with the
+        path of each compound file and the variant of its settings before any
+        compound file is parsed. A compound file, for which it returns True, is
+        not parsed. If None, all compound files are parsed.
+
+    Yields:
+        tuple[str, list[LobsterItem] | None]: The path of the compound file and
+        its LobsterItems or None if it is unchanged.
+
+    Raises:
+        ConversionError: If the requirements or justifications differ from the
+        xrefitem pages in verify mode or a rule is violated. It is raised after all
+        compounds are processed, unless options.max_errors is reached before.
+        It is raised immediately, if a compound file can't be parsed or converted
+        and options.keep_going is not set.
+        Exception: If the index or the xrefitem pages can't be parsed.
+    """
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    # lobster-trace: SwRequirements.sw_req_skip_compounds
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_streaming
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    # lobster-trace: SwRequirements.sw_req_cli_keep_going
+    if options is None:
+        options = ConversionOptions()
+
+    if is_combined_xml_file(doxygen_xml_folder) is True:
+        yield from _iter_combined_compound_lobster_items(doxygen_xml_folder, options)
+        return
+
+    if options.report is None:
+        options = replace(options, report=ConversionReport())
+
+    # Without statistics the phases are measured, but not reported.
+    stats = options.stats if options.stats is not None else ConversionStats()
+    skipped_file_sizes = []
+    is_xrefitem_valid = True
+
+    with stats.measure(PHASE_INDEX) as phase_stats:
+        compounds, xrefitem_values, compound_files = _get_index(doxygen_xml_folder, options)
+        phase_stats.bytes_read += get_xml_file_size(doxygen_xml_folder + "/index.xml")
+
+        unchanged_paths = set()
+        if is_compound_unchanged is not None:
+            unchanged_paths = _get_unchanged_paths(compound_files, xrefitem_values, options, is_compound_unchanged)
+
+    compound_results = _get_compound_results(
+        [compound_file for compound_file in compound_files if compound_file.path not in unchanged_paths], options
+    )
+    compound_file_iterator = iter(compound_files)
+    shared_members = _SharedMembers(
+        frozenset().union(*(compound_file.duplicate_member_ids for compound_file in compound_files))
+    )
+
+    for compound in compounds:
+        if compound.get_kind() in _LOBSTER_ITEM_KINDS:
+            compound_file = next(compound_file_iterator)  # pylint: disable=stop-iteration-return
+            compound_path = compound_file.path
+
+            if compound_path in unchanged_paths:
+                LOG.print_info("compound: %s", compound.get_name())
+                LOG.print_info("kind: %s (unchanged)", compound.get_kind(), level=1)
+                yield compound_path, None
+                continue
+
+            with stats.measure(PHASE_COMPOUNDS) as phase_stats:
+                compound_lobster_items, log_records = next(compound_results)  # pylint: disable=stop-iteration-return
+                LOG.replay(log_records)
+
+                if isinstance(compound_lobster_items, CompoundError):
+                    _skip_compound_error(compound_lobster_items, options)
+                    continue
+
+                if xrefitem_values is not None:
+                    if _apply_xrefitem_values(compound_lobster_items, xrefitem_values, options.trace_source) is False:
+                        is_xrefitem_valid = False
+
+                compound_lobster_items = shared_members.add(compound_lobster_items, compound_file.duplicate_member_ids)
+                _check_rules(
+                    compound_lobster_items, doxygen_xml_folder, options, stats,
+                    shared_members.get_rule_check_items(compound_lobster_items, compound_file.duplicate_member_ids)
+                )
+                phase_stats.items += _get_item_count(compound_lobster_items)
+
+            yield compound_path, compound_lobster_items
+        else:
+            LOG.print_info("compound: %s", compound.get_name())
+            LOG.print_info("kind: %s (skipped)", compound.get_kind(), level=1)
+            skipped_file_sizes.append(get_xml_file_size(doxygen_xml_folder + "/" + compound.get_refid() + ".xml"))
+
+    LOG.print_info(
+        "Skipped %d of %d compound files (%d bytes).", len(skipped_file_sizes), len(compounds), sum(skipped_file_sizes)
+    )
+    LOG.print_info(
+        "Skipped %d duplicate members.",
+        sum(len(compound_file.duplicate_member_ids) for compound_file in compound_files),
+    )
+
+    if is_compound_unchanged is not None:
+        LOG.print_info("Unchanged %d of %d compound files.", len(unchanged_paths), len(compound_files))
+
+    if options.cache is not None:
+        LOG.print_info("Cache: %d hits, %d misses.", options.cache.hits, options.cache.misses)
+
+    _report_rule_violations(options.report)
+
+    if is_xrefitem_valid is False or 0 < len(options.report.rule_violations):
+        raise ConversionError()
+
+
+def iter_lobster_items_from_doxygen_xml_folder(
+    doxygen_xml_folder: str, options: ConversionOptions | None = None
+) -> Iterator[list[LobsterItem]]:
+    """Parse the doxygen XML index file, process each compound defined in it
+    and yield the LobsterItems of one compound after the other.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory, where the
+        file index.xml is located, or its path in an archive, see xml_archive,
+        or a combined doxygen XML file.
+        options (ConversionOptions | None): The conversion options, see
+        iter_compound_lobster_items(). If None, the defaults are used.
+
+    Yields:
+        list[LobsterItem]: The LobsterItems of a compound.
+
+    Raises:
+        ConversionError: If the requirements or justifications differ from the
+        xrefitem pages in verify mode or a rule is violated. It is raised after all
+        compounds are processed, unless options.max_errors is reached before.
+        Exception: If a doxygen XML file can't be parsed.
+    """
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_streaming
+    for _, compound_lobster_items in iter_compound_lobster_items(doxygen_xml_folder, options):
+        yield compound_lobster_items
+
+
+def get_lobster_items_from_doxygen_xml_folder(
+    doxygen_xml_folder: str, options: ConversionOptions | None = None
+) -> list[LobsterItem] | None:
     """Parse the doxygen XML index file, process each compound defined in it
     and build the LobsterItems list.
 
     Args:
         doxygen_xml_folder (str): The Doxygen XML output directory, where the
-        file index.xml is located.
+        file index.xml is located, or its path in an archive, see xml_archive,
+        or a combined doxygen XML file.
+        options (ConversionOptions | None): The conversion options. Its cache has
+        to be opened already. With keep_going the compounds, which can't be
+        converted, are missing in the list. If None, the defaults are used.
 
     Returns:
         list[LobsterItem] | None: The list of lobster items. If an error occurs,
@@ -285,11 +1740,12 @@ def get_lobster_items_from_doxygen_xml_folder(doxygen_xml_folder: str) -> list[L
     lobster_items = []
 
     try:
-        root_obj = doxmlparser.index.parse(doxygen_xml_folder + "/index.xml", True)
+        for compound_lobster_items in iter_lobster_items_from_doxygen_xml_folder(doxygen_xml_folder, options):
+            lobster_items.extend(compound_lobster_items)
 
-        for compound in root_obj.get_compound():  # for each compound defined in the index
-            compound_path = doxygen_xml_folder + "/" + compound.get_refid() + ".xml"
-            lobster_items.extend(_get_lobster_items_from_compound(compound_path))
+    except ConversionError:
+        # The cause is already reported.
+        lobster_items = None
 
     # pylint: disable=broad-exception-caught
     except Exception as e:
@@ -0,0 +1,119 @@
+"""Module for the fingerprint of the inputs of the output file, which allows
+to skip a conversion whose inputs are unchanged since the last run.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import hashlib
+import json
+import os
+
+from lobster_doxygen.constants import FINGERPRINT_FILE_SUFFIX
+
+# Variables ********************************************************************
+
+# Version of the fingerprint content format. Increase it if the fingerprint changes.
+_FINGERPRINT_FORMAT_VERSION = 1
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def _get_fingerprint(output_file_name: str, input_files: list[str], settings: dict) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    """Get the fingerprint of the settings, the inputs and the output file.
+    A file is identified by its path, size and modification time, so no file
+    has to be read.
+
+    Args:
+        output_file_name (str): Path and file name of the output file.
+        input_files (list[str]): The paths of the input files.
+        settings (dict): The settings, which influence the content of the output file.
+
+    Returns:
+        str: The fingerprint as hexadecimal string.
+
+    Raises:
+        OSError: If a file doesn't exist.
+    """
+    fingerprint = hashlib.sha256(json.dumps([_FINGERPRINT_FORMAT_VERSION, settings], sort_keys=True).encode("utf-8"))
+
+    for file_path in [output_file_name, *input_files]:
+        stat_result = os.stat(file_path)
+        fingerprint.update(f"{file_path}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\n".encode("utf-8"))
+
+    return fingerprint.hexdigest()
+
+
+def get_unchanged_input_files(output_file_name: str, settings: dict) -> list[str] | None:
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    """Get the input files of the last run, if the output file and all its
+    inputs are unchanged since then.
+
+    The index.xml is one of the inputs, therefore the recorded input files are
+    complete as long as it is unchanged.
+
+    Args:
+        output_file_name (str): Path and file name of the output file.
+        settings (dict): The settings, which influence the content of the output file.
+
+    Returns:
+        list[str] | None: The input files or None if the output file has to be created again.
+    """
+    input_files = None
+
+    try:
+        with open(output_file_name + FINGERPRINT_FILE_SUFFIX, "r", encoding="utf-8") as fingerprint_file:
+            recorded = json.load(fingerprint_file)
+
+        if recorded["fingerprint"] == _get_fingerprint(output_file_name, recorded["input_files"], settings):
+            input_files = recorded["input_files"]
+
+    except (OSError, ValueError, KeyError, TypeError):
+        # Without a valid fingerprint the conversion is done.
+        input_files = None
+
+    return input_files
+
+
+def write_fingerprint(output_file_name: str, input_files: list[str], settings: dict) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    """Write the fingerprint of the created output file and its inputs.
+
+    Args:
+        output_file_name (str): Path and file name of the output file.
+        input_files (list[str]): The paths of the input files.
+        settings (dict): The settings, which influence the content of the output file.
+
+    Raises:
+        OSError: If a file doesn't exist or the fingerprint file can't be written.
+    """
+    recorded = {
+        "fingerprint": _get_fingerprint(output_file_name, input_files, settings),
+        "input_files": input_files,
+    }
+
+    with open(output_file_name + FINGERPRINT_FILE_SUFFIX, "w", encoding="utf-8") as fingerprint_file:
+        json.dump(recorded, fingerprint_file)
+
+
+# Main *************************************************************************
@@ -0,0 +1,503 @@
+"""Module to parse doxygen compound XML files incrementally.
+
+Module that parses doxygen compound XML files with xml.etree.ElementTree.iterparse
+and only materializes the information needed for the LobsterItems. The returned
+objects provide the same getters as the doxmlparser compound objects.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+from typing import BinaryIO, Iterator
+from xml.etree.ElementTree import Element, iterparse
+
+# Variables ********************************************************************
+
+# Tags of elements, which own a detaileddescription with xrefsects.
+_OWNER_TAGS = ("compounddef", "memberdef")
+
+# Classes **********************************************************************
+
+
+class IterparseLocation:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Location of a compound or member definition."""
+
+    def __init__(self, element: Element) -> None:
+        """Initialize the location from the location element.
+
+        Args:
+            element (Element): The location element.
+        """
+        self._file = element.get("file")
+        self._line = _get_int_attribute(element, "line")
+        self._column = _get_int_attribute(element, "column")
+
+    def get_file(self) -> str | None:
+        """Get the file name.
+
+        Returns:
+            str | None: The file name or None if not available.
+        """
+        return self._file
+
+    def get_line(self) -> int | None:
+        """Get the line number.
+
+        Returns:
+            int | None: The line number or None if not available.
+        """
+        return self._line
+
+    def get_column(self) -> int | None:
+        """Get the column number.
+
+        Returns:
+            int | None: The column number or None if not available.
+        """
+        return self._column
+
+
+class IterparsePara:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Paragraph of a description. Only its text and its xrefsects are kept."""
+
+    def __init__(self, value: str) -> None:
+        """Initialize the paragraph.
+
+        Args:
+            value (str): The text of the paragraph without the text of its child elements.
+        """
+        self._value = value
+        self._xrefsects = []
+
+    def get_valueOf_(self) -> str:  # pylint: disable=invalid-name
+        """Get the text of the paragraph without the text of its child elements.
+
+        Returns:
+            str: The paragraph text.
+        """
+        return self._value
+
+    def get_xrefsect(self) -> list["IterparseXrefsect"]:
+        """Get the xrefsects of the paragraph.
+
+        Returns:
+            list[IterparseXrefsect]: The xrefsects.
+        """
+        return self._xrefsects
+
+    def append_xrefsect(self, xrefsect: "IterparseXrefsect") -> None:
+        """Append a xrefsect to the paragraph.
+
+        Args:
+            xrefsect (IterparseXrefsect): The xrefsect to append.
+        """
+        self._xrefsects.append(xrefsect)
+
+
+class IterparseDescription:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Description, which consists of paragraphs."""
+
+    def __init__(self) -> None:
+        """Initialize an empty description."""
+        self._paras = []
+
+    def get_para(self) -> list[IterparsePara]:
+        """Get the paragraphs of the description.
+
+        Returns:
+            list[IterparsePara]: The paragraphs.
+        """
+        return self._paras
+
+    def append_para(self, para: IterparsePara) -> None:
+        """Append a paragraph to the description.
+
+        Args:
+            para (IterparsePara): The paragraph to append.
+        """
+        self._paras.append(para)
+
+
+class IterparseXrefsect:  # pylint: disable=too-few-public-methods
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Cross reference section with its xrefdescription."""
+
+    def __init__(self, xrefdescription: IterparseDescription) -> None:
+        """Initialize the xrefsect.
+
+        Args:
+            xrefdescription (IterparseDescription): The description of the xrefsect.
+        """
+        self._xrefdescription = xrefdescription
+
+    def get_xrefdescription(self) -> IterparseDescription:
+        """Get the xrefdescription.
+
+        Returns:
+            IterparseDescription: The xrefdescription.
+        """
+        return self._xrefdescription
+
+
+class IterparseMemberdef:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Member definition with id, kind, name, location and detaileddescription."""
+
+    def __init__(self, element: Element) -> None:
+        """Initialize the member definition from the attributes of the memberdef element.
+
+        Args:
+            element (Element): The memberdef element at its start.
+        """
+        self._id = element.get("id")
+        self._kind = element.get("kind")
+        self.name = None
+        self.location = None
+        self.detaileddescription = IterparseDescription()
+
+    def get_id(self) -> str | None:
+        """Get the member id.
+
+        Returns:
+            str | None: The member id.
+        """
+        return self._id
+
+    def get_kind(self) -> str | None:
+        """Get the member kind.
+
+        Returns:
+            str | None: The member kind.
+        """
+        return self._kind
+
+    def get_name(self) -> str | None:
+        """Get the member name.
+
+        Returns:
+            str | None: The member name.
+        """
+        return self.name
+
+    def get_location(self) -> IterparseLocation | None:
+        """Get the member location.
+
+        Returns:
+            IterparseLocation | None: The location or None if not available.
+        """
+        return self.location
+
+    def get_detaileddescription(self) -> IterparseDescription:
+        """Get the detaileddescription of the member.
+
+        Returns:
+            IterparseDescription: The detaileddescription.
+        """
+        return self.detaileddescription
+
+
+class IterparseSectiondef:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Section definition, which groups member definitions."""
+
+    def __init__(self) -> None:
+        """Initialize an empty section definition."""
+        self._memberdefs = []
+
+    def get_memberdef(self) -> list[IterparseMemberdef]:
+        """Get the member definitions of the section.
+
+        Returns:
+            list[IterparseMemberdef]: The member definitions.
+        """
+        return self._memberdefs
+
+    def append_memberdef(self, memberdef: IterparseMemberdef) -> None:
+        """Append a member definition to the section.
+
+        Args:
+            memberdef (IterparseMemberdef): The member definition to append.
+        """
+        self._memberdefs.append(memberdef)
+
+
+class IterparseCompounddef:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Compound definition with id, kind, language, name, location,
+    detaileddescription and section definitions.
+    """
+
+    def __init__(self, element: Element) -> None:
+        """Initialize the compound definition from the attributes of the compounddef element.
+
+        Args:
+            element (Element): The compounddef element at its start.
+        """
+        self._id = element.get("id")
+        self._kind = element.get("kind")
+        self._language = element.get("language")
+        self.compoundname = None
+        self.location = None
+        self.detaileddescription = IterparseDescription()
+        self.sectiondefs = []
+
+    def get_id(self) -> str | None:
+        """Get the compound id.
+
+        Returns:
+            str | None: The compound id.
+        """
+        return self._id
+
+    def get_kind(self) -> str | None:
+        """Get the compound kind.
+
+        Returns:
+            str | None: The compound kind.
+        """
+        return self._kind
+
+    def get_language(self) -> str | None:
+        """Get the programming language of the compound.
+
+        Returns:
+            str | None: The language or None if not available, e.g. for groups.
+        """
+        return self._language
+
+    def get_compoundname(self) -> str | None:
+        """Get the compound name.
+
+        Returns:
+            str | None: The compound name.
+        """
+        return self.compoundname
+
+    def get_location(self) -> IterparseLocation | None:
+        """Get the compound location.
+
+        Returns:
+            IterparseLocation | None: The location or None if not available, e.g. for groups.
+        """
+        return self.location
+
+    def get_detaileddescription(self) -> IterparseDescription:
+        """Get the detaileddescription of the compound.
+
+        Returns:
+            IterparseDescription: The detaileddescription.
+        """
+        return self.detaileddescription
+
+    def get_sectiondef(self) -> list[IterparseSectiondef]:
+        """Get the section definitions of the compound.
+
+        Returns:
+            list[IterparseSectiondef]: The section definitions.
+        """
+        return self.sectiondefs
+
+
+# Functions ********************************************************************
+
+
+def _get_int_attribute(element: Element, name: str) -> int | None:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Get an integer attribute of an element.
+
+    Args:
+        element (Element): The element.
+        name (str): The attribute name.
+
+    Returns:
+        int | None: The attribute value or None if the attribute is not available.
+    """
+    value = element.get(name)
+
+    if value is not None:
+        value = int(value)
+
+    return value
+
+
+def get_para_value(element: Element) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Get the text of a para element without the text of its child elements,
+    the same way as doxmlparser does.
+
+    Args:
+        element (Element): The para element.
+
+    Returns:
+        str: The para text.
+    """
+    text = element.text or ""
+
+    for child in element:
+        if child.tail is not None:
+            text += child.tail
+
+    return text
+
+
+def get_description(element: Element) -> IterparseDescription:
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Get the description from a completely parsed description element, e.g.
+    of the doxygen SQLite3 database. Like with iterparse, only the paras with
+    xrefsects are kept.
+
+    Args:
+        element (Element): The description element, whose children are the paras.
+
+    Returns:
+        IterparseDescription: The description.
+    """
+    description = IterparseDescription()
+
+    for para in element.iterfind("para"):
+        xrefsects = para.findall("xrefsect")
+
+        if 0 < len(xrefsects):
+            description_para = IterparsePara(None)
+
+            for xrefsect in xrefsects:
+                xrefdescription = IterparseDescription()
+
+                for xrefdescription_para in xrefsect.iterfind("xrefdescription/para"):
+                    xrefdescription.append_para(IterparsePara(get_para_value(xrefdescription_para)))
+
+                description_para.append_xrefsect(IterparseXrefsect(xrefdescription))
+
+            description.append_para(description_para)
+
+    return description
+
+
+def _is_detaileddescription_para(tags: list[str], depth: int) -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Check whether the element at depth is a para in the detaileddescription
+    of a compound or member definition.
+
+    Args:
+        tags (list[str]): The tags of the currently open elements, root first.
+        depth (int): Index of the element to check in tags.
+
+    Returns:
+        bool: True if the element is such a para, False otherwise.
+    """
+    return (
+        2 <= depth
+        and tags[depth] == "para"
+        and tags[depth - 1] == "detaileddescription"
+        and tags[depth - 2] in _OWNER_TAGS
+    )
+
+
+# pylint: disable-next=too-many-branches,too-many-locals,too-many-statements
+def iterparse_compounddefs(source: str | BinaryIO) -> Iterator[IterparseCompounddef]:
+    # lobster-trace: SwRequirements.sw_req_cli_parser
+    """Parse a doxygen compound XML file incrementally and yield its compound
+    definitions. Elements are discarded as soon as they were processed, therefore
+    the memory usage doesn't depend on the size of the XML file.
+
+    Args:
+        source (str | BinaryIO): Path of the compound XML file or a binary file object.
+
+    Yields:
+        IterparseCompounddef: The compound definitions in document order.
+    """
+    elements = []  # Stack of currently open elements.
+    tags = []  # Tags of the currently open elements.
+    compounddef = None
+    sectiondef = None
+    memberdef = None
+    xrefsect_paras = []  # Paras of the currently open xrefdescription.
+    detaileddescription_para = None
+
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            elements.append(element)
+            tags.append(element.tag)
+
+            if element.tag == "compounddef":
+                compounddef = IterparseCompounddef(element)
+            elif element.tag == "sectiondef" and compounddef is not None:
+                sectiondef = IterparseSectiondef()
+                compounddef.sectiondefs.append(sectiondef)
+            elif element.tag == "memberdef" and sectiondef is not None:
+                memberdef = IterparseMemberdef(element)
+                sectiondef.append_memberdef(memberdef)
+            continue
+
+        depth = len(tags) - 1
+        tag = tags[depth]
+        parent_tag = tags[depth - 1] if 0 < depth else None
+        in_xrefsect = "xrefsect" in tags
+
+        if tag == "compounddef":
+            yield compounddef
+            compounddef = None
+        elif tag == "sectiondef":
+            sectiondef = None
+        elif tag == "memberdef":
+            memberdef = None
+        elif tag == "compoundname" and parent_tag == "compounddef":
+            compounddef.compoundname = element.text
+        elif tag == "name" and parent_tag == "memberdef":
+            memberdef.name = element.text
+        elif tag == "location" and parent_tag == "compounddef":
+            compounddef.location = IterparseLocation(element)
+        elif tag == "location" and parent_tag == "memberdef":
+            memberdef.location = IterparseLocation(element)
+        elif (
+            tag == "para"
+            and parent_tag == "xrefdescription"
+            and tags[depth - 2] == "xrefsect"
+            and _is_detaileddescription_para(tags, depth - 3)
+        ):
+            xrefsect_paras.append(IterparsePara(get_para_value(element)))
+        elif tag == "xrefsect" and _is_detaileddescription_para(tags, depth - 1):
+            xrefdescription = IterparseDescription()
+            for para in xrefsect_paras:
+                xrefdescription.append_para(para)
+            xrefsect_paras = []
+
+            if detaileddescription_para is None:
+                detaileddescription_para = IterparsePara(None)
+                owner = memberdef if tags[depth - 3] == "memberdef" else compounddef
+                owner.detaileddescription.append_para(detaileddescription_para)
+            detaileddescription_para.append_xrefsect(IterparseXrefsect(xrefdescription))
+        elif _is_detaileddescription_para(tags, depth):
+            detaileddescription_para = None
+
+        elements.pop()
+        tags.pop()
+
+        # Discard the processed element, except inside of xrefsects where the
+        # tails of the child elements are still needed for the para text.
+        if (0 < len(elements)) and (in_xrefsect is False or tag == "xrefsect"):
+            del elements[-1][-1]
+
+
+# Main *************************************************************************
@@ -21,18 +21,41 @@ Author: Andreas Merkle (andreas.merkle@newtec.de)
 
 # Imports **********************************************************************
 
+import sys
 from typing import List
 
 from lobster_doxygen.lobster_kind import LobsterKind
 
 # Variables ********************************************************************
 
+# Tag prefix per programming language, followed by the separator to the item id.
+_TAG_PREFIXES = {
+    "C": "c ",
+    "C++": "cpp ",
+    "C#": "cs ",
+    "Java": "java ",
+    "Python": "python ",
+}
+
+# Tag prefix of an unknown programming language.
+_UNKNOWN_TAG_PREFIX = "unknown  "
+
 # Classes **********************************************************************
 
 
 class LobsterItem:  # pylint: disable=too-many-instance-attributes
     # lobster-trace: SwRequirements.sw_req_output_file_format
-    """Class to represent a lobster item."""
+    """Class to represent a lobster item.
+
+    The attributes are stored in slots to keep the memory usage low with many
+    items. The lists of references, justifications and children are only
+    allocated when they are accessed or set non-empty. File names and languages
+    are interned, because all members of a file repeat them.
+    """
+
+    __slots__ = (
+        "item_id", "_file_name", "line", "column", "name", "_refs", "_just_up", "_language", "kind", "_children"
+    )
 
     def __init__(self, item_id: str) -> None:
         """Initialize the lobster item.
@@ -41,15 +64,91 @@ class LobsterItem:  # pylint: disable=too-many-instance-attributes
             item_id (str): The unique identifier of the lobster item.
         """
         self.item_id = item_id  # Unique identifier of the lobster item.
-        self.file_name = ""  # Code location file name with path.
+        self._file_name = ""  # Code location file name with path.
         self.line = None  # Code location line number.
         self.column = None  # Code location column number.
         self.name = ""  # Name shown in the trace report for this item.
-        self.refs = []  # List of references to requirements.
-        self.just_up = []  # List of justifications.
-        self.language = ""  # Programming language of the code location.
+        self._refs = None  # List of references to requirements.
+        self._just_up = None  # List of justifications.
+        self._language = ""  # Programming language of the code location.
         self.kind = LobsterKind.UNDEFINED  # Kind of the lobster item.
-        self._children = []  # List of child items.
+        self._children = None  # List of child items.
+
+    def __getstate__(self) -> tuple:
+        """Get the attributes to pickle the lobster item, e.g. for the cache or a worker process.
+
+        Returns:
+            tuple: The attribute values.
+        """
+        return (
+            self.item_id, self._file_name, self.line, self.column, self.name, self._refs or None,
+            self._just_up or None, self._language, self.kind, self._children or None
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore the attributes of an unpickled lobster item. The strings are
+        interned again, because unpickling creates new string objects.
+
+        Args:
+            state (tuple): The attribute values, see __getstate__().
+        """
+        (
+            self.item_id, file_name, self.line, self.column, self.name, self._refs, self._just_up,
+            language, self.kind, self._children
+        ) = state
+        self.file_name = file_name
+        self.language = language
+
+    @property
+    def file_name(self) -> str:
+        """Code location file name with path."""
+        return self._file_name
+
+    @file_name.setter
+    def file_name(self, value: str) -> None:
+        self._file_name = sys.intern(value)
+
+    @property
+    def language(self) -> str:
+        """Programming language of the code location."""
+        return self._language
+
+    @language.setter
+    def language(self, value: str) -> None:
+        self._language = sys.intern(value)
+
+    @property
+    def refs(self) -> List[str]:
+        """List of references to requirements."""
+        if self._refs is None:
+            self._refs = []
+
+        return self._refs
+
+    @refs.setter
+    def refs(self, value: List[str]) -> None:
+        self._refs = value
+
+    @property
+    def just_up(self) -> List[str]:
+        """List of justifications."""
+        if self._just_up is None:
+            self._just_up = []
+
+        return self._just_up
+
+    @just_up.setter
+    def just_up(self, value: List[str]) -> None:
+        self._just_up = value
+
+    @property
+    def children(self) -> List["LobsterItem"]:
+        """List of child items."""
+        return self.get_children()
+
+    @children.setter
+    def children(self, value: List["LobsterItem"]) -> None:
+        self._children = value
 
     def append_lobster_child(self, item: "LobsterItem") -> None:
         """Append an child to the lobster item.
@@ -57,7 +156,7 @@ class LobsterItem:  # pylint: disable=too-many-instance-attributes
         Args:
             item (LobsterItem): The item to append.
         """
-        self._children.append(item)
+        self.get_children().append(item)
 
     def get_children(self) -> List["LobsterItem"]:
         """Get the children of the lobster item.
@@ -65,15 +164,33 @@ class LobsterItem:  # pylint: disable=too-many-instance-attributes
         Returns:
             List[LobsterItem]: The list of child items.
         """
+        if self._children is None:
+            self._children = []
+
         return self._children
 
+    def copy_with_children(self, children: List["LobsterItem"]) -> "LobsterItem":
+        """Get a copy of the lobster item with other children. The lobster item
+        itself is unchanged.
+
+        Args:
+            children (List[LobsterItem]): The child items of the copy.
+
+        Returns:
+            LobsterItem: The copy with the child items.
+        """
+        lobster_item = LobsterItem(self.item_id)
+        lobster_item.__setstate__((*self.__getstate__()[:-1], list(children)))
+
+        return lobster_item
+
     def has_children(self) -> bool:
         """Check if the lobster item has children.
 
         Returns:
             bool: True if the lobster item has children, False otherwise.
         """
-        return 0 < len(self._children)
+        return self._children is not None and 0 < len(self._children)
 
     def has_refs(self) -> bool:
         """Check if the lobster item has references.
@@ -81,7 +198,7 @@ class LobsterItem:  # pylint: disable=too-many-instance-attributes
         Returns:
             bool: True if the lobster item has references, False otherwise.
         """
-        return 0 < len(self.refs)
+        return self._refs is not None and 0 < len(self._refs)
 
     def has_just_up(self) -> bool:
         """Check if the lobster item has justifications.
@@ -89,31 +206,7 @@ class LobsterItem:  # pylint: disable=too-many-instance-attributes
         Returns:
             bool: True if the lobster item has justifications, False otherwise.
         """
-        return 0 < len(self.just_up)
-
-    def _language_to_tag_prefix(self, language: str) -> str:
-        """Convert the language to a tag prefix.
-
-        Args:
-            language (str): The language to be converted.
-
-        Returns:
-            str: The tag prefix for the given language.
-        """
-        prefix = "unknown "
-
-        if language == "C":
-            prefix = "c"
-        elif language == "C++":
-            prefix = "cpp"
-        elif language == "C#":
-            prefix = "cs"
-        elif language == "Java":
-            prefix = "java"
-        elif language == "Python":
-            prefix = "python"
-
-        return prefix
+        return self._just_up is not None and 0 < len(self._just_up)
 
     def get_tag(self) -> str:
         """Get the tag of the lobster item.
@@ -121,9 +214,10 @@ class LobsterItem:  # pylint: disable=too-many-instance-attributes
         Returns:
             str: The tag of the lobster item.
         """
-        return self._language_to_tag_prefix(self.language) + " " + self.item_id
+        return _TAG_PREFIXES.get(self._language, _UNKNOWN_TAG_PREFIX) + self.item_id
 
 
 # Functions ********************************************************************
 
+
 # Main *************************************************************************
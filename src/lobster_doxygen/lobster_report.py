@@ -0,0 +1,182 @@
+"""Module to hand the lobster items over to the data model of bmw-lobster and
+to create the trace report in the same process, without the LOBSTER common
+interchange format file in between.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+from collections import OrderedDict
+from typing import Iterable
+
+from lobster.common.errors import LOBSTER_Error
+from lobster.common.exceptions import LOBSTER_Exception
+from lobster.common.io import lobster_read, signal_duplicate_items
+from lobster.common.items import Implementation, Tracing_Tag
+from lobster.common.level_definition import LevelDefinition
+from lobster.common.location import File_Reference
+from lobster.common.parser import load as load_lobster_config
+from lobster.common.report import Report
+
+from lobster_doxygen.conversion_error import ConversionError
+from lobster_doxygen.lobster_item import LobsterItem
+
+# Variables ********************************************************************
+
+# Kind of the lobster levels, which contain the items of the source code.
+_LEVEL_KIND_IMPLEMENTATION = "implementation"
+
+# Namespace of the tags of the requirements, as in the LOBSTER common interchange format file.
+_REQUIREMENT_NAMESPACE = "req"
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def get_lobster_implementation(lobster_item: LobsterItem, level: str) -> Implementation:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Get the lobster Implementation item of a lobster item, which is the same
+    as bmw-lobster reads from the LOBSTER common interchange format file.
+
+    Args:
+        lobster_item (LobsterItem): The lobster item, which is written to the output file.
+        level (str): The name of the implementation level of the lobster configuration.
+
+    Returns:
+        Implementation: The lobster Implementation item with unresolved references.
+    """
+    implementation = Implementation(
+        tag=Tracing_Tag.from_json(lobster_item.get_tag()),
+        location=File_Reference(lobster_item.file_name, lobster_item.line, lobster_item.column),
+        language=lobster_item.language,
+        kind=lobster_item.kind.value,
+        name=lobster_item.name,
+    )
+    implementation.set_level(level)
+
+    for ref in lobster_item.refs:
+        # The tag is parsed like in the file, e.g. for a version after @.
+        implementation.add_tracing_target(Tracing_Tag.from_json(f"{_REQUIREMENT_NAMESPACE} {ref}"))
+
+    implementation.just_up = list(lobster_item.just_up)
+
+    return implementation
+
+
+def _get_level(config: OrderedDict[str, LevelDefinition], level: str | None) -> str:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Get the implementation level of the lobster configuration, which gets the lobster items.
+
+    Args:
+        config (OrderedDict[str, LevelDefinition]): The levels of the lobster configuration.
+        level (str | None): The name of the level or None for the only
+            implementation level without source file.
+
+    Returns:
+        str: The name of the level.
+
+    Raises:
+        ValueError: If the level isn't an implementation level of the lobster
+            configuration or isn't given and can't be determined.
+    """
+    if level is None:
+        levels = [
+            name
+            for name, level_definition in config.items()
+            if level_definition.kind == _LEVEL_KIND_IMPLEMENTATION and 0 == len(level_definition.source)
+        ]
+
+        if 1 != len(levels):
+            raise ValueError(
+                f"The lobster configuration has {len(levels)} implementation levels without source, "
+                "the level of the lobster items has to be given."
+            )
+
+        level = levels[0]
+
+    elif level not in config or config[level].kind != _LEVEL_KIND_IMPLEMENTATION:
+        raise ValueError(f"The lobster configuration has no implementation level '{level}'.")
+
+    return level
+
+
+def get_lobster_report(
+    lobster_items: Iterable[LobsterItem], lobster_config_file: str, level: str | None = None
+) -> Report:
+    # lobster-trace: SwRequirements.sw_req_lobster_report
+    """Create the lobster report like lobster-report does, but the lobster items
+    are added to their level directly instead of reading them from a file.
+    The source files of the other levels are read as usual.
+
+    The lobster items may be a generator, which converts the compounds while
+    the report is created.
+
+    Args:
+        lobster_items (Iterable[LobsterItem]): The lobster items, which are written to the output file.
+        lobster_config_file (str): The lobster configuration file, e.g. lobster.conf.
+        level (str | None): The name of the implementation level, which gets the lobster items.
+            If None, the only implementation level without source file of the configuration.
+
+    Returns:
+        Report: The report with the resolved references and the coverage, see Report.write_report().
+
+    Raises:
+        ValueError: If the level can't be determined or the lobster data is invalid.
+        ConversionError: If bmw-lobster reports an error, e.g. a duplicate tag. The cause is already reported.
+    """
+    report = Report()
+
+    try:
+        report.config = load_lobster_config(report.mh, lobster_config_file)
+        level = _get_level(report.config, level)
+
+        for level_name, level_definition in report.config.items():
+            if level_name == level:
+                duplicate_items = []
+
+                for lobster_item in lobster_items:
+                    implementation = get_lobster_implementation(lobster_item, level)
+
+                    if implementation.tag.key() in report.items:
+                        duplicate_items.append(implementation)
+                    else:
+                        report.items[implementation.tag.key()] = implementation
+
+                signal_duplicate_items(report.mh, report.items, duplicate_items)
+
+            for source in level_definition.source:
+                lobster_read(report.mh, source["file"], level_name, report.items, source)
+
+        report.resolve_references_for_items()
+        report.compute_item_count_and_status()
+        report.compute_coverage_for_items()
+
+    except LOBSTER_Error as e:
+        # The message handler of bmw-lobster already reported the error.
+        raise ConversionError() from e
+
+    except LOBSTER_Exception as e:
+        raise ValueError(e.message) from e
+
+    return report
+
+
+# Main *************************************************************************
@@ -0,0 +1,228 @@
+"""Module for the manifest of the output file, which allows to update only the
+lobster items of changed compound files.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import gzip
+import json
+import os
+from typing import BinaryIO
+
+from lobster_doxygen.constants import MANIFEST_FILE_SUFFIX
+from lobster_doxygen.xml_archive import get_xml_file_hash
+
+# Variables ********************************************************************
+
+# Version of the manifest content format. Increase it if the manifest changes.
+_MANIFEST_FORMAT_VERSION = 1
+
+# Classes **********************************************************************
+
+
+class OutputManifest:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Manifest of the output file, which records for each compound file its
+    content hash and the byte range of its lobster items in the uncompressed
+    output file.
+
+    The manifest is only valid for the settings, which created the output file,
+    and as long as the output file is not modified. Otherwise it is treated as
+    empty and all compound files are converted again.
+    """
+
+    def __init__(self, output_file_name: str, settings: dict) -> None:
+        """Initialize the output manifest.
+
+        Args:
+            output_file_name (str): Path and file name of the output file.
+            settings (dict): The settings, which influence the content of the
+                output file. They have to be JSON serializable.
+        """
+        self._output_file_name = output_file_name
+        self._manifest_file_name = output_file_name + MANIFEST_FILE_SUFFIX
+        self._settings = settings
+        self._old_entries = {}  # Entries of the loaded manifest per compound path in output order.
+        self._keys = {}  # Key of each compound file of the current run per compound path.
+        self._entries = []  # Entries of the current run in output order.
+        self._output_file = None  # The previous output file, opened to read unchanged segments.
+
+    def load(self) -> None:
+        """Load the manifest of the previous run. If it doesn't exist, doesn't
+        match the settings or the output file was modified since, the manifest
+        is treated as empty.
+        """
+        self._old_entries = {}
+
+        try:
+            with open(self._manifest_file_name, "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+
+            stat_result = os.stat(self._output_file_name)
+            is_valid = (
+                manifest.get("version") == _MANIFEST_FORMAT_VERSION
+                and manifest.get("settings") == self._settings
+                and manifest.get("output") == {"size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns}
+            )
+
+            if is_valid is True:
+                self._old_entries = {entry["path"]: entry for entry in manifest["compounds"]}
+
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Without a valid manifest all compound files are converted again.
+            self._old_entries = {}
+
+    def close(self) -> None:
+        """Close the previous output file, if it was opened to read segments."""
+        if self._output_file is not None:
+            self._output_file.close()
+            self._output_file = None
+
+    def is_compound_unchanged(self, compound_path: str, variant: str) -> bool:
+        """Check whether the lobster items of a compound file are in the previous
+        output file and its content and settings are unchanged.
+
+        Args:
+            compound_path (str): The path of the compound file.
+            variant (str): Distinguishes the lobster items of the same compound
+                file, which are created with different settings.
+
+        Returns:
+            bool: True if the lobster items can be taken from the previous output file.
+        """
+        key = f"{get_xml_file_hash(compound_path)}/{variant}"
+        self._keys[compound_path] = key
+        old_entry = self._old_entries.get(compound_path)
+
+        return old_entry is not None and old_entry["key"] == key
+
+    def is_unchanged(self) -> bool:
+        """Check whether the previous output file is up to date, i.e. the same
+        compound files in the same order are unchanged. Only valid after all
+        compound files are checked with is_compound_unchanged().
+
+        Returns:
+            bool: True if the output file doesn't need to be written again.
+        """
+        return (
+            0 < len(self._old_entries)
+            and list(self._old_entries) == list(self._keys)
+            and all(self._old_entries[path]["key"] == key for path, key in self._keys.items())
+        )
+
+    def get_item_count(self) -> int:
+        """Get the number of lobster items in the previous output file.
+
+        Returns:
+            int: The number of lobster items.
+        """
+        return sum(entry["items"] for entry in self._old_entries.values())
+
+    def _open_output_file(self) -> BinaryIO:
+        """Open the previous output file for reading its uncompressed content.
+
+        Returns:
+            BinaryIO: The opened output file.
+        """
+        if self._output_file is None:
+            if self._settings.get("gzip") is True:
+                self._output_file = gzip.GzipFile(self._output_file_name, "rb")
+            else:
+                self._output_file = open(self._output_file_name, "rb")  # pylint: disable=consider-using-with
+
+        return self._output_file
+
+    def read_segment(self, compound_path: str) -> tuple[bytes, int]:
+        """Read the lobster items of an unchanged compound file from the previous output file.
+
+        Args:
+            compound_path (str): The path of the compound file.
+
+        Returns:
+            tuple[bytes, int]: The UTF-8 encoded text of the lobster items and their number.
+
+        Raises:
+            OSError: If the previous output file can't be read.
+        """
+        old_entry = self._old_entries[compound_path]
+        output_file = self._open_output_file()
+        output_file.seek(old_entry["offset"])
+        segment = output_file.read(old_entry["size"])
+
+        if len(segment) != old_entry["size"]:
+            raise OSError(f"{self._output_file_name} is shorter than recorded in its manifest.")
+
+        return segment, old_entry["items"]
+
+    def get_entries(self) -> list[dict]:
+        """Get the entries of the current run.
+
+        Returns:
+            list[dict]: The path, key, offset, size and number of lobster items
+            of each compound file in output order.
+        """
+        return self._entries
+
+    def add(self, compound_path: str, size: int, item_count: int) -> None:
+        """Add the lobster items of a compound file to the manifest of the
+        current run, in output order.
+
+        Args:
+            compound_path (str): The path of the compound file.
+            size (int): The size of the UTF-8 encoded text of the lobster items.
+            item_count (int): The number of lobster items.
+        """
+        self._entries.append(
+            {"path": compound_path, "key": self._keys[compound_path], "offset": 0, "size": size, "items": item_count}
+        )
+
+    def save(self, offsets: list[int]) -> None:
+        """Save the manifest of the current run for the written output file.
+
+        Args:
+            offsets (list[int]): The offset of each added entry in the uncompressed output file.
+
+        Raises:
+            OSError: If the manifest file can't be written.
+        """
+        for entry, offset in zip(self._entries, offsets):
+            entry["offset"] = offset
+
+        stat_result = os.stat(self._output_file_name)
+        manifest = {
+            "version": _MANIFEST_FORMAT_VERSION,
+            "settings": self._settings,
+            "output": {"size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns},
+            "compounds": self._entries,
+        }
+
+        with open(self._manifest_file_name, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+    def remove(self) -> None:
+        """Remove the manifest file, e.g. if the output file is not valid anymore."""
+        if os.path.isfile(self._manifest_file_name):
+            os.remove(self._manifest_file_name)
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
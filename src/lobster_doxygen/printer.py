@@ -25,7 +25,8 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 # Imports **********************************************************************
 
 import sys
-from rich import print as rprint
+
+from lobster_doxygen.utils import indent
 
 
 # Variables ********************************************************************
@@ -37,15 +38,80 @@ class Printer:
     """The printer class.
     Prints errors, warnings and infos. Infos and warnings are only printed, if
     verbose mode is set.
+
+    Infos are formatted lazily, only if they are printed or captured. They are
+    written as plain text to the buffered standard output stream, rich is only
+    used for an interactive terminal. It is imported on its first use, which
+    keeps the startup fast.
     """
 
     _print_verbose = False
+    _captured_records = None
+    _capture_all = False
+    _info_stream = None  # The standard output stream, whose terminal check is cached.
+    _is_info_stream_tty = False  # True if the info stream is an interactive terminal.
 
     @classmethod
-    def set_verbose(cls):
+    def set_verbose(cls, verbose: bool = True):
         # lobster-trace: SwRequirements.sw_req_cli_verbose
-        """Set verbose mode for all instances of the class."""
-        cls._print_verbose = True
+        """Set verbose mode for all instances of the class.
+
+        Args:
+            verbose (bool): True to set verbose mode, False to reset it, e.g.
+                before the server runs the next conversion.
+        """
+        cls._print_verbose = verbose
+
+    @classmethod
+    def is_verbose(cls) -> bool:
+        """Check whether verbose mode is set.
+
+        Returns:
+            bool: True if verbose mode is set, False otherwise.
+        """
+        return cls._print_verbose
+
+    @classmethod
+    def start_capture(cls, capture_all: bool = False) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        # lobster-trace: SwRequirements.sw_req_cli_cache
+        """Start capturing all printed messages instead of printing them.
+        Used by worker processes, whose output is replayed by the main process
+        in a deterministic order.
+
+        Args:
+            capture_all (bool): Capture warnings and infos also if verbose mode
+                is not set, e.g. to store them in the cache.
+        """
+        cls._captured_records = []
+        cls._capture_all = capture_all
+
+    @classmethod
+    def stop_capture(cls) -> list[tuple[str, str]]:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Stop capturing and return the captured messages.
+
+        Returns:
+            list[tuple[str, str]]: The captured messages as tuples of print method name and message.
+        """
+        records = cls._captured_records
+        cls._captured_records = None
+        cls._capture_all = False
+
+        if records is None:
+            records = []
+
+        return records
+
+    def replay(self, records: list[tuple[str, str]]) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Print previously captured messages.
+
+        Args:
+            records (list[tuple[str, str]]): The captured messages, see stop_capture().
+        """
+        for method_name, message in records:
+            getattr(self, method_name)(message)
 
     def print_error(self, message: str) -> None:
         """Print error message to standard error stream.
@@ -54,7 +120,10 @@ class Printer:
             args (str): The error information that will be printed.
         """
         # lobster-trace: SwRequirements.sw_req_stderr_output
-        rprint(f"[bold red]Error: [/bold red]{message}", end="", file=sys.stderr)
+        if self._captured_records is not None:
+            self._captured_records.append(("print_error", message))
+        else:
+            self._rich_print(f"[bold red]Error: [/bold red]{self._escape(message)}", end="", file=sys.stderr)
 
     def print_warning(self, message: str) -> None:
         """Print warning message to standard error stream.
@@ -63,18 +132,110 @@ class Printer:
             args (str): The warning information that will be printed.
         """
         # lobster-trace: SwRequirements.sw_req_stderr_output
-        if self._print_verbose is True:
-            rprint(f"[bold yellow]Warning: [/bold yellow]{message}", end="", file=sys.stderr)
+        if self._captured_records is not None:
+            if self._print_verbose is True or self._capture_all is True:
+                self._captured_records.append(("print_warning", message))
+        elif self._print_verbose is True:
+            self._rich_print(f"[bold yellow]Warning: [/bold yellow]{self._escape(message)}", end="", file=sys.stderr)
 
-    def print_info(self, message: str) -> None:
+    def print_info(self, message: str, *args, level: int = 0) -> None:
         """Print the information to the console standard output.
 
+        The message is only formatted if it is printed or captured, therefore
+        it is cheap to call in verbose mode off.
+
+        Args:
+            message (str): The information that will be printed. If args are
+                given, it is a format string with %-style placeholders.
+            args: The values of the placeholders.
+            level (int): The indentation level of the information.
+        """
+        # lobster-trace: SwRequirements.sw_req_stdout_output
+        if self._captured_records is not None:
+            if self._print_verbose is True or self._capture_all is True:
+                self._captured_records.append(("print_info", self._format(message, args, level)))
+        elif self._print_verbose is True:
+            self._write_info(self._format(message, args, level))
+
+    @staticmethod
+    def _rich_print(*args, **kwargs) -> None:
+        # lobster-trace: SwRequirements.sw_req_startup
+        """Print with rich, which is imported on the first call.
+
+        Args:
+            args: The objects to print.
+            kwargs: The keyword arguments of rich.print.
+        """
+        from rich import print as rprint  # pylint: disable=import-outside-toplevel
+
+        rprint(*args, **kwargs)
+
+    @staticmethod
+    def _escape(message: str) -> str:
+        """Escape the brackets of a message, e.g. of the element path
+        compounddef[@id='class_a'], which rich would treat as markup.
+
+        Args:
+            message (str): The message.
+
+        Returns:
+            str: The message, which rich prints unchanged.
+        """
+        from rich.markup import escape  # pylint: disable=import-outside-toplevel
+
+        return escape(message)
+
+    @staticmethod
+    def _format(message: str, args: tuple, level: int) -> str:
+        """Format a message with its placeholder values and indentation.
+
+        Args:
+            message (str): The message, a format string if args are given.
+            args (tuple): The values of the placeholders.
+            level (int): The indentation level.
+
+        Returns:
+            str: The formatted message.
+        """
+        if 0 < len(args):
+            message = message % args
+
+        if 0 < level:
+            message = indent(level, message)
+
+        return message
+
+    @classmethod
+    def _write_info(cls, message: str) -> None:
+        """Write an information line to the standard output stream. A redirected
+        stream gets plain text, only an interactive terminal is served by rich.
+
+        Args:
+            message (str): The formatted information.
+        """
+        stream = sys.stdout
+
+        # The stream is replaced e.g. by tests, therefore the check is repeated for a new stream.
+        if stream is not cls._info_stream:
+            cls._info_stream = stream
+            cls._is_info_stream_tty = stream.isatty()
+
+        if cls._is_info_stream_tty is True:
+            cls._rich_print(message)
+        else:
+            stream.write(message + "\n")
+
+    def print_report(self, message: str) -> None:
+        """Print a report line to the console standard output, independent of
+        verbose mode.
+
         Args:
-            args (str): The information that will be printed.
+            message (str): The report line that will be printed.
         """
         # lobster-trace: SwRequirements.sw_req_stdout_output
-        if self._print_verbose is True:
-            rprint(message)
+        # lobster-trace: SwRequirements.sw_req_cli_stats
+        # The plain print keeps e.g. brackets in paths, which rich treats as markup.
+        print(message)
 
 
 # Functions ********************************************************************
@@ -36,6 +36,7 @@ class Ret(IntEnum):
     RET_ERROR_ARGPARSE = 2  # Must be 2 to match the argparse error code.
     RET_ERROR_FILEPATH_INVALID = 3
     RET_ERROR_NO_LOBSTER_ITEMS = 4
+    RET_ERROR_PARTIAL_OUTPUT = 5  # The output file lacks the compounds, which can't be converted.
 
 
 # Functions ********************************************************************
@@ -21,67 +21,125 @@ Author: Andreas Merkle (andreas.merkle@newtec.de)
 
 # Imports **********************************************************************
 
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
 from lobster_doxygen.lobster_item import LobsterItem
 from lobster_doxygen.lobster_kind import LobsterKind
-from lobster_doxygen.printer import Printer
 
 # Variables ********************************************************************
 
-LOG = Printer()
-
 # Classes **********************************************************************
 
+
+@dataclass(frozen=True)
+class RuleViolation:
+    # lobster-trace: SwRequirements.sw_req_rule_report
+    """Violation of a rule by a lobster item."""
+
+    rule: str  # The name of the violated rule.
+    tag: str  # The tag of the lobster item, which violates the rule.
+    file_name: str  # The file of the lobster item.
+    line: int | None  # The line of the lobster item, None e.g. for a file.
+    message: str  # The description of the violation.
+
+    def get_report_line(self) -> str:
+        """Get the violation as line of the report.
+
+        Returns:
+            str: The location of the lobster item, the message and the name of the rule.
+        """
+        location = self.file_name
+
+        if self.line is not None:
+            location += f":{self.line}"
+
+        return f"{location}: {self.message} [{self.rule}]"
+
+
+@dataclass(frozen=True)
+class Rule:
+    # lobster-trace: SwRequirements.sw_req_rule_report
+    """A rule, which the lobster item of a compound and its children have to satisfy."""
+
+    name: str  # The name of the rule, which is reported with each violation.
+    check: Callable[[LobsterItem], Iterator[str]]  # Yields the message of each violation of a compound.
+
+
 # Functions ********************************************************************
 
 
-def rule_check(lobster_items: list[LobsterItem]) -> bool:
-    """Check the lobster items for rules.
+def _check_file_level(lobster_item: LobsterItem) -> Iterator[str]:
+    # lobster-trace: SwRequirements.sw_req_rule_file
+    """Its not allowed to have requirements and justifications on file level.
 
     Args:
-        lobster_items (list[LobsterItem]): The list of lobster items.
+        lobster_item (LobsterItem): The lobster item of a compound.
 
-    Returns:
-        bool: True if the rules are satisfied, False otherwise.
+    Yields:
+        str: The message of the violation.
     """
-    # lobster-trace: SwRequirements.sw_req_rule_file
+    if lobster_item.kind == LobsterKind.FILE:
+        if lobster_item.has_refs() or lobster_item.has_just_up():
+            yield (
+                f"The {lobster_item.kind.value} '{lobster_item.name}' "
+                f"has requirements or justifications on file level."
+            )
+
+
+def _check_parent_and_child_level(lobster_item: LobsterItem) -> Iterator[str]:
     # lobster-trace: SwRequirements.sw_req_rule_class
-    success = True
+    """Its not allowed to have a lobster item parent with requirements and any
+    child item with requirements.
+
+    Args:
+        lobster_item (LobsterItem): The lobster item of a compound.
 
-    for lobster_item in lobster_items:
-        # Its not allowed to have requirements and justifications on file level.
-        if lobster_item.kind == LobsterKind.FILE:
-            if lobster_item.has_refs() or lobster_item.has_just_up():
-                LOG.print_error(
+    Yields:
+        str: The message of each child item, which violates the rule.
+    """
+    if lobster_item.has_refs() or lobster_item.has_just_up():
+        for lobster_item_child in lobster_item.get_children():
+            if lobster_item_child.has_refs():
+                yield (
                     f"The {lobster_item.kind.value} '{lobster_item.name}' "
-                    f"has requirements or justifications on file level.",
+                    f"has child item '{lobster_item_child.name}' with requirements."
                 )
-                success = False
-
-        if success is True:
-            # Its not allowed to have a lobster item parent with requirements and
-            # any child item with requirements.
-            if lobster_item.has_refs() or lobster_item.has_just_up():
-                for lobster_item_child in lobster_item.get_children():
-                    if lobster_item_child.has_refs():
-                        LOG.print_error(
-                            f"The {lobster_item.kind.value} '{lobster_item.name}' "
-                            f"has child item '{lobster_item_child.name}' with requirements."
-                        )
-                        success = False
-                    elif lobster_item_child.has_just_up():
-                        LOG.print_error(
-                            f"The {lobster_item.kind.value} '{lobster_item.name}' "
-                            f"has child item '{lobster_item_child.name}' with justification."
-                        )
-                        success = False
-
-                    if success is False:
-                        break
-
-        if success is False:
-            break
-
-    return success
+            elif lobster_item_child.has_just_up():
+                yield (
+                    f"The {lobster_item.kind.value} '{lobster_item.name}' "
+                    f"has child item '{lobster_item_child.name}' with justification."
+                )
+
+
+# Registry of the rules, which are checked for each compound in this order.
+RULES = [
+    Rule("file_level", _check_file_level),
+    Rule("parent_and_child_level", _check_parent_and_child_level),
+]
+
+
+def check_rules(lobster_item: LobsterItem, rules: list[Rule] | None = None) -> list[RuleViolation]:
+    """Check the lobster item of a compound and its children for all rules.
+
+    Args:
+        lobster_item (LobsterItem): The lobster item of a compound.
+        rules (list[Rule] | None): The rules to check. If None, the registered RULES are checked.
+
+    Returns:
+        list[RuleViolation]: All violations, empty if the rules are satisfied.
+    """
+    # lobster-trace: SwRequirements.sw_req_rule_file
+    # lobster-trace: SwRequirements.sw_req_rule_class
+    # lobster-trace: SwRequirements.sw_req_rule_report
+    if rules is None:
+        rules = RULES
+
+    return [
+        RuleViolation(rule.name, lobster_item.get_tag(), lobster_item.file_name, lobster_item.line, message)
+        for rule in rules
+        for message in rule.check(lobster_item)
+    ]
 
 
 # Main *************************************************************************
@@ -0,0 +1,259 @@
+"""Server, which keeps the imports and the results of the compound files in
+memory and converts on request of the client.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+
+# The conversion modules, which lobster-doxygen imports on demand, are imported
+# on start, so the first request is as fast as the following ones.
+import lobster_doxygen.doxygen_to_lobster_converter  # pylint: disable=unused-import
+from lobster_doxygen.__main__ import main as convert_main
+from lobster_doxygen.client import get_socket_path, send_request
+from lobster_doxygen.compound_cache import DEFAULT_CACHE_MAX_SIZE, MemoryCompoundCache
+from lobster_doxygen.get_lobster_items_from_doxygen_xml_folder import create_worker_pool
+from lobster_doxygen.printer import Printer
+from lobster_doxygen.ret import Ret
+
+# Variables ********************************************************************
+
+LOG = Printer()
+
+# Classes **********************************************************************
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    # lobster-trace: SwRequirements.sw_req_server
+    """Handles a conversion request of the client, one JSON line each."""
+
+    def handle(self) -> None:
+        """Run the requested conversion and send its result."""
+        request = json.loads(self.rfile.readline())
+        response = run_request(request["argv"], request["cwd"], self.server.cache, self.server.worker_pool)
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class Server(socketserver.UnixStreamServer):
+    # lobster-trace: SwRequirements.sw_req_server
+    """Unix domain socket server, which runs one conversion after the other
+    with a compound cache in memory and one pool of worker processes.
+    """
+
+    def __init__(
+        self, socket_path: str, cache_max_size: int = DEFAULT_CACHE_MAX_SIZE * 1024 * 1024, jobs: int | None = None
+    ) -> None:
+        """Create the socket, which only the current user may connect to.
+
+        Args:
+            socket_path (str): The path of the server socket.
+            cache_max_size (int): Maximum size of the cached results in bytes.
+            jobs (int | None): Number of worker processes, which all conversions share.
+                None for the number of CPUs.
+
+        Raises:
+            OSError: If another server is running, the folder of the socket may be
+                changed by other users or the socket can't be created.
+        """
+        _create_socket_folder(os.path.dirname(os.path.abspath(socket_path)))
+
+        if os.path.exists(socket_path):
+            try:
+                send_request(socket_path, ["--version"], os.getcwd())
+            except OSError:
+                # The socket was left behind by a server, which didn't stop regularly.
+                os.remove(socket_path)
+            else:
+                raise OSError(f"A server is already running on {socket_path}.")
+
+        previous_umask = os.umask(0o077)
+
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+        self.socket_path = socket_path
+        self.cache = MemoryCompoundCache(cache_max_size)
+
+        # The worker processes are started once on demand, not for each conversion.
+        jobs = jobs or os.cpu_count() or 1
+        self.worker_pool = create_worker_pool(jobs) if 1 < jobs else None
+
+    def server_close(self) -> None:
+        """Close and remove the socket and stop the worker processes."""
+        super().server_close()
+
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown(cancel_futures=True)
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+# Functions ********************************************************************
+
+
+def _create_socket_folder(socket_folder: str) -> None:
+    # lobster-trace: SwRequirements.sw_req_server
+    """Create the folder of the socket, which only the current user may access,
+    if it doesn't exist. Otherwise the folder must belong to the current user or
+    to root and other users must not be able to replace the socket in it.
+
+    Args:
+        socket_folder (str): The folder of the server socket.
+
+    Raises:
+        OSError: If the folder can't be created or may be changed by other users.
+    """
+    os.makedirs(socket_folder, mode=0o700, exist_ok=True)
+
+    folder_stat = os.stat(socket_folder)
+    is_writable_by_others = 0 != folder_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    is_sticky = 0 != folder_stat.st_mode & stat.S_ISVTX
+
+    if folder_stat.st_uid not in (0, os.getuid()) or (is_writable_by_others is True and is_sticky is False):
+        raise OSError(f"The folder {socket_folder} of the socket may be changed by other users.")
+
+
+def run_request(
+    argv: list[str], cwd: str, cache: MemoryCompoundCache, worker_pool: ProcessPoolExecutor | None = None
+) -> dict:
+    # lobster-trace: SwRequirements.sw_req_server
+    """Run a conversion like lobster-doxygen and capture its output.
+
+    Args:
+        argv (list[str]): The command line arguments of lobster-doxygen without the program name.
+        cwd (str): The working directory of the client.
+        cache (MemoryCompoundCache): The compound cache, which is used if no cache directory is given.
+        worker_pool (ProcessPoolExecutor | None): The worker processes of the server or None
+            to start them for the conversion.
+
+    Returns:
+        dict: The exit code and the output to the standard output and error streams.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    server_cwd = os.getcwd()
+
+    try:
+        os.chdir(cwd)
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                exit_code = int(convert_main(argv, cache, worker_pool))
+
+            except SystemExit as e:
+                # Raised by argparse, e.g. for --help or invalid arguments.
+                exit_code = e.code if isinstance(e.code, int) else int(Ret.RET_ERROR_ARGPARSE)
+
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                LOG.print_error(f"{e}")
+                exit_code = int(Ret.RET_ERROR)
+
+    except OSError as e:
+        stderr.write(f"Error: Working directory {cwd} not available: {e}\n")
+        exit_code = int(Ret.RET_ERROR)
+
+    finally:
+        os.chdir(server_cwd)
+
+        # The next conversion starts without the verbose mode of this one.
+        Printer.set_verbose(False)
+
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _stop(signum: int, frame) -> None:
+    """Stop the server on a termination signal.
+
+    Args:
+        signum (int): The signal number.
+        frame: The current stack frame.
+    """
+    raise KeyboardInterrupt()
+
+
+def main() -> Ret:
+    """Main function of the server.
+
+    Returns:
+        int: System exit status
+    """
+    # lobster-trace: SwRequirements.sw_req_server
+    parser = argparse.ArgumentParser(
+        prog="lobster-doxygen-server",
+        description="Keep lobster-doxygen running and convert on request of lobster-doxygen-client."
+    )
+    parser.add_argument(
+        "--socket", type=str, default=get_socket_path(),
+        help="Path of the Unix domain socket. Default: $LOBSTER_DOXYGEN_SOCKET, else lobster-doxygen.sock in "
+        "$XDG_RUNTIME_DIR or in a folder per user in the temporary directory"
+    )
+    parser.add_argument(
+        "--cache-max-size", type=int, default=DEFAULT_CACHE_MAX_SIZE,
+        help=f"Maximum size of the in-memory cache in MiB. Default: {DEFAULT_CACHE_MAX_SIZE}"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of worker processes, which all conversions share. Default: number of CPUs"
+    )
+    args = parser.parse_args()
+
+    ret_status = Ret.RET_OK
+
+    if not hasattr(socket, "AF_UNIX"):
+        LOG.print_error("Unix domain sockets are not supported on this platform.")
+        ret_status = Ret.RET_ERROR
+    else:
+        try:
+            with Server(args.socket, args.cache_max_size * 1024 * 1024, args.jobs) as server:
+                signal.signal(signal.SIGTERM, _stop)
+                print(f"Listening on {args.socket}")
+
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+
+        except OSError as e:
+            LOG.print_error(f"{e}")
+            ret_status = Ret.RET_ERROR
+
+    return ret_status
+
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
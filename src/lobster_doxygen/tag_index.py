@@ -0,0 +1,103 @@
+"""Module for the index of the tags of several doxygen XML folders, which
+detects the tags, which are used in more than one of them.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import sys
+from typing import Iterator
+
+from lobster_doxygen.lobster_item import LobsterItem
+from lobster_doxygen.rule_check import RuleViolation
+
+# Variables ********************************************************************
+
+# Name of the rule, which is reported for a tag used in several doxygen XML folders.
+RULE_UNIQUE_TAG = "unique_tag"
+
+# Classes **********************************************************************
+
+
+class TagIndex:  # pylint: disable=too-few-public-methods
+    # lobster-trace: SwRequirements.sw_req_cli_multi_folder
+    """Hash index of the tags of the LobsterItems of all converted doxygen XML
+    folders. Doxygen derives the ids from the names, therefore e.g. two
+    components with a class of the same name result in the same tag, which
+    the trace report can't distinguish.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._folders: dict[str, str] = {}  # The doxygen XML folder of each tag.
+
+    def check(self, lobster_items: list[LobsterItem], doxygen_xml_folder: str) -> list[RuleViolation]:
+        """Add the tags of the LobsterItems of a compound and their children to
+        the index and check, that no other doxygen XML folder uses them.
+
+        Args:
+            lobster_items (list[LobsterItem]): The LobsterItems of a compound.
+            doxygen_xml_folder (str): The doxygen XML folder of the compound.
+
+        Returns:
+            list[RuleViolation]: A violation for each tag, which is already used
+            by another doxygen XML folder.
+        """
+        # The folder is interned, so the index keeps one string per folder.
+        doxygen_xml_folder = sys.intern(doxygen_xml_folder)
+        rule_violations = []
+
+        for lobster_item in _iter_lobster_items(lobster_items):
+            tag = lobster_item.get_tag()
+            tag_folder = self._folders.setdefault(tag, doxygen_xml_folder)
+
+            if tag_folder != doxygen_xml_folder:
+                rule_violations.append(
+                    RuleViolation(
+                        RULE_UNIQUE_TAG,
+                        tag,
+                        lobster_item.file_name,
+                        lobster_item.line,
+                        f"The tag '{tag}' of {doxygen_xml_folder} is already used in {tag_folder}.",
+                    )
+                )
+
+        return rule_violations
+
+
+# Functions ********************************************************************
+
+
+def _iter_lobster_items(lobster_items: list[LobsterItem]) -> Iterator[LobsterItem]:
+    # lobster-exclude: Helper function that improves readability.
+    """Iterate over the LobsterItems and their children.
+
+    Args:
+        lobster_items (list[LobsterItem]): The LobsterItems of a compound.
+
+    Yields:
+        LobsterItem: A LobsterItem or one of its children.
+    """
+    for lobster_item in lobster_items:
+        yield lobster_item
+        yield from lobster_item.get_children()
+
+
+# Main *************************************************************************
@@ -0,0 +1,42 @@
+"""Module to represent the source of the requirement references and justifications.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+import enum
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class TraceSource(enum.Enum):
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Enum to represent the source of the requirement references and justifications."""
+
+    DESCRIPTION = "description"  # The xrefsects in the detaileddescription of each compound and member.
+    XREFITEM = "xrefitem"  # The xrefitem pages, which doxygen creates for the aliases.
+    VERIFY = "verify"  # The detaileddescriptions, cross-checked with the xrefitem pages.
+
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
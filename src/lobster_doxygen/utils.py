@@ -21,10 +21,16 @@ Author: Andreas Merkle (andreas.merkle@newtec.de)
 
 # Imports **********************************************************************
 
+import hashlib
+from typing import BinaryIO
+
 # Variables ********************************************************************
 
 _INDENT_SPACES = 4
 
+# Block size used to calculate the content hash of a file.
+_HASH_BLOCK_SIZE = 1024 * 1024
+
 # Classes **********************************************************************
 
 # Functions ********************************************************************
@@ -44,4 +50,44 @@ def indent(level: int, text: str) -> str:
     return " " * (_INDENT_SPACES * level) + text
 
 
+def get_file_hash(file_path: str) -> str:
+    # lobster-exclude: Helper function that improves readability.
+    """Get the SHA-256 hash of the file content.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str: The hash as hexadecimal string.
+
+    Raises:
+        OSError: If the file can't be read.
+    """
+    with open(file_path, "rb") as file:
+        content_hash = get_stream_hash(file)
+
+    return content_hash
+
+
+def get_stream_hash(stream: BinaryIO) -> str:
+    # lobster-exclude: Helper function that improves readability.
+    """Get the SHA-256 hash of the remaining content of a stream, e.g. of a file in an archive.
+
+    Args:
+        stream (BinaryIO): The opened stream.
+
+    Returns:
+        str: The hash as hexadecimal string.
+
+    Raises:
+        OSError: If the stream can't be read.
+    """
+    content_hash = hashlib.sha256()
+
+    for block in iter(lambda: stream.read(_HASH_BLOCK_SIZE), b""):
+        content_hash.update(block)
+
+    return content_hash.hexdigest()
+
+
 # Main *************************************************************************
@@ -20,18 +20,26 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
-import importlib.metadata as meta
+# importlib.metadata and toml take a noticeable share of the startup time,
+# therefore they are only imported if the tool information is requested.
+import functools
 import os
 import sys
-import toml
 
 # Variables ********************************************************************
 
-__version__ = "???"
-__author__ = "???"
-__email__ = "???"
-__repository__ = "???"
-__license__ = "???"
+# Names of the tool related information in the order of get_version_info().
+_VERSION_INFO_NAMES = ["__version__", "__author__", "__email__", "__repository__", "__license__"]
+
+# Dummy information when not installed as package but called directly without toml,
+# also necessary to get sphinx running without error.
+_DEV_VERSION_INFO = (
+    "dev",
+    "Andreas Merkle",
+    "andreas.merkle@newtec.de",
+    "https://github.com/NewTec-GmbH/lobster-doxygen.git",
+    "GPLv3",
+)
 
 # Classes **********************************************************************
 
@@ -40,14 +48,16 @@ __license__ = "???"
 
 def resource_path(relative_path):
     # lobster-trace: SwRequirements.sw_req_cli_version
-    """Get the absolute path to the resource, works for dev and for PyInstaller"""
+    """Get the absolute path to the resource, works for dev and for PyInstaller.
+    In dev, the resources are in the project folder above the package folder,
+    independent of the current working directory."""
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         # pylint: disable=protected-access
         # pylint: disable=no-member
         base_path = sys._MEIPASS
     except Exception:  # pylint: disable=broad-except
-        base_path = os.path.abspath(".")
+        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
     return os.path.join(base_path, relative_path)
 
@@ -61,6 +71,8 @@ def init_from_metadata():
         list: Tool related information
     """
 
+    import importlib.metadata as meta  # pylint: disable=import-outside-toplevel
+
     my_metadata = meta.metadata("lobster-doxygen")
 
     return (
@@ -82,6 +94,8 @@ def init_from_toml():
         list: Tool related information
     """
 
+    import toml  # pylint: disable=import-outside-toplevel
+
     toml_file = resource_path("pyproject.toml")
     data = toml.load(toml_file)
 
@@ -102,11 +116,59 @@ def init_from_toml():
     )
 
 
-# Main *************************************************************************
+@functools.cache
+def get_version_info() -> tuple[str, str, str, str, str]:
+    # lobster-trace: SwRequirements.sw_req_cli_version
+    # lobster-trace: SwRequirements.sw_req_startup
+    """Get the tool related information. It is resolved on the first call
+    from the package metadata or the pyproject.toml file, if the package isn't
+    installed, and cached for later calls. Without toml or a readable
+    pyproject.toml file a dummy information is provided.
 
+    Returns:
+        tuple[str, str, str, str, str]: Version, author, email, repository and license.
+    """
+    import importlib.metadata as meta  # pylint: disable=import-outside-toplevel
+
+    try:
+        version_info = init_from_metadata()
+    except meta.PackageNotFoundError:
+        try:
+            version_info = init_from_toml()
+        except (ModuleNotFoundError, OSError, KeyError, ValueError):
+            version_info = _DEV_VERSION_INFO
+
+    return version_info
 
-try:
-    __version__, __author__, __email__, __repository__, __license__ = init_from_metadata()
 
-except meta.PackageNotFoundError:
-    __version__, __author__, __email__, __repository__, __license__ = init_from_toml()
+def get_version() -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_version
+    # lobster-trace: SwRequirements.sw_req_startup
+    """Get the tool version, see get_version_info().
+
+    Returns:
+        str: The tool version.
+    """
+    return get_version_info()[0]
+
+
+def __getattr__(name: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_startup
+    """Resolve the tool related information, e.g. __version__, on first access.
+
+    Args:
+        name (str): The name of the module attribute.
+
+    Returns:
+        str: The tool related information.
+
+    Raises:
+        AttributeError: If the module has no such attribute.
+    """
+    if name not in _VERSION_INFO_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return get_version_info()[_VERSION_INFO_NAMES.index(name)]
+
+
+# Main *************************************************************************
@@ -21,7 +21,12 @@ Author: Andreas Merkle (andreas.merkle@newtec.de)
 
 # Imports **********************************************************************
 
-from io import TextIOWrapper
+import gzip
+import io
+import os
+from dataclasses import dataclass
+from json.encoder import encode_basestring
+from typing import BinaryIO, Callable, Iterable, Iterator, TextIO
 
 from lobster_doxygen.lobster_item import LobsterItem
 from lobster_doxygen.lobster_kind import LobsterKind
@@ -29,161 +34,501 @@ from lobster_doxygen.utils import indent
 
 # Variables ********************************************************************
 
+# Size of the chunks, which are passed to the write function of a stream.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 # Classes **********************************************************************
 
+
+@dataclass(frozen=True)
+class _TextFragments:  # pylint: disable=too-many-instance-attributes
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    """Constant text fragments of the LOBSTER common interchange format file.
+    The fragments of a lobster item are in the order of the item fields, each
+    one ends with the key of the following field.
+    """
+
+    header: str  # File begin up to the first lobster item.
+    tail: str  # File end after the last lobster item.
+    item_separator: str  # Separator between two lobster items.
+    item_tag: str
+    item_file: str
+    item_line: str
+    item_column: str
+    item_name: str
+    item_just_up: str
+    item_refs: str
+    item_language: str
+    item_kind: str
+    item_end: str
+    array_begin: str  # Begin of a not empty array of strings in a lobster item.
+    array_separator: str
+    array_end: str
+
+
+class _WriteFunctionStream(io.RawIOBase):
+    # lobster-trace: SwRequirements.sw_req_api
+    """Raw binary stream, which passes the written bytes to a write function,
+    e.g. the write method of a socket or a callback.
+    """
+
+    def __init__(self, write: Callable[[bytes], object]) -> None:
+        """Initialize the stream.
+
+        Args:
+            write (Callable[[bytes], object]): Called with each chunk of the written bytes.
+        """
+        super().__init__()
+        self._write = write
+
+    def writable(self) -> bool:
+        """The stream is always writable.
+
+        Returns:
+            bool: True
+        """
+        return True
+
+    def write(self, b) -> int:
+        """Pass a copy of the bytes to the write function, because the buffer is reused.
+
+        Args:
+            b (bytes-like object): The bytes to write.
+
+        Returns:
+            int: The number of written bytes, always all of them.
+        """
+        data = bytes(b)
+        self._write(data)
+
+        return len(data)
+
+
 # Functions ********************************************************************
 
 
-def _write_with_indent(output_file: TextIOWrapper, level: int, text: str) -> None:
+def _create_text_fragments(is_compact: bool) -> _TextFragments:
     # lobster-trace: SwRequirements.sw_req_output_file_format
-    """Write the given text to the output file with indentation.
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    """Create the constant text fragments of the LOBSTER common interchange format file.
 
     Args:
-        output_file (TextIOWrapper): The output file to write the results to.
-        level (int): The indentation level.
-        text (str): The text to be written.
+        is_compact (bool): If True, the fragments are without indentation, line
+            breaks and spaces. Otherwise they are pretty printed.
+
+    Returns:
+        _TextFragments: The text fragments.
     """
-    output_file.write(indent(level, text))
+    new_line = "\n"
+    space = " "
+
+    if is_compact is True:
+        new_line = ""
+        space = ""
+
+    def indent_level(level: int, text: str) -> str:
+        # lobster-exclude: Helper function that improves readability.
+        """Indent the text in the pretty printed file only."""
+        return text if is_compact is True else indent(level, text)
+
+    key_separator = ":" + space
+
+    return _TextFragments(
+        header=indent_level(0, "{" + new_line) + indent_level(1, '"data"' + key_separator + "[" + new_line),
+        tail=new_line
+        + indent_level(1, "]," + new_line)
+        + indent_level(1, '"generator"' + key_separator + '"lobster-doxygen",' + new_line)
+        + indent_level(1, '"schema"' + key_separator + '"lobster-imp-trace",' + new_line)
+        + indent_level(1, '"version"' + key_separator + "3" + new_line)
+        + indent_level(0, "}\n"),
+        item_separator="," + new_line,
+        item_tag=indent_level(2, "{" + new_line) + indent_level(3, '"tag"' + key_separator),
+        item_file=","
+        + new_line
+        + indent_level(3, '"location"' + key_separator + "{" + new_line)
+        + indent_level(4, '"kind"' + key_separator + '"file",' + new_line)
+        + indent_level(4, '"file"' + key_separator),
+        item_line="," + new_line + indent_level(4, '"line"' + key_separator),
+        item_column="," + new_line + indent_level(4, '"column"' + key_separator),
+        item_name=new_line + indent_level(3, "}," + new_line) + indent_level(3, '"name"' + key_separator),
+        item_just_up=","
+        + new_line
+        + indent_level(3, '"messages"' + key_separator + "[]," + new_line)
+        + indent_level(3, '"just_up"' + key_separator),
+        item_refs=","
+        + new_line
+        + indent_level(3, '"just_down"' + key_separator + "[]," + new_line)
+        + indent_level(3, '"just_global"' + key_separator + "[]," + new_line)
+        + indent_level(3, '"refs"' + key_separator),
+        item_language="," + new_line + indent_level(3, '"language"' + key_separator),
+        item_kind="," + new_line + indent_level(3, '"kind"' + key_separator),
+        item_end=new_line + indent_level(2, "}"),
+        array_begin="[" + new_line + indent_level(4, ""),
+        array_separator="," + new_line + indent_level(4, ""),
+        array_end=new_line + indent_level(3, "]"),
+    )
+
+
+# Text fragments of the pretty printed and of the compact file.
+_PRETTY_TEXT_FRAGMENTS = _create_text_fragments(False)
+_COMPACT_TEXT_FRAGMENTS = _create_text_fragments(True)
+
+
+def _get_array_text(fragments: _TextFragments, values: list[str], prefix: str = "") -> str:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    """Get the JSON text of an array of strings in a lobster item.
 
+    Args:
+        fragments (_TextFragments): The text fragments of the file format.
+        values (list[str]): The strings of the array.
+        prefix (str): The prefix, which is added to each string.
 
-def _write_lobster_header(output_file: TextIOWrapper) -> None:
+    Returns:
+        str: The JSON text of the array.
+    """
+    if 0 == len(values):
+        return "[]"
+
+    return (
+        fragments.array_begin
+        + fragments.array_separator.join([encode_basestring(prefix + value) for value in values])
+        + fragments.array_end
+    )
+
+
+def _get_lobster_item_text(fragments: _TextFragments, lobster_item: LobsterItem) -> str:
     # lobster-trace: SwRequirements.sw_req_output_file_format
-    """Write the header of the lobster configuration file.
+    """Get the JSON text of a lobster item. All strings are escaped, the
+    constant parts are taken from prepared text fragments.
 
     Args:
-        output_file (TextIOWrapper): The output file to write the results to.
+        fragments (_TextFragments): The text fragments of the file format.
+        lobster_item (LobsterItem): The lobster item to be serialized.
+
+    Returns:
+        str: The JSON text of the lobster item.
     """
-    _write_with_indent(output_file, 0, "{\n")
-    _write_with_indent(output_file, 1, '"data": [\n')
+    line = "null"
+    column = "null"
 
+    if lobster_item.line is not None:
+        line = str(lobster_item.line)
 
-def _write_lobster_tail(output_file: TextIOWrapper) -> None:
+    if lobster_item.column is not None:
+        column = str(lobster_item.column)
+
+    return "".join(
+        [
+            fragments.item_tag,
+            encode_basestring(lobster_item.get_tag()),
+            fragments.item_file,
+            encode_basestring(lobster_item.file_name),
+            fragments.item_line,
+            line,
+            fragments.item_column,
+            column,
+            fragments.item_name,
+            encode_basestring(lobster_item.name),
+            fragments.item_just_up,
+            _get_array_text(fragments, lobster_item.just_up),
+            fragments.item_refs,
+            _get_array_text(fragments, lobster_item.refs, "req "),
+            fragments.item_language,
+            encode_basestring(lobster_item.language),
+            fragments.item_kind,
+            encode_basestring(lobster_item.kind.value),
+            fragments.item_end,
+        ]
+    )
+
+
+def is_replaced_by_children(lobster_item: LobsterItem) -> bool:
     # lobster-trace: SwRequirements.sw_req_output_file_format
-    """Write the tail of the lobster configuration file.
-    This function finalizes the lobster configuration file by closing the data array
-    and adding metadata about the generator and schema.
+    # lobster-trace: SwRequirements.sw_req_duplicate_members
+    """Check whether the lobster item is replaced by its children in the output
+    file. A container item, which only groups its children, and the file and
+    group items are replaced.
 
     Args:
-        output_file (TextIOWrapper): The output file to write the results to.
+        lobster_item (LobsterItem): The lobster item.
+
+    Returns:
+        bool: True if its children are written instead of the lobster item, False otherwise.
     """
-    _write_with_indent(output_file, 1, "],\n")
-    _write_with_indent(output_file, 1, '"generator": "lobster-doxygen",\n')
-    _write_with_indent(output_file, 1, '"schema": "lobster-imp-trace",\n')
-    _write_with_indent(output_file, 1, '"version": 3\n')
-    _write_with_indent(output_file, 0, "}\n")
+    container_kind = [LobsterKind.CLASS, LobsterKind.STRUCT, LobsterKind.INTERFACE, LobsterKind.NAMESPACE]
+    is_replaced = False
+
+    # Skip container items with childs and without references or justifications.
+    if lobster_item.kind in container_kind:
+        if lobster_item.has_children() is True:
+            if (lobster_item.has_refs() is False) and (lobster_item.has_just_up() is False):
+                is_replaced = True
+
+    # Skip file and group items in general.
+    elif lobster_item.kind in [LobsterKind.FILE, LobsterKind.GROUP]:
+        is_replaced = True
+
+    return is_replaced
 
 
-def _write_lobster_item(output_file: TextIOWrapper, lobster_item: LobsterItem) -> None:
+def iter_written_lobster_items(lobster_items: Iterable[LobsterItem]) -> Iterator[LobsterItem]:
     # lobster-trace: SwRequirements.sw_req_output_file_format
-    """Write a lobster item to the output file.
+    # lobster-trace: SwRequirements.sw_req_streaming
+    # lobster-trace: SwRequirements.sw_req_api
+    """Iterate over the lobster items, which are written to the output file.
+    A container item, which only groups its children, is replaced by them.
 
     Args:
-        output_file (TextIOWrapper): The output file to write the results to.
-        lobster_item (LobsterItem): The lobster item to be written.
+        lobster_items (Iterable[LobsterItem]): The lobster items.
+
+    Yields:
+        LobsterItem: The lobster item to be written.
     """
-    line = "null"
-    column = "null"
+    for lobster_item in lobster_items:
+        # If not replaced, write the lobster item to the output file.
+        if is_replaced_by_children(lobster_item) is False:
+            yield lobster_item
 
-    if lobster_item.line is not None:
-        line = lobster_item.line
+        # If the container item has child items, write them to the output file.
+        else:
+            yield from lobster_item.get_children()
 
-    if lobster_item.column is not None:
-        column = lobster_item.column
-
-    _write_with_indent(output_file, 2, "{\n")
-    _write_with_indent(output_file, 3, f'"tag": "{lobster_item.get_tag()}",\n')
-    _write_with_indent(output_file, 3, '"location": {\n')
-    _write_with_indent(output_file, 4, '"kind": "file",\n')
-    _write_with_indent(output_file, 4, f'"file": "{lobster_item.file_name}",\n')
-    _write_with_indent(output_file, 4, f'"line": {line},\n')
-    _write_with_indent(output_file, 4, f'"column": {column}\n')
-    _write_with_indent(output_file, 3, "},\n")
-    _write_with_indent(output_file, 3, f'"name": "{lobster_item.name}",\n')
-    _write_with_indent(output_file, 3, '"messages": [],\n')
-
-    if 0 == len(lobster_item.just_up):
-        _write_with_indent(output_file, 3, '"just_up": [],\n')
-    else:
-        _write_with_indent(output_file, 3, '"just_up": [\n')
-
-        for idx, just_up in enumerate(lobster_item.just_up):
-            if 0 < idx:
-                output_file.write(",\n")
-            _write_with_indent(output_file, 4, f'"{just_up}"')
-
-        output_file.write("\n")
-        _write_with_indent(output_file, 3, "],\n")
-
-    _write_with_indent(output_file, 3, '"just_down": [],\n')
-    _write_with_indent(output_file, 3, '"just_global": [],\n')
-
-    if 0 == len(lobster_item.refs):
-        _write_with_indent(output_file, 3, '"refs": [],\n')
-    else:
-        _write_with_indent(output_file, 3, '"refs": [\n')
-
-        for idx, ref in enumerate(lobster_item.refs):
-            if 0 < idx:
-                output_file.write(",\n")
-            _write_with_indent(output_file, 4, f'"req {ref}"')
-
-        output_file.write("\n")
-        _write_with_indent(output_file, 3, "],\n")
-
-    _write_with_indent(output_file, 3, f'"language": "{lobster_item.language}",\n')
-    _write_with_indent(output_file, 3, f'"kind": "{lobster_item.kind.value}"\n')
-    _write_with_indent(output_file, 2, "}")
-
-
-def write_lobster_common_interchange_format_file(lobster_items: list[LobsterItem], output_file_name: str) -> None:
+
+def _write_lobster_items(output_file: TextIO, fragments: _TextFragments, lobster_items: Iterable[LobsterItem]) -> int:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_streaming
+    """Write the lobster items to the output file, separated by commas.
+    The lobster items are consumed one after the other.
+
+    Args:
+        output_file (TextIO): The output file to write the results to.
+        fragments (_TextFragments): The text fragments of the file format.
+        lobster_items (Iterable[LobsterItem]): The lobster items.
+
+    Returns:
+        int: The number of written lobster items.
+    """
+    cnt = 0
+
+    for lobster_item in iter_written_lobster_items(lobster_items):
+        if 0 < cnt:
+            output_file.write(fragments.item_separator)
+
+        output_file.write(_get_lobster_item_text(fragments, lobster_item))
+        cnt += 1
+
+    return cnt
+
+
+def _get_text_fragments(is_compact: bool) -> _TextFragments:
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    """Get the prepared text fragments of the file format.
+
+    Args:
+        is_compact (bool): If True, the fragments of the compact format are returned.
+
+    Returns:
+        _TextFragments: The text fragments.
+    """
+    return _COMPACT_TEXT_FRAGMENTS if is_compact is True else _PRETTY_TEXT_FRAGMENTS
+
+
+def get_lobster_items_segment(lobster_items: Iterable[LobsterItem], is_compact: bool = False) -> tuple[bytes, int]:
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Get the text of the lobster items as it is written to the output file,
+    e.g. of a single compound, without separator before the first and after
+    the last lobster item.
+
+    Args:
+        lobster_items (Iterable[LobsterItem]): The lobster items.
+        is_compact (bool): If True, the text is without indentation and line breaks.
+
+    Returns:
+        tuple[bytes, int]: The UTF-8 encoded text and the number of lobster items in it.
+    """
+    fragments = _get_text_fragments(is_compact)
+    texts = [
+        _get_lobster_item_text(fragments, lobster_item) for lobster_item in iter_written_lobster_items(lobster_items)
+    ]
+
+    return fragments.item_separator.join(texts).encode("utf-8"), len(texts)
+
+
+def _open_output_file(output_file_name: str, is_gzip: bool) -> TextIO:
+    # lobster-trace: SwRequirements.sw_req_cli_gzip
+    """Open the output file for writing text.
+
+    Args:
+        output_file_name (str): Path and file name of the output file.
+        is_gzip (bool): If True, the text is written as gzip compressed stream.
+
+    Returns:
+        TextIO: The opened output file.
+    """
+    if is_gzip is True:
+        # Without a modification time in the gzip header, the same content results in the same file.
+        return io.TextIOWrapper(gzip.GzipFile(output_file_name, "wb", mtime=0), encoding="utf-8")
+
+    return open(output_file_name, "w", encoding="utf-8")
+
+
+def write_lobster_common_interchange_format_file(
+    lobster_items: Iterable[LobsterItem], output_file_name: str, is_compact: bool = False, is_gzip: bool = False
+) -> int:
     # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_streaming
+    # lobster-trace: SwRequirements.sw_req_cli_compact
+    # lobster-trace: SwRequirements.sw_req_cli_gzip
     """Write the LOBSTER common interchange format file with lobster_items.
     File format as described in
     https://github.com/bmw-software-engineering/lobster/blob/main/documentation/schemas.md.
 
+    The lobster items may be a generator, which creates them while the file is
+    written. If it raises an exception, the partially written file is removed
+    and the exception is passed on.
+
     Args:
-        lobster_items (List[LobsterItem]): The list of lobster items.
+        lobster_items (Iterable[LobsterItem]): The lobster items.
         output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        is_compact (bool): If True, the file is written without indentation and line breaks.
+        is_gzip (bool): If True, the file is written gzip compressed.
+
+    Returns:
+        int: The number of written lobster items.
     """
-    cnt = 0
+    fragments = _get_text_fragments(is_compact)
 
-    container_kind = [LobsterKind.CLASS, LobsterKind.STRUCT, LobsterKind.INTERFACE, LobsterKind.NAMESPACE]
+    try:
+        with _open_output_file(output_file_name, is_gzip) as output_file:
+            output_file.write(fragments.header)
+            item_count = _write_lobster_items(output_file, fragments, lobster_items)
+            output_file.write(fragments.tail)
 
-    with open(output_file_name, "w", encoding="utf-8") as output_file:
-        _write_lobster_header(output_file)
+    except BaseException:
+        # Don't leave an incomplete file behind, which looks like a valid result.
+        if os.path.isfile(output_file_name):
+            os.remove(output_file_name)
+        raise
 
-        for lobster_item in lobster_items:
-            skip = False
+    return item_count
 
-            # Skip container items with childs and without references or justifications.
-            if lobster_item.kind in container_kind:
-                if lobster_item.has_children() is True:
-                    if (lobster_item.has_refs() is False) and (lobster_item.has_just_up() is False):
-                        skip = True
 
-            # Skip file and group items in general.
-            elif lobster_item.kind in [LobsterKind.FILE, LobsterKind.GROUP]:
-                skip = True
+def write_lobster_common_interchange_format_stream(
+    lobster_items: Iterable[LobsterItem], write: Callable[[bytes], object], is_compact: bool = False
+) -> int:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_streaming
+    # lobster-trace: SwRequirements.sw_req_api
+    """Write the LOBSTER common interchange format with lobster_items to a
+    write function, e.g. the write method of a binary stream or a callback.
+    The UTF-8 encoded text is passed in chunks, no file is written.
 
-            # If not skipped, write the lobster item to the output file.
-            if skip is False:
-                if 0 < cnt:
-                    output_file.write(",\n")
+    The lobster items may be a generator, which creates them while the text is
+    written. If it raises an exception, the exception is passed on and the
+    write function has received an incomplete text.
 
-                _write_lobster_item(output_file, lobster_item)
-                cnt += 1
+    Args:
+        lobster_items (Iterable[LobsterItem]): The lobster items.
+        write (Callable[[bytes], object]): Called with each chunk of the UTF-8 encoded text.
+        is_compact (bool): If True, the text is written without indentation and line breaks.
 
-            # If the container item has child items, write them to the output file.
+    Returns:
+        int: The number of written lobster items.
+    """
+    fragments = _get_text_fragments(is_compact)
+    stream = io.BufferedWriter(_WriteFunctionStream(write), _STREAM_CHUNK_SIZE)
+
+    with io.TextIOWrapper(stream, encoding="utf-8") as output_file:
+        output_file.write(fragments.header)
+        item_count = _write_lobster_items(output_file, fragments, lobster_items)
+        output_file.write(fragments.tail)
+
+    return item_count
+
+
+def _write_segments(output_file: BinaryIO, fragments: _TextFragments, segments: Iterable[bytes]) -> list[int]:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Write the prepared segments to the output file, separated by commas.
+
+    Args:
+        output_file (BinaryIO): The output file to write the UTF-8 encoded text to.
+        fragments (_TextFragments): The text fragments of the file format.
+        segments (Iterable[bytes]): The UTF-8 encoded texts of the lobster items.
+
+    Returns:
+        list[int]: The offset of each segment in the uncompressed file content.
+    """
+    header = fragments.header.encode("utf-8")
+    item_separator = fragments.item_separator.encode("utf-8")
+    offsets = []
+
+    output_file.write(header)
+    offset = len(header)
+    is_first = True
+
+    for segment in segments:
+        # A segment without lobster items gets no separator.
+        if 0 < len(segment):
+            if is_first is False:
+                output_file.write(item_separator)
+                offset += len(item_separator)
+
+            is_first = False
+
+        offsets.append(offset)
+        output_file.write(segment)
+        offset += len(segment)
+
+    output_file.write(fragments.tail.encode("utf-8"))
+
+    return offsets
+
+
+def write_lobster_common_interchange_format_segments(
+    segments: Iterable[bytes], output_file_name: str, is_compact: bool = False, is_gzip: bool = False
+) -> list[int]:
+    # lobster-trace: SwRequirements.sw_req_output_file_format
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Write the LOBSTER common interchange format file with prepared segments,
+    each one the text of lobster items, see get_lobster_items_segment().
+
+    The file is written to a temporary file next to it, which replaces the
+    output file after all segments are written. This way the segments can be
+    read from the previous output file. If the segments raise an exception,
+    the temporary file is removed and the exception is passed on.
+
+    Args:
+        segments (Iterable[bytes]): The UTF-8 encoded texts of the lobster items.
+        output_file_name (str): Path and file name for LOBSTER common interchange format file.
+        is_compact (bool): If True, the file is written without indentation and line breaks.
+        is_gzip (bool): If True, the file is written gzip compressed.
+
+    Returns:
+        list[int]: The offset of each segment in the uncompressed file content.
+    """
+    fragments = _get_text_fragments(is_compact)
+    temp_file_name = output_file_name + ".tmp"
+
+    try:
+        with open(temp_file_name, "wb") as output_file:
+            if is_gzip is True:
+                # The gzip header records the name of the output file, not of the temporary file.
+                with gzip.GzipFile(output_file_name, "wb", fileobj=output_file, mtime=0) as gzip_file:
+                    offsets = _write_segments(gzip_file, fragments, segments)
             else:
-                for lobster_item_child in lobster_item.get_children():
-                    if 0 < cnt:
-                        output_file.write(",\n")
+                offsets = _write_segments(output_file, fragments, segments)
+
+        os.replace(temp_file_name, output_file_name)
 
-                    _write_lobster_item(output_file, lobster_item_child)
-                    cnt += 1
+    except BaseException:
+        # Don't leave an incomplete file behind.
+        if os.path.isfile(temp_file_name):
+            os.remove(temp_file_name)
+        raise
 
-        output_file.write("\n")
-        _write_lobster_tail(output_file)
+    return offsets
 
 
 # Main *************************************************************************
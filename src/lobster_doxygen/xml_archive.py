@@ -0,0 +1,513 @@
+"""Module to read the doxygen XML files from a folder or directly from an
+archive. A file in an archive is addressed by the path of the archive followed
+by the path of the file in the archive, e.g. doxygen.zip/xml/index.xml.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+# The modules to read archives are only imported if an archive is read.
+import os
+import posixpath
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+from lobster_doxygen.constants import ARCHIVE_SUFFIXES
+from lobster_doxygen.utils import get_file_hash, get_stream_hash
+
+# Variables ********************************************************************
+
+# Suffixes of the compressed tar archives, which have no index for random access.
+_COMPRESSED_TAR_SUFFIXES = (".tar.gz", ".tgz", ".tar.zst")
+
+# Opened archives of the current process per absolute archive path.
+_archives = {}
+
+# Classes **********************************************************************
+
+
+class _Archive:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Base class of an opened archive, whose files are looked up by their
+    normalized path in the archive.
+    """
+
+    def __init__(self, archive_path: str) -> None:
+        """Initialize the archive.
+
+        Args:
+            archive_path (str): The path of the archive.
+        """
+        stat_result = os.stat(archive_path)
+
+        self.archive_path = archive_path
+        self.stamp = (stat_result.st_size, stat_result.st_mtime_ns)  # Detects a replaced archive.
+        self.pid = os.getpid()  # A forked worker process has to open the archive again.
+        self._members = {}  # Archive specific member info per normalized path in the archive.
+
+    def add_member(self, name: str, info) -> None:
+        """Add a file of the archive.
+
+        Args:
+            name (str): The path of the file in the archive.
+            info: The archive specific member info.
+        """
+        self._members[normalize_member_path(name)] = info
+
+    def get_member(self, member_path: str):
+        """Get the archive specific info of a file.
+
+        Args:
+            member_path (str): The normalized path of the file in the archive.
+
+        Returns:
+            The member info or None if the archive doesn't contain the file.
+        """
+        return self._members.get(member_path)
+
+    def get_size(self, member_path: str) -> int:
+        """Get the uncompressed size of a file.
+
+        Args:
+            member_path (str): The normalized path of the file in the archive.
+
+        Returns:
+            int: The file size in bytes.
+        """
+        raise NotImplementedError
+
+    def get_stamp(self, member_path: str) -> str:
+        """Get the stamp of a file, which changes if the file changes.
+
+        Args:
+            member_path (str): The normalized path of the file in the archive.
+
+        Returns:
+            str: The stamp.
+        """
+        raise NotImplementedError
+
+    def open(self, member_path: str) -> BinaryIO:
+        """Open a file for reading.
+
+        Args:
+            member_path (str): The normalized path of the file in the archive.
+
+        Returns:
+            BinaryIO: The opened file.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the archive."""
+        raise NotImplementedError
+
+
+class _ZipArchive(_Archive):
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Zip archive, whose central directory allows random access to each file."""
+
+    def __init__(self, archive_path: str) -> None:
+        """Open the zip archive and read its central directory.
+
+        Args:
+            archive_path (str): The path of the archive.
+
+        Raises:
+            OSError: If the archive can't be read.
+        """
+        import zipfile  # pylint: disable=import-outside-toplevel
+
+        super().__init__(archive_path)
+
+        try:
+            self._zip_file = zipfile.ZipFile(archive_path)  # pylint: disable=consider-using-with
+        except zipfile.BadZipFile as e:
+            raise OSError(f"The archive {archive_path} can't be read: {e}") from e
+
+        for info in self._zip_file.infolist():
+            if info.is_dir() is False:
+                self.add_member(info.filename, info)
+
+    def get_size(self, member_path: str) -> int:
+        return self.get_member(member_path).file_size
+
+    def get_stamp(self, member_path: str) -> str:
+        info = self.get_member(member_path)
+        return f"{info.file_size}:{info.CRC}"
+
+    def open(self, member_path: str) -> BinaryIO:
+        return self._zip_file.open(self.get_member(member_path))
+
+    def close(self) -> None:
+        self._zip_file.close()
+
+
+class _TarArchive(_Archive):
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Tar archive, whose member headers allow random access to each file.
+    A compressed tar archive is decompressed once into a temporary file,
+    because a compressed stream can't be read at random positions.
+    """
+
+    def __init__(self, archive_path: str) -> None:
+        """Open the tar archive and read its member headers.
+
+        Args:
+            archive_path (str): The path of the archive.
+
+        Raises:
+            OSError: If the archive can't be read.
+        """
+        # pylint: disable=import-outside-toplevel
+        import shutil
+        import tarfile
+        import tempfile
+
+        super().__init__(archive_path)
+        self._temporary_file = None
+
+        decompressed_file = None
+
+        if archive_path.lower().endswith(_COMPRESSED_TAR_SUFFIXES):
+            decompressed_file = _open_decompressed(archive_path)
+            self._temporary_file = tempfile.TemporaryFile()  # pylint: disable=consider-using-with
+
+        try:
+            if decompressed_file is not None:
+                with decompressed_file:
+                    shutil.copyfileobj(decompressed_file, self._temporary_file)
+
+                self._temporary_file.seek(0)
+                self._tar_file = tarfile.open(fileobj=self._temporary_file, mode="r:")
+            else:
+                self._tar_file = tarfile.open(archive_path, mode="r:")  # pylint: disable=consider-using-with
+
+            members = self._tar_file.getmembers()
+
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            # E.g. tarfile.ReadError or the error of the decompressor.
+            if self._temporary_file is not None:
+                self._temporary_file.close()
+
+            raise OSError(f"The archive {archive_path} can't be read: {e}") from e
+
+        for info in members:
+            if info.isfile() is True or info.issym() is True or info.islnk() is True:
+                self.add_member(info.name, info)
+
+    def get_size(self, member_path: str) -> int:
+        return self.get_member(member_path).size
+
+    def get_stamp(self, member_path: str) -> str:
+        info = self.get_member(member_path)
+        return f"{info.size}:{info.mtime}"
+
+    def open(self, member_path: str) -> BinaryIO:
+        return self._tar_file.extractfile(self.get_member(member_path))
+
+    def close(self) -> None:
+        self._tar_file.close()
+
+        if self._temporary_file is not None:
+            self._temporary_file.close()
+
+
+# Functions ********************************************************************
+
+
+def _open_decompressed(archive_path: str) -> BinaryIO:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Open a compressed tar archive as decompressed stream.
+
+    Args:
+        archive_path (str): The path of the archive.
+
+    Returns:
+        BinaryIO: The decompressed stream.
+
+    Raises:
+        OSError: If the archive is zstandard compressed and the zstandard package
+        is not installed.
+    """
+    # pylint: disable=import-outside-toplevel
+    if archive_path.lower().endswith(".tar.zst"):
+        try:
+            import zstandard
+        except ModuleNotFoundError as e:
+            raise OSError(f"Reading {archive_path} requires the zstandard package.") from e
+
+        archive_file = open(archive_path, "rb")  # pylint: disable=consider-using-with
+        decompressed_file = zstandard.ZstdDecompressor().stream_reader(archive_file, closefd=True)
+    else:
+        import gzip
+
+        decompressed_file = gzip.open(archive_path, "rb")
+
+    return decompressed_file
+
+
+def is_archive(path: str) -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Check whether the path is a supported archive file.
+
+    Args:
+        path (str): The path.
+
+    Returns:
+        bool: True if it is an archive file.
+    """
+    return path.lower().endswith(ARCHIVE_SUFFIXES) and os.path.isfile(path)
+
+
+def normalize_member_path(member_path: str) -> str:
+    # lobster-exclude: Helper function that improves readability.
+    """Normalize the path of a file in an archive, e.g. ./xml//index.xml to xml/index.xml.
+
+    Args:
+        member_path (str): The path of the file in the archive.
+
+    Returns:
+        str: The normalized path.
+    """
+    return posixpath.normpath(member_path.replace("\\", "/")).lstrip("/")
+
+
+def _split_archive_path(path: str) -> tuple[str, str] | None:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Split the path of a file in an archive into the archive path and the
+    normalized path of the file in the archive.
+
+    Args:
+        path (str): The path.
+
+    Returns:
+        tuple[str, str] | None: The archive path and the path in the archive or
+        None if the path doesn't refer to a file in an archive.
+    """
+    lower_path = path.lower()
+
+    for suffix in ARCHIVE_SUFFIXES:
+        index = lower_path.find(suffix + "/")
+
+        while index != -1:
+            archive_path = path[:index + len(suffix)]
+
+            if os.path.abspath(archive_path) in _archives or os.path.isfile(archive_path):
+                return archive_path, normalize_member_path(path[index + len(suffix) + 1:])
+
+            index = lower_path.find(suffix + "/", index + 1)
+
+    return None
+
+
+def _get_archive(archive_path: str) -> _Archive:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Get the opened archive. The archive is opened on first access and again
+    if it is replaced or accessed by a forked process.
+
+    Args:
+        archive_path (str): The path of the archive.
+
+    Returns:
+        _Archive: The opened archive.
+
+    Raises:
+        OSError: If the archive can't be read.
+    """
+    key = os.path.abspath(archive_path)
+    archive = _archives.get(key)
+    stat_result = os.stat(archive_path)
+
+    if archive is not None and (
+        archive.pid != os.getpid() or archive.stamp != (stat_result.st_size, stat_result.st_mtime_ns)
+    ):
+        # The file handle of a forked process is shared with its parent, therefore it is not closed.
+        if archive.pid == os.getpid():
+            archive.close()
+
+        archive = None
+
+    if archive is None:
+        archive = _ZipArchive(archive_path) if archive_path.lower().endswith(".zip") else _TarArchive(archive_path)
+        _archives[key] = archive
+
+    return archive
+
+
+def close_archives() -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Close all opened archives of the current process, e.g. after a conversion."""
+    for archive in _archives.values():
+        if archive.pid == os.getpid():
+            archive.close()
+
+    _archives.clear()
+
+
+def get_source_file(path: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    # lobster-trace: SwRequirements.sw_req_cli_skip_if_unchanged
+    """Get the file on disk, which contains the file, e.g. to list it as dependency.
+
+    Args:
+        path (str): The path of a file or of a file in an archive.
+
+    Returns:
+        str: The path of the archive or the unchanged path.
+    """
+    archive_path = _split_archive_path(path)
+
+    return path if archive_path is None else archive_path[0]
+
+
+def is_xml_file(path: str) -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Check whether the file exists.
+
+    Args:
+        path (str): The path of a file or of a file in an archive.
+
+    Returns:
+        bool: True if the file exists.
+
+    Raises:
+        OSError: If the archive can't be read.
+    """
+    archive_path = _split_archive_path(path)
+
+    if archive_path is None:
+        is_file = os.path.isfile(path)
+    else:
+        is_file = _get_archive(archive_path[0]).get_member(archive_path[1]) is not None
+
+    return is_file
+
+
+def get_xml_file_size(path: str) -> int:
+    # lobster-trace: SwRequirements.sw_req_cli_stats
+    """Get the uncompressed size of a file.
+
+    Args:
+        path (str): The path of a file or of a file in an archive.
+
+    Returns:
+        int: The file size in bytes or 0 if the file doesn't exist.
+    """
+    file_size = 0
+
+    if is_xml_file(path) is True:
+        archive_path = _split_archive_path(path)
+
+        if archive_path is None:
+            file_size = os.path.getsize(path)
+        else:
+            file_size = _get_archive(archive_path[0]).get_size(archive_path[1])
+
+    return file_size
+
+
+def get_xml_file_stamp(path: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    """Get a stamp of the file, which changes if the file changes, without
+    reading the file content.
+
+    Args:
+        path (str): The path of a file or of a file in an archive.
+
+    Returns:
+        str: The size and modification time of a file or the size and checksum
+        or modification time of a file in an archive.
+
+    Raises:
+        OSError: If the file doesn't exist.
+    """
+    archive_path = _split_archive_path(path)
+
+    if archive_path is None:
+        stat_result = os.stat(path)
+        stamp = f"{stat_result.st_size}:{stat_result.st_mtime_ns}"
+    else:
+        archive = _get_archive(archive_path[0])
+
+        if archive.get_member(archive_path[1]) is None:
+            raise FileNotFoundError(f"No such file in archive: {path}")
+
+        stamp = archive.get_stamp(archive_path[1])
+
+    return stamp
+
+
+def get_xml_file_hash(path: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_cache
+    # lobster-trace: SwRequirements.sw_req_cli_incremental
+    """Get the SHA-256 hash of the file content.
+
+    Args:
+        path (str): The path of a file or of a file in an archive.
+
+    Returns:
+        str: The hash as hexadecimal string.
+
+    Raises:
+        OSError: If the file can't be read.
+    """
+    archive_path = _split_archive_path(path)
+
+    if archive_path is None:
+        content_hash = get_file_hash(path)
+    else:
+        with open_xml_file(path) as xml_file:
+            content_hash = get_stream_hash(xml_file)
+
+    return content_hash
+
+
+@contextmanager
+def open_xml_file(path: str) -> Iterator[str | BinaryIO]:
+    # lobster-trace: SwRequirements.sw_req_cli_doxygen_xml_archive
+    """Open a file in an archive for the XML parser. A file on disk is not
+    opened, because the XML parsers read it faster by its path.
+
+    Args:
+        path (str): The path of a file or of a file in an archive.
+
+    Yields:
+        str | BinaryIO: The unchanged path of a file or the opened file in an archive.
+
+    Raises:
+        OSError: If the file doesn't exist or can't be read.
+    """
+    archive_path = _split_archive_path(path)
+
+    if archive_path is None:
+        yield path
+    else:
+        archive = _get_archive(archive_path[0])
+
+        if archive.get_member(archive_path[1]) is None:
+            raise FileNotFoundError(f"No such file in archive: {path}")
+
+        with archive.open(archive_path[1]) as xml_file:
+            yield xml_file
+
+
+# Main *************************************************************************
@@ -0,0 +1,270 @@
+"""Module to read the xrefitem pages of the doxygen XML output.
+
+Doxygen collects every use of the requirement and justification alias on a
+xrefitem page. Each entry of the page refers to the traced compound or member
+by its id, followed by the text of the alias.
+
+A member, which is declared and defined in different files, has a different id
+in each file compound, but only one entry on the xrefitem page. Its memberdefs
+have the same kind, name and body location, which pairs the ids, see
+add_paired_member_values().
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+
+from collections.abc import Iterable
+from xml.etree.ElementTree import Element, iterparse, parse
+
+from lobster_doxygen.iterparse_compound import get_para_value
+from lobster_doxygen.xml_archive import open_xml_file
+
+# Variables ********************************************************************
+
+# Xrefitem page names of the requirement and the justification alias, which are
+# configured in the doxygen configuration, see alias.
+XREFITEM_PAGES = ["implements", "justified"]
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def get_member_body(memberdef: Element) -> tuple[str, str, str, str] | None:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Get the kind, name and body location of a memberdef, which pair the ids
+    of a member declared and defined in different files.
+
+    Args:
+        memberdef (Element): The memberdef element.
+
+    Returns:
+        tuple[str, str, str, str] | None: The kind, name, body file and body
+        start line of the member or None if the member has no body.
+    """
+    body = None
+    location = memberdef.find("location")
+
+    if location is not None and location.get("bodyfile") is not None and location.get("bodystart") is not None:
+        body = (memberdef.get("kind"), memberdef.findtext("name"), location.get("bodyfile"), location.get("bodystart"))
+
+    return body
+
+
+def get_member_bodies(compound_path: str, member_ids: set[str]) -> list[tuple[str, tuple]]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Parse a compound file incrementally and get the bodies of the given members.
+
+    Args:
+        compound_path (str): The path of the compound file, which may be a file in an archive.
+        member_ids (set[str]): The ids of the members.
+
+    Returns:
+        list[tuple[str, tuple]]: The id of each member with a body and its body, see get_member_body().
+    """
+    member_bodies = []
+
+    with open_xml_file(compound_path) as compound_file:
+        for _, element in iterparse(compound_file):
+            if element.tag == "memberdef":
+                body = get_member_body(element) if element.get("id") in member_ids else None
+
+                if body is not None:
+                    member_bodies.append((element.get("id"), body))
+
+                element.clear()
+
+    return member_bodies
+
+
+def add_paired_member_values(xrefitem_values: dict[str, list[str]], member_bodies: Iterable[tuple[str, tuple]]) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Add the texts of a member to the ids of the same member in other compounds.
+    The ids are paired by the kind, name and body location of their memberdefs.
+    Members, which only share the anchor part of their id, e.g. static functions
+    with the same signature in different files, are not paired.
+
+    Args:
+        xrefitem_values (dict[str, list[str]]): The texts per id of the compound or member.
+        member_bodies (Iterable[tuple[str, tuple]]): The id of each member with
+        its body, see get_member_body().
+    """
+    member_ids_per_body = {}
+
+    for member_id, body in member_bodies:
+        member_ids_per_body.setdefault(body, []).append(member_id)
+
+    for member_ids in member_ids_per_body.values():
+        traced_member_ids = [member_id for member_id in member_ids if member_id in xrefitem_values]
+
+        if 0 < len(traced_member_ids):
+            for member_id in member_ids:
+                xrefitem_values.setdefault(member_id, xrefitem_values[traced_member_ids[0]])
+
+
+def _read_xrefitem_page(page_path: str, xrefitem_values: dict[str, list[str]]) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Read the entries of a xrefitem page and append their texts to the
+    values of the referred compound or member.
+
+    Args:
+        page_path (str): The path of the xrefitem page file, which may be a file in an archive.
+        xrefitem_values (dict[str, list[str]]): The texts per id of the compound
+        or member.
+    """
+    with open_xml_file(page_path) as page_file:
+        root = parse(page_file).getroot()
+
+    _read_xrefitem_entries(root, xrefitem_values)
+
+
+def _read_xrefitem_entries(page: Element, xrefitem_values: dict[str, list[str]]) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Read the entries of a xrefitem page element and append their texts to
+    the values of the referred compound or member.
+
+    Args:
+        page (Element): The root element of the xrefitem page or its compounddef.
+        xrefitem_values (dict[str, list[str]]): The texts per id of the compound
+        or member.
+    """
+    for variablelist in page.iter("variablelist"):
+        refid = None
+
+        # The term with the reference is followed by the listitem with the texts.
+        for element in variablelist:
+            if element.tag == "varlistentry":
+                ref = element.find("term/ref")
+                refid = None if ref is None else ref.get("refid")
+            elif element.tag == "listitem" and refid is not None:
+                values = xrefitem_values.setdefault(refid, [])
+                for para in element.findall("para"):
+                    values.append(get_para_value(para).strip())
+
+
+def get_xrefitem_page_paths(doxygen_xml_folder: str, page_refids: list[str]) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_depfile
+    """Get the paths of the requirement and justification xrefitem pages,
+    which are listed in the index.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory, where the
+        file index.xml is located.
+        page_refids (list[str]): The ids of the pages listed in the index.
+
+    Returns:
+        list[str]: The paths of the xrefitem page files.
+    """
+    return [doxygen_xml_folder + "/" + page + ".xml" for page in XREFITEM_PAGES if page in page_refids]
+
+
+def get_xrefitem_values(doxygen_xml_folder: str, page_refids: list[str]) -> dict[str, list[str]]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    """Read the requirement and justification xrefitem pages in the doxygen
+    XML folder. A page only exists if its alias is used, therefore only pages
+    listed in the index are read and not outdated files of a previous run.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output directory, where the
+        file index.xml is located.
+        page_refids (list[str]): The ids of the pages listed in the index.
+
+    Returns:
+        dict[str, list[str]]: The texts of the aliases, e.g. "Requirement: REQ",
+        per id of the compound or member. Requirements are listed before
+        justifications.
+    """
+    xrefitem_values = {}
+
+    for page_path in get_xrefitem_page_paths(doxygen_xml_folder, page_refids):
+        _read_xrefitem_page(page_path, xrefitem_values)
+
+    return xrefitem_values
+
+
+def get_xrefitem_values_from_pages(pages: dict[str, Element]) -> dict[str, list[str]]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_sqlite3
+    """Read the requirement and justification xrefitem pages, which are already parsed.
+
+    Args:
+        pages (dict[str, Element]): The compounddef or detaileddescription element
+        per page id. Other pages than the xrefitem pages are ignored.
+
+    Returns:
+        dict[str, list[str]]: The texts of the aliases, e.g. "Requirement: REQ",
+        per id of the compound or member. Requirements are listed before
+        justifications.
+    """
+    xrefitem_values = {}
+
+    for page in XREFITEM_PAGES:
+        if page in pages:
+            _read_xrefitem_entries(pages[page], xrefitem_values)
+
+    return xrefitem_values
+
+
+def get_combined_xrefitem_values(combined_xml_file: str) -> dict[str, list[str]]:
+    # lobster-trace: SwRequirements.sw_req_cli_trace_source
+    # lobster-trace: SwRequirements.sw_req_cli_combined_xml
+    """Read the requirement and justification xrefitem pages in a combined
+    doxygen XML file. The file is parsed incrementally, only the compounddefs of
+    the xrefitem pages and the bodies of the members are kept to pair the ids
+    of a member declared and defined in different files.
+
+    Args:
+        combined_xml_file (str): The path of the combined XML file, which may be
+        a file in an archive.
+
+    Returns:
+        dict[str, list[str]]: The texts of the aliases, e.g. "Requirement: REQ",
+        per id of the compound or member. Requirements are listed before
+        justifications.
+    """
+    pages = {}
+    member_bodies = []
+    root = None
+
+    with open_xml_file(combined_xml_file) as xml_file:
+        for event, element in iterparse(xml_file, events=("start", "end")):
+            if root is None:
+                root = element
+            elif event == "end" and element.tag == "compounddef":
+                if element.get("kind") == "page" and element.get("id") in XREFITEM_PAGES:
+                    pages[element.get("id")] = element
+
+                for memberdef in element.iter("memberdef"):
+                    body = get_member_body(memberdef)
+
+                    if body is not None:
+                        member_bodies.append((memberdef.get("id"), body))
+
+                # Only the compounddefs, which are completely parsed, are children of the root yet.
+                root.clear()
+
+    xrefitem_values = get_xrefitem_values_from_pages(pages)
+    add_paired_member_values(xrefitem_values, member_bodies)
+
+    return xrefitem_values
+
+
+# Main *************************************************************************
@@ -21,12 +21,33 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 
 # Imports **********************************************************************
 
+import os
+import re
 import sys
+import gzip
+import json
+import shutil
+import socket
+import sqlite3
+import stat
+import tarfile
+import tempfile
+import threading
+import zipfile
+from contextlib import closing
 from pathlib import Path
+from xml.etree import ElementTree
 import pytest
+from lobster.tools.core.report.report import lobster_report
 
+import lobster_doxygen
+from lobster_doxygen import client, doxygen_to_lobster_converter, get_lobster_items_from_doxygen_xml_folder
 from lobster_doxygen.__main__ import main
-from lobster_doxygen.version import __version__
+from lobster_doxygen.client import RUNTIME_DIR_ENV_VARIABLE, SOCKET_ENV_VARIABLE, get_socket_path, send_request
+from lobster_doxygen.server import Server
+from lobster_doxygen.compound_cache import CACHE_FILE_NAME, CompoundCache
+from lobster_doxygen.ret import Ret
+from lobster_doxygen.version import __version__, get_version, get_version_info
 
 # Variables ********************************************************************
 
@@ -39,9 +60,30 @@ TEST_XML_FOLDER = "./tests/utils/xml"
 # stdout if program is called with verbose parameter
 STD_OUTPUT_WITH_VERBOSE = [
     "Program arguments: ",
-    f"* doxygen_xml_folder = {TEST_XML_FOLDER}",
+    f"* doxygen_xml_folder = {[TEST_XML_FOLDER]}",
+    "* folder_list = None",
     f"* output = {TEST_LOBSTER_OUTPUT_FILE}",
+    "* output_dir = None",
+    "* lobster_config = None",
+    "* lobster_level = None",
+    "* lobster_report = report.lobster",
     "* verbose = True",
+    "* jobs = None",
+    "* parser = doxmlparser",
+    "* cache_dir = None",
+    "* cache_fast = False",
+    "* cache_max_size = 256",
+    "* trace_source = description",
+    "* compact = False",
+    "* gzip = False",
+    "* stats = False",
+    "* stats_json = None",
+    "* incremental = False",
+    "* depfile = None",
+    "* skip_if_unchanged = False",
+    "* keep_going = False",
+    "* max_errors = None",
+    "* report_json = None",
     "",
     "",
     "compound: main.cpp",
@@ -57,12 +99,33 @@ STD_OUTPUT_WITH_VERBOSE = [
     "    kind: page (skipped)",
     "compound: src",
     "    kind: dir (skipped)",
+    "Skipped 2 of 4 compound files (1329 bytes).",
+    "Skipped 0 duplicate members.",
     "",
 ]
 
 # Empty directory with no XML files.
 EMPTY_FOLDER = "./tests/utils/empty_folder"
 
+# Directory with Doxygen XML files from cpp-level-test project, which consists of many compound files.
+TEST_LEVEL_XML_FOLDER = "./tests/utils/cpp-level-test/out/xml"
+
+# LOBSTER output file of a serial run, which is created and deleted for tests.
+TEST_LOBSTER_SERIAL_OUTPUT_FILE = "./tests/utils/output-test-serial.json"
+
+# Directory with Doxygen XML files of a project without any trace, its tags differ from the cpp-level-test project.
+TEST_NO_TRACE_XML_FOLDER = "./tests/utils/cpp-no-trace/out/xml"
+
+# Directory with the projects, which violate the rules.
+TEST_RULE_TESTS_FOLDER = "./tests/utils/cpp-rule-tests"
+
+# Projects with requirements on file level, on class and method level and on namespace and function level.
+TEST_RULE_PROJECTS = [
+    "cpp-file-requirement",
+    "cpp-class-and-method-requirement",
+    "cpp-namespace-and-function-requirement",
+]
+
 # Classes **********************************************************************
 
 # Functions ********************************************************************
@@ -73,12 +136,27 @@ def _setup_and_teardown():
     # lobster-exclude: This is a simple helper function that prepares and cleanup the tests.
     """Before running the test, delete the LOBSTER file if it exists."""
     # Preparation:
-    if Path(TEST_LOBSTER_OUTPUT_FILE).exists() and Path(TEST_LOBSTER_OUTPUT_FILE).is_file():
-        Path(TEST_LOBSTER_OUTPUT_FILE).unlink()
+    for output_file in [TEST_LOBSTER_OUTPUT_FILE, TEST_LOBSTER_SERIAL_OUTPUT_FILE]:
+        if Path(output_file).exists() and Path(output_file).is_file():
+            Path(output_file).unlink()
     yield
     # Teardown:
 
 
+def _get_conversion_output(stdout: str) -> str:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Get the verbose output of the conversion without the program arguments, which
+    differ between the compared program calls.
+
+    Args:
+        stdout (str): The captured standard output of a verbose program call.
+
+    Returns:
+        str: The standard output after the program arguments.
+    """
+    return stdout.split("\n\n\n", 1)[1]
+
+
 def test_tc_help(record_property, capsys) -> None:
     # lobster-trace: SwTests.tc_help
     """
@@ -91,7 +169,20 @@ def test_tc_help(record_property, capsys) -> None:
     record_property("lobster-trace", "SwTests.tc_help")
 
     expected_output_lines = [
-        "usage: lobster-doxygen [-h] [--version] [-o OUTPUT] [-v] doxygen_xml_folder",
+        "usage: lobster-doxygen [-h] [--version] [--folder-list FOLDER_LIST]",
+        "                       [-o OUTPUT | --output-dir OUTPUT_DIR | --lobster-config LOBSTER_CONFIG]",
+        "                       [--lobster-level LOBSTER_LEVEL]",
+        "                       [--lobster-report LOBSTER_REPORT] [-v] [-j JOBS]",
+        "                       [--parser {doxmlparser,iterparse}]",
+        "                       [--cache-dir CACHE_DIR] [--cache-fast]",
+        "                       [--cache-max-size CACHE_MAX_SIZE]",
+        "                       [--trace-source {description,xrefitem,verify}]",
+        "                       [--compact] [--gzip] [--stats]",
+        "                       [--stats-json STATS_JSON] [--incremental]",
+        "                       [--depfile DEPFILE] [--skip-if-unchanged]",
+        "                       [--keep-going] [--max-errors MAX_ERRORS]",
+        "                       [--report-json REPORT_JSON]",
+        "                       [doxygen_xml_folder ...]",
         "",
         "Convert doxygen XML output to lobster common interchange format.",
         "",
@@ -107,14 +198,94 @@ def test_tc_help(record_property, capsys) -> None:
         "To specify a justification use @justification{JUSTIFICATION}.",
         "",
         "positional arguments:",
-        "  doxygen_xml_folder    Path to the doxygen XML output folder.",
+        "  doxygen_xml_folder    Path to the doxygen XML output folder or to an archive",
+        "                        with it (.zip, .tar, .tar.gz, .tgz, .tar.zst),",
+        "                        optionally followed by the folder in the archive, e.g.",
+        "                        doxygen.zip/xml, or to a combined doxygen XML file,",
+        "                        e.g. all.xml of combine.xslt, or to the doxygen",
+        "                        SQLite3 database, e.g. doxygen_sqlite3.db. Several",
+        "                        ones are converted in one process and their tags have",
+        "                        to be unique.",
         "",
         "options:",
         "  -h, --help            show this help message and exit",
         "  --version             show program's version number and exit",
+        "  --folder-list FOLDER_LIST",
+        "                        File with one doxygen_xml_folder per line, which are",
+        "                        converted in addition. Relative paths are relative to",
+        "                        the file, empty lines and lines starting with # are",
+        "                        ignored. Default: no file",
         "  -o OUTPUT, --output OUTPUT",
         "                        Output file name. Default: lobster.json",
+        "  --output-dir OUTPUT_DIR",
+        "                        Write one output file per doxygen_xml_folder into this",
+        "                        directory instead of one output file, named after the",
+        "                        path of the doxygen_xml_folder. Default: one output",
+        "                        file",
+        "  --lobster-config LOBSTER_CONFIG",
+        "                        Create the lobster report with this lobster",
+        "                        configuration file in the same process instead of the",
+        "                        output file. The lobster items are added to the",
+        "                        implementation level without source file. Default:",
+        "                        output file",
+        "  --lobster-level LOBSTER_LEVEL",
+        "                        Implementation level of the lobster configuration,",
+        "                        which gets the lobster items. Default: the only",
+        "                        implementation level without source file",
+        "  --lobster-report LOBSTER_REPORT",
+        "                        Lobster report file, which is written with --lobster-",
+        "                        config. Default: report.lobster",
         "  -v, --verbose         Enable verbose output.",
+        "  -j JOBS, --jobs JOBS  Number of parallel jobs to parse the doxygen XML",
+        "                        files. Default: number of CPUs",
+        "  --parser {doxmlparser,iterparse}",
+        "                        XML parser for the doxygen compound files. iterparse",
+        "                        parses incrementally with low memory usage. Default:",
+        "                        doxmlparser",
+        "  --cache-dir CACHE_DIR",
+        "                        Directory of a persistent cache for the results of the",
+        "                        doxygen XML files. Only changed files are parsed",
+        "                        again. Default: no cache",
+        "  --cache-fast          Detect changed doxygen XML files by size and",
+        "                        modification time instead of the content hash.",
+        "  --cache-max-size CACHE_MAX_SIZE",
+        "                        Maximum size of the cache in MiB. Default: 256",
+        "  --trace-source {description,xrefitem,verify}",
+        "                        Source of the requirements and justifications.",
+        "                        description reads the detailed description of each",
+        "                        compound and member, xrefitem reads the xrefitem pages",
+        "                        of the aliases and verify checks that both are",
+        "                        identical. Default: description",
+        "  --compact             Write the output file as compact JSON without",
+        "                        indentation and line breaks.",
+        "  --gzip                Write the output file gzip compressed, e.g. for",
+        "                        archiving.",
+        "  --stats               Print the time and throughput of each conversion phase",
+        "                        and the slowest compound files.",
+        "  --stats-json STATS_JSON",
+        "                        Write the time and throughput of each conversion phase",
+        "                        as JSON file. Default: no file",
+        "  --incremental         Update the output file of a previous run only for the",
+        "                        changed doxygen XML files. The byte range of each",
+        "                        compound is recorded in <output>.manifest.json.",
+        "  --depfile DEPFILE     Write the index.xml and all read doxygen XML files as",
+        "                        Makefile style dependencies of the output file, e.g.",
+        "                        for make or ninja. Default: no file",
+        "  --skip-if-unchanged   Skip the conversion if the output file and all read",
+        "                        doxygen XML files are unchanged since the last run.",
+        "                        Their sizes and modification times are recorded in",
+        "                        <output>.fingerprint.json.",
+        "  --keep-going          Skip the doxygen XML files, which can't be converted,",
+        "                        and write the output file with the other ones. The",
+        "                        skipped files are reported and the exit code is 5.",
+        "  --max-errors MAX_ERRORS",
+        "                        Abort the conversion after this number of errors, i.e.",
+        "                        rule violations and with --keep-going skipped doxygen",
+        "                        XML files. Default: all errors are reported",
+        "  --report-json REPORT_JSON",
+        "                        Write the rule violations and with --keep-going the",
+        "                        skipped doxygen XML files as JSON file, also if the",
+        "                        conversion fails. Default: no file",
         "",
     ]
 
@@ -158,6 +329,28 @@ def test_tc_version(record_property, capsys) -> None:
     assert pytest_wrapped_e.value.code == 0, "ExitCode not as expected."
 
 
+def test_tc_version_other_working_directory(record_property, monkeypatch, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_version
+    """
+    Test calls the program from a working directory without pyproject.toml file, while the tool
+    version isn't resolved yet. The conversion shall succeed with the same tool version.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to change the working directory.
+        tmp_path (Path): Temporary directory as working directory and for the output file.
+    """
+    record_property("lobster-trace", "SwTests.tc_version")
+
+    xml_folder = os.path.abspath(TEST_LEVEL_XML_FOLDER)
+    monkeypatch.chdir(tmp_path)
+    get_version_info.cache_clear()
+
+    sys.argv = ["lobster-doxygen", "--skip-if-unchanged", "--output", str(tmp_path / "lobster.json"), xml_folder]
+    assert main() == 0, "Exit Code returns no success."
+    assert get_version() == __version__
+
+
 def test_tc_output(record_property, capsys) -> None:
     # lobster-trace: SwTests.tc_output
     """
@@ -243,4 +436,1322 @@ def test_tc_doxygen_xml_folder_program_without_positional_doxygen_xml_folder_arg
     assert pytest_wrapped_e.value.code != 0, "Exit Code returns success."
 
 
+@pytest.mark.parametrize("archive_name, folder_in_archive", [
+    ("xml.zip", ""),
+    ("xml.tar", "/xml"),
+    ("xml.tar.gz", "/xml"),
+    ("xml.tgz", ""),
+])
+def test_tc_doxygen_xml_archive(record_property, tmp_path, archive_name, folder_in_archive) -> None:
+    # lobster-trace: SwTests.tc_doxygen_xml_archive
+    """
+    Test calls the program with the doxygen XML files in an archive, either at its top level or
+    in a folder of the archive, and checks that the output file is identical to the one of the
+    doxygen XML folder and that the archive is the only dependency.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the archive and the output files.
+        archive_name (str): The file name of the archive, which selects its format.
+        folder_in_archive (str): The folder of the doxygen XML files in the archive.
+    """
+    record_property("lobster-trace", "SwTests.tc_doxygen_xml_archive")
+
+    archive_path = tmp_path / archive_name
+    xml_files = sorted(Path(TEST_LEVEL_XML_FOLDER).iterdir())
+
+    if archive_name.endswith(".zip"):
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for xml_file in xml_files:
+                archive.write(xml_file, folder_in_archive.lstrip("/") + "/" + xml_file.name)
+    else:
+        with tarfile.open(archive_path, "w" if archive_name.endswith(".tar") else "w:gz") as archive:
+            for xml_file in xml_files:
+                archive.add(xml_file, "." + folder_in_archive + "/" + xml_file.name)
+
+    folder_output_file = tmp_path / "folder.json"
+    archive_output_file = tmp_path / "archive.json"
+    depfile = tmp_path / "archive.d"
+
+    sys.argv = ["lobster-doxygen", "--output", str(folder_output_file), TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code returns no success."
+
+    sys.argv = ["lobster-doxygen", "--jobs", "2", "--depfile", str(depfile), "--output", str(archive_output_file),
+                str(archive_path) + folder_in_archive]
+    assert main() == 0, "Exit Code returns no success."
+
+    assert archive_output_file.read_bytes() == folder_output_file.read_bytes()
+    assert depfile.read_text(encoding="utf-8") == f"{archive_output_file}: \\\n {archive_path}\n"
+
+    # Without the folder in the archive there is no index.xml.
+    if 0 < len(folder_in_archive):
+        sys.argv = ["lobster-doxygen", "--output", str(archive_output_file), str(archive_path)]
+        assert main() == Ret.RET_ERROR_FILEPATH_INVALID
+
+
+def test_tc_doxygen_xml_archive_invalid(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_doxygen_xml_archive
+    """
+    Test calls the program with a file, which is no valid archive, and checks that the error is
+    reported.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the invalid archive.
+    """
+    record_property("lobster-trace", "SwTests.tc_doxygen_xml_archive")
+
+    archive_path = tmp_path / "xml.zip"
+    archive_path.write_text("no archive", encoding="utf-8")
+
+    sys.argv = ["lobster-doxygen", "--output", TEST_LOBSTER_OUTPUT_FILE, str(archive_path)]
+
+    assert main() == Ret.RET_ERROR_FILEPATH_INVALID
+
+    # The error output is wrapped at the width of the console.
+    assert f"The archive {archive_path} can't be read" in " ".join(capsys.readouterr().err.split())
+
+
+def _write_combined_xml(doxygen_xml_folder: str, combined_xml_file: Path) -> None:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Write the compound definitions of all compounds in the index into one XML file,
+    like the combine.xslt of doxygen does.
+
+    Args:
+        doxygen_xml_folder (str): The doxygen XML folder.
+        combined_xml_file (Path): The combined XML file to write.
+    """
+    root = ElementTree.Element("doxygen")
+
+    for compound in ElementTree.parse(doxygen_xml_folder + "/index.xml").getroot().iter("compound"):
+        compound_file = doxygen_xml_folder + "/" + compound.get("refid") + ".xml"
+        root.extend(ElementTree.parse(compound_file).getroot().findall("compounddef"))
+
+    ElementTree.ElementTree(root).write(combined_xml_file, encoding="UTF-8", xml_declaration=True)
+
+
+@pytest.mark.parametrize("trace_source", ["description", "verify"])
+@pytest.mark.parametrize("in_archive", [False, True])
+def test_tc_combined_xml(record_property, tmp_path, trace_source, in_archive) -> None:
+    # lobster-trace: SwTests.tc_combined_xml
+    """
+    Test calls the program with a combined doxygen XML file, which contains all compound
+    definitions, and checks that the output file is identical to the one of the doxygen XML
+    folder and that the combined XML file is the only dependency.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the combined XML file and the output files.
+        trace_source (str): The source of the requirements and justifications.
+        in_archive (bool): If True, the combined XML file is read from a zip archive.
+    """
+    record_property("lobster-trace", "SwTests.tc_combined_xml")
+
+    combined_xml_file = tmp_path / "all.xml"
+    _write_combined_xml(TEST_LEVEL_XML_FOLDER, combined_xml_file)
+    combined_xml_path = str(combined_xml_file)
+    source_file = combined_xml_path
+
+    if in_archive is True:
+        source_file = str(tmp_path / "xml.zip")
+        combined_xml_path = source_file + "/all.xml"
+
+        with zipfile.ZipFile(source_file, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(combined_xml_file, "all.xml")
+
+    folder_output_file = tmp_path / "folder.json"
+    combined_output_file = tmp_path / "combined.json"
+    depfile = tmp_path / "combined.d"
+
+    sys.argv = ["lobster-doxygen", "--trace-source", trace_source, "--output", str(folder_output_file),
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code returns no success."
+
+    sys.argv = ["lobster-doxygen", "--trace-source", trace_source, "--depfile", str(depfile), "--output",
+                str(combined_output_file), combined_xml_path]
+    assert main() == 0, "Exit Code returns no success."
+
+    assert combined_output_file.read_bytes() == folder_output_file.read_bytes()
+    assert depfile.read_text(encoding="utf-8") == f"{combined_output_file}: \\\n {source_file}\n"
+
+
+@pytest.mark.parametrize("options", [[], ["--parser", "iterparse"], ["--jobs", "2"]])
+@pytest.mark.parametrize("is_combined", [False, True])
+def test_tc_duplicate_member_written(record_property, tmp_path, options, is_combined) -> None:
+    # lobster-trace: SwTests.tc_duplicate_member_written
+    """
+    Test calls the program with a namespace with requirements and its function without
+    requirements, which is listed in the namespace and in the file compound. The namespace is
+    written without its children, therefore the test checks that the function is written once
+    with its file, from the doxygen XML folder and from the combined XML file.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the output file.
+        options (list[str]): Additional program arguments.
+        is_combined (bool): If True, the combined XML file is converted instead of the folder.
+    """
+    record_property("lobster-trace", "SwTests.tc_duplicate_member_written")
+
+    xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_RULE_TESTS_FOLDER + "/cpp-namespace-and-function-requirement/out/xml", xml_folder)
+
+    namespace_file = xml_folder / "namespacemath.xml"
+    namespace_compound = namespace_file.read_text(encoding="utf-8")
+    memberdef = namespace_compound[namespace_compound.index("      <memberdef"):namespace_compound.index("</memberdef>")]
+    namespace_file.write_text(
+        namespace_compound.replace(memberdef, re.sub(r"<para><xrefsect.*?</xrefsect></para>", "", memberdef,
+                                                     flags=re.DOTALL)),
+        encoding="utf-8"
+    )
+    sectiondef = namespace_file.read_text(encoding="utf-8")
+    sectiondef = sectiondef[sectiondef.index("    <sectiondef"):sectiondef.index("</sectiondef>") + 14]
+
+    file_file = xml_folder / "_namespace_and_function_requirement_8cpp.xml"
+    file_file.write_text(
+        file_file.read_text(encoding="utf-8").replace("    <briefdescription>", sectiondef + "    <briefdescription>", 1),
+        encoding="utf-8"
+    )
+
+    index_file = xml_folder / "index.xml"
+    index = index_file.read_text(encoding="utf-8")
+    member = index[index.index("    <member"):index.index("  </compound>")]
+    index_file.write_text(
+        index.replace("<name>NamespaceAndFunctionRequirement.cpp</name>\n",
+                      "<name>NamespaceAndFunctionRequirement.cpp</name>\n" + member),
+        encoding="utf-8"
+    )
+
+    input_path = str(xml_folder)
+
+    if is_combined is True:
+        input_path = str(tmp_path / "all.xml")
+        _write_combined_xml(str(xml_folder), Path(input_path))
+
+    output_file = tmp_path / "lobster.json"
+    sys.argv = ["lobster-doxygen", *options, "--output", str(output_file), input_path]
+    assert main() == 0, "Exit Code returns no success."
+
+    tags = [item["tag"] for item in json.loads(output_file.read_text(encoding="utf-8"))["data"]]
+
+    assert tags == ["cpp namespacemath", "cpp namespacemath_1abb40ce7b6914681aec0fbc536df3f708"]
+
+
+# Tables of the doxygen SQLite3 database with the columns, which are read or mandatory.
+DOXYGEN_SQLITE3_SCHEMA = """
+    CREATE TABLE refid (rowid INTEGER PRIMARY KEY NOT NULL, refid TEXT NOT NULL UNIQUE);
+    CREATE TABLE path (rowid INTEGER PRIMARY KEY NOT NULL, type INTEGER NOT NULL, local INTEGER NOT NULL,
+        found INTEGER NOT NULL, name TEXT NOT NULL);
+    CREATE TABLE compounddef (rowid INTEGER PRIMARY KEY NOT NULL, name TEXT NOT NULL, title TEXT,
+        kind TEXT NOT NULL, prot INTEGER, file_id INTEGER NOT NULL, line INTEGER NOT NULL,
+        column INTEGER NOT NULL, header_id INTEGER, detaileddescription TEXT, briefdescription TEXT);
+    CREATE TABLE memberdef (rowid INTEGER PRIMARY KEY NOT NULL, name TEXT NOT NULL, kind TEXT NOT NULL,
+        file_id INTEGER NOT NULL, line INTEGER NOT NULL, column INTEGER NOT NULL, bodystart INTEGER DEFAULT 0,
+        bodyend INTEGER DEFAULT 0, bodyfile_id INTEGER, detaileddescription TEXT, briefdescription TEXT);
+    CREATE TABLE member (rowid INTEGER PRIMARY KEY NOT NULL, scope_rowid INTEGER NOT NULL,
+        memberdef_rowid INTEGER NOT NULL, prot INTEGER NOT NULL, virt INTEGER NOT NULL, name TEXT NOT NULL);
+"""
+
+
+def _write_doxygen_sqlite3_db(doxygen_xml_folder: str, db_file: Path) -> None:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Write the compounds and members of the doxygen XML folder into a database
+    like the SQLite3 output of doxygen. The compounds are inserted in reverse
+    index order, like doxygen doesn't insert them in index order.
+
+    Args:
+        doxygen_xml_folder (str): The doxygen XML folder.
+        db_file (Path): The database file to write.
+    """
+    def get_rowid(table: str, column: str, value: str) -> int:
+        connection.execute(f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)", (value,))
+        return connection.execute(f"SELECT rowid FROM {table} WHERE {column} = ?", (value,)).fetchone()[0]
+
+    def get_description(element: ElementTree.Element) -> str:
+        description = element.find("detaileddescription")
+        return "".join(ElementTree.tostring(child, encoding="unicode") for child in description)
+
+    def get_path_id(file_name: str) -> int:
+        connection.execute("INSERT OR IGNORE INTO path (type, local, found, name) SELECT 1, 1, 1, ? "
+                           "WHERE NOT EXISTS (SELECT 1 FROM path WHERE name = ?)", (file_name, file_name))
+        return connection.execute("SELECT rowid FROM path WHERE name = ?", (file_name,)).fetchone()[0]
+
+    def get_file_id(element: ElementTree.Element) -> tuple[int, int, int]:
+        location = element.find("location")
+        file_id = get_path_id("" if location is None else location.get("file"))
+        return (file_id, int(location.get("line", 0)) if location is not None else 0,
+                int(location.get("column", 0)) if location is not None else 0)
+
+    def get_body(element: ElementTree.Element) -> tuple[int, int, int | None]:
+        location = element.find("location")
+        if location is None or location.get("bodyfile") is None:
+            return (0, 0, None)
+        return (int(location.get("bodystart", 0)), int(location.get("bodyend", 0)),
+                get_path_id(location.get("bodyfile")))
+
+    compounds = list(ElementTree.parse(doxygen_xml_folder + "/index.xml").getroot().iter("compound"))
+
+    with closing(sqlite3.connect(db_file)) as connection:
+        connection.executescript(DOXYGEN_SQLITE3_SCHEMA)
+
+        for compound in reversed(compounds):
+            compound_file = doxygen_xml_folder + "/" + compound.get("refid") + ".xml"
+
+            for compounddef in ElementTree.parse(compound_file).getroot().iter("compounddef"):
+                scope_rowid = get_rowid("refid", "refid", compounddef.get("id"))
+                connection.execute(
+                    "INSERT INTO compounddef (rowid, name, kind, file_id, line, column, detaileddescription) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (scope_rowid, compounddef.findtext("compoundname"), compounddef.get("kind"),
+                     *get_file_id(compounddef), get_description(compounddef))
+                )
+
+                for memberdef in compounddef.iter("memberdef"):
+                    memberdef_rowid = get_rowid("refid", "refid", memberdef.get("id"))
+                    connection.execute(
+                        "INSERT OR IGNORE INTO memberdef (rowid, name, kind, file_id, line, column, bodystart, "
+                        "bodyend, bodyfile_id, detaileddescription) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (memberdef_rowid, memberdef.findtext("name"), memberdef.get("kind"),
+                         *get_file_id(memberdef), *get_body(memberdef), get_description(memberdef))
+                    )
+                    connection.execute(
+                        "INSERT INTO member (scope_rowid, memberdef_rowid, prot, virt, name) VALUES (?, ?, 0, 0, ?)",
+                        (scope_rowid, memberdef_rowid, memberdef.findtext("name"))
+                    )
+
+        connection.commit()
+
+
+@pytest.mark.parametrize("trace_source", ["description", "xrefitem", "verify"])
+@pytest.mark.parametrize("doxygen_xml_folder", [TEST_XML_FOLDER, TEST_LEVEL_XML_FOLDER])
+def test_tc_sqlite3(record_property, tmp_path, doxygen_xml_folder, trace_source) -> None:
+    # lobster-trace: SwTests.tc_sqlite3
+    """
+    Test calls the program with a doxygen SQLite3 database, which contains the compounds and
+    members of a doxygen XML folder, and checks that the output file is identical to the one of
+    the doxygen XML folder and that the database is the only dependency.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the database and the output files.
+        doxygen_xml_folder (str): The doxygen XML folder, which is written into the database.
+        trace_source (str): The source of the requirements and justifications.
+    """
+    record_property("lobster-trace", "SwTests.tc_sqlite3")
+
+    db_file = tmp_path / "doxygen_sqlite3.db"
+    _write_doxygen_sqlite3_db(doxygen_xml_folder, db_file)
+
+    folder_output_file = tmp_path / "folder.json"
+    db_output_file = tmp_path / "db.json"
+    depfile = tmp_path / "db.d"
+
+    sys.argv = ["lobster-doxygen", "--trace-source", trace_source, "--output", str(folder_output_file),
+                doxygen_xml_folder]
+    assert main() == 0, "Exit Code returns no success."
+
+    sys.argv = ["lobster-doxygen", "--trace-source", trace_source, "--depfile", str(depfile), "--output",
+                str(db_output_file), str(db_file)]
+    assert main() == 0, "Exit Code returns no success."
+
+    assert db_output_file.read_bytes() == folder_output_file.read_bytes()
+    assert depfile.read_text(encoding="utf-8") == f"{db_output_file}: \\\n {db_file}\n"
+
+
+def test_tc_jobs(record_property, capsys) -> None:
+    # lobster-trace: SwTests.tc_jobs
+    """
+    Test calls the program once with a single job and once with several parallel jobs and checks
+    that the LOBSTER common interchange format files and the verbose output are identical.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+    """
+    record_property("lobster-trace", "SwTests.tc_jobs")
+
+    sys.argv = ["lobster-doxygen", "-v", "--jobs", "1", "--output", TEST_LOBSTER_SERIAL_OUTPUT_FILE,
+                TEST_LEVEL_XML_FOLDER]
+    exit_code_serial = main()
+    captured_serial = capsys.readouterr()
+
+    sys.argv = ["lobster-doxygen", "-v", "--jobs", "4", "--output", TEST_LOBSTER_OUTPUT_FILE,
+                TEST_LEVEL_XML_FOLDER]
+    exit_code_parallel = main()
+    captured_parallel = capsys.readouterr()
+
+    assert exit_code_serial == 0, "Exit Code of serial run returns no success."
+    assert exit_code_parallel == 0, "Exit Code of parallel run returns no success."
+    assert Path(TEST_LOBSTER_SERIAL_OUTPUT_FILE).read_bytes() == Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes(), \
+        "Output file of parallel run differs from serial run."
+
+    # The program arguments differ, but the conversion output shall be identical.
+    assert _get_conversion_output(captured_serial.out) == _get_conversion_output(captured_parallel.out), \
+        "Standard output of parallel run differs from serial run."
+    assert captured_serial.err == captured_parallel.err, "Error output of parallel run differs from serial run."
+
+
+def test_tc_jobs_invalid_value(record_property) -> None:
+    # lobster-trace: SwTests.tc_jobs
+    """
+    Test calls the program with a job count of zero and checks that the program exits with an argument error.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_jobs")
+
+    sys.argv = ["lobster-doxygen", "--jobs", "0", "--output", TEST_LOBSTER_OUTPUT_FILE, TEST_XML_FOLDER]
+
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        main()
+
+    assert pytest_wrapped_e.value.code == 2, "ExitCode not as expected."
+
+
+def _run_with_cache(capsys, cache_dir: Path, doxygen_xml_folder: str, *options: str) -> tuple[int, str, str]:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Call the program in verbose mode with a compound cache.
+
+    Args:
+        capsys (Any): Used to capture stdout and stderr.
+        cache_dir (Path): The cache directory.
+        doxygen_xml_folder (str): The doxygen XML folder to convert.
+        options (str): Additional command line options.
+
+    Returns:
+        tuple[int, str, str]: Exit code, the last line of the conversion output with the cache
+        statistics and the conversion output without it.
+    """
+    sys.argv = ["lobster-doxygen", "-v", "--jobs", "1", "--cache-dir", str(cache_dir), *options,
+                "--output", TEST_LOBSTER_OUTPUT_FILE, doxygen_xml_folder]
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert captured.err == "", f"Program exit with error: {captured.err}"
+
+    conversion_output, cache_statistics, _ = _get_conversion_output(captured.out).rsplit("\n", 2)
+
+    return exit_code, cache_statistics, conversion_output
+
+
+def test_tc_cache(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_cache
+    """
+    Test calls the program twice with the same cache directory and checks that the second call
+    takes all compound results from the cache and creates the same output as a call without cache.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the cache.
+    """
+    record_property("lobster-trace", "SwTests.tc_cache")
+
+    sys.argv = ["lobster-doxygen", "-v", "--jobs", "1", "--output", TEST_LOBSTER_SERIAL_OUTPUT_FILE,
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code without cache returns no success."
+    uncached_output = _get_conversion_output(capsys.readouterr().out).rsplit("\n", 1)[0]
+
+    exit_code, cache_statistics, first_output = _run_with_cache(capsys, tmp_path, TEST_LEVEL_XML_FOLDER)
+    assert exit_code == 0, "Exit Code of first cached run returns no success."
+    assert cache_statistics == "Cache: 0 hits, 35 misses."
+    assert (tmp_path / CACHE_FILE_NAME).is_file()
+
+    exit_code, cache_statistics, second_output = _run_with_cache(capsys, tmp_path, TEST_LEVEL_XML_FOLDER)
+    assert exit_code == 0, "Exit Code of second cached run returns no success."
+    assert cache_statistics == "Cache: 35 hits, 0 misses."
+
+    assert first_output == uncached_output
+    assert second_output == uncached_output
+    assert Path(TEST_LOBSTER_SERIAL_OUTPUT_FILE).read_bytes() == Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes(), \
+        "Output file of cached run differs from run without cache."
+
+
+def test_tc_cache_version(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_cache
+    """
+    Test checks that the cached results are dropped if the cache was created by another tool version.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the cache.
+    """
+    record_property("lobster-trace", "SwTests.tc_cache")
+
+    _run_with_cache(capsys, tmp_path, TEST_LEVEL_XML_FOLDER)
+
+    connection = sqlite3.connect(tmp_path / CACHE_FILE_NAME)
+    connection.execute("UPDATE meta SET value = '0.0.0/1' WHERE name = 'version'")
+    connection.commit()
+    connection.close()
+
+    exit_code, cache_statistics, _ = _run_with_cache(capsys, tmp_path, TEST_LEVEL_XML_FOLDER)
+    assert exit_code == 0, "Exit Code returns no success."
+    assert cache_statistics == "Cache: 0 hits, 35 misses."
+
+
+def test_tc_cache_invalid_file(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_cache
+    """
+    Test checks that an invalid cache database file is replaced by a new one.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the cache.
+    """
+    record_property("lobster-trace", "SwTests.tc_cache")
+
+    (tmp_path / CACHE_FILE_NAME).write_text("no database", encoding="utf-8")
+
+    exit_code, cache_statistics, _ = _run_with_cache(capsys, tmp_path, TEST_LEVEL_XML_FOLDER)
+    assert exit_code == 0, "Exit Code returns no success."
+    assert cache_statistics == "Cache: 0 hits, 35 misses."
+
+
+@pytest.mark.parametrize("cache_fast_option", [[], ["--cache-fast"]])
+def test_tc_cache_changed_file(record_property, capsys, tmp_path, cache_fast_option) -> None:
+    # lobster-trace: SwTests.tc_cache
+    """
+    Test checks that only a changed compound file is parsed again. With the content hash a file
+    with a new modification time but same content is still taken from the cache, in fast mode not.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the cache and the doxygen XML folder.
+        cache_fast_option (list[str]): Command line option to enable the fast mode.
+    """
+    record_property("lobster-trace", "SwTests.tc_cache")
+
+    cache_dir = tmp_path / "cache"
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+    _run_with_cache(capsys, cache_dir, str(doxygen_xml_folder), *cache_fast_option)
+
+    compound_file = doxygen_xml_folder / "main_8cpp.xml"
+    stat_result = compound_file.stat()
+    os.utime(compound_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000000000))
+
+    _, cache_statistics, _ = _run_with_cache(capsys, cache_dir, str(doxygen_xml_folder), *cache_fast_option)
+    if cache_fast_option:
+        assert cache_statistics == "Cache: 1 hits, 1 misses."
+    else:
+        assert cache_statistics == "Cache: 2 hits, 0 misses."
+
+    compound_file.write_text(compound_file.read_text(encoding="utf-8").replace("print_title", "print_headline"),
+                             encoding="utf-8")
+
+    exit_code, cache_statistics, output = _run_with_cache(capsys, cache_dir, str(doxygen_xml_folder),
+                                                          *cache_fast_option)
+    assert exit_code == 0, "Exit Code returns no success."
+    assert cache_statistics == "Cache: 1 hits, 1 misses."
+    assert "        member: print_headline" in output.split("\n")
+
+
+def test_tc_cache_max_size(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_cache
+    """
+    Test checks that the least recently used results are evicted if the cache exceeds its maximum size.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the cache.
+    """
+    record_property("lobster-trace", "SwTests.tc_cache")
+
+    result = ([], [("print_info", "x" * 1000)])
+
+    with CompoundCache(str(tmp_path), max_size=2500) as cache:
+        cache.put("first", result)
+        cache.put("second", result)
+
+    with CompoundCache(str(tmp_path), max_size=2500) as cache:
+        assert cache.get("first") == result
+        cache.put("third", result)
+
+    with CompoundCache(str(tmp_path), max_size=2500) as cache:
+        assert cache.get("first") == result
+        assert cache.get("second") is None
+        assert cache.get("third") == result
+
+
+def test_tc_cache_max_size_invalid_value(record_property) -> None:
+    # lobster-trace: SwTests.tc_cache
+    """
+    Test checks that the program exits with an argparse error if the maximum cache size is not positive.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_cache")
+
+    sys.argv = ["lobster-doxygen", "--cache-max-size", "0", TEST_XML_FOLDER]
+
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 2, "ExitCode not as expected."
+
+
+def test_tc_compact(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_compact
+    """
+    Test calls the program once with pretty printed and once with compact output and checks that
+    both LOBSTER common interchange format files contain the same data and that the compact file
+    has no indentation and only a final line break.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the pretty printed output file.
+    """
+    record_property("lobster-trace", "SwTests.tc_compact")
+
+    pretty_output_file = tmp_path / "output-pretty.json"
+
+    sys.argv = ["lobster-doxygen", "--output", str(pretty_output_file), TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code of pretty printed output returns no success."
+
+    sys.argv = ["lobster-doxygen", "--compact", "--output", TEST_LOBSTER_OUTPUT_FILE, TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code of compact output returns no success."
+
+    pretty_content = pretty_output_file.read_text(encoding="utf-8")
+    compact_content = Path(TEST_LOBSTER_OUTPUT_FILE).read_text(encoding="utf-8")
+
+    assert json.loads(compact_content) == json.loads(pretty_content), "Compact output contains different data."
+    assert compact_content == json.dumps(json.loads(pretty_content), separators=(",", ":")) + "\n"
+
+
+@pytest.mark.parametrize("compact_option", [[], ["--compact"]])
+def test_tc_gzip(record_property, tmp_path, compact_option) -> None:
+    # lobster-trace: SwTests.tc_gzip
+    """
+    Test calls the program once without and once with gzip compressed output and checks that the
+    decompressed LOBSTER common interchange format file is identical to the uncompressed one.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the uncompressed output file.
+        compact_option (list[str]): Additional option for compact output.
+    """
+    record_property("lobster-trace", "SwTests.tc_gzip")
+
+    uncompressed_output_file = tmp_path / "output-uncompressed.json"
+
+    sys.argv = ["lobster-doxygen", *compact_option, "--output", str(uncompressed_output_file),
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code of uncompressed output returns no success."
+
+    sys.argv = ["lobster-doxygen", *compact_option, "--gzip", "--output", TEST_LOBSTER_OUTPUT_FILE,
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code of compressed output returns no success."
+
+    compressed_content = Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes()
+
+    assert gzip.decompress(compressed_content) == uncompressed_output_file.read_bytes(), \
+        "Decompressed output differs from the uncompressed output."
+    assert len(compressed_content) < uncompressed_output_file.stat().st_size
+
+
+def test_tc_stats(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_stats
+    """
+    Test calls the program with statistics and checks that all conversion phases are printed and
+    written to the JSON file with the number of processed compounds and written items.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the statistics file.
+    """
+    record_property("lobster-trace", "SwTests.tc_stats")
+
+    stats_file = tmp_path / "stats.json"
+
+    sys.argv = ["lobster-doxygen", "--stats", "--stats-json", str(stats_file), "--output", TEST_LOBSTER_OUTPUT_FILE,
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code returns no success."
+
+    captured = capsys.readouterr()
+
+    # Verbose output of previous tests may precede the report.
+    output_lines = captured.out.splitlines()
+    assert "Statistics:" in output_lines
+    report_lines = output_lines[output_lines.index("Statistics:"):]
+
+    for phase in ["index", "compounds", "rule_check", "write", "total"]:
+        assert any(line.startswith(phase + " ") for line in report_lines), f"Phase {phase} is not reported."
+
+    assert "Slowest compound files:" in report_lines
+
+    with open(stats_file, "r", encoding="utf-8") as file:
+        stats = json.load(file)
+
+    with open(TEST_LOBSTER_OUTPUT_FILE, "r", encoding="utf-8") as file:
+        output = json.load(file)
+
+    assert stats["generator"] == "lobster-doxygen"
+    assert stats["phases"]["compounds"]["compounds"] == 35
+    assert stats["phases"]["write"]["items"] == len(output["data"])
+    assert stats["phases"]["write"]["bytes_written"] == Path(TEST_LOBSTER_OUTPUT_FILE).stat().st_size
+    assert stats["total"]["bytes_read"] > 0
+    assert len(stats["slowest_compounds"]) == 10
+
+
+@pytest.mark.parametrize("output_options", [[], ["--compact"], ["--gzip"]])
+def test_tc_incremental(record_property, tmp_path, output_options) -> None:
+    # lobster-trace: SwTests.tc_incremental
+    """
+    Test calls the program incrementally on a copy of the doxygen XML output and checks that the
+    output file is not written again if nothing changed and that it is identical to a full
+    conversion after a compound file changed.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the output files.
+        output_options (list[str]): Additional options for the output format.
+    """
+    record_property("lobster-trace", "SwTests.tc_incremental")
+
+    xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_LEVEL_XML_FOLDER, xml_folder)
+    incremental_output_file = tmp_path / "incremental" / "lobster.json"
+    full_output_file = tmp_path / "full" / "lobster.json"
+    incremental_output_file.parent.mkdir()
+    full_output_file.parent.mkdir()
+
+    def read_output(output_file: Path) -> bytes:
+        content = output_file.read_bytes()
+        return gzip.decompress(content) if "--gzip" in output_options else content
+
+    sys.argv = ["lobster-doxygen", *output_options, "--incremental", "--output", str(incremental_output_file),
+                str(xml_folder)]
+    assert main() == 0, "Exit Code of the first run returns no success."
+    assert Path(str(incremental_output_file) + ".manifest.json").is_file()
+
+    first_mtime = incremental_output_file.stat().st_mtime_ns
+    assert main() == 0, "Exit Code of the unchanged run returns no success."
+    assert incremental_output_file.stat().st_mtime_ns == first_mtime, "Unchanged output file was written again."
+
+    compound_file = xml_folder / "class_game.xml"
+    compound_file.write_text(
+        compound_file.read_text(encoding="utf-8").replace("sw_req_public_method", "sw_req_changed_method"),
+        encoding="utf-8"
+    )
+
+    assert main() == 0, "Exit Code of the changed run returns no success."
+
+    sys.argv = ["lobster-doxygen", *output_options, "--output", str(full_output_file), str(xml_folder)]
+    assert main() == 0, "Exit Code of the full run returns no success."
+
+    assert b"sw_req_changed_method" in read_output(incremental_output_file)
+    assert read_output(incremental_output_file) == read_output(full_output_file), \
+        "Incremental output differs from the full conversion."
+
+
+def test_tc_depfile(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_depfile
+    """
+    Test calls the program with a dependency file and checks that it lists the index.xml and all
+    compound files, which can result in a LOBSTER item, as dependencies of the output file.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the dependency file.
+    """
+    record_property("lobster-trace", "SwTests.tc_depfile")
+
+    depfile = tmp_path / "lobster.d"
+
+    sys.argv = ["lobster-doxygen", "--depfile", str(depfile), "--output", TEST_LOBSTER_OUTPUT_FILE,
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code returns no success."
+
+    lines = depfile.read_text(encoding="utf-8").splitlines()
+    dependencies = [line.strip(" \\") for line in lines[1:]]
+
+    assert lines[0] == TEST_LOBSTER_OUTPUT_FILE + ": \\"
+    assert dependencies[0] == TEST_LEVEL_XML_FOLDER + "/index.xml"
+    assert TEST_LEVEL_XML_FOLDER + "/class_game.xml" in dependencies
+    assert len(dependencies) == 1 + 35
+    assert all(os.path.isfile(dependency) for dependency in dependencies)
+
+
+def test_tc_skip_if_unchanged(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_skip_if_unchanged
+    """
+    Test calls the program twice with unchanged inputs and checks that the output file is not
+    written again, then changes the modification time of a compound file and checks that the
+    conversion is done again, as well as for another folder with the same content and for
+    another XML parser.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the output file.
+    """
+    record_property("lobster-trace", "SwTests.tc_skip_if_unchanged")
+
+    xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_LEVEL_XML_FOLDER, xml_folder)
+    output_file = tmp_path / "lobster.json"
+
+    sys.argv = ["lobster-doxygen", "--skip-if-unchanged", "--output", str(output_file), str(xml_folder)]
+    assert main() == 0, "Exit Code of the first run returns no success."
+    assert Path(str(output_file) + ".fingerprint.json").is_file()
+
+    first_mtime = output_file.stat().st_mtime_ns
+    assert main() == 0, "Exit Code of the unchanged run returns no success."
+    assert output_file.stat().st_mtime_ns == first_mtime, "Output file was written again."
+
+    compound_file = xml_folder / "class_game.xml"
+    os.utime(compound_file, ns=(compound_file.stat().st_atime_ns, compound_file.stat().st_mtime_ns + 1000000000))
+
+    assert main() == 0, "Exit Code of the changed run returns no success."
+    changed_mtime = output_file.stat().st_mtime_ns
+    assert changed_mtime != first_mtime, "Output file was not written again."
+
+    # Another folder with the same content must be converted, too.
+    other_xml_folder = tmp_path / "other_xml"
+    shutil.copytree(xml_folder, other_xml_folder)
+
+    sys.argv = ["lobster-doxygen", "--skip-if-unchanged", "--output", str(output_file), str(other_xml_folder)]
+    assert main() == 0, "Exit Code of the run with another folder returns no success."
+    other_mtime = output_file.stat().st_mtime_ns
+    assert other_mtime != changed_mtime, "Output file was not written for another folder."
+
+    sys.argv = [
+        "lobster-doxygen", "--skip-if-unchanged", "--parser", "iterparse",
+        "--output", str(output_file), str(other_xml_folder)
+    ]
+    assert main() == 0, "Exit Code of the run with another parser returns no success."
+    assert output_file.stat().st_mtime_ns != other_mtime, "Output file was not written for another parser."
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported.")
+def test_tc_server(record_property, tmp_path, monkeypatch) -> None:
+    # lobster-trace: SwTests.tc_server
+    """
+    Test lets the server convert twice on request of the client and checks that the second request
+    takes all compounds from the in-memory cache and that the output is identical to a direct run.
+    The conversions use the worker processes of the server and don't start their own ones.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the socket and the output files.
+        monkeypatch (Any): Used to detect worker processes, which are started for a conversion.
+    """
+    record_property("lobster-trace", "SwTests.tc_server")
+
+    socket_path = str(tmp_path / "server.sock")
+    server_output_file = tmp_path / "server.json"
+    argv = ["--verbose", "--jobs", "2", "--output", str(server_output_file), TEST_LEVEL_XML_FOLDER]
+
+    def create_worker_pool(jobs: int) -> None:
+        raise AssertionError(f"A conversion of the server starts {jobs} own worker processes.")
+
+    with Server(socket_path, jobs=2) as server:
+        assert server.worker_pool is not None
+        monkeypatch.setattr(doxygen_to_lobster_converter, "create_worker_pool", create_worker_pool)
+        monkeypatch.setattr(get_lobster_items_from_doxygen_xml_folder, "create_worker_pool", create_worker_pool)
+
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+
+        try:
+            first_response = send_request(socket_path, argv, os.getcwd())
+            second_response = send_request(socket_path, argv, os.getcwd())
+            invalid_response = send_request(socket_path, [], os.getcwd())
+        finally:
+            server.shutdown()
+            server_thread.join()
+            monkeypatch.undo()
+
+    assert not os.path.exists(socket_path), "Socket is not removed."
+
+    assert first_response["exit_code"] == 0
+    assert "Cache: 0 hits, 35 misses." in first_response["stdout"]
+    assert second_response["exit_code"] == 0
+    assert "Cache: 35 hits, 0 misses." in second_response["stdout"]
+    assert invalid_response["exit_code"] == 2
+    assert "usage: lobster-doxygen" in invalid_response["stderr"]
+
+    sys.argv = ["lobster-doxygen", "--output", TEST_LOBSTER_OUTPUT_FILE, TEST_LEVEL_XML_FOLDER]
+    assert main() == 0, "Exit Code of the direct run returns no success."
+
+    assert server_output_file.read_bytes() == Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes(), \
+        "Output of the server differs from the direct run."
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported.")
+def test_tc_server_socket(record_property, tmp_path, monkeypatch) -> None:
+    # lobster-trace: SwTests.tc_server
+    """
+    Test checks the default socket path, that the server creates its folder for the current user
+    only and refuses a folder, which other users may change, and that the client doesn't connect
+    to a socket of another user.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the socket folders.
+        monkeypatch (Any): Used to set the environment variables of the socket path.
+    """
+    record_property("lobster-trace", "SwTests.tc_server")
+
+    monkeypatch.delenv(SOCKET_ENV_VARIABLE, raising=False)
+    monkeypatch.setenv(RUNTIME_DIR_ENV_VARIABLE, str(tmp_path))
+    assert get_socket_path() == str(tmp_path / "lobster-doxygen.sock")
+
+    monkeypatch.delenv(RUNTIME_DIR_ENV_VARIABLE)
+    assert os.path.dirname(get_socket_path()) != tempfile.gettempdir()
+
+    monkeypatch.setenv(SOCKET_ENV_VARIABLE, str(tmp_path / "env.sock"))
+    assert get_socket_path() == str(tmp_path / "env.sock")
+
+    socket_path = tmp_path / "private" / "server.sock"
+
+    with Server(str(socket_path)):
+        assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o700
+
+    shared_folder = tmp_path / "shared"
+    shared_folder.mkdir()
+    shared_folder.chmod(0o777)
+
+    with pytest.raises(OSError):
+        Server(str(shared_folder / "server.sock"))
+
+    foreign_socket_path = tmp_path / "foreign.sock"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as foreign_socket:
+        foreign_socket.bind(str(foreign_socket_path))
+
+        if 0 == os.getuid():
+            os.chown(foreign_socket_path, 1, -1)
+
+            with pytest.raises(OSError, match="belongs to another user"):
+                send_request(str(foreign_socket_path), ["--version"], os.getcwd())
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported.")
+def test_tc_client_fallback(record_property, capsys, tmp_path, monkeypatch) -> None:
+    # lobster-trace: SwTests.tc_server
+    """
+    Test calls the client without server and checks that it converts itself. Then a server
+    receives the request and closes the connection without response. The test checks that the
+    client reports an error and doesn't convert itself, because the server may still write the
+    output file.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the socket and the output files.
+        monkeypatch (Any): Used to set the environment variable of the socket path.
+    """
+    record_property("lobster-trace", "SwTests.tc_server")
+
+    socket_path = tmp_path / "server.sock"
+    monkeypatch.setenv(SOCKET_ENV_VARIABLE, str(socket_path))
+
+    local_output_file = tmp_path / "local.json"
+    sys.argv = ["lobster-doxygen-client", "--output", str(local_output_file), TEST_LEVEL_XML_FOLDER]
+    assert client.main() == Ret.RET_OK, "Exit Code without server returns no success."
+    assert local_output_file.is_file(), "Output file without server is missing."
+
+    def close_without_response() -> None:
+        connection, _ = server_socket.accept()
+
+        with connection, connection.makefile("rb") as request_file:
+            request_file.readline()
+
+    server_output_file = tmp_path / "server.json"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+        server_socket.bind(str(socket_path))
+        server_socket.listen()
+        server_thread = threading.Thread(target=close_without_response)
+        server_thread.start()
+
+        try:
+            capsys.readouterr()
+            sys.argv = ["lobster-doxygen-client", "--output", str(server_output_file), TEST_LEVEL_XML_FOLDER]
+            exit_code = client.main()
+        finally:
+            server_thread.join()
+
+    assert exit_code == Ret.RET_ERROR, "Exit Code without response returns no error."
+    assert "The server closed the connection without response." in capsys.readouterr().err
+    assert server_output_file.exists() is False, "Client converted although the server got the request."
+
+
+def _break_compound_files(xml_folder: Path) -> None:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Break two compound files of the cpp-level-test project: one is truncated, so it can't be
+    parsed, and a member of the other one loses its location, so it can't be converted.
+
+    Args:
+        xml_folder (Path): The copied doxygen XML folder of the cpp-level-test project.
+    """
+    compound_file = xml_folder / "class_game.xml"
+    compound_file.write_bytes(compound_file.read_bytes()[:2000])
+
+    compound_file = xml_folder / "_function_prototype_8h.xml"
+    content = compound_file.read_text(encoding="utf-8")
+    location_start = content.index("<location ", content.index("<memberdef "))
+    location_end = content.index("/>", location_start) + len("/>")
+    compound_file.write_text(content[:location_start] + content[location_end:], encoding="utf-8")
+
+
+@pytest.mark.parametrize("options", [["--jobs", "1"], ["--jobs", "2"], ["--parser", "iterparse"]])
+def test_tc_keep_going(record_property, capsys, tmp_path, options) -> None:
+    # lobster-trace: SwTests.tc_keep_going
+    """
+    Test calls the program with two broken compound files and checks that the conversion is
+    aborted without --keep-going. With --keep-going the output file is written with the other
+    compound files, both broken files are reported and the exit code differs.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the output file.
+        options (list[str]): The options of the conversion.
+    """
+    record_property("lobster-trace", "SwTests.tc_keep_going")
+
+    xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_LEVEL_XML_FOLDER, xml_folder)
+    _break_compound_files(xml_folder)
+    output_file = tmp_path / "lobster.json"
+
+    sys.argv = ["lobster-doxygen", "--output", TEST_LOBSTER_OUTPUT_FILE, TEST_LEVEL_XML_FOLDER]
+    assert main() == Ret.RET_OK, "Exit Code of the unbroken run returns no success."
+
+    sys.argv = ["lobster-doxygen", *options, "--output", str(output_file), str(xml_folder)]
+    assert main() == Ret.RET_ERROR, "Exit Code of the run without --keep-going returns no error."
+    assert not output_file.exists(), "Output file is left behind."
+    assert "class_game.xml" in capsys.readouterr().err
+
+    sys.argv = ["lobster-doxygen", *options, "--keep-going", "--output", str(output_file), str(xml_folder)]
+    assert main() == Ret.RET_ERROR_PARTIAL_OUTPUT, "Exit Code of the run with --keep-going is wrong."
+
+    report = capsys.readouterr().out.splitlines()
+    assert report[0] == "2 compound files can't be converted:"
+    assert report[1].startswith(f"    {xml_folder}/class_game.xml (line ")
+    assert report[2].startswith(
+        f"    {xml_folder}/_function_prototype_8h.xml "
+        "(compounddef[@id='_function_prototype_8h']/sectiondef/memberdef[@id='_function_prototype_8h_1a"
+    )
+    assert report[2].endswith("AttributeError: 'NoneType' object has no attribute 'get_file'")
+
+    with open(TEST_LOBSTER_OUTPUT_FILE, "r", encoding="utf-8") as file:
+        expected_tags = [item["tag"] for item in json.load(file)["data"]]
+
+    with open(output_file, "r", encoding="utf-8") as file:
+        tags = [item["tag"] for item in json.load(file)["data"]]
+
+    assert tags == [
+        tag for tag in expected_tags
+        if not tag.startswith("cpp class_game") and not tag.startswith("cpp _function_prototype_8h")
+    ]
+
+
+def _merge_rule_projects(xml_folder: Path) -> None:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Merge the doxygen XML output of the rule projects into one folder, so
+    each project adds a rule violation.
+
+    Args:
+        xml_folder (Path): The folder of the merged doxygen XML output.
+    """
+    index = None
+
+    for project in TEST_RULE_PROJECTS:
+        project_xml_folder = Path(TEST_RULE_TESTS_FOLDER) / project / "out" / "xml"
+        project_index = ElementTree.parse(project_xml_folder / "index.xml")
+
+        if index is None:
+            shutil.copytree(project_xml_folder, xml_folder)
+            index = project_index
+        else:
+            refids = {compound.get("refid") for compound in index.getroot()}
+
+            for compound in project_index.getroot():
+                if compound.get("refid") not in refids:
+                    shutil.copy(project_xml_folder / f"{compound.get('refid')}.xml", xml_folder)
+                    index.getroot().append(compound)
+
+    index.write(xml_folder / "index.xml", encoding="UTF-8", xml_declaration=True)
+
+
+@pytest.mark.parametrize("options", [["--jobs", "1"], ["--jobs", "2"], ["--parser", "iterparse"]])
+def test_tc_rule_report(record_property, capsys, tmp_path, options) -> None:
+    # lobster-trace: SwTests.tc_rule_report
+    """
+    Test calls the program with the doxygen XML output of three projects, which violate
+    the rules, and checks that all violations are reported and no output file is written.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the output file.
+        options (list[str]): The options of the conversion.
+    """
+    record_property("lobster-trace", "SwTests.tc_rule_report")
+
+    xml_folder = tmp_path / "xml"
+    _merge_rule_projects(xml_folder)
+    output_file = tmp_path / "lobster.json"
+
+    sys.argv = ["lobster-doxygen", *options, "--output", str(output_file), str(xml_folder)]
+    assert main() == Ret.RET_ERROR, "Exit Code returns no error."
+    assert not output_file.exists(), "Output file is left behind."
+
+    stderr = capsys.readouterr().err
+    assert "3 rule violations:" in stderr
+    assert 1 == stderr.count("[file_level]")
+    assert 2 == stderr.count("[parent_and_child_level]")
+
+
+def test_tc_max_errors(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_max_errors
+    """
+    Test calls the program with the doxygen XML output of three projects, which violate
+    the rules, and checks that the conversion is aborted after the maximum number of errors.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the output file.
+    """
+    record_property("lobster-trace", "SwTests.tc_max_errors")
+
+    xml_folder = tmp_path / "xml"
+    _merge_rule_projects(xml_folder)
+    output_file = tmp_path / "lobster.json"
+
+    sys.argv = ["lobster-doxygen", "--max-errors", "2", "--output", str(output_file), str(xml_folder)]
+    assert main() == Ret.RET_ERROR, "Exit Code returns no error."
+    assert not output_file.exists(), "Output file is left behind."
+
+    stderr = capsys.readouterr().err
+    assert "2 rule violations:" in stderr
+    assert 2 == stderr.count("_level]")
+
+    sys.argv = ["lobster-doxygen", "--max-errors", "0", str(xml_folder)]
+
+    with pytest.raises(SystemExit):
+        main()
+
+
+def test_tc_report_json(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_report_json
+    """
+    Test calls the program with rule violations and with broken compound files and checks
+    that the JSON report contains the rule violations and the compound files, which can't
+    be converted.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the doxygen XML output and the report file.
+    """
+    record_property("lobster-trace", "SwTests.tc_report_json")
+
+    xml_folder = tmp_path / "rule"
+    _merge_rule_projects(xml_folder)
+    report_file = tmp_path / "report.json"
+
+    sys.argv = ["lobster-doxygen", "--report-json", str(report_file), "--output", TEST_LOBSTER_OUTPUT_FILE,
+                str(xml_folder)]
+    assert main() == Ret.RET_ERROR, "Exit Code returns no error."
+
+    with open(report_file, "r", encoding="utf-8") as file:
+        report = json.load(file)
+
+    assert report["generator"] == "lobster-doxygen"
+    assert report["version"] == __version__
+    assert report["compound_errors"] == []
+    assert [violation["rule"] for violation in report["rule_violations"]] == [
+        "file_level", "parent_and_child_level", "parent_and_child_level"
+    ]
+    assert report["rule_violations"][0]["file_name"] == "src/FileRequirement.h"
+    assert report["rule_violations"][0]["line"] is None
+    assert report["rule_violations"][1]["tag"] == "cpp class_counter"
+
+    xml_folder = tmp_path / "broken"
+    shutil.copytree(TEST_LEVEL_XML_FOLDER, xml_folder)
+    _break_compound_files(xml_folder)
+
+    sys.argv = ["lobster-doxygen", "--keep-going", "--report-json", str(report_file), "--output",
+                TEST_LOBSTER_OUTPUT_FILE, str(xml_folder)]
+    assert main() == Ret.RET_ERROR_PARTIAL_OUTPUT, "Exit Code of the run with --keep-going is wrong."
+
+    with open(report_file, "r", encoding="utf-8") as file:
+        report = json.load(file)
+
+    assert report["rule_violations"] == []
+    assert [Path(compound_error["path"]).name for compound_error in report["compound_errors"]] == [
+        "class_game.xml", "_function_prototype_8h.xml"
+    ]
+    assert report["compound_errors"][0]["element_path"].startswith("line ")
+    assert report["compound_errors"][1]["exception"] == "AttributeError"
+
+
+def _read_lobster_items(lobster_file: str) -> list[dict]:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Read the lobster items of a LOBSTER common interchange format file.
+
+    Args:
+        lobster_file (str): Path and file name of the LOBSTER common interchange format file.
+
+    Returns:
+        list[dict]: The lobster items.
+    """
+    with open(lobster_file, "r", encoding="utf-8") as file:
+        return json.load(file)["data"]
+
+
+@pytest.mark.parametrize("options", [["--jobs", "1"], ["--jobs", "2"]])
+def test_tc_multi_folder(record_property, capsys, tmp_path, options) -> None:
+    # lobster-trace: SwTests.tc_multi_folder
+    """
+    Test calls the program with two doxygen XML folders, given as positional arguments and in a
+    folder list file, and checks that the merged output file and the output files per folder
+    contain the same lobster items as the runs of the single folders. Two folders with the
+    same tags are reported and no output file is written.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the folder list and the output files.
+        options (list[str]): The options of the conversion.
+    """
+    record_property("lobster-trace", "SwTests.tc_multi_folder")
+
+    expected_items = []
+
+    for index, doxygen_xml_folder in enumerate([TEST_LEVEL_XML_FOLDER, TEST_NO_TRACE_XML_FOLDER]):
+        output_file = str(tmp_path / f"single_{index}.json")
+        sys.argv = ["lobster-doxygen", "--output", output_file, doxygen_xml_folder]
+        assert main() == Ret.RET_OK, "Exit Code of the single folder returns no success."
+        expected_items.append(_read_lobster_items(output_file))
+
+    merged_output_file = tmp_path / "merged.json"
+    sys.argv = ["lobster-doxygen", *options, "--output", str(merged_output_file),
+                TEST_LEVEL_XML_FOLDER, TEST_NO_TRACE_XML_FOLDER]
+    assert main() == Ret.RET_OK, "Exit Code of the merged output returns no success."
+    assert _read_lobster_items(str(merged_output_file)) == expected_items[0] + expected_items[1]
+
+    # The relative paths of the folder list are relative to the folder list file.
+    folder_list_file = tmp_path / "folders.txt"
+    folder_list_file.write_text(
+        "# Components\n"
+        f"{os.path.relpath(TEST_LEVEL_XML_FOLDER, tmp_path)}\n"
+        "\n"
+        f"{os.path.relpath(TEST_NO_TRACE_XML_FOLDER, tmp_path)}\n",
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "out"
+    depfile = tmp_path / "lobster.d"
+    sys.argv = ["lobster-doxygen", *options, "--folder-list", str(folder_list_file), "--output-dir", str(output_dir),
+                "--depfile", str(depfile)]
+    assert main() == Ret.RET_OK, "Exit Code of the output files per folder returns no success."
+    assert _read_lobster_items(str(output_dir / "cpp-level-test_out_xml.json")) == expected_items[0]
+    assert _read_lobster_items(str(output_dir / "cpp-no-trace_out_xml.json")) == expected_items[1]
+    assert depfile.read_text(encoding="utf-8").startswith(
+        f"{output_dir / 'cpp-level-test_out_xml.json'} {output_dir / 'cpp-no-trace_out_xml.json'}:"
+    )
+    capsys.readouterr()
+
+    sys.argv = ["lobster-doxygen", *options, "--output", str(merged_output_file), TEST_XML_FOLDER,
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == Ret.RET_ERROR, "Exit Code of the folders with the same tags returns no error."
+    assert not merged_output_file.exists(), "Output file is left behind."
+    assert "[unique_tag]" in capsys.readouterr().err
+
+
+def _write_lobster_config(config_file: Path, requirements_file: Path, implementation_file: Path | None) -> None:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Write a lobster configuration with a requirements level and an implementation level.
+
+    Args:
+        config_file (Path): Path and file name of the lobster configuration.
+        requirements_file (Path): The source file of the requirements level.
+        implementation_file (Path | None): The source file of the implementation level, None for no source.
+    """
+    implementation_source = "" if implementation_file is None else f'    source: "{implementation_file}";\n'
+    config_file.write_text(
+        f'requirements "Requirements" {{\n    source: "{requirements_file}";\n}}\n\n'
+        f'implementation "Code" {{\n{implementation_source}    trace to: "Requirements";\n}}\n',
+        encoding="utf-8",
+    )
+
+
+def test_tc_lobster_report(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_lobster_report
+    """
+    Test creates the lobster report in the same process, with the command line argument
+    --lobster-config and with the Python API, and checks that it is the same as the report
+    of lobster-report for the output file. A missing requirement is reported in the report.
+    The options of the output file aren't allowed with --lobster-config.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Temporary directory for the lobster files.
+    """
+    record_property("lobster-trace", "SwTests.tc_lobster_report")
+
+    output_file = tmp_path / "lobster.json"
+    sys.argv = ["lobster-doxygen", "--output", str(output_file), TEST_LEVEL_XML_FOLDER]
+    assert main() == Ret.RET_OK, "Exit Code of the output file returns no success."
+
+    # All requirements except one are defined.
+    refs = sorted({ref for item in _read_lobster_items(str(output_file)) for ref in item["refs"]})
+    requirements = [
+        {
+            "tag": ref, "location": {"kind": "file", "file": "requirements.trlc", "line": line, "column": None},
+            "name": ref.split(" ", 1)[1], "messages": [], "just_up": [], "just_down": [], "just_global": [],
+            "framework": "TRLC", "kind": "requirement", "text": None, "status": None
+        }
+        for line, ref in enumerate(refs[1:], start=1)
+    ]
+    requirements_file = tmp_path / "requirements.lobster"
+    requirements_file.write_text(
+        json.dumps({"data": requirements, "generator": "test", "schema": "lobster-req-trace", "version": 4}),
+        encoding="utf-8",
+    )
+
+    file_config = tmp_path / "file.conf"
+    _write_lobster_config(file_config, requirements_file, output_file)
+    lobster_report(str(file_config), str(tmp_path / "file.lobster"))
+
+    with open(tmp_path / "file.lobster", "r", encoding="utf-8") as file:
+        expected_levels = json.load(file)["levels"]
+
+    config = tmp_path / "lobster.conf"
+    _write_lobster_config(config, requirements_file, None)
+    report_file = tmp_path / "report.lobster"
+    sys.argv = ["lobster-doxygen", "--lobster-config", str(config), "--lobster-report", str(report_file),
+                TEST_LEVEL_XML_FOLDER]
+    assert main() == Ret.RET_OK, "Exit Code of the lobster report returns no success."
+
+    with open(report_file, "r", encoding="utf-8") as file:
+        assert json.load(file)["levels"] == expected_levels
+
+    report = lobster_doxygen.create_lobster_report(TEST_LEVEL_XML_FOLDER, str(config), level="Code", jobs=1)
+    assert report.coverage["Code"].items == len(expected_levels[1]["items"])
+    assert report.coverage["Code"].ok < report.coverage["Code"].items, "The missing requirement isn't reported."
+    capsys.readouterr()
+
+    sys.argv = ["lobster-doxygen", "--lobster-config", str(config), "--incremental", TEST_LEVEL_XML_FOLDER]
+
+    with pytest.raises(SystemExit) as pytest_wrapped_e:
+        main()
+
+    assert pytest_wrapped_e.value.code == 2
+    assert "not allowed with argument --incremental" in capsys.readouterr().err
+
+
 # Main *************************************************************************
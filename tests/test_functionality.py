@@ -22,11 +22,19 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 # Imports **********************************************************************
 
 import sys
+import shutil
+import pickle
 from pathlib import Path
+import io
 import json
 import pytest
 
+import lobster_doxygen
 from lobster_doxygen.__main__ import main
+from lobster_doxygen.conversion_error import ConversionError
+from lobster_doxygen.lobster_item import LobsterItem
+from lobster_doxygen.lobster_kind import LobsterKind
+from lobster_doxygen.write_lobster_common_interchange_format_file import write_lobster_common_interchange_format_file
 
 # Variables ********************************************************************
 
@@ -100,6 +108,34 @@ EMPTY_FOLDER = "./tests/utils/empty_folder"
 # source code and the generated doxygen XML code does not cause an error.
 TEST_NO_TRACE_XML_FOLDER = "./tests/utils/cpp-no-trace/out/xml"
 
+# All directories with Doxygen XML files, which are converted successfully.
+TEST_VALID_XML_FOLDERS = [
+    TEST_XML_FOLDER,
+    TEST_LEVEL_XML_FOLDER,
+    TEST_UNSPECIFIED_XML_FOLDER,
+    TEST_BAD_COMMENT_XML_FOLDER,
+    TEST_INVALID_XML_FOLDER,
+    TEST_NO_TRACE_XML_FOLDER,
+]
+
+# LOBSTER output file created with the iterparse XML parser, which is created and deleted for tests.
+TEST_LOBSTER_ITERPARSE_OUTPUT_FILE = "./tests/utils/output-test-iterparse.json"
+
+# LOBSTER output file created from the xrefitem pages, which is created and deleted for tests.
+TEST_LOBSTER_XREFITEM_OUTPUT_FILE = "./tests/utils/output-test-xrefitem.json"
+
+# All directories with Doxygen XML files, which violate the rules.
+TEST_RULE_VIOLATION_XML_FOLDERS = [
+    TEST_RULE_FILE_REQUIREMENT_XML_FOLDER,
+    TEST_RULE_FILE_JUSTIFICATION_XML_FOLDER,
+    TEST_RULE_CLASS_AND_METHOD_REQUIREMENTS_XML_FOLDER,
+    TEST_RULE_CLASS_AND_METHOD_JUSTIFICATIONS_XML_FOLDER,
+    TEST_RULE_CLASS_AND_INTERFACE_REQUIREMENTS_XML_FOLDER,
+    TEST_RULE_CLASS_AND_INTERFACE_JUSTIFICATIONS_XML_FOLDER,
+    TEST_RULE_NAMESPACE_AND_FUNCTION_REQUIREMENTS_XML_FOLDER,
+    TEST_RULE_NAMESPACE_AND_FUNCTION_JUSTIFICATIONS_XML_FOLDER,
+]
+
 # Expected data in LOBSTER file for TEST_XML_FOLDER.
 EXPECTED_LOBSTER_INTERCHANGE_FILE_CONTENT = [
     "{",
@@ -171,12 +207,27 @@ def _setup_and_teardown():
     # lobster-exclude: This is a simple helper function that prepares and cleanup the tests.
     """Before running the test, delete the LOBSTER file if it exists."""
     # Preparation:
-    if Path(TEST_LOBSTER_OUTPUT_FILE).exists() and Path(TEST_LOBSTER_OUTPUT_FILE).is_file():
-        Path(TEST_LOBSTER_OUTPUT_FILE).unlink()
+    for output_file in [TEST_LOBSTER_OUTPUT_FILE, TEST_LOBSTER_ITERPARSE_OUTPUT_FILE, TEST_LOBSTER_XREFITEM_OUTPUT_FILE]:
+        if Path(output_file).exists() and Path(output_file).is_file():
+            Path(output_file).unlink()
     yield
     # Teardown:
 
 
+def _get_conversion_output(stdout: str) -> str:
+    # lobster-exclude: This is a simple helper function for the tests.
+    """Get the verbose output of the conversion without the program arguments, which
+    differ between the compared program calls.
+
+    Args:
+        stdout (str): The captured standard output of a verbose program call.
+
+    Returns:
+        str: The standard output after the program arguments.
+    """
+    return stdout.split("\n\n\n", 1)[1]
+
+
 def _get_data_items_from_lobster_file() -> dict:
     # lobster-exclude: Helper function for all tests in module.
     """
@@ -256,6 +307,78 @@ def test_tc_output_file_format_program_with_directory_with_no_index_file(record_
     assert f"{EMPTY_FOLDER}" in error_output
 
 
+def test_tc_output_file_format_escaped_strings(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_output_file_format
+    """
+    The test case writes a lobster item with quotes, backslashes, control and non-ASCII characters
+    in its name, justification and requirement. It checks that the written file is valid JSON and
+    that the strings are unchanged.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the output file.
+    """
+    record_property("lobster-trace", "SwTests.tc_output_file_format")
+
+    output_file = tmp_path / "output.json"
+    lobster_item = LobsterItem("item_id")
+    lobster_item.kind = LobsterKind.FUNCTION
+    lobster_item.name = 'operator"" _km'
+    lobster_item.file_name = "src\\units.cpp"
+    lobster_item.just_up = ['Uses "C:\\temp"\tfor the größe.']
+    lobster_item.refs = ["SwRequirements.sw_req_\u00e4"]
+
+    write_lobster_common_interchange_format_file([lobster_item], str(output_file))
+
+    with open(output_file, "r", encoding="utf-8") as lobster_file:
+        lobster_file_content = json.load(lobster_file)
+
+    assert lobster_file_content["data"][0]["name"] == lobster_item.name
+    assert lobster_file_content["data"][0]["location"]["file"] == lobster_item.file_name
+    assert lobster_file_content["data"][0]["just_up"] == lobster_item.just_up
+    assert lobster_file_content["data"][0]["refs"] == ["req SwRequirements.sw_req_\u00e4"]
+
+
+def test_tc_output_file_format_shared_values(record_property) -> None:
+    # lobster-trace: SwTests.tc_output_file_format
+    """
+    The test case checks that lobster items without references, justifications and children don't
+    keep empty lists, that the lists of each item can be modified, that file names are interned and
+    that both survive pickling, which is used by the worker processes and the cache.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_output_file_format")
+
+    lobster_items = [LobsterItem(f"item_{idx}") for idx in range(2)]
+
+    for lobster_item in lobster_items:
+        lobster_item.file_name = "".join(["src/", "units.cpp"])
+        lobster_item.language = "C++"
+        lobster_item.refs = []
+
+    lobster_items[1].just_up = ["Justification"]
+    lobster_items[1].append_lobster_child(LobsterItem("child"))
+
+    for items in [lobster_items, pickle.loads(pickle.dumps(lobster_items))]:
+        assert items[0].__getstate__()[5:10:4] == (None, None)
+        assert items[0].file_name is items[1].file_name
+        assert items[1].just_up == ["Justification"]
+        assert items[1].get_children()[0].item_id == "child"
+        assert items[0].get_tag() == "cpp item_0"
+
+        items[0].refs.append("SwRequirements.sw_req")
+        items[0].children += [LobsterItem("other_child")]
+
+        assert items[0].refs == ["SwRequirements.sw_req"]
+        assert items[0].has_children() is True
+        assert items[1].refs == []
+        assert [child.item_id for child in items[1].children] == ["child"]
+
+    assert LobsterItem("item").get_tag() == "unknown  item"
+
+
 def test_tc_function_level(record_property) -> None:
     # lobster-trace: SwTests.tc_function_level
     """
@@ -789,5 +912,531 @@ def test_tc_invalid_input(record_property, capsys) -> None:
     assert exit_code == 0, "Exit Code returns no success."
 
 
+def test_tc_skip_compounds(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_skip_compounds
+    """
+    This test case copies the doxygen XML folder and makes the compound files of the page and the
+    dir compound invalid. The test verifies that the program doesn't open them, because their kind
+    in the index.xml can't result in a LOBSTER item, and that the skipped files are reported.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture the output of the program.
+        tmp_path (Path): Temporary directory for the copied doxygen XML folder.
+    """
+    record_property("lobster-trace", "SwTests.tc_skip_compounds")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+    (doxygen_xml_folder / "implements.xml").write_text("invalid", encoding="utf-8")
+    (doxygen_xml_folder / "dir_68267d1309a1af8e8297ef4c3efbcdba.xml").unlink()
+
+    sys.argv = ["lobster-doxygen", "-v", "--output", TEST_LOBSTER_OUTPUT_FILE, str(doxygen_xml_folder)]
+
+    exit_code = main()
+
+    captured = capsys.readouterr()
+
+    assert exit_code == 0, "Exit Code returns no success."
+    assert captured.err == "", f"Program exit with error: {captured.err}"
+    assert "Skipped 2 of 4 compound files (7 bytes)." in captured.out.split("\n")
+
+    with open(TEST_LOBSTER_OUTPUT_FILE, "r", encoding="utf-8") as lobster_file:
+        lobster_file_content = [line.strip("\n") for line in lobster_file.readlines()]
+
+    assert lobster_file_content == EXPECTED_LOBSTER_INTERCHANGE_FILE_CONTENT
+
+
+@pytest.mark.parametrize("options", [[], ["--parser", "iterparse"], ["--jobs", "2"]])
+def test_tc_duplicate_members(record_property, capsys, tmp_path, options) -> None:
+    # lobster-trace: SwTests.tc_duplicate_members
+    """
+    This test case adds the functions of the file compound to the group compound of a copied doxygen
+    XML folder, like doxygen does for grouped functions. The test verifies that the functions are
+    only written once and that the skipped duplicates are reported in verbose mode.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture the output of the program.
+        tmp_path (Path): Temporary directory for the copied doxygen XML folder.
+        options (list[str]): Additional program arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_duplicate_members")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+
+    file_compound = (doxygen_xml_folder / "main_8cpp.xml").read_text(encoding="utf-8")
+    sectiondef = file_compound[file_compound.index("    <sectiondef"):file_compound.index("</sectiondef>") + 14]
+    group_file = doxygen_xml_folder / "group__main__group.xml"
+    group_file.write_text(group_file.read_text(encoding="utf-8").replace("  </compounddef>", sectiondef + "  </compounddef>"),
+                          encoding="utf-8")
+
+    index = (doxygen_xml_folder / "index.xml").read_text(encoding="utf-8")
+    members = index[index.index("    <member"):index.index("  </compound>")]
+    index_file = doxygen_xml_folder / "index.xml"
+    index_file.write_text(index.replace('<name>main_group</name>\n', '<name>main_group</name>\n' + members),
+                          encoding="utf-8")
+
+    sys.argv = ["lobster-doxygen", "-v", *options, "--output", TEST_LOBSTER_OUTPUT_FILE, str(doxygen_xml_folder)]
+
+    exit_code = main()
+
+    captured = capsys.readouterr()
+
+    assert exit_code == 0, "Exit Code returns no success."
+    assert captured.err == "", f"Program exit with error: {captured.err}"
+    assert "Skipped 2 duplicate members." in captured.out.split("\n")
+    assert 2 == captured.out.split("\n").count("            kind: function (duplicate)")
+
+    with open(TEST_LOBSTER_OUTPUT_FILE, "r", encoding="utf-8") as lobster_file:
+        lobster_file_content = [line.strip("\n") for line in lobster_file.readlines()]
+
+    assert lobster_file_content == EXPECTED_LOBSTER_INTERCHANGE_FILE_CONTENT
+
+
+@pytest.mark.parametrize("options", [[], ["--parser", "iterparse"], ["--jobs", "2"]])
+def test_tc_duplicate_member_rule(record_property, capsys, tmp_path, options) -> None:
+    # lobster-trace: SwTests.tc_duplicate_member_rule
+    """
+    This test case adds the functions of the file compound to a group compound with requirements,
+    like doxygen does for grouped functions. The test verifies that the group is checked for its
+    function with requirements, although the function is only written with its file.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture the output of the program.
+        tmp_path (Path): Temporary directory for the copied doxygen XML folder.
+        options (list[str]): Additional program arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_duplicate_member_rule")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+
+    file_compound = (doxygen_xml_folder / "main_8cpp.xml").read_text(encoding="utf-8")
+    sectiondef = file_compound[file_compound.index("    <sectiondef"):file_compound.index("</sectiondef>") + 14]
+    requirement = (
+        '<para><xrefsect id="implements_1_implements000002"><xreftitle>Implements</xreftitle>'
+        "<xrefdescription><para>Requirement: SwRequirements.sw_req_group </para>\n"
+        "</xrefdescription></xrefsect></para>\n"
+    )
+    group_file = doxygen_xml_folder / "group__main__group.xml"
+    group_file.write_text(group_file.read_text(encoding="utf-8")
+                          .replace("    <detaileddescription>\n", "    <detaileddescription>\n" + requirement)
+                          .replace("  </compounddef>", sectiondef + "  </compounddef>"),
+                          encoding="utf-8")
+
+    index = (doxygen_xml_folder / "index.xml").read_text(encoding="utf-8")
+    members = index[index.index("    <member"):index.index("  </compound>")]
+    index_file = doxygen_xml_folder / "index.xml"
+    index_file.write_text(index.replace('<name>main_group</name>\n', '<name>main_group</name>\n' + members),
+                          encoding="utf-8")
+
+    sys.argv = ["lobster-doxygen", *options, "--output", TEST_LOBSTER_OUTPUT_FILE, str(doxygen_xml_folder)]
+
+    exit_code = main()
+
+    captured = capsys.readouterr()
+
+    assert exit_code != 0, "Exit Code returns success despite the rule violation."
+    assert "The Group 'main_group' has child item 'print_title' with requirements." in captured.err
+    assert 1 == captured.err.count("has child item"), "The rule violation isn't reported once."
+
+
+@pytest.mark.parametrize("doxygen_xml_folder", TEST_VALID_XML_FOLDERS)
+def test_tc_parser(record_property, capsys, doxygen_xml_folder) -> None:
+    # lobster-trace: SwTests.tc_parser
+    """
+    This test case converts the doxygen XML folder once with the doxmlparser and once with the
+    iterparse XML parser and checks that the LOBSTER common interchange format files and the
+    console output are identical.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture the output of the program.
+        doxygen_xml_folder (str): The doxygen XML folder to convert.
+    """
+    record_property("lobster-trace", "SwTests.tc_parser")
+
+    sys.argv = ["lobster-doxygen", "-v", "--parser", "doxmlparser", "--output",
+                TEST_LOBSTER_OUTPUT_FILE, doxygen_xml_folder]
+    exit_code_doxmlparser = main()
+    captured_doxmlparser = capsys.readouterr()
+
+    sys.argv = ["lobster-doxygen", "-v", "--parser", "iterparse", "--output",
+                TEST_LOBSTER_ITERPARSE_OUTPUT_FILE, doxygen_xml_folder]
+    exit_code_iterparse = main()
+    captured_iterparse = capsys.readouterr()
+
+    assert exit_code_doxmlparser == 0, "Exit Code with doxmlparser returns no success."
+    assert exit_code_iterparse == 0, "Exit Code with iterparse returns no success."
+    assert Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes() == Path(TEST_LOBSTER_ITERPARSE_OUTPUT_FILE).read_bytes(), \
+        "Output file of iterparse XML parser differs from doxmlparser."
+
+    # The program arguments differ, but the conversion output shall be identical.
+    assert _get_conversion_output(captured_doxmlparser.out) == _get_conversion_output(captured_iterparse.out), \
+        "Standard output of iterparse XML parser differs from doxmlparser."
+    assert captured_doxmlparser.err == captured_iterparse.err, \
+        "Error output of iterparse XML parser differs from doxmlparser."
+
+
+@pytest.mark.parametrize("doxygen_xml_folder", [
+    TEST_RULE_FILE_REQUIREMENT_XML_FOLDER,
+    TEST_RULE_CLASS_AND_METHOD_REQUIREMENTS_XML_FOLDER,
+    TEST_RULE_NAMESPACE_AND_FUNCTION_JUSTIFICATIONS_XML_FOLDER,
+])
+def test_tc_parser_rule_violation(record_property, doxygen_xml_folder) -> None:
+    # lobster-trace: SwTests.tc_parser
+    """
+    This test case converts doxygen XML folders which violate the rules with the iterparse XML
+    parser and ensures that the program aborts with a no success exit code.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        doxygen_xml_folder (str): The doxygen XML folder to convert.
+    """
+    record_property("lobster-trace", "SwTests.tc_parser")
+
+    sys.argv = ["lobster-doxygen", "--parser", "iterparse", "--output",
+                TEST_LOBSTER_OUTPUT_FILE, doxygen_xml_folder]
+
+    exit_code = main()
+
+    assert exit_code != 0, "Exit Code returns success."
+
+
+@pytest.mark.parametrize("trace_source", ["xrefitem", "verify"])
+@pytest.mark.parametrize("doxygen_xml_folder", TEST_VALID_XML_FOLDERS + TEST_RULE_VIOLATION_XML_FOLDERS)
+def test_tc_trace_source(record_property, capsys, doxygen_xml_folder, trace_source) -> None:
+    # lobster-trace: SwTests.tc_trace_source
+    """
+    This test case converts the doxygen XML folder once with the requirements and justifications
+    from the detaileddescriptions and once from the xrefitem pages, respectively verified against
+    them. It checks that the exit codes, the error output and the LOBSTER common interchange format
+    files are identical.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture the output of the program.
+        doxygen_xml_folder (str): The doxygen XML folder to convert.
+        trace_source (str): The trace source to compare with the detaileddescriptions.
+    """
+    record_property("lobster-trace", "SwTests.tc_trace_source")
+
+    sys.argv = ["lobster-doxygen", "-v", "--output", TEST_LOBSTER_OUTPUT_FILE, doxygen_xml_folder]
+    exit_code_description = main()
+    captured_description = capsys.readouterr()
+
+    sys.argv = ["lobster-doxygen", "-v", "--trace-source", trace_source, "--output",
+                TEST_LOBSTER_XREFITEM_OUTPUT_FILE, doxygen_xml_folder]
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == exit_code_description, "Exit Code differs from the detaileddescriptions."
+    assert captured.err == captured_description.err, "Error output differs from the detaileddescriptions."
+
+    if exit_code_description == 0:
+        assert Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes() == Path(TEST_LOBSTER_XREFITEM_OUTPUT_FILE).read_bytes(), \
+            "Output file differs from the detaileddescriptions."
+
+
+def test_tc_trace_source_mismatch(record_property, capsys, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_trace_source
+    """
+    This test case changes the requirement on the xrefitem page of a copied doxygen XML folder.
+    The test verifies that the requirement of the xrefitem page is used with the xrefitem trace
+    source and that the verify trace source aborts with an error.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture the output of the program.
+        tmp_path (Path): Temporary directory for the copied doxygen XML folder.
+    """
+    record_property("lobster-trace", "SwTests.tc_trace_source")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+    page_file = doxygen_xml_folder / "implements.xml"
+    page_file.write_text(page_file.read_text(encoding="utf-8").replace("sw_req_text_output", "sw_req_other"),
+                         encoding="utf-8")
+
+    sys.argv = ["lobster-doxygen", "--trace-source", "xrefitem", "--output", TEST_LOBSTER_OUTPUT_FILE,
+                str(doxygen_xml_folder)]
+    assert main() == 0, "Exit Code with xrefitem trace source returns no success."
+
+    with open(TEST_LOBSTER_OUTPUT_FILE, "r", encoding="utf-8") as lobster_file:
+        lobster_file_content = json.load(lobster_file)
+
+    assert lobster_file_content["data"][0]["refs"] == ["req SwRequirements.sw_req_other"]
+
+    sys.argv = ["lobster-doxygen", "--trace-source", "verify", "--output", TEST_LOBSTER_OUTPUT_FILE,
+                str(doxygen_xml_folder)]
+    capsys.readouterr()
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code != 0, "Exit Code with verify trace source returns success."
+    assert "The Function 'print_title' has different requirements or justifications" in captured.err
+
+
+@pytest.mark.parametrize("trace_source", ["xrefitem", "verify"])
+def test_tc_trace_source_shared_anchor(record_property, tmp_path, trace_source) -> None:
+    # lobster-trace: SwTests.tc_trace_source
+    """
+    This test case adds a copy of a file compound with a static function to a copied doxygen XML
+    folder. The functions of both files have the same anchor in their id, but only the original one
+    has a requirement. The test verifies that the copy is neither traced from the xrefitem page
+    nor reported in verify mode.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the copied doxygen XML folder.
+        trace_source (str): The trace source to compare with the detaileddescriptions.
+    """
+    record_property("lobster-trace", "SwTests.tc_trace_source")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_LEVEL_XML_FOLDER, doxygen_xml_folder)
+    compound = (doxygen_xml_folder / "_outside_group_8cpp.xml").read_text(encoding="utf-8")
+    compound = compound.replace("_outside_group_8cpp", "_outside_group_copy_8cpp")
+    compound = compound.replace("OutsideGroup.cpp", "OutsideGroupCopy.cpp")
+    compound = compound[:compound.index("<para><xrefsect")] + compound[compound.index("</xrefsect></para>") + 18:]
+    (doxygen_xml_folder / "_outside_group_copy_8cpp.xml").write_text(compound, encoding="utf-8")
+
+    index_file = doxygen_xml_folder / "index.xml"
+    index = index_file.read_text(encoding="utf-8")
+    entry = index[index.index('  <compound refid="_outside_group_8cpp"'):]
+    entry = entry[:entry.index("</compound>") + 12]
+    index_file.write_text(
+        index.replace(entry, entry + entry.replace("_outside_group_8cpp", "_outside_group_copy_8cpp")
+                      .replace("OutsideGroup.cpp", "OutsideGroupCopy.cpp")),
+        encoding="utf-8"
+    )
+
+    sys.argv = ["lobster-doxygen", "--output", TEST_LOBSTER_OUTPUT_FILE, str(doxygen_xml_folder)]
+    assert main() == 0, "Exit Code returns no success."
+
+    sys.argv = ["lobster-doxygen", "--trace-source", trace_source, "--output", TEST_LOBSTER_XREFITEM_OUTPUT_FILE,
+                str(doxygen_xml_folder)]
+    assert main() == 0, "Exit Code returns no success."
+
+    assert Path(TEST_LOBSTER_OUTPUT_FILE).read_bytes() == Path(TEST_LOBSTER_XREFITEM_OUTPUT_FILE).read_bytes(), \
+        "Output file differs from the detaileddescriptions."
+
+    with open(TEST_LOBSTER_XREFITEM_OUTPUT_FILE, "r", encoding="utf-8") as lobster_file:
+        refs = {item["tag"]: item["refs"] for item in json.load(lobster_file)["data"]}
+
+    assert refs["cpp _outside_group_8cpp_1a71fe1b5269d8506f03b66bf7f54b3068"] == \
+        ["req SwRequirements.sw_req_no_group_function"]
+    assert refs["cpp _outside_group_copy_8cpp_1a71fe1b5269d8506f03b66bf7f54b3068"] == []
+
+
+def test_tc_trace_source_outdated_page(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_trace_source
+    """
+    This test case adds a xrefitem page file, which is not listed in the index, to a copied doxygen
+    XML folder, like an outdated file of a previous doxygen run. The test verifies that it is ignored.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the copied doxygen XML folder.
+    """
+    record_property("lobster-trace", "SwTests.tc_trace_source")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+    page = (doxygen_xml_folder / "implements.xml").read_text(encoding="utf-8")
+    (doxygen_xml_folder / "justified.xml").write_text(
+        page.replace("Requirement: SwRequirements.sw_req_text_output", "Justification: Outdated"), encoding="utf-8"
+    )
+
+    sys.argv = ["lobster-doxygen", "--trace-source", "verify", "--output", TEST_LOBSTER_OUTPUT_FILE,
+                str(doxygen_xml_folder)]
+    assert main() == 0, "Exit Code returns no success."
+
+    with open(TEST_LOBSTER_OUTPUT_FILE, "r", encoding="utf-8") as lobster_file:
+        lobster_file_content = [line.strip("\n") for line in lobster_file.readlines()]
+
+    assert lobster_file_content == EXPECTED_LOBSTER_INTERCHANGE_FILE_CONTENT
+
+
+@pytest.mark.parametrize("doxygen_xml_folder", TEST_RULE_VIOLATION_XML_FOLDERS)
+def test_tc_streaming_rule_violation(record_property, doxygen_xml_folder) -> None:
+    # lobster-trace: SwTests.tc_streaming
+    """
+    This test case converts a doxygen XML folder, which violates a rule, while an output file
+    of a previous run exists. The compounds are written before the rule violation is found,
+    therefore the test verifies that no partially written output file is left behind.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        doxygen_xml_folder (str): The doxygen XML folder to convert.
+    """
+    record_property("lobster-trace", "SwTests.tc_streaming")
+
+    Path(TEST_LOBSTER_OUTPUT_FILE).write_text("{}\n", encoding="utf-8")
+
+    sys.argv = ["lobster-doxygen", "--jobs", "2", "--output", TEST_LOBSTER_OUTPUT_FILE, doxygen_xml_folder]
+    exit_code = main()
+
+    assert exit_code != 0, "Exit Code returns success."
+    assert Path(TEST_LOBSTER_OUTPUT_FILE).exists() is False, "Partially written output file is left behind."
+
+
+def test_tc_streaming_writer(record_property, tmp_path) -> None:
+    # lobster-trace: SwTests.tc_streaming
+    """
+    This test case writes the lobster items of a generator, which fails after the first item.
+    The test verifies that the output file is already created while the generator runs and
+    that it is removed after the generator failed.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the output file.
+    """
+    record_property("lobster-trace", "SwTests.tc_streaming")
+
+    output_file = tmp_path / "output.json"
+    is_output_file_created = []
+
+    def get_lobster_items():
+        lobster_item = LobsterItem("item_id")
+        lobster_item.kind = LobsterKind.FUNCTION
+        lobster_item.name = "first_function"
+        yield lobster_item
+
+        is_output_file_created.append(output_file.exists())
+        raise RuntimeError("Failed after the first item.")
+
+    with pytest.raises(RuntimeError):
+        write_lobster_common_interchange_format_file(get_lobster_items(), str(output_file))
+
+    assert output_file.exists() is False, "Partially written output file is left behind."
+    assert [True] == is_output_file_created, "Output file isn't written while the lobster items are created."
+
+
+@pytest.mark.parametrize("doxygen_xml_folder", [TEST_XML_FOLDER, [TEST_LEVEL_XML_FOLDER, TEST_NO_TRACE_XML_FOLDER]])
+def test_tc_api(record_property, tmp_path, doxygen_xml_folder) -> None:
+    # lobster-trace: SwTests.tc_api
+    """
+    This test case converts with the Python API. The test verifies that the LobsterItems
+    of iter_lobster_items() and the text, which convert() writes to a binary stream and to
+    a callback, match the output file of the command line tool.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the output file.
+        doxygen_xml_folder (str | list[str]): The doxygen XML folder or folders to convert.
+    """
+    record_property("lobster-trace", "SwTests.tc_api")
+
+    output_file = tmp_path / "output.json"
+    doxygen_xml_folders = [doxygen_xml_folder] if isinstance(doxygen_xml_folder, str) else doxygen_xml_folder
+
+    sys.argv = ["lobster-doxygen", "--jobs", "1", "--output", str(output_file)] + doxygen_xml_folders
+    exit_code = main()
+
+    assert exit_code == 0, "Exit Code returns failure."
+
+    output = output_file.read_bytes()
+    expected_tags = [item["tag"] for item in json.loads(output)["data"]]
+
+    tags = [lobster_item.get_tag() for lobster_item in lobster_doxygen.iter_lobster_items(doxygen_xml_folder, jobs=1)]
+    assert tags == expected_tags, "The LobsterItems don't match the output file."
+
+    stream = io.BytesIO()
+    item_count = lobster_doxygen.convert(doxygen_xml_folder, stream, jobs=2)
+    assert stream.getvalue() == output, "The text written to the stream doesn't match the output file."
+    assert item_count == len(expected_tags)
+
+    chunks = []
+    lobster_doxygen.convert(doxygen_xml_folder, chunks.append, jobs=1)
+    assert b"".join(chunks) == output, "The text passed to the callback doesn't match the output file."
+
+
+def test_tc_api_error(record_property) -> None:
+    # lobster-trace: SwTests.tc_api
+    """
+    This test case converts invalid inputs with the Python API. The test verifies that a
+    folder without index.xml and a rule violation raise an exception.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_api")
+
+    with pytest.raises(FileNotFoundError):
+        list(lobster_doxygen.iter_lobster_items(EMPTY_FOLDER))
+
+    with pytest.raises(ConversionError):
+        lobster_doxygen.convert(TEST_RULE_FILE_REQUIREMENT_XML_FOLDER, io.BytesIO(), jobs=1)
+
+    with pytest.raises(TypeError):
+        list(lobster_doxygen.iter_lobster_items(TEST_XML_FOLDER, unknown_option=True))
+
+
+@pytest.mark.parametrize("xml_parser", ["doxmlparser", "iterparse"])
+def test_tc_group_only_function(record_property, tmp_path, xml_parser) -> None:
+    # lobster-trace: SwTests.tc_group
+    """
+    This test case converts a group with a function, which is only documented in the group.
+    A group has no language, therefore the test verifies that the conversion succeeds and
+    that the function gets the language "unspecified" like the group itself.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Temporary directory for the doxygen XML folder and the output file.
+        xml_parser (str): The XML parser for the compound files.
+    """
+    record_property("lobster-trace", "SwTests.tc_group")
+
+    doxygen_xml_folder = tmp_path / "xml"
+    shutil.copytree(TEST_XML_FOLDER, doxygen_xml_folder)
+
+    (doxygen_xml_folder / "group__main__group.xml").write_text(
+        "<?xml version='1.0' encoding='UTF-8' standalone='no'?>\n"
+        '<doxygen version="1.14.0" xml:lang="en-US">\n'
+        '  <compounddef id="group__main__group" kind="group">\n'
+        "    <compoundname>main_group</compoundname>\n"
+        "    <title>Main file</title>\n"
+        '    <sectiondef kind="func">\n'
+        '      <memberdef kind="function" id="group__main__group_1ga0" prot="public" static="no">\n'
+        "        <type>void</type>\n"
+        "        <name>group_function</name>\n"
+        "        <briefdescription></briefdescription>\n"
+        "        <detaileddescription></detaileddescription>\n"
+        '        <location file="src/group.h" line="12" column="6"/>\n'
+        "      </memberdef>\n"
+        "    </sectiondef>\n"
+        "    <briefdescription></briefdescription>\n"
+        "    <detaileddescription></detaileddescription>\n"
+        "  </compounddef>\n"
+        "</doxygen>\n",
+        encoding="utf-8",
+    )
+    index_file = doxygen_xml_folder / "index.xml"
+    index_file.write_text(
+        index_file.read_text(encoding="utf-8").replace(
+            '<compound refid="group__main__group" kind="group"><name>main_group</name>\n',
+            '<compound refid="group__main__group" kind="group"><name>main_group</name>\n'
+            '    <member refid="group__main__group_1ga0" kind="function"><name>group_function</name></member>\n',
+        ),
+        encoding="utf-8",
+    )
+
+    output_file = tmp_path / "output.json"
+    sys.argv = ["lobster-doxygen", "--jobs", "1", "--parser", xml_parser, "--output", str(output_file),
+                str(doxygen_xml_folder)]
+    exit_code = main()
+
+    assert exit_code == 0, "Exit Code returns failure."
+
+    lobster_items = json.loads(output_file.read_text(encoding="utf-8"))["data"]
+    group_functions = [item for item in lobster_items if item["name"] == "group_function"]
+
+    assert 1 == len(group_functions), "The function of the group isn't converted."
+    assert "unspecified" == group_functions[0]["language"]
+
 
 # Main *************************************************************************
@@ -21,11 +21,16 @@ Author: Dominik Knoll (dominik.knoll@newtec.de)
 
 # Imports **********************************************************************
 
+import os
+import re
+import subprocess
 import sys
 from pathlib import Path
 import pytest
 
+import lobster_doxygen
 from lobster_doxygen.__main__ import main
+from lobster_doxygen.printer import Printer
 from lobster_doxygen.version import __version__
 
 # Variables ********************************************************************
@@ -36,12 +41,52 @@ TEST_LOBSTER_OUTPUT_FILE = "./tests/utils/output-test.json"
 # Directory with Doxygen XML files.
 TEST_XML_FOLDER = "./tests/utils/xml"
 
+# Modules and their dependencies, which are only imported when the conversion starts.
+CONVERSION_MODULES = [
+    "lobster_doxygen.doxygen_to_lobster_converter",
+    "lobster_doxygen.get_lobster_items_from_doxygen_xml_folder",
+    "lobster_doxygen.compound_cache",
+    "lobster_doxygen.input_fingerprint",
+    "lobster_doxygen.output_manifest",
+    "lobster_doxygen.xml_archive",
+    "doxmlparser",
+    "rich",
+    "sqlite3",
+    "pickle",
+    "gzip",
+]
+
+# Budget for the import time of the command line tool in microseconds. It is
+# generous for slow machines, without lazy imports it is exceeded nevertheless.
+IMPORT_TIME_BUDGET_US = 150000
+
 # stdout if program is called with verbose parameter
 STD_OUTPUT_WITH_VERBOSE = [
     "Program arguments: ",
-    f"* doxygen_xml_folder = {TEST_XML_FOLDER}",
+    f"* doxygen_xml_folder = {[TEST_XML_FOLDER]}",
+    "* folder_list = None",
     f"* output = {TEST_LOBSTER_OUTPUT_FILE}",
+    "* output_dir = None",
+    "* lobster_config = None",
+    "* lobster_level = None",
+    "* lobster_report = report.lobster",
     "* verbose = True",
+    "* jobs = None",
+    "* parser = doxmlparser",
+    "* cache_dir = None",
+    "* cache_fast = False",
+    "* cache_max_size = 256",
+    "* trace_source = description",
+    "* compact = False",
+    "* gzip = False",
+    "* stats = False",
+    "* stats_json = None",
+    "* incremental = False",
+    "* depfile = None",
+    "* skip_if_unchanged = False",
+    "* keep_going = False",
+    "* max_errors = None",
+    "* report_json = None",
     "",
     "",
     "compound: main.cpp",
@@ -57,6 +102,8 @@ STD_OUTPUT_WITH_VERBOSE = [
     "    kind: page (skipped)",
     "compound: src",
     "    kind: dir (skipped)",
+    "Skipped 2 of 4 compound files (1329 bytes).",
+    "Skipped 0 duplicate members.",
     "",
 ]
 
@@ -114,6 +161,45 @@ def test_tc_stdout(record_property, capsys):
     assert STD_OUTPUT_WITH_VERBOSE == standard_output_captured, "Standard output not as expected."
 
 
+def test_tc_stdout_lazy_format(record_property, capsys, monkeypatch):
+    # lobster-trace: SwTests.tc_stdout
+    """
+    Test that an information is only formatted if it is printed and that it is printed as plain
+    text with its indentation.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to reset the verbose mode, which is set by previous tests.
+    """
+    record_property("lobster-trace", "SwTests.tc_stdout")
+
+    class _Name:  # pylint: disable=too-few-public-methods
+        """Counts how often it is formatted."""
+
+        def __init__(self):
+            self.format_count = 0
+
+        def __str__(self):
+            self.format_count += 1
+            return "[bold]name[/bold]"
+
+    name = _Name()
+    printer = Printer()
+
+    monkeypatch.setattr(Printer, "_print_verbose", False)
+    printer.print_info("member: %s", name, level=2)
+
+    assert name.format_count == 0
+    assert capsys.readouterr().out == ""
+
+    monkeypatch.setattr(Printer, "_print_verbose", True)
+    printer.print_info("member: %s", name, level=2)
+
+    assert name.format_count == 1
+    assert capsys.readouterr().out == "        member: [bold]name[/bold]\n"
+
+
 def test_tc_stderr(record_property, capsys):
     # lobster-trace: SwTests.tc_stderr
     """
@@ -127,7 +213,20 @@ def test_tc_stderr(record_property, capsys):
     record_property("lobster-trace", "SwTests.tc_stderr")
 
     expected_error_output = [
-        "usage: lobster-doxygen [-h] [--version] [-o OUTPUT] [-v] doxygen_xml_folder",
+        "usage: lobster-doxygen [-h] [--version] [--folder-list FOLDER_LIST]",
+        "                       [-o OUTPUT | --output-dir OUTPUT_DIR | --lobster-config LOBSTER_CONFIG]",
+        "                       [--lobster-level LOBSTER_LEVEL]",
+        "                       [--lobster-report LOBSTER_REPORT] [-v] [-j JOBS]",
+        "                       [--parser {doxmlparser,iterparse}]",
+        "                       [--cache-dir CACHE_DIR] [--cache-fast]",
+        "                       [--cache-max-size CACHE_MAX_SIZE]",
+        "                       [--trace-source {description,xrefitem,verify}]",
+        "                       [--compact] [--gzip] [--stats]",
+        "                       [--stats-json STATS_JSON] [--incremental]",
+        "                       [--depfile DEPFILE] [--skip-if-unchanged]",
+        "                       [--keep-going] [--max-errors MAX_ERRORS]",
+        "                       [--report-json REPORT_JSON]",
+        "                       [doxygen_xml_folder ...]",
         "lobster-doxygen: error: the following arguments are required: doxygen_xml_folder",
         "",
     ]
@@ -143,4 +242,69 @@ def test_tc_stderr(record_property, capsys):
     assert expected_error_output == error_output_captured, "Error output not as expected."
 
 
+def _get_imports(argv: list[str]) -> dict[str, int]:
+    # lobster-exclude: This is a simple helper function for the startup test.
+    """Run the command line tool in a new process and get its imports.
+
+    Args:
+        argv (list[str]): The command line arguments without the program name.
+
+    Returns:
+        dict[str, int]: The cumulative import time in microseconds of each module,
+        which is imported by the tool and not during the interpreter startup.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(Path(lobster_doxygen.__file__).parents[1]), *filter(None, [os.environ.get("PYTHONPATH")])]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys; from lobster_doxygen.__main__ import main; sys.exit(main({argv!r}))"],
+        capture_output=True, text=True, env=env, check=True
+    )
+
+    imports = {}
+    is_startup = True
+
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+
+        if match is not None:
+            if is_startup is True:
+                # The interpreter startup ends with the site module.
+                is_startup = match.group(3) != "site"
+            else:
+                imports[match.group(3)] = int(match.group(1)) if match.group(2) == " " else 0
+
+    return imports
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["--version"]])
+def test_tc_startup(record_property, argv):
+    # lobster-trace: SwTests.tc_startup
+    """
+    Test that the command line tool doesn't import the conversion modules if no
+    conversion is done, that --help doesn't resolve the version and that the
+    import time is within its budget.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        argv (list[str]): The command line arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_startup")
+
+    imports = _get_imports(argv)
+
+    assert "lobster_doxygen.__main__" in imports
+
+    for module in CONVERSION_MODULES:
+        assert module not in imports, f"{module} is imported on startup."
+
+    if argv == ["--help"]:
+        assert "importlib.metadata" not in imports
+        assert "toml" not in imports
+
+    assert sum(imports.values()) < IMPORT_TIME_BUDGET_US
+
+
 # Main *************************************************************************
@@ -0,0 +1,249 @@
+"""Measures the time and peak memory of the whole lobster-doxygen conversion
+    on synthetic Doxygen XML output folders of different sizes and compares
+    them with the baseline numbers.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Imports **********************************************************************
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from generate_doxygen_xml import generate_doxygen_xml, get_config_for_members
+
+# Variables ********************************************************************
+
+# Number of members of the benchmarked Doxygen XML output folders.
+_DEFAULT_MEMBER_COUNTS = [1000, 10000, 100000, 1000000]
+
+# File with the baseline numbers, next to this script.
+_BASELINE_FILE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# A measured value is a regression, if it exceeds the baseline by this factor.
+_DEFAULT_TOLERANCE = 1.25
+
+# Script, which runs main() of lobster-doxygen in a separate process and prints
+# its wall time and peak memory as JSON. The peak memory of the worker processes
+# is only available on platforms with the resource module.
+_RUNNER_SCRIPT = """
+import json
+import sys
+import time
+
+from lobster_doxygen.__main__ import main
+
+sys.argv = ["lobster-doxygen", *sys.argv[1:]]
+start_time = time.perf_counter()
+ret_status = main()
+wall_time = time.perf_counter() - start_time
+
+try:
+    import resource
+except ImportError:
+    peak_memory_kib = None
+    workers_peak_memory_kib = None
+else:
+    peak_memory_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    workers_peak_memory_kib = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    # macOS reports bytes instead of KiB.
+    if sys.platform == "darwin":
+        peak_memory_kib //= 1024
+        workers_peak_memory_kib //= 1024
+
+print(json.dumps({
+    "ret_status": int(ret_status),
+    "wall_time": wall_time,
+    "peak_memory_kib": peak_memory_kib,
+    "workers_peak_memory_kib": workers_peak_memory_kib,
+}))
+"""
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def _run_conversion(doxygen_xml_folder: str, output_folder: str, options: list[str]) -> dict:
+    """Run the conversion in a separate process, so the peak memory of each
+    run is measured on its own.
+
+    Args:
+        doxygen_xml_folder (str): The Doxygen XML output folder.
+        output_folder (str): Folder for the output file and the statistics file.
+        options (list[str]): Additional command line options of lobster-doxygen.
+
+    Returns:
+        dict: The wall time, the peak memory and the phase statistics of the run.
+
+    Raises:
+        RuntimeError: If the conversion fails.
+    """
+    output_file_name = os.path.join(output_folder, "lobster.json")
+    stats_file_name = os.path.join(output_folder, "stats.json")
+
+    process = subprocess.run(
+        [sys.executable, "-c", _RUNNER_SCRIPT, doxygen_xml_folder, "--output", output_file_name,
+         "--stats-json", stats_file_name, *options],
+        capture_output=True, text=True, check=False
+    )
+
+    # The result is printed as last line, after the output of lobster-doxygen.
+    result = json.loads(process.stdout.strip().splitlines()[-1]) if 0 == process.returncode else None
+
+    if result is None or 0 != result["ret_status"]:
+        raise RuntimeError(f"Conversion of {doxygen_xml_folder} failed: {process.stderr}")
+
+    with open(stats_file_name, "r", encoding="utf-8") as stats_file:
+        stats = json.load(stats_file)
+
+    result["items"] = stats["phases"]["write"]["items"]
+    result["items_per_second"] = stats["total"]["items_per_second"]
+    result["phases"] = {phase: values["wall_time"] for phase, values in stats["phases"].items()}
+
+    return result
+
+
+def benchmark_conversion(member_count: int, work_folder: str, options: list[str]) -> dict:
+    """Generate the Doxygen XML output folder, if it doesn't exist yet, and
+    measure the conversion.
+
+    Args:
+        member_count (int): The number of members of the generated folder.
+        work_folder (str): Folder, where the generated folders are kept for later runs.
+        options (list[str]): Additional command line options of lobster-doxygen.
+
+    Returns:
+        dict: The wall time, the peak memory and the phase statistics of the run.
+    """
+    doxygen_xml_folder = os.path.join(work_folder, f"members-{member_count}")
+
+    if not os.path.isfile(os.path.join(doxygen_xml_folder, "index.xml")):
+        print(f"Generating {member_count} members in {doxygen_xml_folder} ...")
+        generate_doxygen_xml(doxygen_xml_folder, get_config_for_members(member_count))
+
+    with tempfile.TemporaryDirectory() as output_folder:
+        result = _run_conversion(doxygen_xml_folder, output_folder, options)
+
+    return result
+
+
+def _get_regressions(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Compare the results with the baseline numbers.
+
+    Args:
+        results (dict[str, dict]): The results per member count.
+        baseline (dict[str, dict]): The baseline numbers per member count.
+        tolerance (float): Factor, which a measured value may exceed the baseline.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+    regressions = []
+
+    for member_count, result in results.items():
+        for key in ["wall_time", "peak_memory_kib"]:
+            baseline_value = baseline.get(member_count, {}).get(key)
+
+            if baseline_value is not None and result[key] is not None and baseline_value * tolerance < result[key]:
+                regressions.append(
+                    f"{member_count} members: {key} {result[key]:.2f} exceeds baseline {baseline_value:.2f}"
+                )
+
+    return regressions
+
+
+def _print_result(member_count: str, result: dict, baseline: dict[str, dict]) -> None:
+    """Print the result of a member count and its baseline numbers.
+
+    Args:
+        member_count (str): The member count.
+        result (dict): The result of the run.
+        baseline (dict[str, dict]): The baseline numbers per member count.
+    """
+    baseline_result = baseline.get(member_count, {})
+    phases = ", ".join(f"{phase} {wall_time:.2f} s" for phase, wall_time in result["phases"].items())
+
+    print(
+        f"{member_count:>8} members: {result['wall_time']:8.2f} s "
+        f"(baseline {baseline_result.get('wall_time', '-')} s), "
+        f"{result['peak_memory_kib']} KiB peak memory (baseline {baseline_result.get('peak_memory_kib', '-')} KiB), "
+        f"{result['items_per_second']:.0f} items/s"
+    )
+    print(f"{'':>18}{phases}")
+
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark lobster-doxygen on synthetic Doxygen XML output.")
+    parser.add_argument("--members", type=int, nargs="+", default=_DEFAULT_MEMBER_COUNTS,
+                        help=f"Member counts to benchmark. Default: {_DEFAULT_MEMBER_COUNTS}")
+    parser.add_argument("--work-dir", type=str,
+                        default=os.path.join(tempfile.gettempdir(), "lobster-doxygen-benchmark"),
+                        help="Folder for the generated Doxygen XML output, which is reused by later runs.")
+    parser.add_argument("--tolerance", type=float, default=_DEFAULT_TOLERANCE,
+                        help=f"Factor, which a measured value may exceed the baseline. Default: {_DEFAULT_TOLERANCE}")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as new baseline.")
+    parser.add_argument("options", nargs=argparse.REMAINDER,
+                        help="Additional lobster-doxygen options after --, e.g. -- --jobs 1 --parser iterparse")
+    args = parser.parse_args()
+
+    OPTIONS = [option for option in args.options if option != "--"]
+    BASELINE = {}
+
+    if os.path.isfile(_BASELINE_FILE_NAME):
+        with open(_BASELINE_FILE_NAME, "r", encoding="utf-8") as baseline_file:
+            BASELINE = json.load(baseline_file)
+
+    RESULTS = {}
+
+    for MEMBER_COUNT in args.members:
+        RESULTS[str(MEMBER_COUNT)] = benchmark_conversion(MEMBER_COUNT, args.work_dir, OPTIONS)
+        _print_result(str(MEMBER_COUNT), RESULTS[str(MEMBER_COUNT)], BASELINE)
+
+    if args.update_baseline is True:
+        BASELINE.update(
+            {
+                member_count: {
+                    "wall_time": round(result["wall_time"], 2),
+                    "peak_memory_kib": result["peak_memory_kib"],
+                    "items": result["items"],
+                }
+                for member_count, result in RESULTS.items()
+            }
+        )
+
+        with open(_BASELINE_FILE_NAME, "w", encoding="utf-8") as baseline_file:
+            json.dump(BASELINE, baseline_file, indent=4)
+            baseline_file.write("\n")
+
+        print(f"Baseline updated: {_BASELINE_FILE_NAME}")
+        sys.exit(0)
+
+    REGRESSIONS = _get_regressions(RESULTS, BASELINE, args.tolerance)
+
+    for REGRESSION in REGRESSIONS:
+        print(f"Regression: {REGRESSION}")
+
+    sys.exit(1 if 0 < len(REGRESSIONS) else 0)
@@ -0,0 +1,107 @@
+"""Measures how many lobster items per second the LOBSTER common interchange
+    format writer serializes.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Imports **********************************************************************
+import os
+import sys
+import tempfile
+import time
+
+from lobster_doxygen.lobster_item import LobsterItem
+from lobster_doxygen.lobster_kind import LobsterKind
+from lobster_doxygen.write_lobster_common_interchange_format_file import write_lobster_common_interchange_format_file
+
+# Variables ********************************************************************
+
+# Default number of lobster items to write.
+_DEFAULT_ITEM_COUNT = 100000
+
+# Number of runs, the fastest one is reported.
+_RUNS = 5
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def _create_lobster_items(item_count: int) -> list[LobsterItem]:
+    """Create lobster items with requirements and justifications like they
+    are found in a typical C++ project.
+
+    Args:
+        item_count (int): Number of lobster items.
+
+    Returns:
+        list[LobsterItem]: The lobster items.
+    """
+    lobster_items = []
+
+    for idx in range(item_count):
+        lobster_item = LobsterItem(f"class_my_class_{idx}_1a{idx:032x}")
+        lobster_item.kind = LobsterKind.METHOD
+        lobster_item.name = f"MyNamespace::MyClass{idx}.do_something"
+        lobster_item.file_name = f"src/my_namespace/my_class_{idx}.cpp"
+        lobster_item.line = idx % 1000 + 1
+        lobster_item.column = 1
+        lobster_item.language = "C++"
+
+        if 0 == idx % 4:
+            lobster_item.just_up = [f"Justification of item {idx}."]
+        else:
+            lobster_item.refs = [f"SwRequirements.sw_req_{idx}", f"SwRequirements.sw_req_{idx + 1}"]
+
+        lobster_items.append(lobster_item)
+
+    return lobster_items
+
+
+def benchmark_writer(item_count: int) -> float:
+    """Write the lobster items several times and measure the fastest run.
+
+    Args:
+        item_count (int): Number of lobster items.
+
+    Returns:
+        float: Number of lobster items written per second.
+    """
+    lobster_items = _create_lobster_items(item_count)
+    durations = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file_name = os.path.join(temp_dir, "output.json")
+
+        for _ in range(_RUNS):
+            start_time = time.perf_counter()
+            write_lobster_common_interchange_format_file(lobster_items, output_file_name)
+            durations.append(time.perf_counter() - start_time)
+
+    return item_count / min(durations)
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    if 2 < len(sys.argv):
+        print("Usage: python benchmark_writer.py [<item_count>]")
+        sys.exit(1)
+
+    ITEM_COUNT = _DEFAULT_ITEM_COUNT if 1 == len(sys.argv) else int(sys.argv[1])
+
+    print(f"{benchmark_writer(ITEM_COUNT):.0f} items/s ({ITEM_COUNT} items, fastest of {_RUNS} runs)")
@@ -0,0 +1,483 @@
+"""Generates a synthetic Doxygen XML output folder of configurable size, to
+    benchmark lobster-doxygen without running doxygen on a large project.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+# lobster-doxygen - Doxygen XML to LOBSTER common interchange format converter
+# Copyright (c) NewTec GmbH 2025   -   www.newtec.de
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Imports **********************************************************************
+import argparse
+import hashlib
+import os
+import random
+import sys
+from dataclasses import dataclass, field
+
+# Variables ********************************************************************
+
+# Header of each generated XML file.
+_XML_HEADER = "<?xml version='1.0' encoding='UTF-8' standalone='no'?>\n"
+
+# Root element of a compound file.
+_DOXYGEN_BEGIN = (
+    '<doxygen xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="compound.xsd" '
+    'version="1.14.0" xml:lang="en-US">\n'
+)
+
+# Root element of the index file.
+_DOXYGENINDEX_BEGIN = (
+    '<doxygenindex xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="index.xsd" '
+    'version="1.14.0" xml:lang="en-US">\n'
+)
+
+# Number of members per source file, used to derive the configuration from a member count.
+_MEMBERS_PER_FILE = 20
+
+# Classes **********************************************************************
+
+
+@dataclass
+class GeneratorConfig:  # pylint: disable=too-many-instance-attributes
+    """Size and content of the generated Doxygen XML output."""
+
+    files: int = 10  # Number of source files.
+    classes_per_file: int = 2  # Number of classes defined in each source file.
+    methods_per_class: int = 8  # Number of methods of each class.
+    functions_per_file: int = 4  # Number of namespace functions defined in each source file.
+    namespaces: int = 2  # Number of namespaces, the functions are distributed to them.
+    groups: int = 2  # Number of groups, the classes are distributed to them.
+    requirement_ratio: float = 0.5  # Share of the members with a requirement (@implements).
+    justification_ratio: float = 0.1  # Share of the members with a justification (@justification).
+    programlisting_lines: int = 20  # Number of source code lines in each file compound.
+    seed: int = 0  # Seed of the random generator, the same seed results in the same output.
+
+    def get_member_count(self) -> int:
+        """Get the number of generated members.
+
+        Returns:
+            int: The number of methods and functions.
+        """
+        return self.files * (self.classes_per_file * self.methods_per_class + self.functions_per_file)
+
+
+@dataclass
+class _Member:
+    """A generated method or function."""
+
+    member_id: str  # The member id, like doxygen creates it.
+    name: str  # The member name.
+    qualified_name: str  # The name including class or namespace.
+    file_name: str  # The source file name.
+    line: int  # The line in the source file.
+    xrefsects: list[tuple[str, str]] = field(default_factory=list)  # The page id and text of each xrefsect.
+
+
+@dataclass
+class _XrefitemPages:
+    """Entries of the generated xrefitem pages."""
+
+    implements: list[tuple[str, str, str]] = field(default_factory=list)  # Anchor id, member id and text.
+    justified: list[tuple[str, str, str]] = field(default_factory=list)  # Anchor id, member id and text.
+
+    def add(self, page: str, member_id: str, text: str) -> str:
+        """Add an entry to a xrefitem page.
+
+        Args:
+            page (str): The page, either "implements" or "justified".
+            member_id (str): The id of the member, the entry refers to.
+            text (str): The text of the entry.
+
+        Returns:
+            str: The anchor id of the entry.
+        """
+        entries = getattr(self, page)
+        anchor_id = f"{page}_1_{page}{len(entries) + 1:06d}"
+        entries.append((anchor_id, member_id, text))
+
+        return anchor_id
+
+
+# Functions ********************************************************************
+
+
+def get_config_for_members(member_count: int, seed: int = 0) -> GeneratorConfig:
+    """Get a configuration, which generates about the given number of members.
+
+    Args:
+        member_count (int): The number of members.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        GeneratorConfig: The configuration.
+    """
+    files = max(1, member_count // _MEMBERS_PER_FILE)
+
+    return GeneratorConfig(files=files, namespaces=max(1, files // 50), groups=max(1, files // 100), seed=seed)
+
+
+def _get_member_id(compound_id: str, name: str) -> str:
+    """Get a member id in the format doxygen creates it.
+
+    Args:
+        compound_id (str): The id of the compound, which defines the member.
+        name (str): The qualified name of the member.
+
+    Returns:
+        str: The member id.
+    """
+    return f"{compound_id}_1a{hashlib.md5(name.encode('utf-8')).hexdigest()}"
+
+
+def _get_xrefsects_text(member: _Member) -> str:
+    """Get the detailed description of a member with its xrefsects.
+
+    Args:
+        member (_Member): The member.
+
+    Returns:
+        str: The detaileddescription element.
+    """
+    text = "        <detaileddescription>\n"
+
+    for anchor_id, xref_text in member.xrefsects:
+        title = "Implements" if anchor_id.startswith("implements") else "Justified"
+        text += (
+            f'<para><xrefsect id="{anchor_id}"><xreftitle>{title}</xreftitle><xrefdescription><para>'
+            f"{xref_text} </para>\n</xrefdescription></xrefsect></para>\n"
+        )
+
+    return text + "        </detaileddescription>\n"
+
+
+def _get_memberdef_text(member: _Member, kind: str, prot: str) -> str:
+    """Get the memberdef element of a member.
+
+    Args:
+        member (_Member): The member.
+        kind (str): The member kind, e.g. "function".
+        prot (str): The protection, e.g. "public".
+
+    Returns:
+        str: The memberdef element.
+    """
+    return (
+        f'      <memberdef kind="{kind}" id="{member.member_id}" prot="{prot}" static="no" const="no" '
+        'explicit="no" inline="no" virt="non-virtual">\n'
+        "        <type>void</type>\n"
+        f"        <definition>void {member.qualified_name}</definition>\n"
+        "        <argsstring>(void)</argsstring>\n"
+        f"        <name>{member.name}</name>\n"
+        f"        <qualifiedname>{member.qualified_name}</qualifiedname>\n"
+        "        <param>\n          <type>void</type>\n        </param>\n"
+        "        <briefdescription>\n<para>Generated member. </para>\n        </briefdescription>\n"
+        + _get_xrefsects_text(member)
+        + "        <inbodydescription>\n        </inbodydescription>\n"
+        f'        <location file="{member.file_name}" line="{member.line}" column="5" '
+        f'bodyfile="{member.file_name}" bodystart="{member.line}" bodyend="{member.line + 3}"/>\n'
+        "      </memberdef>\n"
+    )
+
+
+def _get_compound_text(compound_id: str, kind: str, name: str, body: list[str]) -> str:
+    """Get the content of a compound file.
+
+    Args:
+        compound_id (str): The compound id.
+        kind (str): The compound kind, e.g. "class".
+        name (str): The compound name.
+        body (list[str]): The elements of the compounddef.
+
+    Returns:
+        str: The content of the compound file.
+    """
+    language = ' language="C++"' if kind != "group" else ""
+
+    return (
+        _XML_HEADER
+        + _DOXYGEN_BEGIN
+        + f'  <compounddef id="{compound_id}" kind="{kind}"{language}>\n'
+        + f"    <compoundname>{name}</compoundname>\n"
+        + "".join(body)
+        + "  </compounddef>\n</doxygen>\n"
+    )
+
+
+def _get_programlisting_text(line_count: int) -> str:
+    """Get a program listing, which doxygen adds to each file compound.
+
+    Args:
+        line_count (int): The number of source code lines.
+
+    Returns:
+        str: The programlisting element.
+    """
+    lines = [
+        f'<codeline lineno="{lineno}"><highlight class="normal">int<sp/>value_{lineno}<sp/>=<sp/>{lineno};'
+        "</highlight></codeline>\n"
+        for lineno in range(1, line_count + 1)
+    ]
+
+    return "    <programlisting>\n" + "".join(lines) + "    </programlisting>\n"
+
+
+def _write_file(folder: str, compound_id: str, content: str) -> None:
+    """Write a XML file to the folder.
+
+    Args:
+        folder (str): The output folder.
+        compound_id (str): The compound id, which is the file name without extension.
+        content (str): The file content.
+    """
+    with open(os.path.join(folder, compound_id + ".xml"), "w", encoding="utf-8") as xml_file:
+        xml_file.write(content)
+
+
+def _add_traces(member: _Member, config: GeneratorConfig, rng: random.Random, pages: _XrefitemPages) -> None:
+    """Add a requirement or justification to the member by chance.
+
+    Args:
+        member (_Member): The member.
+        config (GeneratorConfig): The generator configuration.
+        rng (random.Random): The random generator.
+        pages (_XrefitemPages): The xrefitem pages, which get an entry for each trace.
+    """
+    value = rng.random()
+
+    if value < config.requirement_ratio:
+        text = f"Requirement: SwRequirements.sw_req_{rng.randrange(100000)}"
+        member.xrefsects.append((pages.add("implements", member.member_id, text), text))
+    elif value < config.requirement_ratio + config.justification_ratio:
+        text = f"Justification: {member.name} is generated."
+        member.xrefsects.append((pages.add("justified", member.member_id, text), text))
+
+
+def _get_index_compound_text(compound_id: str, kind: str, name: str, members: list[_Member]) -> str:
+    """Get the entry of a compound in the index.
+
+    Args:
+        compound_id (str): The compound id.
+        kind (str): The compound kind.
+        name (str): The compound name.
+        members (list[_Member]): The members listed in the compound.
+
+    Returns:
+        str: The compound element of the index.
+    """
+    member_lines = [
+        f'    <member refid="{member.member_id}" kind="function"><name>{member.name}</name></member>\n'
+        for member in members
+    ]
+
+    return f'  <compound refid="{compound_id}" kind="{kind}"><name>{name}</name>\n' + "".join(member_lines) + \
+        "  </compound>\n"
+
+
+def _get_xrefitem_page_text(page: str, title: str, entries: list[tuple[str, str, str]]) -> str:
+    """Get the content of a xrefitem page.
+
+    Args:
+        page (str): The page id.
+        title (str): The page title.
+        entries (list[tuple[str, str, str]]): The anchor id, member id and text of each entry.
+
+    Returns:
+        str: The content of the page file.
+    """
+    lines = [
+        f'<varlistentry><term>Member <ref refid="{member_id}" kindref="member">member</ref>  (void)</term>'
+        f'</varlistentry>\n<listitem><para><anchor id="{anchor_id}"/> {text}  </para>\n</listitem>\n'
+        for anchor_id, member_id, text in entries
+    ]
+
+    return _get_compound_text(
+        page, "page", page, [
+            f"    <title>{title}</title>\n",
+            "    <briefdescription>\n    </briefdescription>\n",
+            "    <detaileddescription>\n<para><variablelist>\n",
+            *lines,
+            "</variablelist>\n</para>\n    </detaileddescription>\n",
+        ]
+    )
+
+
+def generate_doxygen_xml(folder: str, config: GeneratorConfig) -> None:  # pylint: disable=too-many-locals
+    """Generate the Doxygen XML output of a synthetic C++ project.
+
+    Each source file defines classes with methods and namespace functions. The
+    functions are listed in the file and in the namespace compound with the same
+    member id, like doxygen does. The classes are distributed to the groups.
+    The members get requirements and justifications by chance, which are also
+    listed on the xrefitem pages.
+
+    Args:
+        folder (str): The output folder, it is created if it doesn't exist.
+        config (GeneratorConfig): The generator configuration.
+    """
+    os.makedirs(folder, exist_ok=True)
+
+    rng = random.Random(config.seed)
+    pages = _XrefitemPages()
+    index_classes = []
+    index_files = []
+    namespace_members = [[] for _ in range(config.namespaces)]
+    group_classes = [[] for _ in range(config.groups)]
+
+    for file_idx in range(config.files):
+        file_id = f"_file_{file_idx}_8cpp"
+        file_name = f"src/module_{file_idx // 100}/File{file_idx}.cpp"
+        namespace_idx = file_idx % config.namespaces
+        inner_classes = []
+        line = 1
+
+        for class_idx in range(config.classes_per_file):
+            class_name = f"Class{file_idx}_{class_idx}"
+            class_id = f"class_class{file_idx}__{class_idx}"
+            methods = []
+
+            for method_idx in range(config.methods_per_class):
+                line += 5
+                method = _Member(
+                    _get_member_id(class_id, f"{class_name}::method_{method_idx}"), f"method_{method_idx}",
+                    f"{class_name}::method_{method_idx}", file_name, line
+                )
+                _add_traces(method, config, rng, pages)
+                methods.append(method)
+
+            _write_file(folder, class_id, _get_compound_text(class_id, "class", class_name, [
+                '    <sectiondef kind="public-func">\n',
+                *[_get_memberdef_text(method, "function", "public") for method in methods],
+                "    </sectiondef>\n",
+                "    <briefdescription>\n    </briefdescription>\n",
+                "    <detaileddescription>\n    </detaileddescription>\n",
+                f'    <location file="{file_name}" line="{line}" column="1"/>\n',
+            ]))
+
+            index_classes.append(_get_index_compound_text(class_id, "class", class_name, methods))
+            inner_classes.append(f'    <innerclass refid="{class_id}" prot="public">{class_name}</innerclass>\n')
+            group_classes[(file_idx * config.classes_per_file + class_idx) % config.groups].append(inner_classes[-1])
+
+        functions = []
+
+        for function_idx in range(config.functions_per_file):
+            line += 5
+            function_name = f"function_{file_idx}_{function_idx}"
+            function = _Member(
+                _get_member_id(f"namespacens{namespace_idx}", function_name), function_name,
+                f"ns{namespace_idx}::{function_name}", file_name, line
+            )
+            _add_traces(function, config, rng, pages)
+            functions.append(function)
+
+        namespace_members[namespace_idx].extend(functions)
+
+        _write_file(folder, file_id, _get_compound_text(file_id, "file", f"File{file_idx}.cpp", [
+            *inner_classes,
+            f'    <innernamespace refid="namespacens{namespace_idx}">ns{namespace_idx}</innernamespace>\n',
+            '    <sectiondef kind="func">\n',
+            *[_get_memberdef_text(function, "function", "public") for function in functions],
+            "    </sectiondef>\n",
+            "    <briefdescription>\n    </briefdescription>\n",
+            "    <detaileddescription>\n    </detaileddescription>\n",
+            _get_programlisting_text(config.programlisting_lines),
+            f'    <location file="{file_name}"/>\n',
+        ]))
+
+        index_files.append(_get_index_compound_text(file_id, "file", f"File{file_idx}.cpp", functions))
+
+    index_namespaces = []
+
+    for namespace_idx, functions in enumerate(namespace_members):
+        namespace_id = f"namespacens{namespace_idx}"
+        _write_file(folder, namespace_id, _get_compound_text(namespace_id, "namespace", f"ns{namespace_idx}", [
+            '    <sectiondef kind="func">\n',
+            *[_get_memberdef_text(function, "function", "public") for function in functions],
+            "    </sectiondef>\n",
+            "    <briefdescription>\n    </briefdescription>\n",
+            "    <detaileddescription>\n    </detaileddescription>\n",
+            '    <location file="src/Namespace.h" line="1" column="1"/>\n',
+        ]))
+        index_namespaces.append(_get_index_compound_text(namespace_id, "namespace", f"ns{namespace_idx}", functions))
+
+    index_groups = []
+
+    for group_idx, inner_classes in enumerate(group_classes):
+        group_id = f"group__group{group_idx}"
+        _write_file(folder, group_id, _get_compound_text(group_id, "group", f"group{group_idx}", [
+            f"    <title>Group {group_idx}</title>\n",
+            *inner_classes,
+            "    <briefdescription>\n    </briefdescription>\n",
+            "    <detaileddescription>\n    </detaileddescription>\n",
+        ]))
+        index_groups.append(_get_index_compound_text(group_id, "group", f"group{group_idx}", []))
+
+    index_pages = []
+
+    for page, title, entries in [
+        ("implements", "Requirement Traceability", pages.implements),
+        ("justified", "Justified", pages.justified),
+    ]:
+        if 0 < len(entries):
+            _write_file(folder, page, _get_xrefitem_page_text(page, title, entries))
+            index_pages.append(_get_index_compound_text(page, "page", page, []))
+
+    _write_file(
+        folder,
+        "index",
+        _XML_HEADER + _DOXYGENINDEX_BEGIN + "".join(index_classes) + "".join(index_namespaces) +
+        "".join(index_files) + "".join(index_groups) + "".join(index_pages) + "</doxygenindex>\n"
+    )
+
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic Doxygen XML output folder.")
+    parser.add_argument("folder", type=str, help="Output folder.")
+    parser.add_argument("--members", type=int, default=None,
+                        help="Approximate number of members, overrides --files.")
+    parser.add_argument("--files", type=int, default=GeneratorConfig.files, help="Number of source files.")
+    parser.add_argument("--classes-per-file", type=int, default=GeneratorConfig.classes_per_file)
+    parser.add_argument("--methods-per-class", type=int, default=GeneratorConfig.methods_per_class)
+    parser.add_argument("--functions-per-file", type=int, default=GeneratorConfig.functions_per_file)
+    parser.add_argument("--namespaces", type=int, default=GeneratorConfig.namespaces)
+    parser.add_argument("--groups", type=int, default=GeneratorConfig.groups)
+    parser.add_argument("--requirement-ratio", type=float, default=GeneratorConfig.requirement_ratio)
+    parser.add_argument("--justification-ratio", type=float, default=GeneratorConfig.justification_ratio)
+    parser.add_argument("--programlisting-lines", type=int, default=GeneratorConfig.programlisting_lines)
+    parser.add_argument("--seed", type=int, default=GeneratorConfig.seed)
+    args = parser.parse_args()
+
+    if args.members is not None:
+        CONFIG = get_config_for_members(args.members, args.seed)
+    else:
+        CONFIG = GeneratorConfig(
+            files=args.files,
+            classes_per_file=args.classes_per_file,
+            methods_per_class=args.methods_per_class,
+            functions_per_file=args.functions_per_file,
+            namespaces=args.namespaces,
+            groups=args.groups,
+            requirement_ratio=args.requirement_ratio,
+            justification_ratio=args.justification_ratio,
+            programlisting_lines=args.programlisting_lines,
+            seed=args.seed,
+        )
+
+    generate_doxygen_xml(args.folder, CONFIG)
+    print(f"{CONFIG.get_member_count()} members in {CONFIG.files} files written to {args.folder}")
+    sys.exit(0)